@@ -0,0 +1,40 @@
+"""add_prompt_hash_to_daily_ticker_summary
+
+Revision ID: a8d4e2f6c1b9
+Revises: f3a7c1e9b2d4
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8d4e2f6c1b9"
+down_revision: str | Sequence[str] | None = "f3a7c1e9b2d4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - key stored LLM summaries by prompt hash for reuse."""
+    op.add_column(
+        "daily_ticker_summary",
+        sa.Column("prompt_hash", sa.String(length=64), nullable=True),
+    )
+    op.create_index(
+        "ix_daily_ticker_summary_prompt_hash",
+        "daily_ticker_summary",
+        ["prompt_hash"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_daily_ticker_summary_prompt_hash", table_name="daily_ticker_summary"
+    )
+    op.drop_column("daily_ticker_summary", "prompt_hash")
@@ -0,0 +1,58 @@
+"""add_archived_counters_to_ticker_stats
+
+Revision ID: a9e3c7b2d5f8
+Revises: f4d1b8c3a6e9
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a9e3c7b2d5f8"
+down_revision: str | Sequence[str] | None = "f4d1b8c3a6e9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Record the share of ticker_stats held by archived comments."""
+    op.add_column(
+        "ticker_stats",
+        sa.Column(
+            "archived_mentions", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+    op.add_column(
+        "ticker_stats",
+        sa.Column(
+            "archived_sentiment_sum", sa.Float(), nullable=False, server_default="0"
+        ),
+    )
+    op.add_column(
+        "ticker_stats",
+        sa.Column(
+            "archived_sentiment_count",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+    op.add_column(
+        "ticker_stats",
+        sa.Column(
+            "archived_last_mention_at", sa.DateTime(timezone=True), nullable=True
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("ticker_stats", "archived_last_mention_at")
+    op.drop_column("ticker_stats", "archived_sentiment_count")
+    op.drop_column("ticker_stats", "archived_sentiment_sum")
+    op.drop_column("ticker_stats", "archived_mentions")
@@ -0,0 +1,46 @@
+"""add_stock_price_rollup_state
+
+Revision ID: b3d9e6a2f8c1
+Revises: c7e4a1f9d3b6
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3d9e6a2f8c1"
+down_revision: str | Sequence[str] | None = "c7e4a1f9d3b6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - track per-symbol rollup coverage.
+
+    Symbols get a row when their rollups are rebuilt over full history, by
+    the collectors or ``app.scripts.backfill_stock_rollups``; until then
+    chart reads aggregate raw history as before.
+    """
+    op.create_table(
+        "stock_price_rollup_state",
+        sa.Column("symbol", sa.String(), nullable=False),
+        sa.Column("rolled_through", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.ForeignKeyConstraint(["symbol"], ["ticker.symbol"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("symbol"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("stock_price_rollup_state")
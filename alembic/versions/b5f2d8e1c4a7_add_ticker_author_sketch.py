@@ -0,0 +1,44 @@
+"""add_ticker_author_sketch
+
+Revision ID: b5f2d8e1c4a7
+Revises: a9e3c7b2d5f8
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5f2d8e1c4a7"
+down_revision: str | Sequence[str] | None = "a9e3c7b2d5f8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create hourly distinct-author sketches per ticker.
+
+    Filled at ingest from here on; run app.scripts.backfill_author_sketches
+    for the existing history.
+    """
+    op.create_table(
+        "ticker_author_sketch",
+        sa.Column("ticker", sa.String(), nullable=False),
+        sa.Column("hour", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("authors", sa.LargeBinary(), nullable=True),
+        sa.Column("positive_authors", sa.LargeBinary(), nullable=True),
+        sa.Column("negative_authors", sa.LargeBinary(), nullable=True),
+        sa.Column("neutral_authors", sa.LargeBinary(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["ticker"], ["ticker.symbol"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("ticker", "hour"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("ticker_author_sketch")
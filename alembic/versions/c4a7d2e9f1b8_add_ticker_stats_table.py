@@ -0,0 +1,80 @@
+"""add_ticker_stats_table
+
+Revision ID: c4a7d2e9f1b8
+Revises: b6e1f9a3d2c7
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a7d2e9f1b8"
+down_revision: str | Sequence[str] | None = "b6e1f9a3d2c7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - add per-ticker lifetime counters and backfill them."""
+    op.create_table(
+        "ticker_stats",
+        sa.Column("ticker", sa.String(), nullable=False),
+        sa.Column("total_mentions", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("sentiment_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("sentiment_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_mention_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "recent_mentions_24h", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.ForeignKeyConstraint(["ticker"], ["ticker.symbol"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("ticker"),
+    )
+    op.create_index(
+        "ticker_stats_recent_idx",
+        "ticker_stats",
+        [sa.text("recent_mentions_24h DESC"), "ticker"],
+    )
+    op.create_index(
+        "ticker_stats_total_idx",
+        "ticker_stats",
+        [sa.text("total_mentions DESC"), "ticker"],
+    )
+
+    op.execute(
+        """
+        INSERT INTO ticker_stats (
+            ticker, total_mentions, sentiment_sum, sentiment_count,
+            last_mention_at, recent_mentions_24h, updated_at
+        )
+        SELECT
+            t.symbol,
+            COUNT(a.id),
+            COALESCE(SUM(a.sentiment), 0),
+            COUNT(a.sentiment),
+            MAX(a.published_at),
+            COUNT(a.id) FILTER (WHERE a.published_at >= NOW() - INTERVAL '24 hours'),
+            NOW()
+        FROM ticker t
+        LEFT JOIN article_ticker l ON l.ticker = t.symbol
+        LEFT JOIN article a ON a.id = l.article_id
+        GROUP BY t.symbol
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ticker_stats_total_idx", table_name="ticker_stats")
+    op.drop_index("ticker_stats_recent_idx", table_name="ticker_stats")
+    op.drop_table("ticker_stats")
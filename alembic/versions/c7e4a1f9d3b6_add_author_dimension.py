@@ -0,0 +1,351 @@
+"""add_author_dimension
+
+Revision ID: c7e4a1f9d3b6
+Revises: b5f2d8e1c4a7
+Create Date: 2026-10-18 23:30:00.000000
+
+"""
+
+import hashlib
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime, time, timedelta
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e4a1f9d3b6"
+down_revision: str | Sequence[str] | None = "b5f2d8e1c4a7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Article ids per backfill statement; each statement commits on its own
+BACKFILL_BATCH_SIZE = 50_000
+
+# Mirrors app.services.author_ids at the time of this migration
+ANONYMOUS_AUTHORS = ("", "[deleted]", "[removed]")
+KNOWN_BOTS = ("AutoModerator",)
+
+# Mirror app.services.hll and app.repos.author_sketch_repo at the time of
+# this migration; rebuilt sketches must merge with ones written at ingest
+HLL_PRECISION = 12
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+SKETCH_COLUMNS = ("authors", "positive_authors", "negative_authors", "neutral_authors")
+SKETCH_WRITE_CHUNK_SIZE = 500
+
+
+def _article_id_ranges(bind, table: str, column: str):
+    max_id = bind.execute(sa.text(f"SELECT MAX({column}) FROM {table}")).scalar()
+    for low in range(0, (max_id or 0) + 1, BACKFILL_BATCH_SIZE):
+        yield {"low": low, "high": low + BACKFILL_BATCH_SIZE}
+
+
+def _partitions(bind, table: str) -> list[str]:
+    """Partitions of ``table``; empty when it is not partitioned."""
+    rows = bind.execute(
+        sa.text(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(:table)
+            ORDER BY child.relname
+            """
+        ),
+        {"table": table},
+    )
+    return [row[0] for row in rows]
+
+
+def _create_author_id_index(bind) -> None:
+    """Index article.author_id without blocking writes (autocommit only).
+
+    CONCURRENTLY is not allowed on a partitioned parent, so each partition
+    is indexed concurrently and attached to an index created ON ONLY the
+    parent, which becomes valid once every partition is attached.
+    """
+    partitions = _partitions(bind, "article")
+    if not partitions:
+        bind.execute(
+            sa.text(
+                "CREATE INDEX CONCURRENTLY article_author_id_idx ON article (author_id)"
+            )
+        )
+        return
+    bind.execute(
+        sa.text("CREATE INDEX article_author_id_idx ON ONLY article (author_id)")
+    )
+    for partition in partitions:
+        bind.execute(
+            sa.text(
+                f"CREATE INDEX CONCURRENTLY {partition}_author_id_idx "
+                f"ON {partition} (author_id)"
+            )
+        )
+        bind.execute(
+            sa.text(
+                "ALTER INDEX article_author_id_idx "
+                f"ATTACH PARTITION {partition}_author_id_idx"
+            )
+        )
+
+
+def _add_author_foreign_key(bind) -> None:
+    """Add article.author_id -> author.id, validating without blocking writes.
+
+    NOT VALID adds the constraint without a scan; VALIDATE CONSTRAINT then
+    scans under a lock that lets reads and writes continue. Partitioned
+    tables reject NOT VALID foreign keys, so each partition is validated on
+    its own and the parent's constraint then attaches them without a scan.
+    """
+    partitions = _partitions(bind, "article")
+    for table in partitions or ["article"]:
+        bind.execute(
+            sa.text(
+                f"ALTER TABLE {table} ADD CONSTRAINT {table}_author_id_fkey "
+                "FOREIGN KEY (author_id) REFERENCES author (id) NOT VALID"
+            )
+        )
+        bind.execute(
+            sa.text(f"ALTER TABLE {table} VALIDATE CONSTRAINT {table}_author_id_fkey")
+        )
+    if partitions:
+        bind.execute(
+            sa.text(
+                "ALTER TABLE article ADD CONSTRAINT article_author_id_fkey "
+                "FOREIGN KEY (author_id) REFERENCES author (id)"
+            )
+        )
+
+
+def _sketch_bytes(author_ids: Iterable[int]) -> bytes:
+    """Serialized HyperLogLog sketch of ``author_ids``, as app.services.hll writes."""
+    width = 64 - HLL_PRECISION
+    registers: dict[int, int] = {}
+    for author_id in author_ids:
+        hashed = int.from_bytes(
+            hashlib.blake2b(
+                author_id.to_bytes(8, "big", signed=True), digest_size=8
+            ).digest(),
+            "big",
+        )
+        index = hashed >> width
+        rank = width - (hashed & ((1 << width) - 1)).bit_length() + 1
+        if rank > registers.get(index, 0):
+            registers[index] = rank
+    size = 1 << HLL_PRECISION
+    # Sparse (index, rank) entries of 3 bytes until dense registers are smaller
+    if len(registers) * 3 >= size:
+        dense = bytearray(size)
+        for index, rank in registers.items():
+            dense[index] = rank
+        return bytes((2, HLL_PRECISION)) + bytes(dense)
+    sparse = bytearray((1, HLL_PRECISION))
+    for index in sorted(registers):
+        sparse += index.to_bytes(2, "big")
+        sparse.append(registers[index])
+    return bytes(sparse)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite returns naive datetimes; stored values are UTC
+    return value.astimezone(UTC) if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _rebuild_day(bind, day_start: datetime, day_end: datetime) -> None:
+    """Write the id sketches of one UTC day's links."""
+    authors: dict[tuple[str, datetime], dict[str, set[int]]] = {}
+    rows = bind.execute(
+        sa.text(
+            """
+            SELECT t.ticker, t.published_at, t.author_id, t.sentiment
+            FROM article_ticker t
+            JOIN author au ON au.id = t.author_id
+            WHERE NOT au.is_bot
+              AND t.published_at >= :start
+              AND t.published_at < :end
+            """
+        )
+        .bindparams(
+            sa.bindparam("start", type_=sa.DateTime(timezone=True)),
+            sa.bindparam("end", type_=sa.DateTime(timezone=True)),
+        )
+        .columns(published_at=sa.DateTime(timezone=True)),
+        {"start": day_start, "end": day_end},
+    )
+    for ticker, published_at, author_id, sentiment in rows:
+        hour = _as_utc(published_at).replace(minute=0, second=0, microsecond=0)
+        columns = authors.setdefault((ticker, hour), {})
+        columns.setdefault("authors", set()).add(author_id)
+        if sentiment is None:
+            continue
+        if sentiment >= POSITIVE_THRESHOLD:
+            column = "positive_authors"
+        elif sentiment <= NEGATIVE_THRESHOLD:
+            column = "negative_authors"
+        else:
+            column = "neutral_authors"
+        columns.setdefault(column, set()).add(author_id)
+
+    now = datetime.now(UTC)
+    sketches = [
+        {
+            "ticker": ticker,
+            "hour": hour,
+            **{
+                column: _sketch_bytes(columns[column]) if column in columns else None
+                for column in SKETCH_COLUMNS
+            },
+            "updated_at": now,
+        }
+        for (ticker, hour), columns in sorted(authors.items())
+    ]
+    insert = sa.text(
+        """
+        INSERT INTO ticker_author_sketch (
+            ticker, hour, authors, positive_authors, negative_authors,
+            neutral_authors, updated_at
+        )
+        VALUES (
+            :ticker, :hour, :authors, :positive_authors, :negative_authors,
+            :neutral_authors, :updated_at
+        )
+        """
+    ).bindparams(
+        sa.bindparam("hour", type_=sa.DateTime(timezone=True)),
+        sa.bindparam("updated_at", type_=sa.DateTime(timezone=True)),
+        *(sa.bindparam(column, type_=sa.LargeBinary()) for column in SKETCH_COLUMNS),
+    )
+    for start in range(0, len(sketches), SKETCH_WRITE_CHUNK_SIZE):
+        bind.execute(insert, sketches[start : start + SKETCH_WRITE_CHUNK_SIZE])
+
+
+def _rebuild_author_sketches(bind, now: datetime | None = None) -> None:
+    """Replace the name-hashed sketches of every live day with id sketches.
+
+    Sketches written before this revision hash author names and count bots
+    and "[deleted]"; merging id hashes into them would count each author
+    twice. Days whose comments were archived cannot be rebuilt and keep the
+    old sketches. The rest are cleared, then rebuilt from the links one UTC
+    day at a time, each day committing on its own.
+    """
+    now = now or datetime.now(UTC)
+    timestamp = sa.DateTime(timezone=True)
+    archived_through = bind.execute(
+        sa.text(
+            "SELECT MAX(archived_last_mention_at) AS archived_through "
+            "FROM ticker_stats"
+        ).columns(archived_through=timestamp)
+    ).scalar()
+    oldest = bind.execute(
+        sa.text("SELECT MIN(published_at) AS oldest FROM article_ticker").columns(
+            oldest=timestamp
+        )
+    ).scalar()
+    if archived_through is None:
+        bind.execute(sa.text("DELETE FROM ticker_author_sketch"))
+    else:
+        # Archival moves whole UTC days, as the backfill script assumes
+        first_live_day = _as_utc(archived_through).date() + timedelta(days=1)
+        bind.execute(
+            sa.text("DELETE FROM ticker_author_sketch WHERE hour >= :start").bindparams(
+                sa.bindparam("start", type_=sa.DateTime(timezone=True))
+            ),
+            {"start": datetime.combine(first_live_day, time.min, tzinfo=UTC)},
+        )
+    if oldest is None:
+        return
+    day = _as_utc(oldest).date()
+    if archived_through is not None:
+        day = max(day, first_live_day)
+    day_start = datetime.combine(day, time.min, tzinfo=UTC)
+    while day_start < now:
+        _rebuild_day(bind, day_start, day_start + timedelta(days=1))
+        day_start += timedelta(days=1)
+
+
+def upgrade() -> None:
+    """Dictionary-encode article authors into an author table.
+
+    Articles written by the previous release while this runs keep a NULL
+    author_id; pause ingest for the migration or rerun the UPDATEs after.
+    The distinct-author sketches of non-archived days are rebuilt with ids
+    before it finishes.
+    """
+    op.create_table(
+        "author",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("is_bot", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.add_column("article", sa.Column("author_id", sa.BigInteger(), nullable=True))
+    op.add_column(
+        "article_ticker", sa.Column("author_id", sa.BigInteger(), nullable=True)
+    )
+
+    bind = op.get_bind()
+    params = {"anonymous": list(ANONYMOUS_AUTHORS), "bots": list(KNOWN_BOTS)}
+    # Committing per statement releases row locks as the backfill goes, and
+    # lets the index and constraint below avoid blocking writes
+    with op.get_context().autocommit_block():
+        for ids in _article_id_ranges(bind, "article", "id"):
+            bind.execute(
+                sa.text(
+                    """
+                    INSERT INTO author (name, is_bot, created_at)
+                    SELECT DISTINCT author, author = ANY(:bots), now()
+                    FROM article
+                    WHERE author IS NOT NULL
+                      AND author <> ALL(:anonymous)
+                      AND id >= :low
+                      AND id < :high
+                    ON CONFLICT (name) DO NOTHING
+                    """
+                ),
+                {**params, **ids},
+            )
+            bind.execute(
+                sa.text(
+                    """
+                    UPDATE article a
+                    SET author_id = au.id
+                    FROM author au
+                    WHERE au.name = a.author
+                      AND a.id >= :low
+                      AND a.id < :high
+                    """
+                ),
+                ids,
+            )
+            bind.execute(
+                sa.text(
+                    """
+                    UPDATE article_ticker t
+                    SET author_id = a.author_id
+                    FROM article a
+                    WHERE a.id = t.article_id
+                      AND a.author_id IS NOT NULL
+                      AND t.article_id >= :low
+                      AND t.article_id < :high
+                    """
+                ),
+                ids,
+            )
+
+        _rebuild_author_sketches(bind)
+        _create_author_id_index(bind)
+        _add_author_foreign_key(bind)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("article_author_id_fkey", "article", type_="foreignkey")
+    op.drop_index("article_author_id_idx", table_name="article")
+    op.drop_column("article_ticker", "author_id")
+    op.drop_column("article", "author_id")
+    op.drop_table("author")
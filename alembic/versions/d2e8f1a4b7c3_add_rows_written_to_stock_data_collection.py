@@ -0,0 +1,32 @@
+"""add_rows_written_to_stock_data_collection
+
+Revision ID: d2e8f1a4b7c3
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2e8f1a4b7c3"
+down_revision: str | Sequence[str] | None = "a1b2c3d4e5f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - track rows written per collection run."""
+    op.add_column(
+        "stock_data_collection",
+        sa.Column("rows_written", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("stock_data_collection", "rows_written")
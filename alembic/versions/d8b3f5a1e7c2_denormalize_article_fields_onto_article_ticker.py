@@ -0,0 +1,78 @@
+"""denormalize_article_fields_onto_article_ticker
+
+Revision ID: d8b3f5a1e7c2
+Revises: c4a7d2e9f1b8
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d8b3f5a1e7c2"
+down_revision: str | Sequence[str] | None = "c4a7d2e9f1b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Article ids per backfill UPDATE; each batch commits on its own
+BACKFILL_BATCH_SIZE = 50_000
+
+
+def upgrade() -> None:
+    """Copy published_at, sentiment and author onto article_ticker."""
+    op.add_column(
+        "article_ticker",
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column("article_ticker", sa.Column("sentiment", sa.Float(), nullable=True))
+    op.add_column(
+        "article_ticker", sa.Column("author", sa.String(length=50), nullable=True)
+    )
+
+    bind = op.get_bind()
+    max_id = bind.execute(
+        sa.text("SELECT MAX(article_id) FROM article_ticker")
+    ).scalar()
+    with op.get_context().autocommit_block():
+        for low in range(0, (max_id or 0) + 1, BACKFILL_BATCH_SIZE):
+            bind.execute(
+                sa.text(
+                    """
+                    UPDATE article_ticker l
+                    SET published_at = a.published_at,
+                        sentiment = a.sentiment,
+                        author = a.author
+                    FROM article a
+                    WHERE a.id = l.article_id
+                      AND l.article_id >= :low
+                      AND l.article_id < :high
+                    """
+                ),
+                {"low": low, "high": low + BACKFILL_BATCH_SIZE},
+            )
+
+    # Built after the backfill; supersedes the single-column ticker index
+    op.create_index(
+        "article_ticker_ticker_published_idx",
+        "article_ticker",
+        ["ticker", sa.text("published_at DESC")],
+        postgresql_include=["sentiment"],
+    )
+    op.drop_index(
+        "article_ticker_ticker_idx", table_name="article_ticker", if_exists=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "article_ticker_ticker_idx", "article_ticker", ["ticker"], if_not_exists=True
+    )
+    op.drop_index("article_ticker_ticker_published_idx", table_name="article_ticker")
+    op.drop_column("article_ticker", "author")
+    op.drop_column("article_ticker", "sentiment")
+    op.drop_column("article_ticker", "published_at")
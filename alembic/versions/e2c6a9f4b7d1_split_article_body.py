@@ -0,0 +1,109 @@
+"""split_article_body
+
+Revision ID: e2c6a9f4b7d1
+Revises: d8b3f5a1e7c2
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2c6a9f4b7d1"
+down_revision: str | Sequence[str] | None = "d8b3f5a1e7c2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Article ids per copy statement; each batch commits on its own
+COPY_BATCH_SIZE = 50_000
+
+
+def _article_id_ranges(bind, table: str, column: str):
+    max_id = bind.execute(sa.text(f"SELECT MAX({column}) FROM {table}")).scalar()
+    for low in range(0, (max_id or 0) + 1, COPY_BATCH_SIZE):
+        yield {"low": low, "high": low + COPY_BATCH_SIZE}
+
+
+def upgrade() -> None:
+    """Move article.text into the article_body side table.
+
+    Existing bodies are copied in committed id batches while the app keeps
+    writing. The final transaction blocks article writes (reads continue),
+    copies every body that still has no article_body row, and drops the
+    column. Bodies are never edited after insert, so rows already copied
+    need no second pass.
+
+    Dropping the column only marks it dead in PostgreSQL; the space in
+    existing pages is reclaimed by the next table rewrite (VACUUM FULL or
+    pg_repack), while new rows are written narrow immediately.
+    """
+    op.create_table(
+        "article_body",
+        sa.Column("article_id", sa.BigInteger(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(["article_id"], ["article.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("article_id"),
+    )
+
+    bind = op.get_bind()
+    copy = sa.text(
+        """
+        INSERT INTO article_body (article_id, text)
+        SELECT id, text
+        FROM article
+        WHERE text IS NOT NULL
+          AND id >= :low
+          AND id < :high
+        ON CONFLICT (article_id) DO NOTHING
+        """
+    )
+    with op.get_context().autocommit_block():
+        for params in _article_id_ranges(bind, "article", "id"):
+            bind.execute(copy, params)
+
+    if bind.dialect.name == "postgresql":
+        bind.execute(sa.text("LOCK TABLE article IN EXCLUSIVE MODE"))
+    # Anything the batches missed, at any id: rows inserted after their
+    # batch ran, or committed late by a transaction that was in flight
+    bind.execute(
+        sa.text(
+            """
+        INSERT INTO article_body (article_id, text)
+        SELECT a.id, a.text
+        FROM article a
+        WHERE a.text IS NOT NULL
+          AND NOT EXISTS (
+            SELECT 1 FROM article_body b WHERE b.article_id = a.id
+          )
+        """
+        )
+    )
+
+    op.drop_column("article", "text")
+
+
+def downgrade() -> None:
+    """Copy bodies back onto article and drop article_body."""
+    op.add_column("article", sa.Column("text", sa.Text(), nullable=True))
+
+    bind = op.get_bind()
+    for params in _article_id_ranges(bind, "article_body", "article_id"):
+        bind.execute(
+            sa.text(
+                """
+                UPDATE article a
+                SET text = b.text
+                FROM article_body b
+                WHERE b.article_id = a.id
+                  AND b.article_id >= :low
+                  AND b.article_id < :high
+                """
+            ),
+            params,
+        )
+
+    op.drop_table("article_body")
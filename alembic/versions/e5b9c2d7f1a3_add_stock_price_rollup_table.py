@@ -0,0 +1,54 @@
+"""add_stock_price_rollup_table
+
+Revision ID: e5b9c2d7f1a3
+Revises: d2e8f1a4b7c3
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b9c2d7f1a3"
+down_revision: str | Sequence[str] | None = "d2e8f1a4b7c3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - add daily/weekly OHLCV rollup table."""
+    op.create_table(
+        "stock_price_rollup",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("symbol", sa.String(), nullable=False),
+        sa.Column("resolution", sa.String(length=2), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("open_price", sa.Float(), nullable=True),
+        sa.Column("high_price", sa.Float(), nullable=True),
+        sa.Column("low_price", sa.Float(), nullable=True),
+        sa.Column("close_price", sa.Float(), nullable=False),
+        sa.Column("volume", sa.BigInteger(), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.ForeignKeyConstraint(["symbol"], ["ticker.symbol"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "symbol",
+            "resolution",
+            "bucket_start",
+            name="uq_stock_price_rollup_symbol_resolution_bucket",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("stock_price_rollup")
@@ -0,0 +1,42 @@
+"""add_participants_and_price_to_daily_ticker_summary
+
+Revision ID: f3a7c1e9b2d4
+Revises: e5b9c2d7f1a3
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a7c1e9b2d4"
+down_revision: str | Sequence[str] | None = "e5b9c2d7f1a3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - persist email metrics computed by the summary job."""
+    op.add_column(
+        "daily_ticker_summary",
+        sa.Column("participant_count", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "daily_ticker_summary",
+        sa.Column("last_price", sa.Float(), nullable=True),
+    )
+    op.add_column(
+        "daily_ticker_summary",
+        sa.Column("price_change_percent", sa.Float(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("daily_ticker_summary", "price_change_percent")
+    op.drop_column("daily_ticker_summary", "last_price")
+    op.drop_column("daily_ticker_summary", "participant_count")
@@ -0,0 +1,370 @@
+"""partition_article_tables_by_month
+
+Revision ID: f4d1b8c3a6e9
+Revises: e2c6a9f4b7d1
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f4d1b8c3a6e9"
+down_revision: str | Sequence[str] | None = "e2c6a9f4b7d1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Article ids per copy statement; each batch commits on its own
+COPY_BATCH_SIZE = 50_000
+# Months created past the current one; the scheduled job keeps this window
+MONTHS_AHEAD = 3
+
+# Secondary indexes, rebuilt on the partitioned parents
+ARTICLE_INDEXES = {
+    "article_published_at_idx": "(published_at DESC)",
+    "article_reddit_id_idx": "(reddit_id)",
+    "article_subreddit_idx": "(subreddit)",
+    "article_upvotes_idx": "(upvotes DESC)",
+}
+LINK_INDEXES = {
+    "article_ticker_ticker_published_idx": (
+        "(ticker, published_at DESC) INCLUDE (sentiment)"
+    ),
+}
+
+
+def _month(value: date | datetime) -> date:
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return date(value.year, value.month, 1)
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _columns(bind, table: str) -> list[str]:
+    return [column["name"] for column in sa.inspect(bind).get_columns(table)]
+
+
+def _create_partitioned_copy(bind, table: str, months: list[date]) -> None:
+    """Create ``<table>_new`` partitioned by month with a DEFAULT partition."""
+    bind.execute(
+        sa.text(
+            f"CREATE TABLE {table}_new (LIKE {table} INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (published_at)"
+        )
+    )
+    for month in months:
+        lower = datetime.combine(month, datetime.min.time(), tzinfo=UTC)
+        upper = datetime.combine(_next_month(month), datetime.min.time(), tzinfo=UTC)
+        bind.execute(
+            sa.text(
+                f"CREATE TABLE {table}_y{month.year}m{month.month:02d} "
+                f"PARTITION OF {table}_new "
+                f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+        )
+    bind.execute(
+        sa.text(f"CREATE TABLE {table}_default PARTITION OF {table}_new DEFAULT")
+    )
+
+
+def _create_mirror_trigger(
+    bind,
+    table: str,
+    columns: list[str],
+    key: list[str],
+    values: list[str],
+    conflict: list[str],
+) -> None:
+    """Replay writes to ``table`` onto ``<table>_new`` while rows are copied.
+
+    Rows are upserted on the new table's primary key (``conflict``): when a
+    copy batch has read a row but not committed it, the trigger's INSERT
+    waits for the batch and then overwrites the copied row with the live one.
+    """
+    column_list = ", ".join(columns)
+    value_list = ", ".join(values)
+    excluded_list = ", ".join(f"EXCLUDED.{c}" for c in columns)
+    match_new = " AND ".join(f"{c} = NEW.{c}" for c in key)
+    match_old = " AND ".join(f"{c} = OLD.{c}" for c in key)
+    bind.execute(
+        sa.text(
+            f"""
+            CREATE FUNCTION {table}_mirror() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF TG_OP = 'DELETE' THEN
+                    DELETE FROM {table}_new WHERE {match_old};
+                    RETURN OLD;
+                END IF;
+                UPDATE {table}_new SET ({column_list}) = ROW({value_list})
+                WHERE {match_new};
+                IF NOT FOUND THEN
+                    INSERT INTO {table}_new ({column_list})
+                    VALUES ({value_list})
+                    ON CONFLICT ({", ".join(conflict)}) DO UPDATE
+                    SET ({column_list}) = ROW({excluded_list});
+                END IF;
+                RETURN NEW;
+            END
+            $$
+            """
+        )
+    )
+    bind.execute(
+        sa.text(
+            f"CREATE TRIGGER {table}_mirror "
+            f"AFTER INSERT OR UPDATE OR DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION {table}_mirror()"
+        )
+    )
+
+
+def _drop_mirror_trigger(bind, table: str) -> None:
+    bind.execute(sa.text(f"DROP TRIGGER IF EXISTS {table}_mirror ON {table}"))
+    bind.execute(sa.text(f"DROP FUNCTION IF EXISTS {table}_mirror()"))
+
+
+def _copy_in_batches(bind, statement: str) -> None:
+    """Run ``statement`` once per article id range, each in its own commit."""
+    max_id = bind.execute(sa.text("SELECT MAX(id) FROM article")).scalar()
+    for low in range(0, (max_id or 0) + 1, COPY_BATCH_SIZE):
+        bind.execute(sa.text(statement), {"low": low, "high": low + COPY_BATCH_SIZE})
+
+
+def upgrade() -> None:
+    """Range-partition article and article_ticker by month of published_at.
+
+    PostgreSQL only. The conversion runs online: partitioned copies are
+    created next to the live tables, triggers replay concurrent writes onto
+    them, rows are copied in committed id batches, and a short final
+    transaction swaps the tables. Primary keys and unique constraints must
+    contain the partition key, so they become (id, published_at),
+    (url, published_at) and (reddit_id, published_at); article_ticker
+    references article on (article_id, published_at). article_body keeps no
+    foreign key, since a partitioned article has no unique id alone.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    article_columns = _columns(bind, "article")
+    link_columns = _columns(bind, "article_ticker")
+    oldest = bind.execute(sa.text("SELECT MIN(published_at) FROM article")).scalar()
+    current = _month(datetime.now(UTC))
+    last = current
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+    months = [_month(oldest or current)]
+    while months[-1] < last:
+        months.append(_next_month(months[-1]))
+
+    # Articles: partitioned copy, mirror trigger, batched copy
+    _create_partitioned_copy(bind, "article", months)
+    bind.execute(
+        sa.text(
+            """
+            ALTER TABLE article_new
+                ADD CONSTRAINT article_new_pkey PRIMARY KEY (id, published_at),
+                ADD CONSTRAINT article_url_published_at_key
+                    UNIQUE (url, published_at),
+                ADD CONSTRAINT article_reddit_id_published_at_key
+                    UNIQUE (reddit_id, published_at)
+            """
+        )
+    )
+    for name, definition in ARTICLE_INDEXES.items():
+        bind.execute(sa.text(f"CREATE INDEX {name}_new ON article_new {definition}"))
+    _create_mirror_trigger(
+        bind,
+        "article",
+        article_columns,
+        key=["id"],
+        values=[f"NEW.{c}" for c in article_columns],
+        conflict=["id", "published_at"],
+    )
+
+    article_list = ", ".join(article_columns)
+    with op.get_context().autocommit_block():
+        _copy_in_batches(
+            bind,
+            f"""
+            INSERT INTO article_new ({article_list})
+            SELECT {article_list} FROM article
+            WHERE id >= :low AND id < :high
+            ON CONFLICT DO NOTHING
+            """,
+        )
+
+        # Links: every article is mirrored now, so the new table's foreign
+        # key holds from the first copied row
+        _create_partitioned_copy(bind, "article_ticker", months)
+        bind.execute(
+            sa.text(
+                """
+                ALTER TABLE article_ticker_new
+                    ALTER COLUMN published_at SET NOT NULL,
+                    ADD CONSTRAINT article_ticker_new_pkey
+                        PRIMARY KEY (article_id, ticker, published_at),
+                    ADD CONSTRAINT article_ticker_new_ticker_fkey
+                        FOREIGN KEY (ticker) REFERENCES ticker (symbol),
+                    ADD CONSTRAINT article_ticker_article_fkey
+                        FOREIGN KEY (article_id, published_at)
+                        REFERENCES article_new (id, published_at)
+                        ON DELETE CASCADE ON UPDATE CASCADE
+                """
+            )
+        )
+        for name, definition in LINK_INDEXES.items():
+            bind.execute(
+                sa.text(f"CREATE INDEX {name}_new ON article_ticker_new {definition}")
+            )
+        _create_mirror_trigger(
+            bind,
+            "article_ticker",
+            link_columns,
+            key=["article_id", "ticker"],
+            values=[
+                (
+                    "COALESCE(NEW.published_at, "
+                    "(SELECT published_at FROM article WHERE id = NEW.article_id))"
+                    if c == "published_at"
+                    else f"NEW.{c}"
+                )
+                for c in link_columns
+            ],
+            conflict=["article_id", "ticker", "published_at"],
+        )
+
+        link_select = ", ".join(
+            "a.published_at" if c == "published_at" else f"l.{c}" for c in link_columns
+        )
+        _copy_in_batches(
+            bind,
+            f"""
+            INSERT INTO article_ticker_new ({", ".join(link_columns)})
+            SELECT {link_select}
+            FROM article_ticker l
+            JOIN article a ON a.id = l.article_id
+            WHERE l.article_id >= :low AND l.article_id < :high
+            ON CONFLICT DO NOTHING
+            """,
+        )
+
+    # Swap: brief exclusive lock, no row copying
+    bind.execute(sa.text("LOCK TABLE article, article_ticker IN ACCESS EXCLUSIVE MODE"))
+    _drop_mirror_trigger(bind, "article_ticker")
+    _drop_mirror_trigger(bind, "article")
+    sequence = bind.execute(
+        sa.text("SELECT pg_get_serial_sequence('article', 'id')")
+    ).scalar()
+    if sequence:
+        # Keep the id sequence alive when its owning table is dropped
+        bind.execute(sa.text(f"ALTER SEQUENCE {sequence} OWNED BY NONE"))
+    op.drop_constraint(
+        "article_body_article_id_fkey", "article_body", type_="foreignkey"
+    )
+    op.drop_table("article_ticker")
+    op.drop_table("article")
+    op.rename_table("article_new", "article")
+    op.rename_table("article_ticker_new", "article_ticker")
+    if sequence:
+        bind.execute(sa.text(f"ALTER SEQUENCE {sequence} OWNED BY article.id"))
+    bind.execute(
+        sa.text(
+            "ALTER TABLE article RENAME CONSTRAINT article_new_pkey TO article_pkey"
+        )
+    )
+    bind.execute(
+        sa.text(
+            """
+            ALTER TABLE article_ticker
+                RENAME CONSTRAINT article_ticker_new_pkey TO article_ticker_pkey
+            """
+        )
+    )
+    bind.execute(
+        sa.text(
+            """
+            ALTER TABLE article_ticker
+                RENAME CONSTRAINT article_ticker_new_ticker_fkey
+                TO article_ticker_ticker_fkey
+            """
+        )
+    )
+    for name in [*ARTICLE_INDEXES, *LINK_INDEXES]:
+        bind.execute(sa.text(f"ALTER INDEX {name}_new RENAME TO {name}"))
+
+
+def downgrade() -> None:
+    """Convert back to unpartitioned tables.
+
+    Offline: rows are copied in one transaction under the swap lock.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    bind.execute(sa.text("LOCK TABLE article, article_ticker IN ACCESS EXCLUSIVE MODE"))
+    for table in ("article", "article_ticker"):
+        bind.execute(
+            sa.text(f"CREATE TABLE {table}_flat (LIKE {table} INCLUDING DEFAULTS)")
+        )
+        bind.execute(sa.text(f"INSERT INTO {table}_flat SELECT * FROM {table}"))
+
+    sequence = bind.execute(
+        sa.text("SELECT pg_get_serial_sequence('article', 'id')")
+    ).scalar()
+    if sequence:
+        bind.execute(sa.text(f"ALTER SEQUENCE {sequence} OWNED BY NONE"))
+    # Dropping the parents drops their partitions
+    op.drop_table("article_ticker")
+    op.drop_table("article")
+    op.rename_table("article_flat", "article")
+    op.rename_table("article_ticker_flat", "article_ticker")
+    if sequence:
+        bind.execute(sa.text(f"ALTER SEQUENCE {sequence} OWNED BY article.id"))
+
+    bind.execute(
+        sa.text(
+            """
+            ALTER TABLE article
+                ADD CONSTRAINT article_pkey PRIMARY KEY (id),
+                ADD CONSTRAINT article_url_key UNIQUE (url),
+                ADD CONSTRAINT article_reddit_id_key UNIQUE (reddit_id)
+            """
+        )
+    )
+    bind.execute(
+        sa.text(
+            """
+            ALTER TABLE article_ticker
+                ALTER COLUMN published_at DROP NOT NULL,
+                ADD CONSTRAINT article_ticker_pkey PRIMARY KEY (article_id, ticker),
+                ADD CONSTRAINT article_ticker_ticker_fkey
+                    FOREIGN KEY (ticker) REFERENCES ticker (symbol),
+                ADD CONSTRAINT article_ticker_article_id_fkey
+                    FOREIGN KEY (article_id) REFERENCES article (id)
+                    ON DELETE CASCADE
+            """
+        )
+    )
+    op.create_foreign_key(
+        "article_body_article_id_fkey",
+        "article_body",
+        "article",
+        ["article_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    for name, definition in ARTICLE_INDEXES.items():
+        bind.execute(sa.text(f"CREATE INDEX {name} ON article {definition}"))
+    for name, definition in LINK_INDEXES.items():
+        bind.execute(sa.text(f"CREATE INDEX {name} ON article_ticker {definition}"))
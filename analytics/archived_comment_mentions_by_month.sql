@@ -0,0 +1,17 @@
+-- Monthly mentions per ticker from archived Reddit comments
+-- DuckDB query over the Parquet archive (see README for setup)
+SELECT
+    date_trunc('month', l.published_date) AS month,
+    l.ticker,
+    COUNT(*) AS mentions,
+    COUNT(DISTINCT a.author_id) AS unique_authors,
+    AVG(l.sentiment) AS avg_sentiment
+FROM
+    archived_article_ticker l
+    JOIN archived_article a ON a.id = l.article_id
+GROUP BY
+    month,
+    l.ticker
+ORDER BY
+    month DESC,
+    mentions DESC;
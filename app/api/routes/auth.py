@@ -19,7 +19,9 @@ from app.services.auth_service import (
     MissingProfileDataError,
     NonGmailDomainError,
     get_auth_service,
+    resolve_session_user,
 )
+from app.services.session_cache import invalidate_session_user
 
 logger = logging.getLogger(__name__)
 
@@ -209,6 +211,7 @@ async def logout(request: Request):
 
 @router.get("/me")
 async def get_current_user_info(
+    request: Request,
     session_token: Annotated[str | None, Cookie()] = None,
     db: Session = Depends(get_db),
 ):
@@ -216,8 +219,7 @@ async def get_current_user_info(
     if not session_token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    auth_service = get_auth_service()
-    user = auth_service.get_current_user(db, session_token)
+    user = resolve_session_user(request, db)
 
     if not user:
         raise HTTPException(status_code=401, detail="Invalid session")
@@ -268,8 +270,7 @@ async def update_timezone(
     if not timezone:
         raise HTTPException(status_code=400, detail="Timezone required")
 
-    auth_service = get_auth_service()
-    user = auth_service.get_current_user(db, session_token)
+    user = resolve_session_user(request, db)
 
     if not user:
         raise HTTPException(status_code=401, detail="Invalid session")
@@ -279,6 +280,7 @@ async def update_timezone(
     if profile:
         profile.timezone = timezone
         profile.updated_at = datetime.now(UTC)
+        invalidate_session_user(db, user.id)
         db.commit()
 
         logger.info(
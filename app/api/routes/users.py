@@ -3,9 +3,8 @@
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Cookie, Depends, HTTPException
+from fastapi import APIRouter, Cookie, Depends, HTTPException, Request
 from pydantic import BaseModel
-from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -23,8 +22,9 @@ from app.models.dto import (
 )
 from app.repos.user_repo import UserRepository
 from app.repos.weekly_digest_repo import WeeklyDigestRepository
-from app.services.auth_service import get_auth_service
+from app.services.auth_service import resolve_session_user
 from app.services.slack_service import SlackService
+from app.services.ticker_search import ticker_search_cache
 from app.services.user_deletion_service import UserDeletionService
 from app.services.user_notification_channel_service import (
     ensure_email_notification_channel,
@@ -36,6 +36,7 @@ router = APIRouter(prefix="/api/users", tags=["users"])
 
 
 def get_current_user_id(
+    request: Request,
     session_token: Annotated[str | None, Cookie()] = None,
     db: Session = Depends(get_db),
 ) -> int:
@@ -43,8 +44,7 @@ def get_current_user_id(
     if not session_token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    auth_service = get_auth_service()
-    user = auth_service.get_current_user(db, session_token)
+    user = resolve_session_user(request, db)
 
     if not user:
         raise HTTPException(status_code=401, detail="Invalid session")
@@ -613,35 +613,8 @@ async def search_tickers(
     if not q or len(q.strip()) < 1:
         return []
 
-    normalized_query = q.strip()
-    upper_query = normalized_query.upper()
-    search_term = f"%{upper_query}%"
-    prefix_term = f"{upper_query}%"
-    max_limit = min(limit, 50)
-
-    relevance_order = case(
-        (func.lower(Ticker.symbol) == upper_query.lower(), 0),
-        (Ticker.symbol.ilike(prefix_term), 1),
-        (Ticker.symbol.ilike(search_term), 2),
-        else_=3,
-    )
-
-    tickers = (
-        db.query(Ticker)
-        .filter(Ticker.symbol.ilike(search_term) | Ticker.name.ilike(search_term))
-        .order_by(relevance_order, Ticker.symbol)
-        .limit(max_limit)
-        .all()
-    )
-
-    return [
-        {
-            "symbol": t.symbol,
-            "name": t.name,
-            "exchange": t.exchange,
-        }
-        for t in tickers
-    ]
+    tickers = ticker_search_cache.search(db, q, limit=min(limit, 50))
+    return [t.to_dict() for t in tickers]
 
 
 @router.delete("/me", response_model=UserDeletionResponseDTO)
@@ -4,21 +4,86 @@ import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import and_, func
+import numpy as np
+import pandas as pd
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.db.models import (
     BackfillProgress,
     StockDataCollection,
-    StockPrice,
     StockPriceHistory,
     Ticker,
 )
 from app.db.session import SessionLocal
+from app.repos.stock_price_repo import (
+    QUOTE_FIELDS,
+    StockPriceRepository,
+    price_row_from_quote,
+)
 from app.services.stock_data import StockDataService
 
 logger = logging.getLogger(__name__)
 
+# StockPrice columns populated by StockDataService.get_bulk_quotes
+_BULK_QUOTE_FIELDS = (
+    "price",
+    "previous_close",
+    "change",
+    "change_percent",
+    "open",
+    "day_high",
+    "day_low",
+    "volume",
+    "market_state",
+    "currency",
+)
+
+
+def _forward_fill_missing_days(history: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute forward-fill rows for calendar days missing from price history.
+
+    Each symbol's series is reindexed to every calendar day between its first
+    and last bar, and gaps take the close of the last trading day.
+
+    Args:
+        history: Frame with ``symbol``, ``date`` and ``close_price`` columns
+
+    Returns:
+        Frame with ``symbol``, ``date`` (UTC midnight) and ``close_price`` for
+        days that have no bar at all
+    """
+    columns = ["symbol", "date", "close_price"]
+    if history.empty:
+        return pd.DataFrame(columns=columns)
+
+    days = pd.to_datetime(history["date"], utc=True).dt.normalize()
+    # Last bar of each day carries that day's close
+    daily = (
+        history.assign(date=days)
+        .groupby(["symbol", "date"], sort=True)["close_price"]
+        .last()
+    )
+
+    bounds = daily.reset_index().groupby("symbol")["date"].agg(["min", "max"])
+    lengths = ((bounds["max"] - bounds["min"]).dt.days + 1).to_numpy()
+    offsets = np.arange(lengths.sum()) - np.repeat(
+        np.cumsum(lengths) - lengths, lengths
+    )
+    calendar = pd.MultiIndex.from_arrays(
+        [
+            np.repeat(bounds.index.to_numpy(), lengths),
+            pd.DatetimeIndex(bounds["min"]).repeat(lengths)
+            + pd.to_timedelta(offsets, unit="D"),
+        ],
+        names=["symbol", "date"],
+    )
+
+    filled = daily.reindex(calendar).groupby(level="symbol").ffill()
+    missing = calendar.difference(daily.index)
+    return filled.loc[missing].reset_index()[columns]
+
 
 class StockPriceCollector:
     """Collector for stock price data."""
@@ -50,105 +115,52 @@ class StockPriceCollector:
         now = datetime.now(UTC)
         cutoff_date = now - timedelta(days=days_back)
 
-        # Get symbols to process
+        # Pull the whole window as columns in one query (default: all symbols)
+        query = db.query(
+            StockPriceHistory.symbol,
+            StockPriceHistory.date,
+            StockPriceHistory.close_price,
+        ).filter(StockPriceHistory.date >= cutoff_date)
         if symbols:
-            symbols_to_process = symbols
-        else:
-            # Get all symbols that have at least one history record
-            result = (
-                db.query(StockPriceHistory.symbol)
-                .distinct()
-                .order_by(StockPriceHistory.symbol)
-                .all()
-            )
-            symbols_to_process = [symbol for (symbol,) in result]
-
-        logger.info(f"Processing {len(symbols_to_process)} symbols")
-
-        total_filled = 0
-        symbols_processed = 0
-
-        for symbol in symbols_to_process:
-            try:
-                # Get all existing dates for this symbol within the range
-                existing_records = (
-                    db.query(StockPriceHistory)
-                    .filter(
-                        StockPriceHistory.symbol == symbol,
-                        StockPriceHistory.date >= cutoff_date,
-                    )
-                    .order_by(StockPriceHistory.date)
-                    .all()
-                )
-
-                if not existing_records:
-                    continue
-
-                # Create a map of dates to records
-                records_by_date = {}
-                for record in existing_records:
-                    date_key = record.date.date()
-                    records_by_date[date_key] = record
-
-                # Get first and last dates
-                first_date = existing_records[0].date.date()
-                last_date = existing_records[-1].date.date()
-
-                # Fill gaps between first and last date
-                current_date = first_date
-                last_trading_record = existing_records[0]
-                filled_count = 0
-
-                while current_date <= last_date:
-                    if current_date in records_by_date:
-                        # Update last trading record
-                        last_trading_record = records_by_date[current_date]
-                    else:
-                        # Gap found - forward-fill from last trading day
-                        # Check if we already have a forward-filled record for this date
-                        date_with_time = datetime.combine(
-                            current_date, datetime.min.time()
-                        ).replace(tzinfo=UTC)
-
-                        existing = (
-                            db.query(StockPriceHistory)
-                            .filter(
-                                and_(
-                                    StockPriceHistory.symbol == symbol,
-                                    func.date(StockPriceHistory.date) == current_date,
-                                )
-                            )
-                            .first()
-                        )
-
-                        if not existing:
-                            # Create forward-filled record
-                            filled_record = StockPriceHistory(
-                                symbol=symbol,
-                                date=date_with_time,
-                                open_price=last_trading_record.close_price,
-                                high_price=last_trading_record.close_price,
-                                low_price=last_trading_record.close_price,
-                                close_price=last_trading_record.close_price,
-                                volume=0,  # No trading volume on non-trading days
-                                created_at=datetime.now(UTC),
-                            )
-                            db.add(filled_record)
-                            filled_count += 1
-                            total_filled += 1
-
-                    current_date += timedelta(days=1)
+            query = query.filter(StockPriceHistory.symbol.in_(symbols))
+        history = pd.DataFrame(
+            query.order_by(StockPriceHistory.symbol, StockPriceHistory.date).all(),
+            columns=["symbol", "date", "close_price"],
+        )
 
-                if filled_count > 0:
-                    logger.info(f"✓ {symbol}: Filled {filled_count} gap days")
-                    symbols_processed += 1
+        logger.info(
+            f"Processing {history['symbol'].nunique()} symbols "
+            f"({len(history)} history rows)"
+        )
 
-            except Exception as e:
-                logger.error(f"Error processing {symbol}: {e}")
-                continue
+        fills = _forward_fill_missing_days(history)
+        total_filled = len(fills)
+        symbols_processed = fills["symbol"].nunique() if total_filled else 0
 
-        # Commit all fills
         try:
+            if total_filled:
+                created_at = datetime.now(UTC)
+                price_repo = StockPriceRepository(db)
+                price_repo.insert_history(
+                    [
+                        {
+                            "symbol": symbol,
+                            "date": day.to_pydatetime(),
+                            "open_price": close_price,
+                            "high_price": close_price,
+                            "low_price": close_price,
+                            "close_price": close_price,
+                            "volume": 0,  # No trading volume on non-trading days
+                            "created_at": created_at,
+                        }
+                        for symbol, day, close_price in fills.itertuples(
+                            index=False, name=None
+                        )
+                    ]
+                )
+                price_repo.refresh_rollups(
+                    fills["symbol"].unique(), since=fills["date"].min().to_pydatetime()
+                )
             db.commit()
             logger.info("=" * 80)
             logger.info(
@@ -165,9 +177,25 @@ class StockPriceCollector:
         }
 
     async def collect_current_prices(
-        self, db: Session, symbols: list[str] | None = None
+        self,
+        db: Session,
+        symbols: list[str] | None = None,
+        bulk: bool = False,
+        chunk_size: int = 200,
     ) -> dict:
-        """Collect current stock prices for all or specified tickers."""
+        """
+        Collect current stock prices for all or specified tickers.
+
+        Args:
+            db: Database session
+            symbols: Optional list of specific symbols (default: all tickers)
+            bulk: Fetch quotes with multi-symbol downloads and write each chunk
+                with a single upsert instead of per-symbol ``Ticker.info`` calls
+            chunk_size: Symbols per download/upsert when ``bulk`` is True
+
+        Returns:
+            Statistics about the collection run
+        """
         collection_run = StockDataCollection(
             collection_type="current",
             symbols_requested=0,
@@ -187,12 +215,14 @@ class StockPriceCollector:
 
             logger.info(f"Collecting current prices for {len(symbols)} symbols")
 
+            price_repo = StockPriceRepository(db)
             errors = []
             success_count = 0
             failed_count = 0
+            rows_written = 0
 
             # Process in batches to avoid rate limiting
-            batch_size = 10
+            batch_size = chunk_size if bulk else 10
             for i in range(0, len(symbols), batch_size):
                 batch = symbols[i : i + batch_size]
                 logger.info(
@@ -200,41 +230,23 @@ class StockPriceCollector:
                 )
 
                 # Get stock data for batch
-                results = await self.stock_service.get_multiple_prices(batch)
+                if bulk:
+                    results = await self.stock_service.get_bulk_quotes(
+                        batch, chunk_size=batch_size
+                    )
+                else:
+                    results = await self.stock_service.get_multiple_prices(batch)
 
+                # Per-symbol quotes carry the full field set; bulk quotes only
+                # the price/intraday subset, so other columns are left intact
+                fields = _BULK_QUOTE_FIELDS if bulk else QUOTE_FIELDS
+                rows = []
                 for symbol, stock_data in results.items():
                     try:
                         if stock_data:
-                            # Update or create stock price record
-                            existing = (
-                                db.query(StockPrice)
-                                .filter(StockPrice.symbol == symbol)
-                                .first()
+                            rows.append(
+                                price_row_from_quote(symbol, stock_data, fields=fields)
                             )
-
-                            if existing:
-                                existing.price = stock_data["price"]
-                                existing.previous_close = stock_data["previous_close"]
-                                existing.change = stock_data["change"]
-                                existing.change_percent = stock_data["change_percent"]
-                                existing.market_state = stock_data["market_state"]
-                                existing.currency = stock_data["currency"]
-                                existing.exchange = stock_data["exchange"]
-                                existing.updated_at = datetime.now(UTC)
-                            else:
-                                new_price = StockPrice(
-                                    symbol=symbol,
-                                    price=stock_data["price"],
-                                    previous_close=stock_data["previous_close"],
-                                    change=stock_data["change"],
-                                    change_percent=stock_data["change_percent"],
-                                    market_state=stock_data["market_state"],
-                                    currency=stock_data["currency"],
-                                    exchange=stock_data["exchange"],
-                                    updated_at=datetime.now(UTC),
-                                )
-                                db.add(new_price)
-
                             success_count += 1
                             logger.debug(
                                 f"Updated price for {symbol}: ${stock_data['price']}"
@@ -251,6 +263,9 @@ class StockPriceCollector:
                         errors.append(error_msg)
                         logger.error(error_msg)
 
+                if rows:
+                    rows_written += price_repo.upsert_prices(rows)
+
                 # Commit after each batch
                 db.commit()
 
@@ -261,6 +276,7 @@ class StockPriceCollector:
             # Update collection run
             collection_run.symbols_success = success_count
             collection_run.symbols_failed = failed_count
+            collection_run.rows_written = rows_written
             collection_run.errors = errors[:100]  # Limit errors stored
             collection_run.completed_at = datetime.now(UTC)
 
@@ -282,6 +298,7 @@ class StockPriceCollector:
             return {
                 "success": success_count,
                 "failed": failed_count,
+                "rows_written": rows_written,
                 "errors": errors,
                 "duration": collection_run.duration_seconds,
             }
@@ -320,9 +337,11 @@ class StockPriceCollector:
 
             logger.info(f"Collecting historical data for {len(symbols)} symbols")
 
+            price_repo = StockPriceRepository(db)
             errors = []
             success_count = 0
             failed_count = 0
+            rows_written = 0
 
             for symbol in symbols:
                 try:
@@ -357,33 +376,44 @@ class StockPriceCollector:
                                 StockPriceHistory.symbol == symbol
                             ).delete()
 
-                        # Insert new data
-                        for point in hist_data["data"]:
-                            # Check if this date already exists
-                            date_obj = datetime.strptime(
-                                point["date"], "%Y-%m-%d"
-                            ).replace(tzinfo=UTC)
-                            existing = (
-                                db.query(StockPriceHistory)
-                                .filter(
-                                    and_(
-                                        StockPriceHistory.symbol == symbol,
-                                        func.date(StockPriceHistory.date)
-                                        == date_obj.date(),
-                                    )
-                                )
-                                .first()
+                        # Skip days that already have a bar (daily or intraday)
+                        points = [
+                            (
+                                datetime.strptime(point["date"], "%Y-%m-%d").replace(
+                                    tzinfo=UTC
+                                ),
+                                point,
                             )
+                            for point in hist_data["data"]
+                        ]
+                        existing_days = {
+                            existing_date.date()
+                            for (existing_date,) in db.query(StockPriceHistory.date)
+                            .filter(
+                                StockPriceHistory.symbol == symbol,
+                                StockPriceHistory.date
+                                >= min(date_obj for date_obj, _ in points),
+                            )
+                            .all()
+                        }
 
-                            if not existing:
-                                history_record = StockPriceHistory(
-                                    symbol=symbol,
-                                    date=date_obj,
-                                    close_price=point["price"],
-                                    volume=point.get("volume", 0),
-                                    created_at=datetime.now(UTC),
-                                )
-                                db.add(history_record)
+                        # Insert new data
+                        new_rows = [
+                            {
+                                "symbol": symbol,
+                                "date": date_obj,
+                                "close_price": point["price"],
+                                "volume": point.get("volume", 0),
+                                "created_at": datetime.now(UTC),
+                            }
+                            for date_obj, point in points
+                            if date_obj.date() not in existing_days
+                        ]
+                        if new_rows:
+                            rows_written += price_repo.insert_history(new_rows)
+                            price_repo.refresh_rollups(
+                                [symbol], since=min(row["date"] for row in new_rows)
+                            )
 
                         success_count += 1
                         logger.debug(
@@ -412,6 +442,7 @@ class StockPriceCollector:
             # Update collection run
             collection_run.symbols_success = success_count
             collection_run.symbols_failed = failed_count
+            collection_run.rows_written = rows_written
             collection_run.errors = errors[:100]
             collection_run.completed_at = datetime.now(UTC)
 
@@ -433,6 +464,7 @@ class StockPriceCollector:
             return {
                 "success": success_count,
                 "failed": failed_count,
+                "rows_written": rows_written,
                 "errors": errors,
                 "duration": collection_run.duration_seconds,
             }
@@ -554,6 +586,7 @@ class StockPriceCollector:
 
         logger.info(f"Processing {len(symbols)} tickers")
 
+        price_repo = StockPriceRepository(db)
         success_count = 0
         failed_count = 0
         skipped_count = len(processed_symbols)
@@ -700,29 +733,12 @@ class StockPriceCollector:
                         continue
 
                     # Bulk insert with conflict resolution (ignore duplicates)
-                    inserted_count = 0
-                    for record in records_to_insert:
-                        try:
-                            # Check if record already exists
-                            existing = (
-                                db.query(StockPriceHistory)
-                                .filter(
-                                    and_(
-                                        StockPriceHistory.symbol == record["symbol"],
-                                        StockPriceHistory.date == record["date"],
-                                    )
-                                )
-                                .first()
-                            )
-
-                            if not existing:
-                                db.add(StockPriceHistory(**record))
-                                inserted_count += 1
-                        except Exception as insert_error:
-                            logger.debug(
-                                f"Skipping duplicate for {symbol} at {record['date']}: {insert_error}"
-                            )
-                            continue
+                    inserted_count = price_repo.insert_history(records_to_insert)
+                    if inserted_count:
+                        price_repo.refresh_rollups(
+                            [symbol],
+                            since=min(row["date"] for row in records_to_insert),
+                        )
 
                     progress.status = "success"
                     progress.records_inserted = inserted_count
@@ -886,6 +902,16 @@ class StockPriceCollector:
                 "errors": [],
             }
 
+        price_repo = StockPriceRepository(db)
+        collection_run = StockDataCollection(
+            collection_type="historical_append",
+            symbols_requested=len(tickers_to_process),
+            symbols_success=0,
+            symbols_failed=0,
+        )
+        db.add(collection_run)
+        db.commit()
+
         success_count = 0
         failed_count = 0
         skipped_count = 0
@@ -1012,29 +1038,12 @@ class StockPriceCollector:
                         continue
 
                     # Insert records (skip duplicates)
-                    inserted_count = 0
-                    for record in records_to_insert:
-                        try:
-                            # Check if record already exists
-                            existing = (
-                                db.query(StockPriceHistory)
-                                .filter(
-                                    and_(
-                                        StockPriceHistory.symbol == record["symbol"],
-                                        StockPriceHistory.date == record["date"],
-                                    )
-                                )
-                                .first()
-                            )
-
-                            if not existing:
-                                db.add(StockPriceHistory(**record))
-                                inserted_count += 1
-                        except Exception as insert_error:
-                            logger.debug(
-                                f"Skipping duplicate for {symbol} at {record['date']}: {insert_error}"
-                            )
-                            continue
+                    inserted_count = price_repo.insert_history(records_to_insert)
+                    if inserted_count:
+                        price_repo.refresh_rollups(
+                            [symbol],
+                            since=min(row["date"] for row in records_to_insert),
+                        )
 
                     total_records_inserted += inserted_count
                     success_count += 1
@@ -1064,6 +1073,19 @@ class StockPriceCollector:
                 logger.info(f"Waiting {delay_between_batches}s before next batch...")
                 await asyncio.sleep(delay_between_batches)
 
+        collection_run.symbols_success = success_count
+        collection_run.symbols_failed = failed_count
+        collection_run.rows_written = total_records_inserted
+        collection_run.errors = errors[:100]
+        collection_run.completed_at = datetime.now(UTC)
+        started_at = collection_run.started_at
+        if started_at.tzinfo is None:
+            started_at = started_at.replace(tzinfo=UTC)
+        collection_run.duration_seconds = (
+            collection_run.completed_at - started_at
+        ).total_seconds()
+        db.commit()
+
         logger.info("=" * 80)
         logger.info("Daily Historical Append Summary:")
         logger.info(f"  Total processed: {len(tickers_to_process)}")
@@ -64,6 +64,8 @@ class Settings(BaseSettings):
     # Default budgets are per-IP, per-endpoint
     rl_requests_per_minute: int = 60
     rl_window_seconds: int = 60
+    # Requests granted per Redis round-trip to a client well under quota
+    rl_local_lease: int = 5
 
     # Parameter caps to protect the API from abuse
     MAX_LIMIT_ARTICLES: int = 100
@@ -75,6 +77,10 @@ class Settings(BaseSettings):
 
     # Stock price cache configuration
     STOCK_PRICE_FRESHNESS_MINUTES: int = 15
+    # In-process quote cache shared by concurrent ticker page requests
+    STOCK_PRICE_QUOTE_CACHE_TTL_SECONDS: int = 60
+    # Render stale prices immediately and refresh them in the background
+    STOCK_PRICE_STALE_WHILE_REVALIDATE: bool = True
 
     # Historical Data Configuration
     historical_backfill_start_month: int = 10
@@ -84,8 +90,22 @@ class Settings(BaseSettings):
     historical_daily_interval: str = "1h"
     historical_daily_days_back: int = 1
 
+    # Homepage renders from the job-built snapshot while it is younger than
+    # this (two scrape cycles); older snapshots fall back to live queries
+    HOMEPAGE_SNAPSHOT_MAX_AGE_MINUTES: int = 30
+
+    # Cold storage for old Reddit comments: a local directory or an s3:// URI
+    # (S3-compatible stores via ?endpoint_override=host:port)
+    COMMENT_ARCHIVE_URI: str = "data/archive"
+    # Comments older than this move to the archive; must cover the longest
+    # UI window (MAX_DAYS_TIME_SERIES)
+    COMMENT_ARCHIVE_HORIZON_DAYS: int = 180
+
     # User limits
     USER_MAX_TICKER_FOLLOWS: int = 100
+    # Rebuild interval of the in-memory ticker typeahead index; picks up
+    # tickers added by other processes (in-process commits rebuild at once)
+    TICKER_SEARCH_INDEX_TTL_SECONDS: int = 600
 
     # Google OAuth configuration
     google_client_id: str | None = Field(
@@ -106,6 +126,12 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("SESSION_SECRET_KEY", "session_secret_key"),
     )
     session_max_age_seconds: int = 86400 * 30  # 30 days
+    # Cache of the user behind a session token (0 disables); bounds how long
+    # other processes may keep serving a blocked or deleted user
+    SESSION_USER_CACHE_TTL_SECONDS: int = 30
+    SESSION_USER_CACHE_MAX_ENTRIES: int = 10_000
+    # Share cached session users across processes via REDIS_URL
+    SESSION_USER_CACHE_REDIS: bool = False
 
     # Slack configuration
     slack_bot_token: str | None = Field(
@@ -260,6 +286,20 @@ class Settings(BaseSettings):
         ),
     )
 
+    email_max_send_rate: float = Field(
+        default=14.0,
+        gt=0,
+        validation_alias=AliasChoices("EMAIL_MAX_SEND_RATE", "email_max_send_rate"),
+        description="Emails per second when the provider quota can't be read",
+    )
+    email_send_concurrency: int = Field(
+        default=8,
+        ge=1,
+        validation_alias=AliasChoices(
+            "EMAIL_SEND_CONCURRENCY", "email_send_concurrency"
+        ),
+    )
+
     # Test email configuration
     test_email_recipient: str = Field(
         default="test@example.com",  # Default for tests, override in .env for production
@@ -312,6 +352,14 @@ class Settings(BaseSettings):
             "WEEKLY_DIGEST_LLM_TEMPERATURE", "weekly_digest_llm_temperature"
         ),
     )
+    weekly_digest_llm_concurrency: int = Field(
+        default=4,
+        ge=1,
+        validation_alias=AliasChoices(
+            "WEEKLY_DIGEST_LLM_CONCURRENCY", "weekly_digest_llm_concurrency"
+        ),
+        description="Concurrent LLM syntheses per dispatch batch",
+    )
     weekly_digest_default_cadence_new_users: str = Field(
         default="both",
         validation_alias=AliasChoices(
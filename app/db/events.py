@@ -0,0 +1,40 @@
+"""Registration of the global ORM session hooks.
+
+The hooks that keep ``article_ticker`` copies, author ids and the
+``ticker_stats`` counters in sync, and the ones that drop the ticker search
+index and cached session users after commit, are defined next to the code
+they maintain (app.services.article_ticker_sync, author_ids, ticker_stats,
+ticker_search and session_cache). Importing those modules registers nothing;
+every process that writes articles calls :func:`install_session_hooks` once
+at startup.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.services import (
+    article_ticker_sync,
+    author_ids,
+    session_cache,
+    ticker_search,
+    ticker_stats,
+)
+
+_HOOK_MODULES = (
+    author_ids,
+    article_ticker_sync,
+    ticker_stats,
+    ticker_search,
+    session_cache,
+)
+
+
+def install_session_hooks() -> None:
+    """Register the article link, author id, ticker counter and cache hooks.
+
+    Safe to call more than once; hooks already registered are skipped.
+    """
+    for module in _HOOK_MODULES:
+        for identifier, handler, insert in module.SESSION_HOOKS:
+            if not event.contains(Session, identifier, handler):
+                event.listen(Session, identifier, handler, insert=insert)
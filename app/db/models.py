@@ -12,6 +12,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -21,6 +22,8 @@ from sqlalchemy import (
     Enum as SQLEnum,
 )
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.types import TypeDecorator
 
@@ -141,8 +144,32 @@ class Ticker(Base):
     )
 
 
+class Author(Base):
+    """Distinct article authors, so analytics compare integer ids, not names.
+
+    Ids are assigned at ingest (see app.services.author_ids).
+    """
+
+    __tablename__ = "author"
+
+    id: Mapped[int] = mapped_column(
+        BigIntegerCompat, primary_key=True, autoincrement=True
+    )
+    name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    # Automated accounts, left out of unique-user counts
+    is_bot: Mapped[bool] = mapped_column(default=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+
+
 class Article(Base):
-    """Articles from various sources."""
+    """Articles from various sources.
+
+    On PostgreSQL the table is range-partitioned by month of ``published_at``
+    (see ``app.db.partitions``), so its primary key and unique constraints
+    there also include ``published_at``.
+    """
 
     __tablename__ = "article"
 
@@ -157,7 +184,6 @@ class Article(Base):
         DateTime(timezone=True), nullable=False
     )
     title: Mapped[str] = mapped_column(Text, nullable=False)
-    text: Mapped[str | None] = mapped_column(Text, nullable=True)
     lang: Mapped[str | None] = mapped_column(String, nullable=True)
     sentiment: Mapped[float | None] = mapped_column(Float, nullable=True)
     # Reddit-specific fields
@@ -166,6 +192,10 @@ class Article(Base):
     )
     subreddit: Mapped[str | None] = mapped_column(String(50), nullable=True)
     author: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    # Null for articles without a real author ("[deleted]", missing)
+    author_id: Mapped[int | None] = mapped_column(
+        BigInteger, ForeignKey("author.id"), nullable=True
+    )
     upvotes: Mapped[int | None] = mapped_column(Integer, nullable=True, default=0)
     num_comments: Mapped[int | None] = mapped_column(Integer, nullable=True, default=0)
     engagement_score: Mapped[float | None] = mapped_column(Float, nullable=True)
@@ -178,6 +208,28 @@ class Article(Base):
     tickers: Mapped[list["ArticleTicker"]] = relationship(
         "ArticleTicker", back_populates="article", cascade="all, delete-orphan"
     )
+    body: Mapped["ArticleBody | None"] = relationship(
+        "ArticleBody", back_populates="article", cascade="all, delete-orphan"
+    )
+
+    # Full body, stored in article_body and loaded only when accessed;
+    # Article(text=...) creates the body row
+    text: AssociationProxy[str | None] = association_proxy(
+        "body", "text", creator=lambda text: ArticleBody(text=text)
+    )
+
+
+class ArticleBody(Base):
+    """Full text of an article, kept out of the hot article table."""
+
+    __tablename__ = "article_body"
+
+    article_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("article.id", ondelete="CASCADE"), primary_key=True
+    )
+    text: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    article: Mapped["Article"] = relationship("Article", back_populates="body")
 
 
 class ArticleTicker(Base):
@@ -194,6 +246,16 @@ class ArticleTicker(Base):
     confidence: Mapped[float] = mapped_column(default=1.0)
     matched_terms: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
 
+    # Copies of article fields so per-ticker analytics need no join to
+    # article; kept in sync by app.services.article_ticker_sync. On
+    # PostgreSQL published_at is the (NOT NULL) monthly partition key.
+    published_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    sentiment: Mapped[float | None] = mapped_column(Float, nullable=True)
+    author: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    author_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+
     # Relationships
     article: Mapped["Article"] = relationship("Article", back_populates="tickers")
     ticker_obj: Mapped["Ticker"] = relationship("Ticker", back_populates="articles")
@@ -299,6 +361,12 @@ class DailyTickerSummary(Base):
     )
     llm_model: Mapped[str | None] = mapped_column(String(100), nullable=True)
     llm_version: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    # Snapshot taken by the summary job so emails never query articles/prices
+    participant_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    last_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+    price_change_percent: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # SHA-256 of the model settings and prompt that produced llm_summary
+    prompt_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
     )
@@ -318,6 +386,7 @@ class DailyTickerSummary(Base):
             "ticker",
             desc("summary_date"),
         ),
+        Index("ix_daily_ticker_summary_prompt_hash", "prompt_hash"),
     )
 
 
@@ -350,6 +419,61 @@ class StockPriceHistory(Base):
     )
 
 
+class StockPriceRollup(Base):
+    """Downsampled OHLCV bars (daily/weekly) derived from stock_price_history."""
+
+    __tablename__ = "stock_price_rollup"
+
+    id: Mapped[int] = mapped_column(
+        BigIntegerCompat, primary_key=True, autoincrement=True
+    )
+    symbol: Mapped[str] = mapped_column(
+        String, ForeignKey("ticker.symbol"), nullable=False
+    )
+    resolution: Mapped[str] = mapped_column(String(2), nullable=False)  # '1d', '1w'
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    open_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+    high_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+    low_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+    close_price: Mapped[float] = mapped_column(Float, nullable=False)
+    volume: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "symbol",
+            "resolution",
+            "bucket_start",
+            name="uq_stock_price_rollup_symbol_resolution_bucket",
+        ),
+    )
+
+
+class StockPriceRollupState(Base):
+    """How far each symbol's rollups cover its stock_price_history.
+
+    A row exists once a symbol's rollups were built over its whole history;
+    ``rolled_through`` is the newest raw bar included. Chart reads trust the
+    rollups unless raw bars exist past it.
+    """
+
+    __tablename__ = "stock_price_rollup_state"
+
+    symbol: Mapped[str] = mapped_column(
+        String, ForeignKey("ticker.symbol", ondelete="CASCADE"), primary_key=True
+    )
+    rolled_through: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+
+
 class StockDataCollection(Base):
     """Track stock data collection runs."""
 
@@ -364,6 +488,9 @@ class StockDataCollection(Base):
     symbols_requested: Mapped[int] = mapped_column(Integer, nullable=False)
     symbols_success: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     symbols_failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rows_written: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )  # Rows inserted/updated by bulk upserts
     errors: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
     started_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
@@ -635,9 +762,101 @@ class WeeklyDigestSendRecord(Base):
     )
 
 
+class TickerStats(Base):
+    """Per-ticker lifetime mention and sentiment counters.
+
+    Maintained incrementally as article links and sentiment scores are
+    committed (see app.services.ticker_stats) and reconciled nightly.
+    """
+
+    __tablename__ = "ticker_stats"
+
+    ticker: Mapped[str] = mapped_column(
+        String, ForeignKey("ticker.symbol", ondelete="CASCADE"), primary_key=True
+    )
+    total_mentions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sentiment_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    sentiment_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_mention_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Mentions published in the trailing 24h as of the last refresh
+    recent_mentions_24h: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Part of the counters above contributed by comments moved to cold
+    # storage (app.services.comment_archive); reconciliation adds it back
+    archived_mentions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    archived_sentiment_sum: Mapped[float] = mapped_column(
+        Float, nullable=False, default=0.0
+    )
+    archived_sentiment_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    archived_last_mention_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+
+    @property
+    def avg_sentiment(self) -> float | None:
+        if not self.sentiment_count:
+            return None
+        return self.sentiment_sum / self.sentiment_count
+
+    @hybrid_property
+    def live_mentions(self) -> int:
+        """Mentions still stored in the database, i.e. not yet archived."""
+        return self.total_mentions - self.archived_mentions
+
+
+class TickerAuthorSketch(Base):
+    """Distinct authors mentioning a ticker in one UTC hour, as HyperLogLog sketches.
+
+    Sketches merge into any window (see app.repos.author_sketch_repo), so
+    unique-user counts never rescan the links. The sentiment sketches hold
+    authors with at least one comment of that class in the hour.
+    """
+
+    __tablename__ = "ticker_author_sketch"
+
+    ticker: Mapped[str] = mapped_column(
+        String, ForeignKey("ticker.symbol", ondelete="CASCADE"), primary_key=True
+    )
+    hour: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    authors: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    positive_authors: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    negative_authors: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    neutral_authors: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+
+
+class HomepageSnapshot(Base):
+    """Precomputed homepage dataset, rebuilt after each scrape/sentiment run."""
+
+    __tablename__ = "homepage_snapshot"
+
+    id: Mapped[int] = mapped_column(
+        BigIntegerCompat, primary_key=True, autoincrement=True
+    )
+    # Payload layout version; readers ignore snapshots of another version
+    schema_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONBCompat, nullable=False)
+    built_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+
+
 # Indexes for performance
 Index("article_published_at_idx", Article.published_at.desc())
-Index("article_ticker_ticker_idx", ArticleTicker.ticker)
+Index(
+    "article_ticker_ticker_published_idx",
+    ArticleTicker.ticker,
+    ArticleTicker.published_at.desc(),
+    postgresql_include=["sentiment"],
+)
 # Ticker indexes
 Index("ticker_exchange_idx", Ticker.exchange)
 Index("ticker_is_sp500_idx", Ticker.is_sp500)
@@ -646,11 +865,23 @@ Index("ticker_cik_idx", Ticker.cik)
 Index("article_reddit_id_idx", Article.reddit_id)
 Index("article_subreddit_idx", Article.subreddit)
 Index("article_upvotes_idx", Article.upvotes.desc())
+Index("article_author_id_idx", Article.author_id)
 # RedditThread indexes
 Index("reddit_thread_subreddit_idx", RedditThread.subreddit)
 Index("reddit_thread_type_idx", RedditThread.thread_type)
 Index("reddit_thread_last_scraped_idx", RedditThread.last_scraped_at.desc())
 Index("reddit_thread_created_idx", RedditThread.created_at.desc())
+# Ticker stats indexes (browse sort orders)
+Index(
+    "ticker_stats_recent_idx",
+    TickerStats.recent_mentions_24h.desc(),
+    TickerStats.ticker,
+)
+Index(
+    "ticker_stats_total_idx",
+    TickerStats.total_mentions.desc(),
+    TickerStats.ticker,
+)
 # Stock price indexes
 Index("stock_price_updated_at_idx", StockPrice.updated_at.desc())
 Index(
@@ -0,0 +1,157 @@
+"""Monthly range partitions of the article tables (PostgreSQL).
+
+On PostgreSQL ``article`` and ``article_ticker`` are partitioned by
+``published_at``, one partition per calendar month (UTC) plus a DEFAULT
+partition for rows outside every month range. Time-bounded reads then scan
+only the months they overlap. Partitions are created ahead of time by the
+``maintain_article_partitions`` job; other dialects are left unpartitioned.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+
+from sqlalchemy import Connection, text
+
+logger = logging.getLogger(__name__)
+
+# Parents before children: article_ticker references article
+PARTITIONED_TABLES = ("article", "article_ticker")
+
+# Months created ahead of the current one, so inserts never fall through to
+# the DEFAULT partition between job runs
+DEFAULT_MONTHS_AHEAD = 3
+
+
+def month_floor(value: date | datetime) -> date:
+    """First day of the month containing ``value`` (aware datetimes in UTC)."""
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """The first day of the month ``months`` after ``month``."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_range(start: date | datetime, end: date | datetime) -> list[date]:
+    """Every month from ``start``'s through ``end``'s, inclusive."""
+    month, last = month_floor(start), month_floor(end)
+    months = []
+    while month <= last:
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+@dataclass(frozen=True)
+class MonthPartition:
+    """One month of a partitioned table: ``[month, next month)`` in UTC."""
+
+    table: str
+    month: date
+
+    @property
+    def name(self) -> str:
+        return f"{self.table}_y{self.month.year}m{self.month.month:02d}"
+
+    @property
+    def lower(self) -> datetime:
+        return datetime.combine(self.month, datetime.min.time(), tzinfo=UTC)
+
+    @property
+    def upper(self) -> datetime:
+        return datetime.combine(
+            add_months(self.month, 1), datetime.min.time(), tzinfo=UTC
+        )
+
+    def create_sql(self) -> str:
+        """DDL creating this month as a partition of ``table``."""
+        return (
+            f"CREATE TABLE IF NOT EXISTS {self.name} "
+            f"PARTITION OF {self.table} "
+            f"FOR VALUES FROM ('{self.lower.isoformat()}') "
+            f"TO ('{self.upper.isoformat()}')"
+        )
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def existing_partitions(conn: Connection, table: str) -> set[str]:
+    """Names of the partitions currently attached to ``table``."""
+    rows = conn.execute(
+        text(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(:table)
+            """
+        ),
+        {"table": table},
+    )
+    return {row[0] for row in rows}
+
+
+def ensure_partitions(
+    conn: Connection,
+    months: Iterable[date],
+    tables: Sequence[str] = PARTITIONED_TABLES,
+) -> list[str]:
+    """Create the missing month partitions of ``tables``.
+
+    A month whose rows already sit in the DEFAULT partition is skipped with a
+    warning: PostgreSQL refuses to attach a range the DEFAULT partition holds
+    rows for, and moving them is a manual, supervised step.
+
+    Returns:
+        Names of the partitions created
+    """
+    if conn.dialect.name != "postgresql":
+        return []
+    months = sorted(set(months))
+    created = []
+    for table in tables:
+        existing = existing_partitions(conn, table)
+        default = default_partition_name(table)
+        for month in months:
+            partition = MonthPartition(table, month)
+            if partition.name in existing:
+                continue
+            if (
+                default in existing
+                and conn.execute(
+                    text(
+                        f"""
+                    SELECT EXISTS (
+                        SELECT 1 FROM {default}
+                        WHERE published_at >= :lower AND published_at < :upper
+                    )
+                    """
+                    ),
+                    {"lower": partition.lower, "upper": partition.upper},
+                ).scalar()
+            ):
+                logger.warning(
+                    "partition_blocked_by_default_rows",
+                    extra={"partition": partition.name, "default": default},
+                )
+                continue
+            conn.execute(text(partition.create_sql()))
+            created.append(partition.name)
+    return created
+
+
+def upcoming_months(
+    today: date | None = None, months_ahead: int = DEFAULT_MONTHS_AHEAD
+) -> list[date]:
+    """The current month and the next ``months_ahead`` months."""
+    current = month_floor(today or datetime.now(UTC))
+    return [add_months(current, n) for n in range(months_ahead + 1)]
@@ -1,6 +1,7 @@
 """FastAPI application with server-rendered templates."""
 
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
@@ -9,22 +10,48 @@ from fastapi.templating import Jinja2Templates
 
 from app.api.routes import auth, email, users
 from app.config import settings
+from app.db.events import install_session_hooks
+from app.services.auth_service import get_optional_session_user
+from app.services.homepage_snapshot import get_homepage_data
 from app.services.mention_stats import get_mention_stats_service
 from app.services.rate_limit import rate_limit
 
 # Removed get_sentiment_service_hybrid - main app only needs label conversion, not analysis
 from app.services.sentiment_analytics import get_sentiment_analytics_service
+from app.services.session_cache import SessionUser
 from app.services.stock_data import stock_service
 from app.services.stock_price_cache import ensure_fresh_stock_price
+from app.services.ticker_overview import get_ticker_overview
+from app.services.ticker_search import ticker_search_cache
 from app.services.velocity import get_velocity_service
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """Install session hooks and warm the ticker typeahead index."""
+    from app.db.session import SessionLocal
+
+    install_session_hooks()
+
+    try:
+        db = SessionLocal()
+        try:
+            ticker_search_cache.get_index(db)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.warning("ticker_search_index_warm_failed", extra={"error": str(e)})
+    yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title="AlexStocks",
     description="Lean MVP for market news analytics",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Include routers
@@ -335,7 +362,7 @@ async def get_ticker_sentiment_timeline(
     Args:
         ticker: Ticker symbol
         period: Time period - "day" (hourly, 24h), "week" (daily, 7d), or "month" (daily, 30d)
-        metric: Metric type - "comments" (count all comments) or "users" (count unique users)
+        metric: Metric type - "comments" (count all comments) or "users" (estimated unique users)
 
     Returns:
         Timeline data with positive, negative, neutral, and total counts per time bucket
@@ -344,32 +371,37 @@ async def get_ticker_sentiment_timeline(
 
     from sqlalchemy import case, func
 
-    from app.db.models import Article, ArticleTicker
+    from app.db.models import ArticleTicker
     from app.db.session import SessionLocal
+    from app.repos.author_sketch_repo import (
+        NEGATIVE_THRESHOLD,
+        POSITIVE_THRESHOLD,
+        AuthorSketchRepository,
+    )
 
     try:
         db = SessionLocal()
         try:
             # Define sentiment thresholds
-            positive_threshold = 0.05
-            negative_threshold = -0.05
+            positive_threshold = POSITIVE_THRESHOLD
+            negative_threshold = NEGATIVE_THRESHOLD
 
             # Determine time range and grouping
             if period == "day":
                 hours_back = 24
                 cutoff_date = datetime.now(UTC) - timedelta(hours=hours_back)
                 # Group by hour
-                time_bucket = func.date_trunc("hour", Article.published_at)
+                time_bucket = func.date_trunc("hour", ArticleTicker.published_at)
             elif period == "week":
                 days_back = 7
                 cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
                 # Group by day
-                time_bucket = func.date(Article.published_at)
+                time_bucket = func.date(ArticleTicker.published_at)
             else:  # month
                 days_back = 30
                 cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
                 # Group by day
-                time_bucket = func.date(Article.published_at)
+                time_bucket = func.date(ArticleTicker.published_at)
 
             # Query based on metric type
             if metric == "comments":
@@ -378,28 +410,33 @@ async def get_ticker_sentiment_timeline(
                     db.query(
                         time_bucket.label("time_bucket"),
                         func.sum(
-                            case((Article.sentiment >= positive_threshold, 1), else_=0)
+                            case(
+                                (ArticleTicker.sentiment >= positive_threshold, 1),
+                                else_=0,
+                            )
                         ).label("positive"),
                         func.sum(
-                            case((Article.sentiment <= negative_threshold, 1), else_=0)
+                            case(
+                                (ArticleTicker.sentiment <= negative_threshold, 1),
+                                else_=0,
+                            )
                         ).label("negative"),
                         func.sum(
                             case(
                                 (
-                                    (Article.sentiment > negative_threshold)
-                                    & (Article.sentiment < positive_threshold),
+                                    (ArticleTicker.sentiment > negative_threshold)
+                                    & (ArticleTicker.sentiment < positive_threshold),
                                     1,
                                 ),
                                 else_=0,
                             )
                         ).label("neutral"),
-                        func.count(Article.id).label("total"),
+                        func.count(ArticleTicker.article_id).label("total"),
                     )
-                    .join(ArticleTicker, Article.id == ArticleTicker.article_id)
                     .filter(
                         ArticleTicker.ticker == ticker.upper(),
-                        Article.published_at >= cutoff_date,
-                        Article.sentiment.isnot(None),
+                        ArticleTicker.published_at >= cutoff_date,
+                        ArticleTicker.sentiment.isnot(None),
                     )
                     .group_by(time_bucket)
                     .order_by(time_bucket)
@@ -416,60 +453,23 @@ async def get_ticker_sentiment_timeline(
                         "total": int(row.total or 0),
                     }
             else:  # metric == "users"
-                # Get all articles with time bucket and author
-                # We'll process in Python to get latest sentiment per user per bucket
-                articles_data = (
-                    db.query(
-                        time_bucket.label("time_bucket"),
-                        Article.author,
-                        Article.sentiment,
-                        Article.published_at,
-                    )
-                    .join(ArticleTicker, Article.id == ArticleTicker.article_id)
-                    .filter(
-                        ArticleTicker.ticker == ticker.upper(),
-                        Article.published_at >= cutoff_date,
-                        Article.sentiment.isnot(None),
-                        Article.author.isnot(None),
-                        Article.author != "",
-                    )
-                    .order_by(time_bucket, Article.published_at.desc())
-                    .all()
-                )
-
-                # Group by time bucket and author, keeping only latest sentiment
-                from collections import defaultdict
-                from typing import Any
-
-                user_latest_sentiment: defaultdict[Any, dict[str, float]] = defaultdict(
-                    dict
+                # Distinct authors per bucket from the hourly author sketches;
+                # an author with comments of several classes counts in each
+                timeline = AuthorSketchRepository(db).author_timeline(
+                    ticker.upper(),
+                    cutoff_date,
+                    datetime.now(UTC),
+                    bucket="hour" if period == "day" else "day",
                 )
-
-                for row in articles_data:
-                    bucket = row.time_bucket
-                    author = row.author
-                    # Only keep the first (latest) sentiment for each user in each bucket
-                    if author not in user_latest_sentiment[bucket]:
-                        user_latest_sentiment[bucket][author] = row.sentiment
-
-                # Count sentiment categories per time bucket
-                data_by_time = {}
-                for bucket, users in user_latest_sentiment.items():
-                    positive = sum(1 for s in users.values() if s >= positive_threshold)
-                    negative = sum(1 for s in users.values() if s <= negative_threshold)
-                    neutral = sum(
-                        1
-                        for s in users.values()
-                        if negative_threshold < s < positive_threshold
-                    )
-                    total = len(users)
-
-                    data_by_time[bucket] = {
-                        "positive": positive,
-                        "negative": negative,
-                        "neutral": neutral,
-                        "total": total,
+                data_by_time = {
+                    bucket: {
+                        "positive": counts.positive,
+                        "negative": counts.negative,
+                        "neutral": counts.neutral,
+                        "total": counts.total,
                     }
+                    for bucket, counts in timeline.items()
+                }
 
             # Fill missing time buckets with zeros for continuous display
             result_data = []
@@ -575,13 +575,19 @@ async def get_ticker_articles(
     ticker: str,
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=settings.MAX_LIMIT_ARTICLES),
+    cursor: str | None = Query(None, max_length=200),
+    include_total: bool = Query(True),
     _: None = Depends(rate_limit("ticker_articles", requests=60, window_seconds=60)),
 ):
-    """Get paginated articles for a specific ticker."""
-    from sqlalchemy import desc, func
+    """Get paginated articles for a specific ticker.
 
-    from app.db.models import Article, ArticleTicker, Ticker
+    Pass ``pagination.next_cursor`` back as ``cursor`` to page by keyset at
+    constant cost; ``page`` remains for compatibility and is offset-based.
+    ``total`` comes from the ticker's maintained counter, not a COUNT.
+    """
+    from app.db.models import Ticker
     from app.db.session import SessionLocal
+    from app.repos.article_feed_repo import ArticleFeedRepository, FeedCursor
 
     try:
         db = SessionLocal()
@@ -595,38 +601,47 @@ async def get_ticker_articles(
                     status_code=404, content={"error": f"Ticker {ticker} not found"}
                 )
 
-            # Get total article count
-            total_count = (
-                db.query(func.count(ArticleTicker.article_id))
-                .filter(ArticleTicker.ticker == ticker.upper())
-                .scalar()
-                or 0
-            )
-
-            # Calculate pagination with server-side clamps and offset guard
             limit = min(limit, settings.MAX_LIMIT_ARTICLES)
-            offset = (page - 1) * limit
-            if offset > settings.MAX_OFFSET_ITEMS:
-                return JSONResponse(
-                    status_code=400,
-                    content={
-                        "error": "Offset too large",
-                        "message": "Requested page exceeds maximum offset.",
-                    },
-                )
-            total_pages = (total_count + limit - 1) // limit
-
-            # Get paginated articles
-            articles_query = (
-                db.query(Article, ArticleTicker.confidence, ArticleTicker.matched_terms)
-                .join(ArticleTicker, Article.id == ArticleTicker.article_id)
-                .filter(ArticleTicker.ticker == ticker.upper())
-                .order_by(desc(Article.published_at))
-                .offset(offset)
-                .limit(limit)
+            after = None
+            offset = 0
+            if cursor:
+                try:
+                    after = FeedCursor.decode(cursor)
+                except ValueError:
+                    return JSONResponse(
+                        status_code=400,
+                        content={
+                            "error": "Invalid cursor",
+                            "message": "Use a next_cursor value returned by this API.",
+                        },
+                    )
+            else:
+                # Page-number compatibility with the offset guard
+                offset = (page - 1) * limit
+                if offset > settings.MAX_OFFSET_ITEMS:
+                    return JSONResponse(
+                        status_code=400,
+                        content={
+                            "error": "Offset too large",
+                            "message": "Requested page exceeds maximum offset; "
+                            "paginate with cursor instead.",
+                        },
+                    )
+
+            feed_repo = ArticleFeedRepository(db)
+            feed = feed_repo.fetch_page(
+                feed_repo.ticker_feed_query(ticker.upper()),
+                limit,
+                after=after,
+                offset=offset,
             )
+            articles_with_confidence = feed.rows
 
-            articles_with_confidence = articles_query.all()
+            total_count = None
+            total_pages = None
+            if include_total:
+                total_count = feed_repo.ticker_total(ticker.upper())
+                total_pages = (total_count + limit - 1) // limit
 
             # Format articles
             articles = []
@@ -672,8 +687,10 @@ async def get_ticker_articles(
                     "limit": limit,
                     "total": total_count,
                     "total_pages": total_pages,
-                    "has_next": page < total_pages,
-                    "has_prev": page > 1,
+                    "total_is_estimate": include_total,
+                    "has_next": feed.has_next,
+                    "has_prev": page > 1 or after is not None,
+                    "next_cursor": feed.next_cursor,
                 },
             }
         finally:
@@ -683,15 +700,50 @@ async def get_ticker_articles(
         return JSONResponse(status_code=500, content={"error": "Internal server error"})
 
 
+@app.get("/api/ticker/{ticker}/overview")
+async def get_ticker_overview_api(
+    ticker: str,
+    _: None = Depends(rate_limit("ticker_overview", requests=60, window_seconds=60)),
+):
+    """Header metrics for a ticker: counts, unique authors, price and history."""
+    from app.db.session import SessionLocal
+
+    try:
+        db = SessionLocal()
+        try:
+            await ensure_fresh_stock_price(
+                db,
+                ticker.upper(),
+                freshness_minutes=settings.STOCK_PRICE_FRESHNESS_MINUTES,
+                stale_while_revalidate=settings.STOCK_PRICE_STALE_WHILE_REVALIDATE,
+            )
+            overview = get_ticker_overview(db, ticker)
+            if overview is None:
+                return JSONResponse(
+                    status_code=404, content={"error": f"Ticker {ticker} not found"}
+                )
+            return overview.to_dict()
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"Error in ticker overview API: {e}")
+        return JSONResponse(status_code=500, content={"error": "Internal server error"})
+
+
 @app.get("/api/stock/{symbol}/chart")
 async def get_stock_chart_data(symbol: str, period: str = "1mo"):
-    """Get historical stock data for charting from database, combined with current price."""
-    from datetime import datetime, timedelta
+    """Get historical stock data for charting from database, combined with current price.
+
+    Long periods are served from the daily/weekly rollup tiers so the response
+    stays within a bounded number of points.
+    """
+    from datetime import UTC, datetime, timedelta
 
-    from sqlalchemy import desc
+    from sqlalchemy import select
 
-    from app.db.models import StockPrice, StockPriceHistory
+    from app.db.models import StockPrice
     from app.db.session import SessionLocal
+    from app.repos.stock_price_repo import StockPriceRepository, pick_resolution
 
     try:
         db = SessionLocal()
@@ -709,39 +761,35 @@ async def get_stock_chart_data(symbol: str, period: str = "1mo"):
             }
             days = period_days.get(period, 30)
 
-            # Get historical data from database
-            cutoff_date = datetime.now() - timedelta(days=days)
-            historical_data = (
-                db.query(StockPriceHistory)
-                .filter(
-                    StockPriceHistory.symbol == symbol.upper(),
-                    StockPriceHistory.date >= cutoff_date,
-                )
-                .order_by(desc(StockPriceHistory.date))
-                .all()
+            # Get historical data from the tier matching the requested span
+            now = datetime.now(UTC)
+            span = timedelta(days=days)
+            resolution = pick_resolution(span)
+            historical_data = StockPriceRepository(db).get_ohlcv(
+                symbol.upper(), now - span, now, resolution
             )
 
             # Get current price data
-            current_price = (
-                db.query(StockPrice).filter(StockPrice.symbol == symbol.upper()).first()
-            )
+            current_price = db.execute(
+                select(StockPrice.price, StockPrice.updated_at).where(
+                    StockPrice.symbol == symbol.upper()
+                )
+            ).first()
 
             if historical_data:
-                chart_points = []
-                for point in reversed(
-                    historical_data
-                ):  # Reverse to get chronological order
-                    chart_points.append(
-                        {
-                            "date": point.date.strftime("%Y-%m-%d"),
-                            "price": point.close_price,
-                            "volume": point.volume or 0,
-                        }
-                    )
+                # Bars are already in chronological order
+                chart_points = [
+                    {
+                        "date": point["date"].strftime("%Y-%m-%d"),
+                        "price": point["close_price"],
+                        "volume": point["volume"] or 0,
+                    }
+                    for point in historical_data
+                ]
 
                 # Add current price as latest point if available and more recent
                 if current_price and current_price.updated_at:
-                    latest_historical_date = historical_data[0].date.date()
+                    latest_historical_date = historical_data[-1]["date"].date()
                     today = datetime.now().date()
 
                     if today >= latest_historical_date:
@@ -764,6 +812,7 @@ async def get_stock_chart_data(symbol: str, period: str = "1mo"):
                 chart_data = {
                     "symbol": symbol.upper(),
                     "period": period,
+                    "resolution": resolution,
                     "data": chart_points,
                     "meta": {"symbol": symbol.upper(), "source": "database+current"},
                 }
@@ -836,14 +885,18 @@ async def get_stock_history(
         end_date: Optional end date in YYYY-MM-DD format. Only used if period is not provided.
 
     Returns:
-        JSON response with historical price data including open, high, low, close, volume
+        JSON response with historical price data including open, high, low, close, volume,
+        and the tier the bars were read from ("raw", "1d" or "1w")
     """
     from datetime import UTC, datetime, timedelta
 
-    from sqlalchemy import desc
-
-    from app.db.models import StockPriceHistory, Ticker
+    from app.db.models import Ticker
     from app.db.session import SessionLocal
+    from app.repos.stock_price_repo import (
+        RAW_RESOLUTION,
+        StockPriceRepository,
+        pick_resolution,
+    )
 
     try:
         db = SessionLocal()
@@ -929,18 +982,19 @@ async def get_stock_history(
                         },
                     )
 
-            # Query historical data
-            query = (
-                db.query(StockPriceHistory)
-                .filter(
-                    StockPriceHistory.symbol == symbol_upper,
-                    StockPriceHistory.date >= start_dt,
-                    StockPriceHistory.date <= end_dt,
-                )
-                .order_by(desc(StockPriceHistory.date))
-            )
+            # Pick the tier: hourly bars for a single day, daily bars for
+            # week/month (to match sentiment timeline granularity), otherwise the
+            # finest tier that keeps the response bounded
+            if period == "day":
+                resolution = RAW_RESOLUTION
+            elif period:
+                resolution = "1d"
+            else:
+                resolution = pick_resolution(end_dt - start_dt)
 
-            historical_data = query.all()
+            historical_data = StockPriceRepository(db).get_ohlcv(
+                symbol_upper, start_dt, end_dt, resolution
+            )
 
             # If no historical data, return empty array instead of 404
             # This allows frontend to display sentiment data even without price data
@@ -964,47 +1018,31 @@ async def get_stock_history(
 
                 return response_data
 
-            # Aggregate to daily for week/month periods (to match sentiment timeline granularity)
-            if period in ("week", "month"):
-                # Group by date and keep only the last (most recent) price for each day
-                from collections import OrderedDict
-
-                daily_data = OrderedDict()
-                # historical_data is already in descending order (newest first)
-                for point in historical_data:
-                    date_key = point.date.strftime("%Y-%m-%d")
-                    # Keep first occurrence (latest time) for each date
-                    if date_key not in daily_data:
-                        daily_data[date_key] = point
-
-                # Convert back to list, maintaining descending order
-                historical_data = list(daily_data.values())
-
-            # Format response data - reverse to chronological (oldest to newest)
+            # Format response data - bars are chronological (oldest to newest)
             price_data = []
-            for point in reversed(historical_data):
-                # For day period (hourly data), include time; for week/month, date only
+            for point in historical_data:
+                # For day period (hourly data), include time; otherwise date only
                 if period == "day":
                     # Include hour for intraday alignment with sentiment timeline
-                    date_str = point.date.isoformat()
+                    date_str = point["date"].isoformat()
                 else:
-                    # Daily data - just the date
-                    date_str = point.date.strftime("%Y-%m-%d")
+                    date_str = point["date"].strftime("%Y-%m-%d")
 
                 price_data.append(
                     {
                         "date": date_str,
-                        "open": point.open_price,
-                        "high": point.high_price,
-                        "low": point.low_price,
-                        "close": point.close_price,
-                        "volume": point.volume,
+                        "open": point["open_price"],
+                        "high": point["high_price"],
+                        "low": point["low_price"],
+                        "close": point["close_price"],
+                        "volume": point["volume"],
                     }
                 )
 
             response_data = {
                 "symbol": symbol_upper,
                 "count": len(price_data),
+                "resolution": resolution,
                 "data": price_data,
             }
 
@@ -1029,236 +1067,42 @@ async def get_stock_history(
 
 
 @app.get("/", response_class=HTMLResponse)
-async def home(request: Request, page: int = 1) -> HTMLResponse:
-    """Home page with ticker grid showing top 50 most discussed tickers in last 24h."""
-    from datetime import datetime, timedelta
-
-    from sqlalchemy import and_, func, or_
+async def home(
+    request: Request,
+    page: int = 1,
+    user: SessionUser | None = Depends(get_optional_session_user),
+) -> HTMLResponse:
+    """Home page with ticker grid showing top 50 most discussed tickers in last 24h.
 
-    from app.db.models import Article, ArticleTicker, StockPrice, Ticker
+    Everything but the user's follows comes from the precomputed homepage
+    snapshot (see app.services.homepage_snapshot), or is computed live when
+    the snapshot is missing or stale.
+    """
     from app.db.session import SessionLocal
 
     db = SessionLocal()
     try:
-        # Calculate 24 hours ago
-        twenty_four_hours_ago = datetime.utcnow() - timedelta(hours=24)
-
-        # Get tickers with article counts from last 24h, average sentiment, and stock prices
-        # First, get the top 50 most discussed tickers in last 24h
-        top_tickers_subquery = (
-            db.query(
-                ArticleTicker.ticker,
-                func.count(ArticleTicker.article_id).label("recent_article_count"),
-            )
-            .join(Article, ArticleTicker.article_id == Article.id)
-            .join(Ticker, Ticker.symbol == ArticleTicker.ticker)
-            .filter(
-                Article.published_at >= twenty_four_hours_ago,
-                or_(Ticker.name.is_(None), ~Ticker.name.ilike("%ETF%")),
-            )
-            .group_by(ArticleTicker.ticker)
-            .order_by(func.count(ArticleTicker.article_id).desc())
-            .limit(50)
-            .subquery()
-        )
-
-        # Now get full data for these top tickers
-        tickers_query = (
-            db.query(
-                Ticker.symbol,
-                Ticker.name,
-                func.count(ArticleTicker.article_id).label("article_count"),
-                func.avg(Article.sentiment).label("avg_sentiment"),
-                top_tickers_subquery.c.recent_article_count,
-                StockPrice.price,
-                StockPrice.previous_close,
-                StockPrice.change,
-                StockPrice.change_percent,
-                StockPrice.market_state,
-                StockPrice.currency,
-                StockPrice.exchange,
-                StockPrice.updated_at,
-            )
-            .join(top_tickers_subquery, Ticker.symbol == top_tickers_subquery.c.ticker)
-            .outerjoin(
-                ArticleTicker,
-                and_(
-                    Ticker.symbol == ArticleTicker.ticker,
-                    ArticleTicker.article_id.in_(
-                        db.query(Article.id).filter(
-                            Article.published_at >= twenty_four_hours_ago
-                        )
-                    ),
-                ),
-            )
-            .outerjoin(Article, ArticleTicker.article_id == Article.id)
-            .outerjoin(StockPrice, Ticker.symbol == StockPrice.symbol)
-            .group_by(
-                Ticker.symbol,
-                Ticker.name,
-                top_tickers_subquery.c.recent_article_count,
-                StockPrice.price,
-                StockPrice.previous_close,
-                StockPrice.change,
-                StockPrice.change_percent,
-                StockPrice.market_state,
-                StockPrice.currency,
-                StockPrice.exchange,
-                StockPrice.updated_at,
-            )
-            .order_by(top_tickers_subquery.c.recent_article_count.desc(), Ticker.symbol)
-        )
-
-        # Get velocity service for calculating velocity data
-        velocity_service = get_velocity_service(db)
-
-        # Get sentiment analytics service for overall sentiment (24h)
-        sentiment_analytics = get_sentiment_analytics_service()
-        overall_sentiment_data = sentiment_analytics.get_sentiment_distribution_data(
-            db, days=1
-        )
-        overall_lean = sentiment_analytics.get_sentiment_lean_data(db, days=1)
-
-        # Execute the query once and collect all data
-        ticker_rows = tickers_query.all()
-
-        # Extract symbols for lean map computation
-        top_symbols = [row[0] for row in ticker_rows]
-        lean_map = sentiment_analytics.get_ticker_lean_map(db, top_symbols, days=1)
-
-        tickers = []
-        default_mention_symbols: list[str] = []
-        for row in ticker_rows:
-            (
-                symbol,
-                name,
-                article_count,
-                avg_sentiment,
-                recent_article_count,
-                price,
-                previous_close,
-                change,
-                change_percent,
-                market_state,
-                currency,
-                exchange,
-                updated_at,
-            ) = row
-
-            # Skip ETFs from the homepage display to focus on individual equities
-            if name and "ETF" in name.upper():
-                continue
-
-            # Calculate velocity for this ticker
-            velocity_data = velocity_service.calculate_velocity(symbol)
-
-            # Build stock data from DB
-            stock_data = None
-            if price is not None:
-                stock_data = {
-                    "symbol": symbol,
-                    "price": price,
-                    "previous_close": previous_close,
-                    "change": change,
-                    "change_percent": change_percent,
-                    "market_state": market_state,
-                    "currency": currency,
-                    "exchange": exchange,
-                    "last_updated": updated_at.isoformat() if updated_at else None,
-                }
-
-            ticker_dict = {
-                "symbol": symbol,
-                "name": name,
-                "article_count": recent_article_count,  # Use 24h count for display
-                "avg_sentiment": avg_sentiment,
-                "velocity": velocity_data,
-                "stock_data": stock_data,
-                "sentiment_lean": lean_map.get(symbol, None),
-            }
-            tickers.append(ticker_dict)
-            if len(default_mention_symbols) < 7:
-                default_mention_symbols.append(symbol)
-
-        mention_surge_tickers: list[dict] = []
-        positive_mention_surge_tickers: list[dict] = []
-        negative_mention_surge_tickers: list[dict] = []
-        mention_candidates = [
-            t
-            for t in tickers
-            if t.get("velocity") and t["velocity"].get("velocity_score") is not None
-        ]
-        if mention_candidates:
-            mention_surge_tickers = sorted(
-                mention_candidates,
-                key=lambda t: t["velocity"].get("velocity_score", 0),
-                reverse=True,
-            )[:5]
-            positive_mention_surge_tickers = sorted(
-                [
-                    t
-                    for t in mention_candidates
-                    if t.get("avg_sentiment") is not None and t["avg_sentiment"] > 0
-                ],
-                key=lambda t: t.get("avg_sentiment", float("-inf")),
-                reverse=True,
-            )[:5]
-            negative_mention_surge_tickers = sorted(
-                [
-                    t
-                    for t in mention_candidates
-                    if t.get("avg_sentiment") is not None and t["avg_sentiment"] < 0
-                ],
-                key=lambda t: t.get("avg_sentiment", float("inf")),
-            )[:5]
-
-        # Get scraping status
-        from app.db.models import ScrapingStatus
-
-        scraping_status = (
-            db.query(ScrapingStatus).filter(ScrapingStatus.source == "reddit").first()
-        )
-
-        scraping_info = None
-        if scraping_status:
-            scraping_info = {
-                "last_scrape_at": scraping_status.last_scrape_at.isoformat(),
-                "items_scraped": scraping_status.items_scraped,
-                "status": scraping_status.status,
-            }
+        homepage_data = get_homepage_data(db)
 
         # Get user's followed tickers if authenticated
         followed_tickers: list[str] = []
-        session_token = request.cookies.get("session_token")
-        if session_token:
+        if user:
             try:
-                from app.services.auth_service import get_auth_service
-
-                auth_service = get_auth_service()
-                user = auth_service.get_current_user(db, session_token)
-                if user:
-                    from app.repos.user_repo import UserRepository
+                from app.repos.user_repo import UserRepository
 
-                    repo = UserRepository(db)
-                    follows = repo.get_ticker_follows(user.id)
-                    followed_tickers = [f.ticker for f in follows]
+                repo = UserRepository(db)
+                follows = repo.get_ticker_follows(user.id)
+                followed_tickers = [f.ticker for f in follows]
             except Exception:
-                # If auth fails, just continue without followed tickers
+                # If the lookup fails, just continue without followed tickers
                 pass
 
         return templates.TemplateResponse(
             "home.html",
             {
                 "request": request,
-                "tickers": tickers,
-                "sentiment_histogram": overall_sentiment_data,
-                "overall_lean": overall_lean,
-                "scraping_status": scraping_info,
-                "default_mention_symbols": default_mention_symbols,
+                **homepage_data,
                 "followed_tickers": followed_tickers,
-                "mention_surge_tickers": mention_surge_tickers,
-                "positive_mention_surge_tickers": positive_mention_surge_tickers,
-                "negative_mention_surge_tickers": negative_mention_surge_tickers,
             },
         )
     finally:
@@ -1273,13 +1117,14 @@ async def get_all_tickers(
     sort_by: str = "recent_activity",  # recent_activity, alphabetical, total_articles
     _: None = Depends(rate_limit("tickers_list", requests=60, window_seconds=60)),
 ):
-    """Get paginated list of all tickers with optional search and sorting."""
-    from datetime import datetime, timedelta
+    """Get paginated list of all tickers with optional search and sorting.
 
-    from sqlalchemy import func
-
-    from app.db.models import Article, ArticleTicker, StockPrice, Ticker
+    Counts and average sentiment come from the incrementally maintained
+    ``ticker_stats`` table, so each page is an indexed scan rather than an
+    aggregate over every article.
+    """
     from app.db.session import SessionLocal
+    from app.repos.ticker_stats_repo import TickerStatsRepository
 
     db = SessionLocal()
     try:
@@ -1303,97 +1148,18 @@ async def get_all_tickers(
                 "error": "Requested page exceeds maximum offset.",
             }
 
-        # Base query for tickers
-        base_query = db.query(
-            Ticker.symbol,
-            Ticker.name,
-            func.count(ArticleTicker.article_id).label("total_article_count"),
-            func.avg(Article.sentiment).label("avg_sentiment"),
-            StockPrice.price,
-            StockPrice.previous_close,
-            StockPrice.change,
-            StockPrice.change_percent,
-            StockPrice.market_state,
-            StockPrice.currency,
-            StockPrice.exchange,
-            StockPrice.updated_at,
+        stats_repo = TickerStatsRepository(db)
+        total_count = stats_repo.count(search)
+        paginated_tickers = (
+            stats_repo.browse_query(search, sort_by).offset(offset).limit(limit).all()
         )
 
-        # Add search filter if provided (only search ticker symbols)
-        if search:
-            search_term = f"%{search.upper()}%"
-            base_query = base_query.filter(Ticker.symbol.ilike(search_term))
-
-        # Calculate 24h activity for all queries (for consistent ordering)
-        twenty_four_hours_ago = datetime.utcnow() - timedelta(hours=24)
-        recent_count = (
-            db.query(
-                ArticleTicker.ticker,
-                func.count(ArticleTicker.article_id).label("recent_count"),
-            )
-            .join(Article, ArticleTicker.article_id == Article.id)
-            .filter(Article.published_at >= twenty_four_hours_ago)
-            .group_by(ArticleTicker.ticker)
-            .subquery()
-        )
-
-        # Complete the query with joins and grouping
-        tickers_query = (
-            base_query.add_columns(
-                func.coalesce(recent_count.c.recent_count, 0).label(
-                    "recent_activity_count"
-                )
-            )
-            .outerjoin(ArticleTicker, Ticker.symbol == ArticleTicker.ticker)
-            .outerjoin(Article, ArticleTicker.article_id == Article.id)
-            .outerjoin(StockPrice, Ticker.symbol == StockPrice.symbol)
-            .outerjoin(recent_count, Ticker.symbol == recent_count.c.ticker)
-            .group_by(
-                Ticker.symbol,
-                Ticker.name,
-                StockPrice.price,
-                StockPrice.previous_close,
-                StockPrice.change,
-                StockPrice.change_percent,
-                StockPrice.market_state,
-                StockPrice.currency,
-                StockPrice.exchange,
-                StockPrice.updated_at,
-                recent_count.c.recent_count,
-            )
-        )
-
-        # Apply sorting
-        if sort_by == "recent_activity":
-            tickers_query = tickers_query.order_by(
-                func.coalesce(recent_count.c.recent_count, 0).desc(), Ticker.symbol
-            )
-        elif sort_by == "alphabetical":
-            tickers_query = tickers_query.order_by(Ticker.symbol)
-        elif sort_by == "total_articles":
-            tickers_query = tickers_query.order_by(
-                func.count(ArticleTicker.article_id).desc(), Ticker.symbol
-            )
-
-        # Get total count for pagination
-        total_query = db.query(Ticker.symbol)
-        if search:
-            search_term = f"%{search.upper()}%"
-            total_query = total_query.filter(Ticker.symbol.ilike(search_term))
-        total_count = total_query.count()
-
-        # Apply pagination
-        paginated_tickers = tickers_query.offset(offset).limit(limit).all()
-
         # Format results
         tickers = []
         for row in paginated_tickers:
-            # All queries now have the same structure with recent_activity_count
             (
-                symbol,
+                stats,
                 name,
-                total_article_count,
-                avg_sentiment,
                 price,
                 previous_close,
                 change,
@@ -1402,8 +1168,8 @@ async def get_all_tickers(
                 currency,
                 exchange,
                 updated_at,
-                recent_activity_count,
             ) = row
+            symbol = stats.ticker
 
             # Build stock data from DB
             stock_data = None
@@ -1423,8 +1189,8 @@ async def get_all_tickers(
             ticker_dict = {
                 "symbol": symbol,
                 "name": name,
-                "article_count": total_article_count,
-                "avg_sentiment": avg_sentiment,
+                "article_count": stats.total_mentions,
+                "avg_sentiment": stats.avg_sentiment,
                 "stock_data": stock_data,
             }
             tickers.append(ticker_dict)
@@ -1450,6 +1216,7 @@ async def browse_tickers(
     page: int = 1,
     search: str | None = None,
     sort_by: str = "recent_activity",
+    user: SessionUser | None = Depends(get_optional_session_user),
 ) -> HTMLResponse:
     """Browse all tickers with pagination and search."""
 
@@ -1461,21 +1228,16 @@ async def browse_tickers(
     )
 
     followed_tickers: list[str] = []
-    session_token = request.cookies.get("session_token")
-    if session_token:
+    if user:
         from app.db.session import SessionLocal
 
         db = SessionLocal()
         try:
             from app.repos.user_repo import UserRepository
-            from app.services.auth_service import get_auth_service
 
-            auth_service = get_auth_service()
-            user = auth_service.get_current_user(db, session_token)
-            if user:
-                repo = UserRepository(db)
-                follows = repo.get_ticker_follows(user.id)
-                followed_tickers = [f.ticker for f in follows]
+            repo = UserRepository(db)
+            follows = repo.get_ticker_follows(user.id)
+            followed_tickers = [f.ticker for f in follows]
         except Exception:
             pass
         finally:
@@ -1503,183 +1265,48 @@ async def ticker_page(
     source: str | None = None,
     start: str | None = None,  # YYYY-MM-DD
     end: str | None = None,  # YYYY-MM-DD
+    cursor: str | None = None,
     _: None = Depends(rate_limit("ticker_page", requests=60, window_seconds=60)),
+    user: SessionUser | None = Depends(get_optional_session_user),
 ) -> HTMLResponse:
-    """Ticker detail page with articles."""
-    from datetime import UTC, datetime, timedelta
+    """Ticker detail page with articles.
 
-    from sqlalchemy import desc, func
+    The "Next" link carries a keyset ``cursor`` so paging forward stays cheap
+    at any depth; numbered page links are offset-based.
+    """
+    from datetime import UTC, date, datetime, timedelta
 
-    from app.db.models import (
-        Article,
-        ArticleTicker,
-        StockPrice,
-        StockPriceHistory,
-        Ticker,
-    )
+    from app.db.models import Article, ArticleTicker
     from app.db.session import SessionLocal
+    from app.repos.article_feed_repo import ArticleFeedRepository, FeedCursor
 
     db = SessionLocal()
     try:
-        # Get ticker info
-        ticker_obj = db.query(Ticker).filter(Ticker.symbol == ticker.upper()).first()
-
         # Ensure we have a fresh price cached for this symbol
         await ensure_fresh_stock_price(
             db,
             ticker.upper(),
             freshness_minutes=settings.STOCK_PRICE_FRESHNESS_MINUTES,
+            stale_while_revalidate=settings.STOCK_PRICE_STALE_WHILE_REVALIDATE,
         )
 
-        # Unfiltered total article count for this ticker (for header metrics)
-        unfiltered_total_article_count = (
-            db.query(func.count(ArticleTicker.article_id))
-            .filter(ArticleTicker.ticker == ticker.upper())
-            .scalar()
-            or 0
-        )
-
-        # Get today's article count
-        today = datetime.now().date()
-        today_start = datetime.combine(today, datetime.min.time())
-        today_article_count = (
-            db.query(func.count(ArticleTicker.article_id))
-            .join(Article, ArticleTicker.article_id == Article.id)
-            .filter(
-                ArticleTicker.ticker == ticker.upper(),
-                Article.published_at >= today_start,
-            )
-            .scalar()
-            or 0
-        )
-
-        # Get yesterday's article count for comparison
-        yesterday = today - timedelta(days=1)
-        yesterday_start = datetime.combine(yesterday, datetime.min.time())
-        yesterday_end = datetime.combine(today, datetime.min.time())
-        yesterday_article_count = (
-            db.query(func.count(ArticleTicker.article_id))
-            .join(Article, ArticleTicker.article_id == Article.id)
-            .filter(
-                ArticleTicker.ticker == ticker.upper(),
-                Article.published_at >= yesterday_start,
-                Article.published_at < yesterday_end,
-            )
-            .scalar()
-            or 0
-        )
-
-        # Calculate percentage change from yesterday
-        if yesterday_article_count > 0:
-            article_change_percent = (
-                (today_article_count - yesterday_article_count)
-                / yesterday_article_count
-            ) * 100
-        elif today_article_count > 0:
-            article_change_percent = 100.0  # 100% increase from 0
-        else:
-            article_change_percent = 0.0
-
-        # Get unique users talking about this ticker today
-        unique_users_today = (
-            db.query(func.count(func.distinct(Article.author)))
-            .join(ArticleTicker, Article.id == ArticleTicker.article_id)
-            .filter(
-                ArticleTicker.ticker == ticker.upper(),
-                Article.published_at >= today_start,
-                Article.author.isnot(None),
-                Article.author != "",
-            )
-            .scalar()
-            or 0
-        )
-
-        # Get unique users from yesterday for comparison
-        unique_users_yesterday = (
-            db.query(func.count(func.distinct(Article.author)))
-            .join(ArticleTicker, Article.id == ArticleTicker.article_id)
-            .filter(
-                ArticleTicker.ticker == ticker.upper(),
-                Article.published_at >= yesterday_start,
-                Article.published_at < yesterday_end,
-                Article.author.isnot(None),
-                Article.author != "",
-            )
-            .scalar()
-            or 0
-        )
-
-        # Calculate user change
-        users_change = unique_users_today - unique_users_yesterday
-        if unique_users_yesterday > 0:
-            users_change_percent = (users_change / unique_users_yesterday) * 100
-        elif unique_users_today > 0:
-            users_change_percent = 100.0  # 100% increase from 0
-        else:
-            users_change_percent = 0.0
-
-        # Get stock data from database
-        stock_data = None
-        stock_price = (
-            db.query(
-                StockPrice.symbol,
-                StockPrice.price,
-                StockPrice.previous_close,
-                StockPrice.change,
-                StockPrice.change_percent,
-                StockPrice.market_state,
-                StockPrice.currency,
-                StockPrice.exchange,
-                StockPrice.updated_at,
-            )
-            .filter(StockPrice.symbol == ticker.upper())
-            .first()
-        )
-        if stock_price is not None:
-            stock_data = {
-                "symbol": stock_price.symbol,
-                "price": stock_price.price,
-                "previous_close": stock_price.previous_close,
-                "change": stock_price.change,
-                "change_percent": stock_price.change_percent,
-                "market_state": stock_price.market_state,
-                "currency": stock_price.currency,
-                "exchange": stock_price.exchange,
-                "last_updated": (
-                    stock_price.updated_at.isoformat()
-                    if stock_price.updated_at
-                    else None
-                ),
-            }
+        # Header metrics, price and 30-day history
+        overview = get_ticker_overview(db, ticker)
+        if overview is None:
+            # Ticker doesn't exist - return 404
+            raise HTTPException(status_code=404, detail=f"Ticker {ticker} not found")
+        stock_data = overview.stock_data
 
         # Get chart data combining historical data + current price
         chart_data = None
-        historical_data = (
-            db.query(StockPriceHistory)
-            .filter(StockPriceHistory.symbol == ticker.upper())
-            .order_by(desc(StockPriceHistory.date))
-            .limit(30)
-            .all()
-        )
-
-        if historical_data:
-            chart_points = []
-            for point in reversed(
-                historical_data
-            ):  # Reverse to get chronological order
-                chart_points.append(
-                    {
-                        "date": point.date.strftime("%Y-%m-%d"),
-                        "price": point.close_price,
-                        "volume": point.volume or 0,
-                    }
-                )
+        if overview.price_history:
+            chart_points = list(overview.price_history)
 
             # Add current price as latest point if it's more recent than last historical data
-            if stock_price and stock_price.updated_at:
-                latest_historical_date = historical_data[
-                    0
-                ].date.date()  # Most recent historical date
+            if stock_data and stock_data["last_updated"]:
+                latest_historical_date = date.fromisoformat(
+                    chart_points[-1]["date"]
+                )  # Most recent historical date
                 today = datetime.now().date()
 
                 # If current price is from today and newer than latest historical data
@@ -1695,7 +1322,7 @@ async def ticker_page(
                     chart_points.append(
                         {
                             "date": today.strftime("%Y-%m-%d"),
-                            "price": stock_price.price,
+                            "price": stock_data["price"],
                             "volume": 0,  # Volume not available in current price data
                         }
                     )
@@ -1708,13 +1335,13 @@ async def ticker_page(
             }
         else:
             # No historical data, try to create chart from current price + API fallback
-            if stock_price:
+            if stock_data:
                 # Start with current price point
                 today = datetime.now().date()
                 chart_points = [
                     {
                         "date": today.strftime("%Y-%m-%d"),
-                        "price": stock_price.price,
+                        "price": stock_data["price"],
                         "volume": 0,
                     }
                 ]
@@ -1735,20 +1362,20 @@ async def ticker_page(
                     logger.error(f"Error getting chart data for UI: {e}")
                     chart_data = None
 
-        if not ticker_obj:
-            # Ticker doesn't exist - return 404
-            raise HTTPException(status_code=404, detail=f"Ticker {ticker} not found")
-
         # Pagination settings
         articles_per_page = 50
         offset = (page - 1) * articles_per_page
+        after = None
+        if cursor:
+            try:
+                after = FeedCursor.decode(cursor)
+                offset = 0
+            except ValueError:
+                logger.warning("invalid_feed_cursor", extra={"value": cursor})
 
         # Build filtered base query for this ticker
-        filtered_query_base = (
-            db.query(Article, ArticleTicker.confidence, ArticleTicker.matched_terms)
-            .join(ArticleTicker, Article.id == ArticleTicker.article_id)
-            .filter(ArticleTicker.ticker == ticker.upper())
-        )
+        feed_repo = ArticleFeedRepository(db)
+        filtered_query_base = feed_repo.ticker_feed_query(ticker.upper())
 
         # Apply server-side filters
         # Sentiment thresholds (aligned with analytics)
@@ -1807,26 +1434,30 @@ async def ticker_page(
             except Exception:
                 logger.warning("invalid_end_date", extra={"value": end})
 
-        # Compute filtered count AFTER filters for proper pagination
-        filtered_article_count = filtered_query_base.count()
+        # Totals for page links: the maintained counter when unfiltered,
+        # otherwise the planner's estimate
+        if sentiment or source or start or end:
+            filtered_article_count = feed_repo.estimate_count(filtered_query_base)
+        else:
+            filtered_article_count = feed_repo.ticker_total(ticker.upper())
 
         # Always order newest first, then paginate
-        articles_with_confidence = (
-            filtered_query_base.order_by(Article.published_at.desc())
-            .offset(offset)
-            .limit(articles_per_page)
-            .all()
+        feed = feed_repo.fetch_page(
+            filtered_query_base, articles_per_page, after=after, offset=offset
         )
+        articles_with_confidence = feed.rows
 
         # Calculate pagination info (based on filtered results)
-        total_pages = (
-            filtered_article_count + articles_per_page - 1
-        ) // articles_per_page
+        total_pages = max(
+            (filtered_article_count + articles_per_page - 1) // articles_per_page,
+            page + 1 if feed.has_next else page,
+        )
         pagination = {
             "page": page,
             "total_pages": total_pages,
-            "has_next": page < total_pages,
+            "has_next": feed.has_next,
             "has_prev": page > 1,
+            "next_cursor": feed.next_cursor,
             "total_articles": filtered_article_count,
         }
 
@@ -1890,21 +1521,15 @@ async def ticker_page(
 
         # Get user's followed tickers if authenticated
         is_following = False
-        session_token = request.cookies.get("session_token")
-        if session_token:
+        if user:
             try:
-                from app.services.auth_service import get_auth_service
-
-                auth_service = get_auth_service()
-                user = auth_service.get_current_user(db, session_token)
-                if user:
-                    from app.repos.user_repo import UserRepository
+                from app.repos.user_repo import UserRepository
 
-                    repo = UserRepository(db)
-                    follow = repo.get_ticker_follow(user.id, ticker.upper())
-                    is_following = follow is not None
+                repo = UserRepository(db)
+                follow = repo.get_ticker_follow(user.id, ticker.upper())
+                is_following = follow is not None
             except Exception:
-                # If auth fails, just continue without follow status
+                # If the lookup fails, just continue without follow status
                 pass
 
         return templates.TemplateResponse(
@@ -1912,18 +1537,18 @@ async def ticker_page(
             {
                 "request": request,
                 "ticker": ticker,
-                "ticker_obj": ticker_obj,
+                "ticker_obj": overview,
                 "articles": articles,
                 "stock_data": stock_data,
                 "chart_data": chart_data,
-                "total_article_count": unfiltered_total_article_count,
+                "total_article_count": overview.total_articles,
                 "filtered_article_count": filtered_article_count,
-                "today_article_count": today_article_count,
-                "article_change": today_article_count - yesterday_article_count,
-                "article_change_percent": article_change_percent,
-                "unique_users_today": unique_users_today,
-                "users_change": users_change,
-                "users_change_percent": users_change_percent,
+                "today_article_count": overview.today_articles,
+                "article_change": overview.article_change,
+                "article_change_percent": overview.article_change_percent,
+                "unique_users_today": overview.unique_users_today,
+                "users_change": overview.users_change,
+                "users_change_percent": overview.users_change_percent,
                 "pagination": pagination,
                 "sentiment": sentiment,
                 "source": source,
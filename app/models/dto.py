@@ -244,6 +244,10 @@ class DailyTickerSummaryUpsertDTO:
     llm_sentiment: LLMSentimentCategory | None = None
     llm_model: str | None = None
     llm_version: str | None = None
+    participant_count: int | None = None
+    last_price: float | None = None
+    price_change_percent: float | None = None
+    prompt_hash: str | None = None
 
 
 @dataclass
@@ -267,6 +271,10 @@ class DailyTickerSummaryDTO:
     llm_version: str | None
     created_at: datetime
     updated_at: datetime
+    participant_count: int | None = None
+    last_price: float | None = None
+    price_change_percent: float | None = None
+    prompt_hash: str | None = None
 
 
 @dataclass
@@ -0,0 +1,164 @@
+"""Repository for per-ticker article feeds with keyset pagination."""
+
+from __future__ import annotations
+
+import base64
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import func, literal, select, tuple_
+from sqlalchemy.orm import Query, Session, selectinload
+
+from app.db.models import Article, ArticleTicker, TickerStats
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FeedCursor:
+    """Position after the last article of a page, in feed order.
+
+    Feeds are ordered by ``(published_at, article_id)`` descending; the next
+    page starts strictly after this key, so its cost does not grow with depth.
+    """
+
+    published_at: datetime
+    article_id: int
+
+    def encode(self) -> str:
+        """Opaque URL-safe token for clients to pass back unchanged."""
+        published_at = self.published_at
+        if published_at.tzinfo is None:
+            published_at = published_at.replace(tzinfo=UTC)
+        raw = f"{published_at.isoformat()}|{self.article_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> FeedCursor:
+        """Parse a token from :meth:`encode`.
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+            published_at, article_id = raw.split("|")
+            return cls(datetime.fromisoformat(published_at), int(article_id))
+        except Exception as e:
+            raise ValueError(f"Invalid cursor: {token!r}") from e
+
+
+@dataclass
+class ArticleFeedPage:
+    """One page of feed rows plus the cursor for the page after it."""
+
+    rows: list[Any]
+    next_cursor: str | None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+class ArticleFeedRepository:
+    """Data-access helpers for the articles linked to one ticker."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize the repository with a database session."""
+        self.session = session
+
+    def ticker_feed_query(self, ticker: str) -> Query:
+        """(Article, confidence, matched_terms) rows linked to ``ticker``.
+
+        Feed rows show text previews, so each page's bodies are loaded in one
+        extra SELECT rather than per article.
+        """
+        return (
+            self.session.query(
+                Article, ArticleTicker.confidence, ArticleTicker.matched_terms
+            )
+            .join(ArticleTicker, Article.id == ArticleTicker.article_id)
+            .filter(ArticleTicker.ticker == ticker)
+            .options(selectinload(Article.body))
+        )
+
+    def fetch_page(
+        self,
+        query: Query,
+        limit: int,
+        after: FeedCursor | None = None,
+        offset: int = 0,
+    ) -> ArticleFeedPage:
+        """Return up to ``limit`` rows of ``query`` newest first.
+
+        Pages are addressed by ``after`` (keyset) or, for the page-number API,
+        by ``offset``. One extra row is read to tell whether a next page exists.
+        """
+        if after is not None:
+            query = query.filter(
+                tuple_(Article.published_at, Article.id)
+                < tuple_(
+                    literal(after.published_at, Article.published_at.type),
+                    literal(after.article_id, Article.id.type),
+                )
+            )
+        rows = (
+            query.order_by(Article.published_at.desc(), Article.id.desc())
+            .offset(offset)
+            .limit(limit + 1)
+            .all()
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1][0]
+            next_cursor = FeedCursor(last.published_at, last.id).encode()
+        return ArticleFeedPage(rows=rows, next_cursor=next_cursor)
+
+    def ticker_total(self, ticker: str) -> int:
+        """Number of articles linked to ``ticker``, read from ``ticker_stats``.
+
+        The counter is maintained incrementally and reconciled nightly, so it
+        can briefly lag; tickers without a stats row are counted exactly.
+        Archived comments are excluded since the feed can no longer load them.
+        """
+        total = self.session.scalar(
+            select(TickerStats.live_mentions).where(TickerStats.ticker == ticker)
+        )
+        if total is not None:
+            return total
+        return (
+            self.session.scalar(
+                select(func.count())
+                .select_from(ArticleTicker)
+                .where(ArticleTicker.ticker == ticker)
+            )
+            or 0
+        )
+
+    def estimate_count(self, query: Query) -> int:
+        """Row count of ``query`` from the PostgreSQL planner's estimate.
+
+        Other dialects (and planner failures) fall back to an exact COUNT.
+        """
+        bind = self.session.get_bind()
+        if bind.dialect.name == "postgresql":
+            compiled = query.statement.compile(dialect=bind.dialect)
+            try:
+                # Savepoint so a failed EXPLAIN leaves the transaction usable
+                with self.session.begin_nested():
+                    plan = (
+                        self.session.connection()
+                        .exec_driver_sql(
+                            f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+                        )
+                        .scalar()
+                    )
+                if plan is not None:
+                    return int(plan[0]["Plan"]["Plan Rows"])
+            except Exception as e:
+                logger.warning("feed_count_estimate_failed", extra={"error": str(e)})
+        return query.order_by(None).count()
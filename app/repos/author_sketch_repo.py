@@ -0,0 +1,385 @@
+"""Repository for per-ticker, per-hour distinct-author sketches.
+
+Unique-user counts for any window are read by merging the window's hourly
+:class:`~app.db.models.TickerAuthorSketch` rows, with the error bound of
+:mod:`app.services.hll`. Windows are widened to whole UTC hours. Sketches
+hold integer author ids; authors flagged ``is_bot`` are left out. Days
+archived before ids existed keep sketches of author names (bots and
+"[deleted]" included), so windows reaching them can count an author twice.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, Literal
+
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.db.models import Article, ArticleTicker, Author, TickerAuthorSketch
+from app.services.hll import HyperLogLog, merge_sketches
+
+# Sentiment classes, as on the ticker page timeline
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+
+SKETCH_COLUMNS = ("authors", "positive_authors", "negative_authors", "neutral_authors")
+
+# Rows per executemany batch and keys per IN (...) lookup
+SKETCH_WRITE_CHUNK_SIZE = 500
+ARTICLE_ID_CHUNK_SIZE = 1000
+
+HOUR = timedelta(hours=1)
+
+# {(ticker, hour): {sketch column: author ids}}
+SketchUpdates = dict[tuple[str, datetime], dict[str, set[int]]]
+
+
+@dataclass
+class AuthorCounts:
+    """Distinct authors in one window, overall and per sentiment class."""
+
+    total: int = 0
+    positive: int = 0
+    negative: int = 0
+    neutral: int = 0
+
+
+def hour_floor(value: datetime) -> datetime:
+    """Start of the UTC hour containing ``value`` (naive values are UTC)."""
+    value = value.astimezone(UTC) if value.tzinfo else value.replace(tzinfo=UTC)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def _hour_ceil(value: datetime) -> datetime:
+    floor = hour_floor(value)
+    exact = value.astimezone(UTC) if value.tzinfo else value.replace(tzinfo=UTC)
+    return floor if floor == exact else floor + HOUR
+
+
+def sentiment_column(sentiment: float | None) -> str | None:
+    """Sketch column for an author's comment with ``sentiment``."""
+    if sentiment is None:
+        return None
+    if sentiment >= POSITIVE_THRESHOLD:
+        return "positive_authors"
+    if sentiment <= NEGATIVE_THRESHOLD:
+        return "negative_authors"
+    return "neutral_authors"
+
+
+def _chunks(items: list[Any], size: int) -> Iterable[list[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _add(
+    updates: SketchUpdates,
+    ticker: str,
+    published_at: datetime,
+    author_id: int | None,
+    is_bot: bool | None,
+    sentiment: float | None,
+    include_total: bool = True,
+) -> None:
+    if author_id is None or is_bot:
+        return
+    columns = updates.setdefault((ticker, hour_floor(published_at)), {})
+    if include_total:
+        columns.setdefault("authors", set()).add(author_id)
+    column = sentiment_column(sentiment)
+    if column:
+        columns.setdefault(column, set()).add(author_id)
+
+
+class AuthorSketchRepository:
+    """Data-access helpers for :class:`TickerAuthorSketch`."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize the repository with a database session."""
+        self.session = session
+
+    def _insert(self):
+        if self.session.get_bind().dialect.name == "postgresql":
+            return pg_insert(TickerAuthorSketch)
+        return sqlite_insert(TickerAuthorSketch)
+
+    # Incremental maintenance -------------------------------------------------
+
+    def add_links(self, links: Iterable[tuple[int, str]]) -> None:
+        """Add the authors of newly written (article_id, ticker) links."""
+        pending = sorted(set(links))
+        updates: SketchUpdates = {}
+        article_ids = sorted({article_id for article_id, _ in pending})
+        for chunk in _chunks(article_ids, ARTICLE_ID_CHUNK_SIZE):
+            articles = {
+                row.id: row
+                for row in self.session.execute(
+                    select(
+                        Article.id,
+                        Article.published_at,
+                        Article.author_id,
+                        Author.is_bot,
+                        Article.sentiment,
+                    )
+                    .outerjoin(Author, Author.id == Article.author_id)
+                    .where(Article.id.in_(chunk))
+                )
+            }
+            for article_id, ticker in pending:
+                row = articles.get(article_id)
+                if row is not None:
+                    _add(
+                        updates,
+                        ticker,
+                        row.published_at,
+                        row.author_id,
+                        row.is_bot,
+                        row.sentiment,
+                    )
+        self.apply(updates)
+
+    def add_scores(self, scores: Mapping[int, float]) -> None:
+        """Add authors to the sentiment sketches for first-time scores."""
+        updates: SketchUpdates = {}
+        for chunk in _chunks(sorted(scores), ARTICLE_ID_CHUNK_SIZE):
+            for row in self.session.execute(
+                select(
+                    ArticleTicker.article_id,
+                    ArticleTicker.ticker,
+                    Article.published_at,
+                    Article.author_id,
+                    Author.is_bot,
+                )
+                .join(Article, Article.id == ArticleTicker.article_id)
+                .outerjoin(Author, Author.id == Article.author_id)
+                .where(ArticleTicker.article_id.in_(chunk))
+            ):
+                _add(
+                    updates,
+                    row.ticker,
+                    row.published_at,
+                    row.author_id,
+                    row.is_bot,
+                    scores[row.article_id],
+                    include_total=False,
+                )
+        self.apply(updates)
+
+    def apply(self, updates: SketchUpdates) -> None:
+        """Merge ``updates`` into the stored sketches, creating missing rows.
+
+        Rows are created empty first and then locked, so concurrent writers
+        merge in turn instead of overwriting each other's authors.
+        """
+        if not updates:
+            return
+        now = datetime.now(UTC)
+        keys = sorted(updates)
+        for chunk in _chunks(keys, SKETCH_WRITE_CHUNK_SIZE):
+            self.session.execute(
+                self._insert().on_conflict_do_nothing(
+                    index_elements=["ticker", "hour"]
+                ),
+                [
+                    {"ticker": ticker, "hour": hour, "updated_at": now}
+                    for ticker, hour in chunk
+                ],
+            )
+
+        stored: dict[tuple[str, datetime], Any] = {}
+        for chunk in _chunks(keys, SKETCH_WRITE_CHUNK_SIZE):
+            wanted = set(chunk)
+            for row in self.session.execute(
+                select(TickerAuthorSketch.__table__)
+                .where(
+                    TickerAuthorSketch.ticker.in_({ticker for ticker, _ in chunk}),
+                    TickerAuthorSketch.hour.in_({hour for _, hour in chunk}),
+                )
+                .order_by(TickerAuthorSketch.ticker, TickerAuthorSketch.hour)
+                .with_for_update()
+            ):
+                key = (row.ticker, hour_floor(row.hour))
+                if key in wanted:
+                    stored[key] = row
+
+        rows = []
+        for key in keys:
+            row = stored[key]
+            values: dict[str, Any] = {"b_ticker": row.ticker, "b_hour": row.hour}
+            for column in SKETCH_COLUMNS:
+                authors = updates[key].get(column)
+                current = getattr(row, column)
+                if authors:
+                    sketch = merge_sketches([current])
+                    sketch.update(authors)
+                    current = sketch.to_bytes()
+                values[column] = current
+            rows.append(values)
+
+        stmt = (
+            update(TickerAuthorSketch)
+            .where(
+                TickerAuthorSketch.ticker == bindparam("b_ticker"),
+                TickerAuthorSketch.hour == bindparam("b_hour"),
+            )
+            .values(
+                {column: bindparam(column) for column in SKETCH_COLUMNS}
+                | {"updated_at": now}
+            )
+        )
+        # Run as Core: an ORM executemany UPDATE would match rows by primary key
+        for chunk in _chunks(rows, SKETCH_WRITE_CHUNK_SIZE):
+            self.session.connection().execute(stmt, chunk)
+
+    def rebuild(self, start: datetime, end: datetime | None = None) -> int:
+        """Recompute the sketches of the hours in ``[start, end)`` from the links.
+
+        Corrects authors of deleted links and re-scored comments, which the
+        incremental path cannot remove. Hours whose comments were archived
+        must not be rebuilt.
+
+        Returns:
+            Number of (ticker, hour) sketches written
+        """
+        start = hour_floor(start)
+        end = _hour_ceil(end or datetime.now(UTC))
+        written = 0
+        day_start = start
+        # A day at a time keeps the author sets small
+        while day_start < end:
+            day_end = min(day_start + timedelta(days=1), end)
+            self.session.execute(
+                delete(TickerAuthorSketch).where(
+                    TickerAuthorSketch.hour >= day_start,
+                    TickerAuthorSketch.hour < day_end,
+                )
+            )
+            updates: SketchUpdates = {}
+            for row in self.session.execute(
+                select(
+                    ArticleTicker.ticker,
+                    ArticleTicker.published_at,
+                    ArticleTicker.author_id,
+                    Author.is_bot,
+                    ArticleTicker.sentiment,
+                )
+                .outerjoin(Author, Author.id == ArticleTicker.author_id)
+                .where(
+                    ArticleTicker.published_at >= day_start,
+                    ArticleTicker.published_at < day_end,
+                )
+            ):
+                _add(
+                    updates,
+                    row.ticker,
+                    row.published_at,
+                    row.author_id,
+                    row.is_bot,
+                    row.sentiment,
+                )
+            self.apply(updates)
+            written += len(updates)
+            day_start = day_end
+        return written
+
+    # Windows -----------------------------------------------------------------
+
+    def _sketches(
+        self, tickers: Sequence[str], start: datetime, end: datetime, columns
+    ):
+        return self.session.execute(
+            select(
+                TickerAuthorSketch.ticker,
+                TickerAuthorSketch.hour,
+                *(getattr(TickerAuthorSketch, column) for column in columns),
+            ).where(
+                TickerAuthorSketch.ticker.in_(tickers),
+                TickerAuthorSketch.hour >= hour_floor(start),
+                TickerAuthorSketch.hour < _hour_ceil(end),
+            )
+        )
+
+    def unique_authors(
+        self, tickers: Sequence[str], start: datetime, end: datetime
+    ) -> dict[str, int]:
+        """Estimated distinct authors per ticker between ``start`` and ``end``.
+
+        Tickers without any authors in the window are omitted.
+        """
+        if not tickers:
+            return {}
+        merged: dict[str, HyperLogLog] = {}
+        for row in self._sketches(tickers, start, end, ("authors",)):
+            if row.authors:
+                merged.setdefault(row.ticker, HyperLogLog()).merge(
+                    HyperLogLog.from_bytes(row.authors)
+                )
+        return {ticker: sketch.count() for ticker, sketch in merged.items()}
+
+    def unique_authors_in_windows(
+        self, ticker: str, windows: Sequence[tuple[datetime, datetime]]
+    ) -> list[int]:
+        """Estimated distinct authors of ``ticker`` in each ``(start, end)`` window.
+
+        Reads the sketches spanning all windows once.
+        """
+        if not windows:
+            return []
+        bounds = [(hour_floor(start), _hour_ceil(end)) for start, end in windows]
+        merged = [HyperLogLog() for _ in windows]
+        for row in self._sketches(
+            [ticker],
+            min(start for start, _ in bounds),
+            max(end for _, end in bounds),
+            ("authors",),
+        ):
+            if not row.authors:
+                continue
+            hour = hour_floor(row.hour)
+            sketch = HyperLogLog.from_bytes(row.authors)
+            for (start, end), window in zip(bounds, merged, strict=True):
+                if start <= hour < end:
+                    window.merge(sketch)
+        return [window.count() for window in merged]
+
+    def author_timeline(
+        self,
+        ticker: str,
+        start: datetime,
+        end: datetime,
+        bucket: Literal["hour", "day"] = "hour",
+    ) -> dict[datetime | date, AuthorCounts]:
+        """Distinct authors of ``ticker`` per UTC hour or day, by sentiment class.
+
+        Hour buckets are keyed by their UTC start, day buckets by UTC date.
+        An author with comments in several classes counts in each of them.
+        """
+        merged: defaultdict[datetime | date, dict[str, HyperLogLog]] = defaultdict(dict)
+        for row in self._sketches([ticker], start, end, SKETCH_COLUMNS):
+            hour = hour_floor(row.hour)
+            sketches = merged[hour if bucket == "hour" else hour.date()]
+            for column in SKETCH_COLUMNS:
+                data = getattr(row, column)
+                if data:
+                    sketches.setdefault(column, HyperLogLog()).merge(
+                        HyperLogLog.from_bytes(data)
+                    )
+
+        def count(sketches: dict[str, HyperLogLog], column: str) -> int:
+            return sketches[column].count() if column in sketches else 0
+
+        return {
+            key: AuthorCounts(
+                total=count(sketches, "authors"),
+                positive=count(sketches, "positive_authors"),
+                negative=count(sketches, "negative_authors"),
+                neutral=count(sketches, "neutral_authors"),
+            )
+            for key, sketches in sorted(merged.items())
+        }
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from datetime import UTC, date, datetime
 from typing import TYPE_CHECKING
 
@@ -59,6 +60,39 @@ class EmailSendLogRepository:
         self.session.flush()
         return log_entry
 
+    def create_log_entries(
+        self,
+        summary_date: date,
+        entries: Iterable[tuple[int, str, int, EmailSendResult]],
+    ) -> list[EmailSendLog]:
+        """Create log entries for many send attempts with a single flush.
+
+        Args:
+            summary_date: Date of the summary
+            entries: (user_id, email_address, ticker_count, result) tuples
+
+        Returns:
+            Created EmailSendLog entries
+        """
+        sent_at = datetime.now(UTC)
+        log_entries = [
+            EmailSendLog(
+                user_id=user_id,
+                email_address=email_address,
+                summary_date=summary_date,
+                ticker_count=ticker_count,
+                success=result.success,
+                message_id=result.message_id,
+                error=result.error,
+                provider=result.provider,
+                sent_at=sent_at,
+            )
+            for user_id, email_address, ticker_count, result in entries
+        ]
+        self.session.add_all(log_entries)
+        self.session.flush()
+        return log_entries
+
     def get_user_sends_for_date(
         self, user_id: int, summary_date: date
     ) -> list[EmailSendLog]:
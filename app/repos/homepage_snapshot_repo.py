@@ -0,0 +1,51 @@
+"""Repository for precomputed homepage snapshots."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.db.models import HomepageSnapshot
+
+# Snapshots kept after each write (older ones are pruned)
+SNAPSHOT_RETENTION = 3
+
+
+class HomepageSnapshotRepository:
+    """Data-access helpers for :class:`HomepageSnapshot`."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize the repository with a database session."""
+        self.session = session
+
+    def get_latest(self) -> HomepageSnapshot | None:
+        """Return the most recently written snapshot in one primary-key read."""
+        stmt = select(HomepageSnapshot).order_by(HomepageSnapshot.id.desc()).limit(1)
+        return self.session.execute(stmt).scalar_one_or_none()
+
+    def add(
+        self,
+        payload: dict[str, Any],
+        schema_version: int,
+        built_at: datetime | None = None,
+    ) -> HomepageSnapshot:
+        """Store a snapshot and prune all but the newest SNAPSHOT_RETENTION.
+
+        The caller owns the transaction.
+        """
+        snapshot = HomepageSnapshot(
+            schema_version=schema_version,
+            payload=payload,
+            built_at=built_at or datetime.now(UTC),
+        )
+        self.session.add(snapshot)
+        self.session.flush()
+        self.session.execute(
+            delete(HomepageSnapshot).where(
+                HomepageSnapshot.id <= snapshot.id - SNAPSHOT_RETENTION
+            )
+        )
+        return snapshot
@@ -0,0 +1,415 @@
+"""Repository for bulk writes and tiered reads on stock price tables."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+
+import pandas as pd
+from sqlalchemy import CursorResult, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.db.models import (
+    StockPrice,
+    StockPriceHistory,
+    StockPriceRollup,
+    StockPriceRollupState,
+)
+
+# Quote dict keys (as returned by StockDataService) that map onto StockPrice columns
+QUOTE_FIELDS = (
+    "price",
+    "previous_close",
+    "change",
+    "change_percent",
+    "open",
+    "day_high",
+    "day_low",
+    "volume",
+    "bid",
+    "ask",
+    "bid_size",
+    "ask_size",
+    "market_cap",
+    "shares_outstanding",
+    "average_volume",
+    "average_volume_10d",
+    "market_state",
+    "currency",
+    "exchange",
+)
+
+# Chart tiers: raw stock_price_history bars (hourly/daily), then materialised rollups
+RAW_RESOLUTION = "raw"
+ROLLUP_RESOLUTIONS = ("1d", "1w")
+
+# Conservative bars per calendar day for each tier (raw assumes 24/7 hourly bars)
+_BARS_PER_DAY = {RAW_RESOLUTION: 24.0, "1d": 1.0, "1w": 1 / 7}
+
+_OHLCV_COLUMNS = (
+    "open_price",
+    "high_price",
+    "low_price",
+    "close_price",
+    "volume",
+)
+
+# Symbols aggregated per history read when refreshing rollups
+_ROLLUP_SYMBOL_BATCH = 25
+
+
+def price_row_from_quote(
+    symbol: str,
+    data: dict[str, Any],
+    updated_at: datetime | None = None,
+    fields: Iterable[str] = QUOTE_FIELDS,
+) -> dict[str, Any]:
+    """Build a ``stock_price`` row from a quote dict.
+
+    Args:
+        symbol: Ticker symbol (primary key)
+        data: Quote dict from StockDataService
+        updated_at: Timestamp for the row (default: now)
+        fields: Quote fields to copy; columns not listed are left untouched on upsert
+
+    Returns:
+        Column mapping suitable for :meth:`StockPriceRepository.upsert_prices`
+    """
+    row: dict[str, Any] = {"symbol": symbol}
+    for field in fields:
+        row[field] = data.get(field)
+    if "currency" in row and not row["currency"]:
+        row["currency"] = "USD"
+    row["updated_at"] = updated_at or datetime.now(UTC)
+    return row
+
+
+class StockPriceRepository:
+    """Dialect-aware bulk upserts and tiered OHLCV reads for stock price tables.
+
+    Uses ``INSERT ... ON CONFLICT`` on both PostgreSQL and SQLite (3.24+), so a
+    chunk of rows costs one statement instead of a SELECT per row. Reads are
+    column-only and never materialise ORM objects.
+    """
+
+    def __init__(self, session: Session, chunk_size: int = 500):
+        """Initialize the repository with a database session."""
+        self.session = session
+        self.chunk_size = chunk_size
+
+    def _insert(self, model):
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            return pg_insert(model)
+        return sqlite_insert(model)
+
+    def upsert_prices(self, rows: Sequence[dict[str, Any]]) -> int:
+        """Insert or update current prices keyed on symbol.
+
+        Only the columns present in the rows are overwritten on conflict. All
+        rows in a call must share the same keys.
+
+        Returns:
+            Number of rows written
+        """
+        rows = list({row["symbol"]: row for row in rows}.values())
+        written = 0
+        for chunk in _chunks(rows, self.chunk_size):
+            stmt = self._insert(StockPrice).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[StockPrice.symbol],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in chunk[0]
+                    if column != "symbol"
+                },
+            )
+            self.session.execute(stmt)
+            written += len(chunk)
+        return written
+
+    def insert_history(
+        self, rows: Sequence[dict[str, Any]], update_existing: bool = False
+    ) -> int:
+        """Insert history bars keyed on (symbol, date).
+
+        Args:
+            rows: Column mappings for ``stock_price_history``; all rows must share
+                the same keys
+            update_existing: Overwrite OHLCV of existing bars instead of skipping them
+
+        Returns:
+            Number of rows inserted (or written, when ``update_existing`` is True)
+        """
+        rows = list({(row["symbol"], row["date"]): row for row in rows}.values())
+        written = 0
+        for chunk in _chunks(rows, self.chunk_size):
+            stmt = self._insert(StockPriceHistory).values(chunk)
+            conflict_columns = [StockPriceHistory.symbol, StockPriceHistory.date]
+            if update_existing:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=conflict_columns,
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in chunk[0]
+                        if column not in ("symbol", "date", "created_at")
+                    },
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+            result = cast(CursorResult[Any], self.session.execute(stmt))
+            written += result.rowcount if result.rowcount >= 0 else len(chunk)
+        return written
+
+    def refresh_rollups(
+        self, symbols: Iterable[str], since: datetime | None = None
+    ) -> int:
+        """Recompute daily and weekly rollups from ``stock_price_history``.
+
+        Also advances each symbol's ``stock_price_rollup_state`` watermark once
+        its rollups span its whole history: on a full rebuild, when it has no
+        bars before ``since``, or when it was already covered.
+
+        Args:
+            symbols: Symbols whose history changed
+            since: Earliest changed bar; rollups are rebuilt from the start of its
+                week (default: the full history)
+
+        Returns:
+            Number of rollup rows written
+        """
+        symbols = sorted(set(symbols))
+        start = bucket_start(since, "1w") if since is not None else None
+        now = datetime.now(UTC)
+        written = 0
+
+        for i in range(0, len(symbols), _ROLLUP_SYMBOL_BATCH):
+            batch = symbols[i : i + _ROLLUP_SYMBOL_BATCH]
+            history = self._history_frame(batch, start)
+            if history.empty:
+                continue
+
+            rows = []
+            for resolution in ROLLUP_RESOLUTIONS:
+                for row in _frame_records(aggregate_ohlcv(history, resolution)):
+                    row.update(resolution=resolution, updated_at=now)
+                    rows.append(row)
+
+            # executemany keeps one cached statement instead of compiling a
+            # multi-row VALUES clause per chunk
+            stmt = self._insert(StockPriceRollup.__table__)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["symbol", "resolution", "bucket_start"],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in (*_OHLCV_COLUMNS, "updated_at")
+                },
+            )
+            for chunk in _chunks(rows, self.chunk_size):
+                self.session.execute(stmt, chunk)
+            written += len(rows)
+            self._advance_rollup_state(batch, history, start, now)
+        return written
+
+    def _advance_rollup_state(
+        self,
+        symbols: Sequence[str],
+        history: pd.DataFrame,
+        start: datetime | None,
+        now: datetime,
+    ) -> None:
+        """Record the newest rolled-up bar of symbols whose rollups are complete."""
+        latest = (
+            pd.to_datetime(history["date"], utc=True).groupby(history["symbol"]).max()
+        )
+        covered = set(history["symbol"])
+        if start is not None:
+            # Older bars were not re-read; they count only if already covered
+            older = self.session.scalars(
+                select(StockPriceHistory.symbol)
+                .where(
+                    StockPriceHistory.symbol.in_(symbols),
+                    StockPriceHistory.date < start,
+                )
+                .distinct()
+            )
+            tracked = self.session.scalars(
+                select(StockPriceRollupState.symbol).where(
+                    StockPriceRollupState.symbol.in_(symbols)
+                )
+            )
+            covered -= set(older) - set(tracked)
+        rows = [
+            {
+                "symbol": symbol,
+                "rolled_through": ts.to_pydatetime(),
+                "updated_at": now,
+            }
+            for symbol, ts in latest.items()
+            if symbol in covered
+        ]
+        if not rows:
+            return
+        stmt = self._insert(StockPriceRollupState)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[StockPriceRollupState.symbol],
+            set_={
+                "rolled_through": stmt.excluded.rolled_through,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        self.session.execute(stmt, rows)
+
+    def get_ohlcv(
+        self, symbol: str, start: datetime, end: datetime, resolution: str
+    ) -> list[dict[str, Any]]:
+        """Return chronological OHLCV bars for one symbol at the given tier.
+
+        Rollup tiers are served from ``stock_price_rollup`` when the symbol's
+        rollups cover its history (see ``stock_price_rollup_state``) and no raw
+        bar in range is newer than the covered point. Otherwise (e.g. before
+        the backfill) the bars are aggregated from raw history instead.
+
+        Returns:
+            Dicts with ``date`` and the OHLCV columns
+        """
+        if resolution == RAW_RESOLUTION:
+            history = self._history_frame([symbol], start, end)
+            return _frame_records(history.drop(columns="symbol"))
+
+        if self._rollups_cover(symbol, end):
+            rows = self.session.execute(
+                select(
+                    StockPriceRollup.bucket_start.label("date"),
+                    *(getattr(StockPriceRollup, column) for column in _OHLCV_COLUMNS),
+                )
+                .where(
+                    StockPriceRollup.symbol == symbol,
+                    StockPriceRollup.resolution == resolution,
+                    StockPriceRollup.bucket_start >= bucket_start(start, resolution),
+                    StockPriceRollup.bucket_start <= end,
+                )
+                .order_by(StockPriceRollup.bucket_start)
+            ).all()
+            return [row._asdict() for row in rows]
+
+        history = self._history_frame([symbol], start, end)
+        bars = aggregate_ohlcv(history, resolution)
+        return _frame_records(
+            bars.drop(columns="symbol").rename(columns={"bucket_start": "date"})
+        )
+
+    def _rollups_cover(self, symbol: str, end: datetime) -> bool:
+        """Whether rollups include every raw bar of ``symbol`` up to ``end``.
+
+        One primary-key read plus one probe of the (symbol, date) index.
+        """
+        rolled_through = self.session.scalar(
+            select(StockPriceRollupState.rolled_through).where(
+                StockPriceRollupState.symbol == symbol
+            )
+        )
+        if rolled_through is None:
+            return False
+        newer = self.session.scalar(
+            select(StockPriceHistory.date)
+            .where(
+                StockPriceHistory.symbol == symbol,
+                StockPriceHistory.date > rolled_through,
+                StockPriceHistory.date <= end,
+            )
+            .limit(1)
+        )
+        return newer is None
+
+    def _history_frame(
+        self,
+        symbols: Sequence[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame:
+        """Load raw history bars as a column-only frame ordered by date."""
+        columns = (StockPriceHistory.symbol, StockPriceHistory.date) + tuple(
+            getattr(StockPriceHistory, column) for column in _OHLCV_COLUMNS
+        )
+        query = select(*columns).where(StockPriceHistory.symbol.in_(symbols))
+        if start is not None:
+            query = query.where(StockPriceHistory.date >= start)
+        if end is not None:
+            query = query.where(StockPriceHistory.date <= end)
+        query = query.order_by(StockPriceHistory.symbol, StockPriceHistory.date)
+        return pd.DataFrame(
+            self.session.execute(query).all(),
+            columns=["symbol", "date", *_OHLCV_COLUMNS],
+        )
+
+
+def pick_resolution(span: timedelta, max_points: int = 500) -> str:
+    """Return the finest tier that keeps ``span`` within ``max_points`` bars."""
+    days = max(span.total_seconds() / 86400, 1.0)
+    for resolution in (RAW_RESOLUTION, *ROLLUP_RESOLUTIONS[:-1]):
+        if days * _BARS_PER_DAY[resolution] <= max_points:
+            return resolution
+    return ROLLUP_RESOLUTIONS[-1]
+
+
+def bucket_start(ts: datetime, resolution: str) -> datetime:
+    """Return the UTC start of the daily or weekly (Monday) bucket holding ``ts``."""
+    ts = ts.replace(tzinfo=UTC) if ts.tzinfo is None else ts.astimezone(UTC)
+    day = ts.replace(hour=0, minute=0, second=0, microsecond=0)
+    if resolution == "1w":
+        day -= timedelta(days=day.weekday())
+    return day
+
+
+def aggregate_ohlcv(history: pd.DataFrame, resolution: str) -> pd.DataFrame:
+    """Downsample raw bars into daily or weekly OHLCV buckets.
+
+    Args:
+        history: Frame with ``symbol``, ``date`` and the OHLCV columns of
+            ``stock_price_history``
+        resolution: ``"1d"`` or ``"1w"``
+
+    Returns:
+        Frame with ``symbol``, ``bucket_start`` and OHLCV columns, ordered by
+        symbol and bucket
+    """
+    history = history.astype(dict.fromkeys(_OHLCV_COLUMNS, "float64"))
+    dates = pd.to_datetime(history["date"], utc=True)
+    buckets = dates.dt.floor("D")
+    if resolution == "1w":
+        buckets = buckets - pd.to_timedelta(buckets.dt.weekday, unit="D")
+
+    frame = history.assign(date=dates, bucket_start=buckets).sort_values("date")
+    return (
+        frame.groupby(["symbol", "bucket_start"], sort=True)
+        .agg(
+            open_price=("open_price", "first"),
+            high_price=("high_price", "max"),
+            low_price=("low_price", "min"),
+            close_price=("close_price", "last"),
+            volume=("volume", "sum"),
+        )
+        .reset_index()
+    )
+
+
+def _chunks(rows: list[dict[str, Any]], size: int) -> Iterable[list[dict[str, Any]]]:
+    for i in range(0, len(rows), size):
+        yield rows[i : i + size]
+
+
+def _frame_records(frame: pd.DataFrame) -> list[dict[str, Any]]:
+    """Convert a frame to row dicts with native datetimes/ints and None for NaN."""
+    records = []
+    for row in frame.astype(object).where(frame.notna(), None).to_dict("records"):
+        for key, value in row.items():
+            if isinstance(value, pd.Timestamp):
+                row[key] = value.to_pydatetime()
+        if row.get("volume") is not None:
+            row["volume"] = int(row["volume"])
+        records.append(row)
+    return records
@@ -8,9 +8,12 @@ from datetime import UTC, date, datetime
 from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
-from app.db.models import DailyTickerSummary
+from app.db.models import DailyTickerSummary, LLMSentimentCategory
 from app.models.dto import DailyTickerSummaryDTO, DailyTickerSummaryUpsertDTO
 
+# Prompt hashes per IN (...) lookup
+PROMPT_HASH_CHUNK_SIZE = 500
+
 
 class DailyTickerSummaryRepository:
     """Data-access helpers for :class:`DailyTickerSummary`."""
@@ -44,6 +47,10 @@ class DailyTickerSummaryRepository:
             existing.llm_sentiment = summary.llm_sentiment
             existing.llm_model = summary.llm_model
             existing.llm_version = summary.llm_version
+            existing.participant_count = summary.participant_count
+            existing.last_price = summary.last_price
+            existing.price_change_percent = summary.price_change_percent
+            existing.prompt_hash = summary.prompt_hash
             existing.updated_at = now
             self.session.flush()
             return self._to_dto(existing)
@@ -63,6 +70,10 @@ class DailyTickerSummaryRepository:
             llm_sentiment=summary.llm_sentiment,
             llm_model=summary.llm_model,
             llm_version=summary.llm_version,
+            participant_count=summary.participant_count,
+            last_price=summary.last_price,
+            price_change_percent=summary.price_change_percent,
+            prompt_hash=summary.prompt_hash,
             created_at=now,
             updated_at=now,
         )
@@ -115,6 +126,36 @@ class DailyTickerSummaryRepository:
         rows = self.session.execute(stmt).scalars().all()
         return [self._to_dto(row) for row in rows]
 
+    def get_llm_results_by_prompt_hash(
+        self, prompt_hashes: Iterable[str]
+    ) -> dict[str, tuple[str, LLMSentimentCategory | None]]:
+        """Return stored ``(llm_summary, llm_sentiment)`` keyed by prompt hash.
+
+        Only rows with a non-empty ``llm_summary`` are returned.
+        """
+
+        hashes = list(set(prompt_hashes))
+        if not hashes:
+            return {}
+
+        results: dict[str, tuple[str, LLMSentimentCategory | None]] = {}
+        for i in range(0, len(hashes), PROMPT_HASH_CHUNK_SIZE):
+            rows = self.session.execute(
+                select(
+                    DailyTickerSummary.prompt_hash,
+                    DailyTickerSummary.llm_summary,
+                    DailyTickerSummary.llm_sentiment,
+                ).where(
+                    DailyTickerSummary.prompt_hash.in_(
+                        hashes[i : i + PROMPT_HASH_CHUNK_SIZE]
+                    ),
+                    DailyTickerSummary.llm_summary.isnot(None),
+                )
+            ).all()
+            for row in rows:
+                results[row.prompt_hash] = (row.llm_summary, row.llm_sentiment)
+        return results
+
     def get_most_recent_summary_date(self) -> date | None:
         """Return the most recent summary_date that has llm content."""
 
@@ -268,4 +309,8 @@ class DailyTickerSummaryRepository:
             llm_version=entity.llm_version,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
+            participant_count=entity.participant_count,
+            last_price=entity.last_price,
+            price_change_percent=entity.price_change_percent,
+            prompt_hash=entity.prompt_hash,
         )
@@ -0,0 +1,415 @@
+"""Repository for per-ticker lifetime counters (``ticker_stats``)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Query, Session
+
+from app.db.models import Article, ArticleTicker, StockPrice, Ticker, TickerStats
+
+# Rows per executemany batch for counter upserts
+STATS_WRITE_CHUNK_SIZE = 500
+
+# Article ids per IN (...) lookup when resolving pending links or scores
+ARTICLE_ID_CHUNK_SIZE = 1000
+
+RECENT_WINDOW = timedelta(hours=24)
+
+_COUNTER_COLUMNS = (
+    "total_mentions",
+    "sentiment_sum",
+    "sentiment_count",
+    "last_mention_at",
+    "recent_mentions_24h",
+)
+
+
+@dataclass
+class TickerStatsDelta:
+    """Increments to apply to one ticker's counters."""
+
+    mentions: int = 0
+    sentiment_sum: float = 0.0
+    sentiment_count: int = 0
+    last_mention_at: datetime | None = None
+    recent_mentions: int = 0
+
+    def add_mention(
+        self, published_at: datetime, sentiment: float | None, cutoff: datetime
+    ) -> None:
+        published_at = _as_utc(published_at)
+        self.mentions += 1
+        if sentiment is not None:
+            self.sentiment_sum += sentiment
+            self.sentiment_count += 1
+        if self.last_mention_at is None or published_at > self.last_mention_at:
+            self.last_mention_at = published_at
+        if published_at >= cutoff:
+            self.recent_mentions += 1
+
+
+@dataclass
+class _TickerCounters:
+    """One ticker's counters as stored in, or recomputed for, ``ticker_stats``."""
+
+    total_mentions: int
+    sentiment_sum: float
+    sentiment_count: int
+    last_mention_at: datetime | None
+    recent_mentions_24h: int
+
+    def matches(self, other: _TickerCounters) -> bool:
+        return (
+            self.total_mentions == other.total_mentions
+            and abs(self.sentiment_sum - other.sentiment_sum) <= 1e-6
+            and self.sentiment_count == other.sentiment_count
+            and self.last_mention_at == other.last_mention_at
+            and self.recent_mentions_24h == other.recent_mentions_24h
+        )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite returns naive datetimes; stored values are UTC
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _chunks(items: list[Any], size: int) -> Iterable[list[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class TickerStatsRepository:
+    """Data-access helpers for :class:`TickerStats`."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize the repository with a database session."""
+        self.session = session
+
+    def _insert(self):
+        if self.session.get_bind().dialect.name == "postgresql":
+            return pg_insert(TickerStats)
+        return sqlite_insert(TickerStats)
+
+    # Incremental maintenance -------------------------------------------------
+
+    def link_deltas(
+        self, links: Iterable[tuple[int, str]], now: datetime | None = None
+    ) -> dict[str, TickerStatsDelta]:
+        """Compute counter increments for newly written (article_id, ticker) links."""
+        cutoff = (now or datetime.now(UTC)) - RECENT_WINDOW
+        pending = set(links)
+        deltas: dict[str, TickerStatsDelta] = {}
+        article_ids = sorted({article_id for article_id, _ in pending})
+        for chunk in _chunks(article_ids, ARTICLE_ID_CHUNK_SIZE):
+            rows = self.session.execute(
+                select(Article.id, Article.published_at, Article.sentiment).where(
+                    Article.id.in_(chunk)
+                )
+            ).all()
+            articles = {row.id: row for row in rows}
+            for article_id, ticker in pending:
+                row = articles.get(article_id)
+                if row is None:
+                    continue
+                deltas.setdefault(ticker, TickerStatsDelta()).add_mention(
+                    row.published_at, row.sentiment, cutoff
+                )
+        return deltas
+
+    def sentiment_deltas(
+        self, scores: Mapping[int, float]
+    ) -> dict[str, TickerStatsDelta]:
+        """Compute increments for first-time sentiment scores of linked articles."""
+        deltas: dict[str, TickerStatsDelta] = {}
+        for chunk in _chunks(sorted(scores), ARTICLE_ID_CHUNK_SIZE):
+            rows = self.session.execute(
+                select(ArticleTicker.article_id, ArticleTicker.ticker).where(
+                    ArticleTicker.article_id.in_(chunk)
+                )
+            ).all()
+            for article_id, ticker in rows:
+                delta = deltas.setdefault(ticker, TickerStatsDelta())
+                delta.sentiment_sum += scores[article_id]
+                delta.sentiment_count += 1
+        return deltas
+
+    def apply_deltas(self, deltas: Mapping[str, TickerStatsDelta]) -> None:
+        """Add ``deltas`` to the counters, creating missing rows."""
+        if not deltas:
+            return
+        now = datetime.now(UTC)
+        rows = [
+            {
+                "ticker": ticker,
+                "total_mentions": delta.mentions,
+                "sentiment_sum": delta.sentiment_sum,
+                "sentiment_count": delta.sentiment_count,
+                "last_mention_at": delta.last_mention_at,
+                "recent_mentions_24h": delta.recent_mentions,
+                "updated_at": now,
+            }
+            for ticker, delta in sorted(deltas.items())
+        ]
+        stmt = self._insert()
+        table = TickerStats.__table__.c
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["ticker"],
+            set_={
+                "total_mentions": table.total_mentions + excluded.total_mentions,
+                "sentiment_sum": table.sentiment_sum + excluded.sentiment_sum,
+                "sentiment_count": table.sentiment_count + excluded.sentiment_count,
+                "last_mention_at": case(
+                    (
+                        table.last_mention_at.is_(None)
+                        | (excluded.last_mention_at > table.last_mention_at),
+                        excluded.last_mention_at,
+                    ),
+                    else_=table.last_mention_at,
+                ),
+                "recent_mentions_24h": table.recent_mentions_24h
+                + excluded.recent_mentions_24h,
+                "updated_at": excluded.updated_at,
+            },
+        )
+        for chunk in _chunks(rows, STATS_WRITE_CHUNK_SIZE):
+            self.session.execute(stmt, chunk)
+
+    def record_archived(self, deltas: Mapping[str, TickerStatsDelta]) -> None:
+        """Note mentions moved to the comment archive.
+
+        The lifetime counters already include them; this only records the
+        archived share so :meth:`reconcile` can keep counting it.
+        """
+        if not deltas:
+            return
+        now = datetime.now(UTC)
+        rows = [
+            {
+                "ticker": ticker,
+                "archived_mentions": delta.mentions,
+                "archived_sentiment_sum": delta.sentiment_sum,
+                "archived_sentiment_count": delta.sentiment_count,
+                "archived_last_mention_at": delta.last_mention_at,
+                "updated_at": now,
+            }
+            for ticker, delta in sorted(deltas.items())
+        ]
+        stmt = self._insert()
+        table = TickerStats.__table__.c
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["ticker"],
+            set_={
+                "archived_mentions": table.archived_mentions
+                + excluded.archived_mentions,
+                "archived_sentiment_sum": table.archived_sentiment_sum
+                + excluded.archived_sentiment_sum,
+                "archived_sentiment_count": table.archived_sentiment_count
+                + excluded.archived_sentiment_count,
+                "archived_last_mention_at": case(
+                    (
+                        table.archived_last_mention_at.is_(None)
+                        | (
+                            excluded.archived_last_mention_at
+                            > table.archived_last_mention_at
+                        ),
+                        excluded.archived_last_mention_at,
+                    ),
+                    else_=table.archived_last_mention_at,
+                ),
+                "updated_at": excluded.updated_at,
+            },
+        )
+        for chunk in _chunks(rows, STATS_WRITE_CHUNK_SIZE):
+            self.session.execute(stmt, chunk)
+
+    def refresh_recent_mentions(self, now: datetime | None = None) -> int:
+        """Recount trailing-24h mentions, which decay as time passes.
+
+        Only the last 24h of articles are scanned. Tickers without a stats
+        row get a zeroed one so browse listings cover the whole universe.
+
+        Returns:
+            Number of tickers with recent mentions
+        """
+        now = now or datetime.now(UTC)
+        counts: dict[str, int] = {
+            row.ticker: row.mentions
+            for row in self.session.execute(
+                select(ArticleTicker.ticker, func.count().label("mentions"))
+                .where(ArticleTicker.published_at >= now - RECENT_WINDOW)
+                .group_by(ArticleTicker.ticker)
+            )
+        }
+        self.ensure_rows()
+        self.session.execute(
+            update(TickerStats)
+            .where(
+                TickerStats.recent_mentions_24h != 0,
+                TickerStats.ticker.not_in(list(counts)),
+            )
+            .values(recent_mentions_24h=0, updated_at=now)
+        )
+        if counts:
+            stmt = self._insert()
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["ticker"],
+                set_={
+                    "recent_mentions_24h": stmt.excluded.recent_mentions_24h,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+            rows = [
+                {"ticker": ticker, "recent_mentions_24h": count, "updated_at": now}
+                for ticker, count in sorted(counts.items())
+            ]
+            for chunk in _chunks(rows, STATS_WRITE_CHUNK_SIZE):
+                self.session.execute(stmt, chunk)
+        return len(counts)
+
+    def ensure_rows(self) -> None:
+        """Insert zeroed rows for tickers that have none."""
+        missing = self.session.scalars(
+            select(Ticker.symbol).where(
+                ~select(TickerStats.ticker)
+                .where(TickerStats.ticker == Ticker.symbol)
+                .exists()
+            )
+        ).all()
+        if missing:
+            self.session.execute(
+                self._insert().on_conflict_do_nothing(index_elements=["ticker"]),
+                [{"ticker": symbol} for symbol in missing],
+            )
+
+    # Reconciliation ----------------------------------------------------------
+
+    def reconcile(self, now: datetime | None = None) -> int:
+        """Recompute every ticker's counters from the corpus.
+
+        Mentions moved to the comment archive are no longer in the corpus;
+        their recorded ``archived_*`` share is added back.
+
+        Returns:
+            Number of tickers whose stored counters were corrected
+        """
+        now = now or datetime.now(UTC)
+        cutoff = now - RECENT_WINDOW
+        actual = {
+            row.ticker: _TickerCounters(
+                total_mentions=int(row.total_mentions or 0),
+                sentiment_sum=float(row.sentiment_sum or 0.0),
+                sentiment_count=int(row.sentiment_count or 0),
+                last_mention_at=(
+                    _as_utc(row.last_mention_at) if row.last_mention_at else None
+                ),
+                recent_mentions_24h=int(row.recent_mentions_24h or 0),
+            )
+            for row in self.session.execute(
+                select(
+                    Ticker.symbol.label("ticker"),
+                    func.count(Article.id).label("total_mentions"),
+                    func.sum(Article.sentiment).label("sentiment_sum"),
+                    func.count(Article.sentiment).label("sentiment_count"),
+                    func.max(Article.published_at).label("last_mention_at"),
+                    func.sum(case((Article.published_at >= cutoff, 1), else_=0)).label(
+                        "recent_mentions_24h"
+                    ),
+                )
+                .outerjoin(ArticleTicker, ArticleTicker.ticker == Ticker.symbol)
+                .outerjoin(Article, Article.id == ArticleTicker.article_id)
+                .group_by(Ticker.symbol)
+            )
+        }
+        stored: dict[str, _TickerCounters] = {}
+        for stats in self.session.scalars(select(TickerStats)):
+            stored[stats.ticker] = _TickerCounters(
+                total_mentions=stats.total_mentions,
+                sentiment_sum=stats.sentiment_sum,
+                sentiment_count=stats.sentiment_count,
+                last_mention_at=(
+                    _as_utc(stats.last_mention_at) if stats.last_mention_at else None
+                ),
+                recent_mentions_24h=stats.recent_mentions_24h,
+            )
+            values = actual.get(stats.ticker)
+            if values is not None and stats.archived_mentions:
+                values.total_mentions += stats.archived_mentions
+                values.sentiment_sum += stats.archived_sentiment_sum
+                values.sentiment_count += stats.archived_sentiment_count
+                if stats.archived_last_mention_at is not None:
+                    archived_last = _as_utc(stats.archived_last_mention_at)
+                    if values.last_mention_at is None or (
+                        archived_last > values.last_mention_at
+                    ):
+                        values.last_mention_at = archived_last
+
+        changed = [
+            {"ticker": ticker, **asdict(values), "updated_at": now}
+            for ticker, values in sorted(actual.items())
+            if ticker not in stored or not stored[ticker].matches(values)
+        ]
+        if changed:
+            stmt = self._insert()
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["ticker"],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in (*_COUNTER_COLUMNS, "updated_at")
+                },
+            )
+            for chunk in _chunks(changed, STATS_WRITE_CHUNK_SIZE):
+                self.session.execute(stmt, chunk)
+        return len(changed)
+
+    # Reads -------------------------------------------------------------------
+
+    def browse_query(self, search: str | None, sort_by: str) -> Query:
+        """Ticker rows with counters and latest price in browse order.
+
+        Each sort order is served by an index on ``ticker_stats``.
+        """
+        query = (
+            self.session.query(
+                TickerStats,
+                Ticker.name,
+                StockPrice.price,
+                StockPrice.previous_close,
+                StockPrice.change,
+                StockPrice.change_percent,
+                StockPrice.market_state,
+                StockPrice.currency,
+                StockPrice.exchange,
+                StockPrice.updated_at,
+            )
+            .join(Ticker, Ticker.symbol == TickerStats.ticker)
+            .outerjoin(StockPrice, StockPrice.symbol == TickerStats.ticker)
+        )
+        if search:
+            query = query.filter(TickerStats.ticker.ilike(f"%{search.upper()}%"))
+        if sort_by == "recent_activity":
+            query = query.order_by(
+                TickerStats.recent_mentions_24h.desc(), TickerStats.ticker
+            )
+        elif sort_by == "alphabetical":
+            query = query.order_by(TickerStats.ticker)
+        elif sort_by == "total_articles":
+            query = query.order_by(
+                TickerStats.total_mentions.desc(), TickerStats.ticker
+            )
+        return query
+
+    def count(self, search: str | None = None) -> int:
+        """Number of tickers listed by :meth:`browse_query`."""
+        stmt = select(func.count()).select_from(TickerStats)
+        if search:
+            stmt = stmt.where(TickerStats.ticker.ilike(f"%{search.upper()}%"))
+        return self.session.scalar(stmt) or 0
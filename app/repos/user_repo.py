@@ -1,9 +1,10 @@
 """User repository for database operations."""
 
 import logging
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime
 
-from sqlalchemy import Text, cast, func, select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.orm.attributes import flag_modified
 
@@ -25,9 +26,14 @@ from app.models.dto import (
     UserTickerFollowCreateDTO,
     UserTickerFollowDTO,
 )
+from app.services.session_cache import invalidate_session_user
 
 logger = logging.getLogger(__name__)
 
+# Max IDs per IN (...) list for bulk lookups (keeps bind params well under
+# PostgreSQL and SQLite limits)
+BULK_LOOKUP_CHUNK_SIZE = 5000
+
 
 class UserRepository:
     """Repository for user CRUD operations with soft-delete support."""
@@ -103,28 +109,52 @@ class UserRepository:
         Returns:
             List of UserDTOs with daily briefing enabled
         """
-        stmt = (
-            select(User)
-            .join(
-                UserNotificationChannel,
-                User.id == UserNotificationChannel.user_id,
+        stmt = self._daily_briefing_filter(select(User))
+        users = self.session.execute(stmt).unique().scalars().all()
+        return [self._user_to_dto(user) for user in users]
+
+    def get_daily_briefing_users_with_cadence(
+        self,
+    ) -> list[tuple[UserDTO, EmailCadence]]:
+        """Get daily briefing users together with their email cadence.
+
+        Resolves cadence from the joined profile in the same query instead of
+        one profile lookup per user.
+
+        Returns:
+            List of (user, cadence) tuples, one per user
+        """
+        stmt = self._daily_briefing_filter(
+            select(User, UserProfile.preferences).outerjoin(
+                UserProfile, User.id == UserProfile.user_id
             )
-            .where(
-                User.is_deleted == False,  # noqa: E712
-                User.is_active == True,  # noqa: E712
-                UserNotificationChannel.channel_type == "email",
-                UserNotificationChannel.is_enabled == True,  # noqa: E712
-                UserNotificationChannel.is_verified == True,  # noqa: E712
-                UserNotificationChannel.email_bounced == False,  # noqa: E712
-                cast(
-                    UserNotificationChannel.preferences["notify_on_daily_briefing"],
-                    Text,
+        )
+        users: dict[int, tuple[UserDTO, EmailCadence]] = {}
+        for user, preferences in self.session.execute(stmt):
+            if user.id not in users:
+                users[user.id] = (
+                    self._user_to_dto(user),
+                    self._cadence_from_preferences(user.id, preferences),
                 )
-                == "true",
-            )
+        return list(users.values())
+
+    @staticmethod
+    def _daily_briefing_filter(stmt):
+        """Restrict a User select to verified, enabled daily briefing channels."""
+        return stmt.join(
+            UserNotificationChannel,
+            User.id == UserNotificationChannel.user_id,
+        ).where(
+            User.is_deleted == False,  # noqa: E712
+            User.is_active == True,  # noqa: E712
+            UserNotificationChannel.channel_type == "email",
+            UserNotificationChannel.is_enabled == True,  # noqa: E712
+            UserNotificationChannel.is_verified == True,  # noqa: E712
+            UserNotificationChannel.email_bounced == False,  # noqa: E712
+            UserNotificationChannel.preferences[
+                "notify_on_daily_briefing"
+            ].as_boolean(),
         )
-        users = self.session.execute(stmt).unique().scalars().all()
-        return [self._user_to_dto(user) for user in users]
 
     def update_user(
         self, user_id: int, is_active: bool | None = None
@@ -139,6 +169,7 @@ class UserRepository:
 
         user.updated_at = datetime.now(UTC)
         self.session.flush()
+        invalidate_session_user(self.session, user_id)
         return self._user_to_dto(user)
 
     def soft_delete_user(self, user_id: int) -> bool:
@@ -152,6 +183,7 @@ class UserRepository:
         user.deleted_at = datetime.now(UTC)
         user.updated_at = datetime.now(UTC)
         self.session.flush()
+        invalidate_session_user(self.session, user_id)
         return True
 
     def restore_user(self, user_id: int) -> bool:
@@ -165,6 +197,7 @@ class UserRepository:
         user.deleted_at = None
         user.updated_at = datetime.now(UTC)
         self.session.flush()
+        invalidate_session_user(self.session, user_id)
         return True
 
     def hard_delete_user(self, user_id: int) -> bool:
@@ -175,6 +208,7 @@ class UserRepository:
 
         self.session.delete(user)
         self.session.flush()
+        invalidate_session_user(self.session, user_id)
         return True
 
     # UserProfile operations
@@ -303,6 +337,7 @@ class UserRepository:
         if updated:
             profile.updated_at = datetime.now(UTC)
             self.session.flush()
+            invalidate_session_user(self.session, user_id)
 
         return self._profile_to_dto(profile)
 
@@ -428,19 +463,7 @@ class UserRepository:
         if not profile:
             return EmailCadence.DAILY_ONLY
 
-        if profile.preferences and isinstance(profile.preferences, dict):
-            cadence_str = profile.preferences.get("email_cadence")
-            if cadence_str:
-                try:
-                    return EmailCadence(cadence_str)
-                except ValueError:
-                    logger.warning(
-                        "invalid_email_cadence",
-                        extra={"user_id": user_id, "cadence": cadence_str},
-                    )
-
-        # Default to daily_only for backward compatibility
-        return EmailCadence.DAILY_ONLY
+        return self._cadence_from_preferences(user_id, profile.preferences)
 
     def update_email_cadence(self, user_id: int, cadence: EmailCadence) -> bool:
         """Update user's email cadence preference.
@@ -567,6 +590,42 @@ class UserRepository:
         follows = self.session.execute(stmt).unique().scalars().all()
         return [self._ticker_follow_to_dto(f) for f in follows]
 
+    def get_profiles(self, user_ids: Sequence[int]) -> dict[int, UserProfileDTO]:
+        """Get profiles for many users, keyed by user ID."""
+        profiles: dict[int, UserProfileDTO] = {}
+        for chunk in _chunks(list(user_ids), BULK_LOOKUP_CHUNK_SIZE):
+            stmt = select(UserProfile).where(UserProfile.user_id.in_(chunk))
+            for profile in self.session.execute(stmt).scalars():
+                profiles[profile.user_id] = self._profile_to_dto(profile)
+        return profiles
+
+    def get_ticker_follows_for_users(
+        self, user_ids: Sequence[int]
+    ) -> dict[int, list[UserTickerFollowDTO]]:
+        """Get ticker follows for many users, keyed by user ID.
+
+        Each user's follows are ordered like :meth:`get_ticker_follows` and capped
+        at ``MAX_LIMIT_TICKERS``. Users without follows are omitted.
+        """
+        max_limit = getattr(settings, "MAX_LIMIT_TICKERS", 100)
+        follows: dict[int, list[UserTickerFollowDTO]] = {}
+        for chunk in _chunks(list(user_ids), BULK_LOOKUP_CHUNK_SIZE):
+            stmt = (
+                select(UserTickerFollow)
+                .options(joinedload(UserTickerFollow.ticker_obj))
+                .where(UserTickerFollow.user_id.in_(chunk))
+                .order_by(
+                    UserTickerFollow.user_id,
+                    UserTickerFollow.order.asc(),
+                    UserTickerFollow.created_at.asc(),
+                )
+            )
+            for follow in self.session.execute(stmt).unique().scalars():
+                user_follows = follows.setdefault(follow.user_id, [])
+                if len(user_follows) < max_limit:
+                    user_follows.append(self._ticker_follow_to_dto(follow))
+        return follows
+
     def get_ticker_follow(
         self, user_id: int, ticker: str
     ) -> UserTickerFollowDTO | None:
@@ -638,6 +697,25 @@ class UserRepository:
         # Return all follows in order
         return self.get_ticker_follows(user_id)
 
+    @staticmethod
+    def _cadence_from_preferences(
+        user_id: int, preferences: dict | None
+    ) -> EmailCadence:
+        """Resolve email cadence from profile preferences."""
+        if preferences and isinstance(preferences, dict):
+            cadence_str = preferences.get("email_cadence")
+            if cadence_str:
+                try:
+                    return EmailCadence(cadence_str)
+                except ValueError:
+                    logger.warning(
+                        "invalid_email_cadence",
+                        extra={"user_id": user_id, "cadence": cadence_str},
+                    )
+
+        # Default to daily_only for backward compatibility
+        return EmailCadence.DAILY_ONLY
+
     # Helper methods to convert models to DTOs
     @staticmethod
     def _user_to_dto(user: User) -> UserDTO:
@@ -711,3 +789,8 @@ class UserRepository:
             created_at=follow.created_at,
             updated_at=follow.updated_at,
         )
+
+
+def _chunks(items: list[int], size: int) -> Iterator[list[int]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import UTC, date, datetime, timedelta
+from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import Executable, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.db.models import WeeklyDigestSendRecord
 from app.models.dto import WeeklyDigestSendRecordDTO
 
+# Rows per executemany batch for bulk record writes
+RECORD_WRITE_CHUNK_SIZE = 500
+
 
 def get_iso_week_start(dt: datetime | date) -> date:
     """Return Monday of the ISO week containing dt."""
@@ -45,6 +52,80 @@ class WeeklyDigestRepository:
         )
         return self.session.execute(stmt).scalar_one_or_none() is not None
 
+    def get_finalized_user_ids(
+        self, user_ids: Sequence[int], week_start: date
+    ) -> set[int]:
+        """Return the users whose digest for the week is already sent or skipped."""
+        if not user_ids:
+            return set()
+        stmt = select(WeeklyDigestSendRecord.user_id).where(
+            WeeklyDigestSendRecord.user_id.in_(list(user_ids)),
+            WeeklyDigestSendRecord.week_start_date == week_start,
+            WeeklyDigestSendRecord.status.in_(["sent", "skipped"]),
+        )
+        return set(self.session.execute(stmt).scalars())
+
+    def upsert_records(self, week_start: date, rows: Sequence[dict[str, Any]]) -> int:
+        """Write many send records with one ``INSERT ... ON CONFLICT`` statement.
+
+        Each row needs ``user_id`` and ``status`` and may carry ``message_id``,
+        ``error``, ``skip_reason``, ``ticker_count`` and ``days_with_data``.
+        Existing records for the user and week are overwritten, except that a
+        ``sent`` record is never downgraded, so retries stay idempotent.
+
+        Returns:
+            Number of rows submitted
+        """
+        if not rows:
+            return 0
+        now = datetime.now(UTC)
+        values = [
+            {
+                "user_id": row["user_id"],
+                "week_start_date": week_start,
+                "status": row["status"],
+                "ticker_count": row.get("ticker_count", 0),
+                "days_with_data": row.get("days_with_data", 0),
+                "message_id": row.get("message_id"),
+                "error": row.get("error"),
+                "skip_reason": row.get("skip_reason"),
+                "created_at": now,
+                "sent_at": now if row["status"] == "sent" else None,
+            }
+            for row in rows
+        ]
+
+        updated = (
+            "status",
+            "ticker_count",
+            "days_with_data",
+            "message_id",
+            "error",
+            "skip_reason",
+            "sent_at",
+        )
+        current_status = WeeklyDigestSendRecord.status
+        stmt: Executable
+        if self.session.get_bind().dialect.name == "postgresql":
+            pg_stmt = pg_insert(WeeklyDigestSendRecord)
+            stmt = pg_stmt.on_conflict_do_update(
+                index_elements=["user_id", "week_start_date"],
+                set_={column: pg_stmt.excluded[column] for column in updated},
+                where=or_(current_status != "sent", pg_stmt.excluded.status == "sent"),
+            )
+        else:
+            sqlite_stmt = sqlite_insert(WeeklyDigestSendRecord)
+            stmt = sqlite_stmt.on_conflict_do_update(
+                index_elements=["user_id", "week_start_date"],
+                set_={column: sqlite_stmt.excluded[column] for column in updated},
+                where=or_(
+                    current_status != "sent", sqlite_stmt.excluded.status == "sent"
+                ),
+            )
+        for i in range(0, len(values), RECORD_WRITE_CHUNK_SIZE):
+            self.session.execute(stmt, values[i : i + RECORD_WRITE_CHUNK_SIZE])
+        return len(values)
+
     def create_pending(
         self, user_id: int, week_start: date
     ) -> WeeklyDigestSendRecordDTO:
@@ -5,9 +5,12 @@ import logging
 import sys
 
 from sqlalchemy import select, update
+from sqlalchemy.orm import selectinload
 
+from app.db.events import install_session_hooks
 from app.db.models import Article
 from app.db.session import SessionLocal
+from app.services.article_ticker_sync import sync_link_sentiment
 from app.services.sentiment import get_sentiment_service_hybrid
 
 logger = logging.getLogger(__name__)
@@ -48,7 +51,11 @@ def add_sentiment_to_articles(
     db = SessionLocal()
     try:
         # Get articles without sentiment
-        query = select(Article).where(Article.sentiment.is_(None))
+        query = (
+            select(Article)
+            .where(Article.sentiment.is_(None))
+            .options(selectinload(Article.body))
+        )
         if max_articles:
             query = query.limit(max_articles)
 
@@ -94,6 +101,7 @@ def add_sentiment_to_articles(
                         .where(Article.id == article.id)
                         .values(sentiment=sentiment_score)
                     )
+                    sync_link_sentiment(db, {article.id: sentiment_score})
 
                     successful += 1
                     if verbose:
@@ -134,6 +142,7 @@ def add_sentiment_to_articles(
 
 def main() -> None:
     """Main CLI entry point."""
+    install_session_hooks()
     import argparse
 
     parser = argparse.ArgumentParser(
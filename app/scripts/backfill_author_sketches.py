@@ -0,0 +1,79 @@
+"""Backfill the hourly distinct-author sketches from existing article links.
+
+Rebuilds one day at a time, committing after each, from the oldest link (or
+``--days`` back) up to now. Safe to rerun; each day's sketches are replaced.
+Days with comments moved to cold storage are skipped, since their authors
+now exist only in the sketches.
+
+Usage:
+    uv run python -m app.scripts.backfill_author_sketches [--days 90]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db.models import ArticleTicker, TickerStats
+from app.db.session import SessionLocal
+from app.repos.author_sketch_repo import AuthorSketchRepository, hour_floor
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_author_sketches(db: Session, days: int | None = None) -> int:
+    """Rebuild sketches for the last ``days`` days (all history if None).
+
+    Returns:
+        Number of (ticker, hour) sketches written.
+    """
+    now = datetime.now(UTC)
+    if days is not None:
+        start = now - timedelta(days=days)
+    else:
+        oldest = db.scalar(select(func.min(ArticleTicker.published_at)))
+        if oldest is None:
+            return 0
+        start = oldest
+    day = hour_floor(start).replace(hour=0)
+    archived_through = db.scalar(select(func.max(TickerStats.archived_last_mention_at)))
+    if archived_through is not None:
+        # Archival moves whole UTC days
+        day = max(day, hour_floor(archived_through).replace(hour=0) + timedelta(days=1))
+    repo = AuthorSketchRepository(db)
+    written = 0
+    while day < now:
+        written += repo.rebuild(day, min(day + timedelta(days=1), now))
+        db.commit()
+        day += timedelta(days=1)
+    return written
+
+
+def main() -> None:
+    """Run the backfill and log a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--days", type=int, default=None, help="Days back to rebuild (default: all)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        written = backfill_author_sketches(db, days=args.days)
+        logger.info("author_sketch_backfill_complete", extra={"sketches": written})
+        print(f"Wrote {written} ticker-hour author sketches.")
+    except Exception:
+        db.rollback()
+        logger.exception("author_sketch_backfill_failed")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
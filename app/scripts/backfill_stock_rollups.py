@@ -0,0 +1,77 @@
+"""Backfill daily/weekly OHLCV rollups from existing stock price history.
+
+Rebuilds every symbol's rollups over its full history, committing after each
+batch of symbols, and records the covered point in stock_price_rollup_state
+so chart reads stop aggregating raw history. Symbols already covered are
+skipped unless ``--all`` is given. Safe to rerun.
+
+Usage:
+    uv run python -m app.scripts.backfill_stock_rollups [--all]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.models import StockPriceHistory, StockPriceRollupState
+from app.db.session import SessionLocal
+from app.repos.stock_price_repo import StockPriceRepository
+
+logger = logging.getLogger(__name__)
+
+# Symbols rebuilt per transaction
+SYMBOL_BATCH_SIZE = 25
+
+
+def backfill_stock_rollups(db: Session, rebuild_all: bool = False) -> int:
+    """Rebuild rollups for symbols with history (only uncovered ones by default).
+
+    Returns:
+        Number of rollup rows written.
+    """
+    query = select(StockPriceHistory.symbol).distinct()
+    if not rebuild_all:
+        query = query.where(
+            StockPriceHistory.symbol.not_in(select(StockPriceRollupState.symbol))
+        )
+    symbols = sorted(db.scalars(query))
+    repo = StockPriceRepository(db)
+    written = 0
+    for i in range(0, len(symbols), SYMBOL_BATCH_SIZE):
+        written += repo.refresh_rollups(symbols[i : i + SYMBOL_BATCH_SIZE])
+        db.commit()
+        logger.info(
+            "stock_rollup_backfill_progress",
+            extra={"symbols_done": min(i + SYMBOL_BATCH_SIZE, len(symbols))},
+        )
+    return written
+
+
+def main() -> None:
+    """Run the backfill and log a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--all", action="store_true", help="Rebuild symbols that are already covered"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        written = backfill_stock_rollups(db, rebuild_all=args.all)
+        logger.info("stock_rollup_backfill_complete", extra={"rows": written})
+        print(f"Wrote {written} stock price rollup rows.")
+    except Exception:
+        db.rollback()
+        logger.exception("stock_rollup_backfill_failed")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
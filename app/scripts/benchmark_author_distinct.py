@@ -0,0 +1,74 @@
+"""Time distinct-author counts by name versus by author id (PostgreSQL).
+
+Runs the per-ticker unique-user aggregate over ``article_ticker`` once with
+``COUNT(DISTINCT author)`` and once with ``COUNT(DISTINCT author_id)``, the
+second also dropping bot accounts through the ``author`` table.
+"""
+
+import argparse
+import logging
+import time
+
+from sqlalchemy import text
+
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+QUERIES = {
+    "by name": """
+        SELECT ticker, COUNT(DISTINCT author)
+        FROM article_ticker
+        WHERE published_at >= now() - make_interval(days => :days)
+        GROUP BY ticker
+    """,
+    "by author_id": """
+        SELECT ticker, COUNT(DISTINCT author_id)
+        FROM article_ticker
+        WHERE published_at >= now() - make_interval(days => :days)
+        GROUP BY ticker
+    """,
+    "by author_id, no bots": """
+        SELECT t.ticker, COUNT(DISTINCT t.author_id)
+        FROM article_ticker t
+        JOIN author au ON au.id = t.author_id
+        WHERE t.published_at >= now() - make_interval(days => :days)
+          AND NOT au.is_bot
+        GROUP BY t.ticker
+    """,
+}
+
+
+def benchmark_author_distinct(runs: int = 3, days: int = 30) -> None:
+    """Print timings of each distinct-author query over the last ``days``."""
+    db = SessionLocal()
+    try:
+        authors = db.execute(text("SELECT COUNT(*) FROM author")).scalar()
+        print(f"\n👤 AUTHORS: {authors:,}")
+        for label, sql in QUERIES.items():
+            print(f"\n⏱️  {label.upper()} ({runs} runs, last {days} days)")
+            for run in range(1, runs + 1):
+                start = time.perf_counter()
+                rows = db.execute(text(sql), {"days": days}).all()
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                print(f"   Run {run}: {elapsed_ms:,.1f} ms ({len(rows):,} tickers)")
+    except Exception as e:
+        logger.error(f"Failed to benchmark distinct authors: {e}")
+        print(f"❌ Error benchmarking distinct authors: {e}")
+    finally:
+        db.close()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per query")
+    parser.add_argument("--days", type=int, default=30, help="Window in days")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    benchmark_author_distinct(args.runs, args.days)
+
+
+if __name__ == "__main__":
+    main()
@@ -26,7 +26,7 @@ async def collect_all_current_prices():
 
     try:
         # Pass symbols=None to collect ALL tickers
-        result = await collector.collect_current_prices(db)
+        result = await collector.collect_current_prices(db, bulk=True)
 
         logger.info(
             f"Collection completed: "
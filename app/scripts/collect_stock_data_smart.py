@@ -75,7 +75,9 @@ async def collect_smart(
         # Collect data
         if collection_type in ["current", "both"]:
             logger.info("Collecting current prices...")
-            result = await collector.collect_current_prices(db, symbols=symbols)
+            result = await collector.collect_current_prices(
+                db, symbols=symbols, bulk=True
+            )
             logger.info(
                 f"✓ Current prices: {result['success']} success, "
                 f"{result['failed']} failed, {result['duration']:.1f}s"
@@ -0,0 +1,85 @@
+"""Report article table size and aggregate scan time (PostgreSQL).
+
+Run before and after the article_body split (and after the table rewrite
+that reclaims the dropped column) to compare heap size, average row width
+and the cost of the metadata scans behind the analytics pages.
+"""
+
+import argparse
+import logging
+import time
+
+from sqlalchemy import text
+
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Representative metadata-only aggregate: sentiment per source over all rows
+SCAN_SQL = """
+    SELECT source, COUNT(*), AVG(sentiment)
+    FROM article
+    GROUP BY source
+"""
+
+
+def measure_article_table(runs: int = 3) -> None:
+    """Print heap/TOAST size, row width and timed scans of ``article``."""
+    db = SessionLocal()
+    try:
+        sizes = db.execute(
+            text(
+                """
+                SELECT
+                    pg_relation_size('article') AS heap_bytes,
+                    pg_total_relation_size('article') AS total_bytes,
+                    (SELECT relpages FROM pg_class WHERE relname = 'article')
+                        AS pages,
+                    (SELECT AVG(pg_column_size(a.*)) FROM article a)
+                        AS avg_row_bytes
+                """
+            )
+        ).one()
+        print("\n📏 ARTICLE TABLE")
+        print(f"   Heap size:      {sizes.heap_bytes / 1024 / 1024:,.1f} MB")
+        print(f"   Total size:     {sizes.total_bytes / 1024 / 1024:,.1f} MB")
+        print(f"   Pages:          {sizes.pages or 0:,}")
+        print(f"   Avg row width:  {float(sizes.avg_row_bytes or 0):,.0f} bytes")
+
+        has_body_table = db.execute(
+            text("SELECT to_regclass('article_body') IS NOT NULL")
+        ).scalar()
+        if has_body_table:
+            body_bytes = (
+                db.execute(
+                    text("SELECT pg_total_relation_size('article_body')")
+                ).scalar()
+                or 0
+            )
+            print(f"   article_body:   {body_bytes / 1024 / 1024:,.1f} MB")
+
+        print(f"\n⏱️  AGGREGATE SCAN ({runs} runs)")
+        for run in range(1, runs + 1):
+            start = time.perf_counter()
+            db.execute(text(SCAN_SQL)).all()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"   Run {run}: {elapsed_ms:,.1f} ms")
+    except Exception as e:
+        logger.error(f"Failed to measure article table: {e}")
+        print(f"❌ Error measuring article table: {e}")
+    finally:
+        db.close()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3, help="Timed scan runs")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    measure_article_table(args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,11 @@ from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Any
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import selectinload, sessionmaker
 from tqdm import tqdm
 
 from app.config import settings
+from app.db.events import install_session_hooks
 from app.db.models import Article, ArticleTicker, Ticker
 from jobs.ingest.linker import TickerLinker
 
@@ -20,6 +21,7 @@ logger = logging.getLogger(__name__)
 def setup_worker_db():
     """Set up database connection for worker processes."""
     # Import settings in worker to avoid pickling issues
+    install_session_hooks()
 
     engine = create_engine(
         str(settings.postgres_url), pool_pre_ping=True, pool_recycle=3600, echo=False
@@ -192,7 +194,11 @@ class ParallelArticleRelinkingService:
         """Get article data in batches for parallel processing."""
         logger.info("Loading articles for parallel processing...")
 
-        query = self.db.query(Article).order_by(Article.published_at.desc())
+        query = (
+            self.db.query(Article)
+            .options(selectinload(Article.body))
+            .order_by(Article.published_at.desc())
+        )
 
         if limit:
             query = query.limit(limit)
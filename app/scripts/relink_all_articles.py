@@ -5,7 +5,9 @@ import time
 from typing import Any
 
 from sqlalchemy import func, text
+from sqlalchemy.orm import selectinload
 
+from app.db.events import install_session_hooks
 from app.db.models import Article, ArticleTicker, Ticker
 from app.db.session import SessionLocal
 from jobs.ingest.linker import TickerLinker
@@ -55,8 +57,10 @@ class ArticleRelinkingService:
         self, batch_size: int = 100, limit: int | None = None
     ) -> list[Article]:
         """Get articles that need to be re-linked."""
-        query = self.db.query(Article).order_by(
-            Article.published_at.desc()
+        query = (
+            self.db.query(Article)
+            .options(selectinload(Article.body))
+            .order_by(Article.published_at.desc())
         )  # Start with most recent
 
         if limit:
@@ -150,6 +154,7 @@ class ArticleRelinkingService:
             # Get batch of articles
             batch_articles = (
                 self.db.query(Article)
+                .options(selectinload(Article.body))
                 .order_by(Article.published_at.desc())
                 .offset(batch_start)
                 .limit(batch_size)
@@ -287,6 +292,7 @@ class ArticleRelinkingService:
 
 def main():
     """Main function for article re-linking."""
+    install_session_hooks()
     import sys
 
     logging.basicConfig(
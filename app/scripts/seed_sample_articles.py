@@ -3,6 +3,7 @@
 import logging
 from datetime import UTC, datetime, timedelta
 
+from app.db.events import install_session_hooks
 from app.db.models import Article, ArticleTicker
 from app.db.session import SessionLocal
 
@@ -174,6 +175,7 @@ def seed_sample_articles() -> bool:
 
 def main() -> None:
     """Main function for seeding sample articles."""
+    install_session_hooks()
     logging.basicConfig(level=logging.INFO)
     logger.info("Starting sample article seeding...")
 
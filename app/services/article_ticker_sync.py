@@ -0,0 +1,108 @@
+"""Keep the article fields copied onto ``article_ticker`` in sync.
+
+``article_ticker`` carries ``published_at``, ``sentiment``, ``author`` and
+``author_id`` of its article so per-ticker analytics read one table. Links
+added through the ORM get the copies before they are inserted, and ORM
+changes to those article fields are pushed to the article's links in the
+same flush (hooks installed with app.db.events.install_session_hooks).
+Writers that bypass the unit of work set the copies themselves (bulk link
+saves) or call :func:`sync_link_sentiment` (Core sentiment UPDATEs).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from sqlalchemy import bindparam, inspect, select, update
+from sqlalchemy.orm import Session
+
+from app.db.models import Article, ArticleTicker
+
+# Article columns mirrored on article_ticker
+SYNCED_FIELDS = ("published_at", "sentiment", "author", "author_id")
+
+
+def copy_article_fields(link: ArticleTicker, article: Article) -> None:
+    """Set ``link``'s copies of the article fields from ``article``."""
+    for name in SYNCED_FIELDS:
+        setattr(link, name, getattr(article, name))
+
+
+def sync_link_sentiment(session: Session, scores: Mapping[int, float]) -> None:
+    """Copy sentiment written with a Core UPDATE onto the articles' links."""
+    if not scores:
+        return
+    # Run as Core: an ORM executemany UPDATE would match rows by primary key
+    session.connection().execute(
+        update(ArticleTicker)
+        .where(ArticleTicker.article_id == bindparam("b_article_id"))
+        .values(sentiment=bindparam("b_sentiment")),
+        [
+            {"b_article_id": article_id, "b_sentiment": score}
+            for article_id, score in scores.items()
+        ],
+    )
+
+
+def _fill_new_links(session: Session, flush_context, instances) -> None:
+    links = [
+        obj
+        for obj in session.new
+        if isinstance(obj, ArticleTicker) and obj.published_at is None
+    ]
+    if not links:
+        return
+    # Prefer in-memory articles: they may be inserted in this same flush
+    pending = {
+        obj.id: obj
+        for obj in session.new
+        if isinstance(obj, Article) and obj.id is not None
+    }
+    missing: dict[int, list[ArticleTicker]] = {}
+    for link in links:
+        article = link.__dict__.get("article")
+        if article is None and link.article_id is not None:
+            article = pending.get(link.article_id) or session.identity_map.get(
+                session.identity_key(Article, link.article_id)
+            )
+        if article is not None:
+            copy_article_fields(link, article)
+        elif link.article_id is not None:
+            missing.setdefault(link.article_id, []).append(link)
+
+    if missing:
+        with session.no_autoflush:
+            rows = session.execute(
+                select(Article.id, *(getattr(Article, f) for f in SYNCED_FIELDS)).where(
+                    Article.id.in_(list(missing))
+                )
+            ).all()
+        for row in rows:
+            for link in missing[row.id]:
+                for name in SYNCED_FIELDS:
+                    setattr(link, name, getattr(row, name))
+
+
+def _push_article_changes(session: Session, flush_context) -> None:
+    for article in session.dirty:
+        if not isinstance(article, Article):
+            continue
+        state = inspect(article)
+        changed = {
+            name: getattr(article, name)
+            for name in SYNCED_FIELDS
+            if state.attrs[name].history.has_changes()
+        }
+        if changed:
+            session.connection().execute(
+                update(ArticleTicker)
+                .where(ArticleTicker.article_id == article.id)
+                .values(**changed)
+            )
+
+
+# (event, handler, insert) registered by app.db.events.install_session_hooks
+SESSION_HOOKS = (
+    ("before_flush", _fill_new_links, False),
+    ("after_flush", _push_article_changes, False),
+)
@@ -5,12 +5,19 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import httpx
+from fastapi import Depends, Request
 from jose import JWTError, jwt
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.db.models import User, UserProfile
+from app.db.session import get_db
+from app.services.session_cache import (
+    SessionUser,
+    invalidate_session_user,
+    session_user_cache,
+)
 from app.services.slack_service import get_slack_service
 from app.services.user_notification_channel_service import (
     ensure_email_notification_channel,
@@ -235,6 +242,7 @@ class AuthService:
             # Update or create profile if name/avatar provided
             if display_name or avatar_url:
                 self._update_or_create_profile(db, user.id, display_name, avatar_url)
+            invalidate_session_user(db, user.id)
 
             ensure_email_notification_channel(db, user_id=user.id, email=user.email)
 
@@ -464,21 +472,29 @@ class AuthService:
             )
             raise InvalidCredentialsError("Invalid or expired session token") from e
 
-    def get_current_user(self, db: Session, token: str) -> User | None:
+    def get_current_user(self, db: Session, token: str) -> SessionUser | None:
         """Get current user from session token.
 
+        The token is verified on every call; the user lookup is served from
+        :data:`session_user_cache` (keyed by ``sub`` + ``iat``) when possible.
+
         Args:
             db: Database session
             token: JWT session token
 
         Returns:
-            User object if token is valid, None otherwise
+            Snapshot of the active user if token is valid, None otherwise
         """
         try:
             payload = self.verify_session_token(token)
             user_id = int(payload.get("sub", 0))
             if not user_id:
                 return None
+            issued_at = int(payload.get("iat", 0))
+
+            cached = session_user_cache.get(user_id, issued_at)
+            if cached is not None:
+                return cached
 
             user = (
                 db.query(User)
@@ -489,11 +505,44 @@ class AuthService:
                 )
                 .first()
             )
-            return user
+            if user is None:
+                return None
+
+            session_user = SessionUser.from_user(user)
+            session_user_cache.set(user_id, issued_at, session_user)
+            return session_user
         except (InvalidCredentialsError, ValueError):
             return None
 
 
+_auth_service: AuthService | None = None
+
+
 def get_auth_service() -> AuthService:
-    """Dependency to get auth service instance."""
-    return AuthService()
+    """Dependency to get the shared auth service instance."""
+    global _auth_service
+    if _auth_service is None:
+        _auth_service = AuthService()
+    return _auth_service
+
+
+def resolve_session_user(request: Request, db: Session) -> SessionUser | None:
+    """Return the signed-in user for this request, resolving the cookie once.
+
+    The result is memoized on ``request.state.current_user`` so dependencies,
+    handlers and templates (via ``request.state``) share one lookup.
+    """
+    if hasattr(request.state, "current_user"):
+        return request.state.current_user
+
+    token = request.cookies.get("session_token")
+    user = get_auth_service().get_current_user(db, token) if token else None
+    request.state.current_user = user
+    return user
+
+
+def get_optional_session_user(
+    request: Request, db: Session = Depends(get_db)
+) -> SessionUser | None:
+    """Dependency resolving the signed-in user, or None for anonymous requests."""
+    return resolve_session_user(request, db)
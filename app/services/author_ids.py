@@ -0,0 +1,170 @@
+"""Dictionary encoding of article authors as integer ids.
+
+Every real author name gets one ``author`` row; articles and their ticker
+links carry its id as ``author_id``. Ids are resolved through a
+process-wide LRU cache, so steady-state ingest of known authors costs no
+queries.
+
+Articles added through the ORM get their ``author_id`` just before they are
+flushed, once app.db.events.install_session_hooks has run. Bulk writers
+call :func:`assign_author_ids` themselves. An id created in a transaction
+is only cached once that transaction commits, so a rollback cannot leave
+the cache pointing at a missing row.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.db.models import Article, Author
+
+# Reddit placeholders for deleted or missing accounts; these get no id
+ANONYMOUS_AUTHORS = frozenset({"", "[deleted]", "[removed]"})
+
+# Accounts flagged is_bot when first seen
+KNOWN_BOTS = frozenset({"AutoModerator"})
+
+CACHE_SIZE = 200_000
+
+# Names per IN (...) lookup or insert batch
+NAME_CHUNK_SIZE = 1000
+
+# Session.info key holding ids created in the current transaction
+_PENDING_KEY = "author_ids_pending"
+
+
+class AuthorIdCache:
+    """Bounded name -> id map, evicting the least recently used names."""
+
+    def __init__(self, max_size: int = CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._ids: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> int | None:
+        with self._lock:
+            author_id = self._ids.get(name)
+            if author_id is not None:
+                self._ids.move_to_end(name)
+            return author_id
+
+    def put(self, name: str, author_id: int) -> None:
+        with self._lock:
+            self._ids[name] = author_id
+            self._ids.move_to_end(name)
+            while len(self._ids) > self.max_size:
+                self._ids.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+author_id_cache = AuthorIdCache()
+
+
+def _insert(session: Session):
+    if session.get_bind().dialect.name == "postgresql":
+        return pg_insert(Author)
+    return sqlite_insert(Author)
+
+
+def _lookup(session: Session, names: list[str]) -> dict[str, int]:
+    found: dict[str, int] = {}
+    for start in range(0, len(names), NAME_CHUNK_SIZE):
+        chunk = names[start : start + NAME_CHUNK_SIZE]
+        found.update(
+            (row.name, row.id)
+            for row in session.execute(
+                select(Author.name, Author.id).where(Author.name.in_(chunk))
+            )
+        )
+    return found
+
+
+def resolve_author_ids(session: Session, names: Iterable[str | None]) -> dict[str, int]:
+    """Ids for ``names``, creating ``author`` rows for new ones.
+
+    Anonymous placeholders and empty names are left out of the result.
+    """
+    pending: dict[str, int] = session.info.setdefault(_PENDING_KEY, {})
+    ids: dict[str, int] = {}
+    missing = []
+    for name in set(names):
+        if not name or name in ANONYMOUS_AUTHORS:
+            continue
+        author_id = pending.get(name) or author_id_cache.get(name)
+        if author_id is None:
+            missing.append(name)
+        else:
+            ids[name] = author_id
+    if not missing:
+        return ids
+
+    missing.sort()
+    for name, author_id in _lookup(session, missing).items():
+        ids[name] = author_id
+        author_id_cache.put(name, author_id)
+
+    new = [name for name in missing if name not in ids]
+    if new:
+        now = datetime.now(UTC)
+        stmt = _insert(session).on_conflict_do_nothing(index_elements=["name"])
+        for start in range(0, len(new), NAME_CHUNK_SIZE):
+            session.execute(
+                stmt,
+                [
+                    {"name": name, "is_bot": name in KNOWN_BOTS, "created_at": now}
+                    for name in new[start : start + NAME_CHUNK_SIZE]
+                ],
+            )
+        # Rows another writer committed first are found here too
+        created = _lookup(session, new)
+        pending.update(created)
+        ids.update(created)
+    return ids
+
+
+def assign_author_ids(session: Session, articles: Iterable[Article]) -> None:
+    """Set ``author_id`` on articles that have an author but no id yet."""
+    articles = [a for a in articles if a.author_id is None and a.author]
+    if not articles:
+        return
+    with session.no_autoflush:
+        ids = resolve_author_ids(session, (a.author for a in articles))
+    for article in articles:
+        if article.author:
+            article.author_id = ids.get(article.author)
+
+
+def _assign_new_articles(session: Session, flush_context, instances) -> None:
+    assign_author_ids(session, (obj for obj in session.new if isinstance(obj, Article)))
+
+
+def _cache_created(session: Session) -> None:
+    for name, author_id in session.info.pop(_PENDING_KEY, {}).items():
+        author_id_cache.put(name, author_id)
+
+
+def _discard_created(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# (event, handler, insert) registered by app.db.events.install_session_hooks;
+# before_flush runs ahead of the other hooks, which copy author_id onto links
+SESSION_HOOKS = (
+    ("before_flush", _assign_new_articles, True),
+    ("after_commit", _cache_created, False),
+    ("after_rollback", _discard_created, False),
+)
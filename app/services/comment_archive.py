@@ -0,0 +1,429 @@
+"""Cold storage of old Reddit comments as date-partitioned Parquet.
+
+:class:`CommentArchiver` moves ``reddit_comment`` articles older than a
+horizon, with their bodies and ticker links, out of the database into zstd
+Parquet files, one directory per UTC publish date::
+
+    <root>/article/published_date=2026-01-05/part-<first id>-<last id>.parquet
+    <root>/article_ticker/published_date=2026-01-05/part-...parquet
+
+``<root>`` is a local directory or an ``s3://`` URI. ``ticker_stats`` keeps
+counting archived mentions. :func:`read_archive` and
+:func:`connect_duckdb` query the files without touching the database, for
+``analytics/`` SQL and notebooks.
+
+pyarrow (and duckdb, for :func:`connect_duckdb`) are imported on use so the
+web app does not need them.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.models import Article, ArticleBody, ArticleTicker
+from app.repos.ticker_stats_repo import TickerStatsDelta, TickerStatsRepository
+
+if TYPE_CHECKING:
+    import duckdb
+    import pyarrow as pa
+    from pyarrow import fs
+
+logger = logging.getLogger(__name__)
+
+ARCHIVED_SOURCE = "reddit_comment"
+ARTICLE_DATASET = "article"
+LINK_DATASET = "article_ticker"
+PARTITION_COLUMN = "published_date"
+
+# Article ids per IN (...) when reading links and deleting archived rows
+ID_CHUNK_SIZE = 1000
+
+ARTICLE_COLUMNS = (
+    "id",
+    "source",
+    "url",
+    "published_at",
+    "title",
+    "text",
+    "lang",
+    "sentiment",
+    "reddit_id",
+    "subreddit",
+    "author",
+    "author_id",
+    "upvotes",
+    "num_comments",
+    "engagement_score",
+    "reddit_url",
+    "created_at",
+)
+LINK_COLUMNS = (
+    "article_id",
+    "ticker",
+    "confidence",
+    "matched_terms",
+    "published_at",
+    "sentiment",
+    "author",
+    "author_id",
+)
+
+
+def _article_schema() -> pa.Schema:
+    import pyarrow as pa
+
+    timestamp = pa.timestamp("us", tz="UTC")
+    return pa.schema(
+        [
+            ("id", pa.int64()),
+            ("source", pa.string()),
+            ("url", pa.string()),
+            ("published_at", timestamp),
+            ("title", pa.string()),
+            ("text", pa.string()),
+            ("lang", pa.string()),
+            ("sentiment", pa.float64()),
+            ("reddit_id", pa.string()),
+            ("subreddit", pa.string()),
+            ("author", pa.string()),
+            ("author_id", pa.int64()),
+            ("upvotes", pa.int64()),
+            ("num_comments", pa.int64()),
+            ("engagement_score", pa.float64()),
+            ("reddit_url", pa.string()),
+            ("created_at", timestamp),
+        ]
+    )
+
+
+def _link_schema() -> pa.Schema:
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("article_id", pa.int64()),
+            ("ticker", pa.string()),
+            ("confidence", pa.float64()),
+            ("matched_terms", pa.list_(pa.string())),
+            ("published_at", pa.timestamp("us", tz="UTC")),
+            ("sentiment", pa.float64()),
+            ("author", pa.string()),
+            ("author_id", pa.int64()),
+        ]
+    )
+
+
+def _partitioning():
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    return ds.partitioning(pa.schema([(PARTITION_COLUMN, pa.date32())]), flavor="hive")
+
+
+def resolve_archive(uri: str | None = None) -> tuple[fs.FileSystem, str]:
+    """Filesystem and base path for an archive root (defaults to settings)."""
+    from pyarrow import fs
+
+    uri = uri or settings.COMMENT_ARCHIVE_URI
+    if "://" not in uri:
+        return fs.LocalFileSystem(), os.path.abspath(uri)
+    return fs.FileSystem.from_uri(uri)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    # SQLite returns naive datetimes; stored values are UTC
+    if value is None or value.tzinfo:
+        return value
+    return value.replace(tzinfo=UTC)
+
+
+def _day_range(day: date) -> tuple[datetime, datetime]:
+    """``[start, end)`` of a UTC day."""
+    start = datetime.combine(day, time.min, tzinfo=UTC)
+    return start, start + timedelta(days=1)
+
+
+def _chunks(items: list[int], size: int) -> Iterable[list[int]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+@dataclass
+class ArchiveResult:
+    """What one archival run moved."""
+
+    cutoff: datetime
+    days: list[date] = field(default_factory=list)
+    articles: int = 0
+    links: int = 0
+
+
+class CommentArchiver:
+    """Move old Reddit comments from the database to Parquet, a day at a time.
+
+    Each day's files are written before its rows are deleted, and the delete
+    commits per day, so an interrupted run leaves every comment in the
+    database, the archive, or (briefly) both. File names are derived from
+    the archived ids, so re-archiving the same rows overwrites rather than
+    duplicates them.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        uri: str | None = None,
+        horizon_days: int | None = None,
+    ) -> None:
+        horizon_days = horizon_days or settings.COMMENT_ARCHIVE_HORIZON_DAYS
+        if horizon_days <= settings.MAX_DAYS_TIME_SERIES:
+            raise ValueError(
+                f"Archive horizon of {horizon_days} days would archive comments "
+                f"inside the {settings.MAX_DAYS_TIME_SERIES}-day UI window"
+            )
+        self.session = session
+        self.horizon = timedelta(days=horizon_days)
+        self.filesystem, self.base_path = resolve_archive(uri)
+
+    def cutoff(self, now: datetime | None = None) -> datetime:
+        """Start of the UTC day ``horizon`` before ``now``; older rows move."""
+        day = ((now or datetime.now(UTC)) - self.horizon).astimezone(UTC).date()
+        return datetime.combine(day, time.min, tzinfo=UTC)
+
+    def pending_days(self, cutoff: datetime) -> list[date]:
+        """UTC publish dates that still hold comments older than ``cutoff``."""
+        oldest = _as_utc(
+            self.session.scalar(
+                select(func.min(Article.published_at)).where(
+                    Article.source == ARCHIVED_SOURCE, Article.published_at < cutoff
+                )
+            )
+        )
+        if oldest is None:
+            return []
+        day, days = oldest.date(), []
+        while day < cutoff.date():
+            days.append(day)
+            day += timedelta(days=1)
+        return days
+
+    def run(self, now: datetime | None = None, dry_run: bool = False) -> ArchiveResult:
+        """Archive every comment older than the horizon."""
+        result = ArchiveResult(cutoff=self.cutoff(now))
+        for day in self.pending_days(result.cutoff):
+            if dry_run:
+                articles, links = self._count_day(day)
+            else:
+                articles, links = self.archive_day(day)
+                self.session.commit()
+            if articles:
+                result.days.append(day)
+                result.articles += articles
+                result.links += links
+                logger.info(
+                    "comment_archive_day",
+                    extra={
+                        "day": day.isoformat(),
+                        "articles": articles,
+                        "links": links,
+                        "dry_run": dry_run,
+                    },
+                )
+        return result
+
+    def _day_filter(self, day: date) -> list[Any]:
+        start, end = _day_range(day)
+        return [
+            Article.source == ARCHIVED_SOURCE,
+            Article.published_at >= start,
+            Article.published_at < end,
+        ]
+
+    def _count_day(self, day: date) -> tuple[int, int]:
+        articles = self.session.scalar(
+            select(func.count()).select_from(Article).where(*self._day_filter(day))
+        )
+        links = self.session.scalar(
+            select(func.count())
+            .select_from(ArticleTicker)
+            .join(Article, Article.id == ArticleTicker.article_id)
+            .where(*self._day_filter(day))
+        )
+        return articles or 0, links or 0
+
+    def archive_day(self, day: date) -> tuple[int, int]:
+        """Write one day's comments and links to Parquet, then delete them.
+
+        The caller commits.
+
+        Returns:
+            (articles, links) archived
+        """
+        import pyarrow as pa
+
+        article_rows = [
+            {
+                **row._asdict(),
+                "published_at": _as_utc(row.published_at),
+                "created_at": _as_utc(row.created_at),
+            }
+            for row in self.session.execute(
+                select(
+                    *(
+                        ArticleBody.text if name == "text" else getattr(Article, name)
+                        for name in ARTICLE_COLUMNS
+                    )
+                )
+                .outerjoin(ArticleBody, ArticleBody.article_id == Article.id)
+                .where(*self._day_filter(day))
+                .order_by(Article.id)
+            )
+        ]
+        if not article_rows:
+            return 0, 0
+        ids = [row["id"] for row in article_rows]
+
+        # Bounding published_at as well prunes to the day's monthly partition
+        start, end = _day_range(day)
+        in_day = (ArticleTicker.published_at >= start, ArticleTicker.published_at < end)
+        link_rows: list[dict[str, Any]] = []
+        for chunk in _chunks(ids, ID_CHUNK_SIZE):
+            link_rows.extend(
+                {**row._asdict(), "published_at": _as_utc(row.published_at)}
+                for row in self.session.execute(
+                    select(*(getattr(ArticleTicker, name) for name in LINK_COLUMNS))
+                    .where(ArticleTicker.article_id.in_(chunk), *in_day)
+                    .order_by(ArticleTicker.article_id, ArticleTicker.ticker)
+                )
+            )
+
+        file_name = f"part-{ids[0]}-{ids[-1]}.parquet"
+        self._write(
+            ARTICLE_DATASET,
+            day,
+            file_name,
+            pa.Table.from_pylist(article_rows, schema=_article_schema()),
+        )
+        if link_rows:
+            self._write(
+                LINK_DATASET,
+                day,
+                file_name,
+                pa.Table.from_pylist(link_rows, schema=_link_schema()),
+            )
+
+        # Lifetime counters keep these mentions; note them as archived
+        deltas: dict[str, TickerStatsDelta] = {}
+        for link in link_rows:
+            delta = deltas.setdefault(link["ticker"], TickerStatsDelta())
+            delta.mentions += 1
+            if link["sentiment"] is not None:
+                delta.sentiment_sum += link["sentiment"]
+                delta.sentiment_count += 1
+            if delta.last_mention_at is None or (
+                link["published_at"] > delta.last_mention_at
+            ):
+                delta.last_mention_at = link["published_at"]
+        TickerStatsRepository(self.session).record_archived(deltas)
+
+        for chunk in _chunks(ids, ID_CHUNK_SIZE):
+            self.session.execute(
+                delete(ArticleTicker).where(
+                    ArticleTicker.article_id.in_(chunk), *in_day
+                )
+            )
+            self.session.execute(
+                delete(ArticleBody).where(ArticleBody.article_id.in_(chunk))
+            )
+            self.session.execute(
+                delete(Article).where(
+                    Article.id.in_(chunk),
+                    Article.published_at >= start,
+                    Article.published_at < end,
+                )
+            )
+        return len(article_rows), len(link_rows)
+
+    def _write(self, dataset: str, day: date, file_name: str, table: pa.Table) -> None:
+        import pyarrow.parquet as pq
+
+        directory = f"{self.base_path}/{dataset}/{PARTITION_COLUMN}={day.isoformat()}"
+        self.filesystem.create_dir(directory, recursive=True)
+        pq.write_table(
+            table,
+            f"{directory}/{file_name}",
+            filesystem=self.filesystem,
+            compression="zstd",
+        )
+
+
+# Readers ----------------------------------------------------------------------
+
+
+def archive_dataset(dataset: str = ARTICLE_DATASET, uri: str | None = None):
+    """A ``pyarrow.dataset.Dataset`` over one archived table.
+
+    Rows carry a ``published_date`` column from the directory layout;
+    filtering on it skips whole days of files.
+    """
+    import pyarrow.dataset as ds
+
+    if dataset not in (ARTICLE_DATASET, LINK_DATASET):
+        raise ValueError(f"Unknown archive dataset: {dataset!r}")
+    filesystem, base_path = resolve_archive(uri)
+    path = f"{base_path}/{dataset}"
+    if filesystem.get_file_info(path).type.name == "NotFound":
+        schema = _article_schema() if dataset == ARTICLE_DATASET else _link_schema()
+        return ds.InMemoryDataset(schema.empty_table())
+    return ds.dataset(
+        path,
+        filesystem=filesystem,
+        format="parquet",
+        partitioning=_partitioning(),
+    )
+
+
+def read_archive(
+    dataset: str = ARTICLE_DATASET,
+    start: date | None = None,
+    end: date | None = None,
+    columns: list[str] | None = None,
+    uri: str | None = None,
+) -> pa.Table:
+    """Read archived rows published between ``start`` and ``end`` (inclusive)."""
+    import pyarrow.dataset as ds
+
+    data = archive_dataset(dataset, uri)
+    condition = None
+    if PARTITION_COLUMN in data.schema.names:
+        for bound in (
+            ds.field(PARTITION_COLUMN) >= start if start else None,
+            ds.field(PARTITION_COLUMN) <= end if end else None,
+        ):
+            if bound is not None:
+                condition = bound if condition is None else condition & bound
+    return data.to_table(columns=columns, filter=condition)
+
+
+def connect_duckdb(
+    uri: str | None = None, connection: duckdb.DuckDBPyConnection | None = None
+) -> duckdb.DuckDBPyConnection:
+    """DuckDB connection with ``archived_article`` and ``archived_article_ticker``.
+
+    The views scan the Parquet files through pyarrow, so filters on
+    ``published_date`` prune whole days and S3 URIs work as configured.
+    """
+    import duckdb
+
+    connection = connection or duckdb.connect()
+    for dataset in (ARTICLE_DATASET, LINK_DATASET):
+        connection.register(f"archived_{dataset}", archive_dataset(dataset, uri))
+    return connection
@@ -2,32 +2,49 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import math
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import UTC, datetime, time, timedelta
-from typing import Any, Literal
+from typing import Any, Literal, cast
 from zoneinfo import ZoneInfo
 
 from langchain.chat_models import init_chat_model
 from pydantic import BaseModel, Field
-from sqlalchemy import func
+from sqlalchemy import ColumnElement, case, func, or_, select
 from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.db.models import Article, ArticleTicker, LLMSentimentCategory, Ticker
+from app.db.models import (
+    Article,
+    ArticleBody,
+    ArticleTicker,
+    LLMSentimentCategory,
+    StockPrice,
+    Ticker,
+)
+from app.repos.author_sketch_repo import AuthorSketchRepository
+from app.repos.summary_repo import DailyTickerSummaryRepository
 from app.services.engagement import (
     DEFAULT_COMMENT_WEIGHT,
     DEFAULT_UPVOTE_WEIGHT,
-    calculate_engagement_score,
 )
 
 logger = logging.getLogger(__name__)
 
 Framework = Literal["langchain", "langgraph"]
 
+# In-process LLM results kept across service instances (reruns in one process)
+LOCAL_SUMMARY_CACHE_SIZE = 1024
+
+# Characters of article text shown per article in a ticker prompt
+PROMPT_TEXT_CHARS = 500
+
 
 class SummaryInfo(BaseModel):
     """Structured response model for LLM summary with sentiment classification."""
@@ -55,6 +72,62 @@ class SummaryInfo(BaseModel):
     )
 
 
+class PartialSummaryError(RuntimeError):
+    """Raised when the model failed for some, but not all, tickers.
+
+    ``results`` is aligned with ``summary.tickers``; failed tickers are None.
+    Successful responses are already cached, so a rerun only re-invokes the
+    model for the missing tickers.
+    """
+
+    def __init__(self, message: str, results: list[SummaryInfo | None]):
+        super().__init__(message)
+        self.results = results
+
+
+@dataclass
+class SummaryCacheStats:
+    """Prompt-cache counters accumulated by a :class:`DailySummaryService`."""
+
+    local_hits: int = 0
+    db_hits: int = 0
+    misses: int = 0
+    deduplicated: int = 0
+
+
+class SummaryResultCache:
+    """Thread-safe LRU of prompt hash -> :class:`SummaryInfo`."""
+
+    def __init__(self, max_entries: int = LOCAL_SUMMARY_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, SummaryInfo] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> SummaryInfo | None:
+        with self._lock:
+            info = self._entries.get(key)
+            if info is not None:
+                self._entries.move_to_end(key)
+            return info
+
+    def put(self, key: str, info: SummaryInfo) -> None:
+        with self._lock:
+            self._entries[key] = info
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+local_summary_cache = SummaryResultCache()
+
+
 @dataclass(frozen=True)
 class ParsedLLMResponse:
     """Parsed structured response from LLM."""
@@ -171,6 +244,10 @@ class DailyTickerSummary:
     ticker: str
     mentions: int
     articles: list[DailySummaryArticle]
+    # Distinct authors across all of the window's articles, not just the ranked ones
+    participants: int | None = None
+    last_price: float | None = None
+    price_change_percent: float | None = None
 
 
 @dataclass(frozen=True)
@@ -194,11 +271,16 @@ class DailySummaryService:
         articles_per_ticker: int = 10,
         upvote_weight: float = DEFAULT_UPVOTE_WEIGHT,
         comment_weight: float = DEFAULT_COMMENT_WEIGHT,
+        summary_cache: SummaryResultCache | None = None,
     ) -> None:
         self._session = session
         self._articles_per_ticker = max(1, articles_per_ticker)
         self._upvote_weight = upvote_weight
         self._comment_weight = comment_weight
+        self._summary_cache = (
+            summary_cache if summary_cache is not None else local_summary_cache
+        )
+        self.cache_stats = SummaryCacheStats()
 
     def load_previous_day_summary(
         self, max_tickers: int | None = None
@@ -237,40 +319,7 @@ class DailySummaryService:
                 total_ranked_articles=0,
             )
 
-        articles = self._fetch_articles_for_tickers(
-            top_tickers, window_start, window_end
-        )
-
-        ticker_summaries: list[DailyTickerSummary] = []
-        total_mentions = 0
-        total_ranked_articles = 0
-
-        for ticker_symbol, mentions in top_tickers:
-            ranked_articles = [
-                article for article in articles if article.ticker == ticker_symbol
-            ]
-            ranked_articles.sort(
-                key=lambda article: article.engagement_score, reverse=True
-            )
-            limited_articles = ranked_articles[: self._articles_per_ticker]
-
-            ticker_summaries.append(
-                DailyTickerSummary(
-                    ticker=ticker_symbol,
-                    mentions=mentions,
-                    articles=limited_articles,
-                )
-            )
-            total_mentions += mentions
-            total_ranked_articles += len(limited_articles)
-
-        return DailySummaryResult(
-            window_start=window_start,
-            window_end=window_end,
-            tickers=ticker_summaries,
-            total_mentions=total_mentions,
-            total_ranked_articles=total_ranked_articles,
-        )
+        return self._build_result(top_tickers, window_start, window_end)
 
     def load_custom_summary(
         self,
@@ -318,32 +367,46 @@ class DailySummaryService:
                 total_ranked_articles=0,
             )
 
+        return self._build_result(top_tickers, window_start, window_end)
+
+    def _build_result(
+        self,
+        top_tickers: list[tuple[str, int]],
+        window_start: datetime,
+        window_end: datetime,
+    ) -> DailySummaryResult:
+        """Attach ranked articles, participants and prices to the top tickers."""
+        tickers = [ticker for ticker, _ in top_tickers]
         articles = self._fetch_articles_for_tickers(
             top_tickers, window_start, window_end
         )
+        participants = self._fetch_participant_counts(tickers, window_start, window_end)
+        prices = self._fetch_price_snapshot(tickers)
+
+        articles_by_ticker: dict[str, list[DailySummaryArticle]] = {}
+        for article in articles:
+            articles_by_ticker.setdefault(article.ticker, []).append(article)
 
         ticker_summaries: list[DailyTickerSummary] = []
         total_mentions = 0
         total_ranked_articles = 0
 
         for ticker_symbol, mentions in top_tickers:
-            ranked_articles = [
-                article for article in articles if article.ticker == ticker_symbol
-            ]
-            ranked_articles.sort(
-                key=lambda article: article.engagement_score, reverse=True
-            )
-            limited_articles = ranked_articles[: self._articles_per_ticker]
+            ranked_articles = articles_by_ticker.get(ticker_symbol, [])
+            last_price, price_change_percent = prices.get(ticker_symbol, (None, None))
 
             ticker_summaries.append(
                 DailyTickerSummary(
                     ticker=ticker_symbol,
                     mentions=mentions,
-                    articles=limited_articles,
+                    articles=ranked_articles,
+                    participants=participants.get(ticker_symbol, 0),
+                    last_price=last_price,
+                    price_change_percent=price_change_percent,
                 )
             )
             total_mentions += mentions
-            total_ranked_articles += len(limited_articles)
+            total_ranked_articles += len(ranked_articles)
 
         return DailySummaryResult(
             window_start=window_start,
@@ -450,8 +513,8 @@ class DailySummaryService:
                 # Only show score, no other metadata
                 lines.append(f" - Score {article.engagement_score:.2f}:")
                 # Truncate text if too long (limit to ~500 chars)
-                display_text = article_text[:500]
-                if len(article_text) > 500:
+                display_text = article_text[:PROMPT_TEXT_CHARS]
+                if len(article_text) > PROMPT_TEXT_CHARS:
                     display_text += "..."
                 lines.append(f"   {display_text}")
 
@@ -557,11 +620,10 @@ class DailySummaryService:
                 func.upper(ArticleTicker.ticker).label("ticker"),
                 func.count(ArticleTicker.article_id).label("mentions"),
             )
-            .join(Article, Article.id == ArticleTicker.article_id)
             .join(Ticker, Ticker.symbol == ArticleTicker.ticker)
             .filter(
-                Article.published_at >= window_start,
-                Article.published_at < window_end,
+                ArticleTicker.published_at >= window_start,
+                ArticleTicker.published_at < window_end,
                 ~Ticker.name.like("%ETF%"),
             )
             .group_by(func.upper(ArticleTicker.ticker))
@@ -592,52 +654,84 @@ class DailySummaryService:
         window_start: datetime,
         window_end: datetime,
     ) -> list[DailySummaryArticle]:
+        """Return the top ``articles_per_ticker`` articles per ticker by engagement.
+
+        Ranking runs in SQL with ``ROW_NUMBER() OVER (PARTITION BY ticker ...)``
+        so only the selected rows are loaded, as plain columns with ``text``
+        cut to what the prompt shows. Results are ordered by ticker, then rank.
+        """
         tickers = [ticker for ticker, _ in tickers_with_counts]
-        rows = (
-            self._session.query(
-                Article,
-                func.upper(ArticleTicker.ticker).label("ticker"),
+        ticker = func.upper(ArticleTicker.ticker)
+        score = self._engagement_score_expr()
+        ranked = (
+            select(
+                ArticleTicker.article_id,
+                ticker.label("ticker"),
                 ArticleTicker.confidence,
                 ArticleTicker.matched_terms,
+                score.label("engagement_score"),
+                func.row_number()
+                .over(
+                    partition_by=ticker,
+                    order_by=(score.desc(), ArticleTicker.article_id),
+                )
+                .label("rank"),
             )
-            .join(ArticleTicker, Article.id == ArticleTicker.article_id)
-            .filter(
-                func.upper(ArticleTicker.ticker).in_(tickers),
+            .join(Article, Article.id == ArticleTicker.article_id)
+            .where(
+                ticker.in_(tickers),
                 Article.published_at >= window_start,
                 Article.published_at < window_end,
             )
-            .all()
+            .subquery()
         )
-
-        articles: list[DailySummaryArticle] = []
-        for article, ticker, confidence, matched_terms in rows:
-            engagement = self._engagement_score(article, confidence)
-            normalized_terms: tuple[str, ...] = ()
-            if matched_terms:
-                normalized_terms = tuple(str(term) for term in matched_terms if term)
-            articles.append(
-                DailySummaryArticle(
-                    article_id=int(article.id),
-                    ticker=str(ticker).upper(),
-                    title=article.title,
-                    url=article.url,
-                    text=article.text,
-                    published_at=self._ensure_utc(article.published_at),
-                    upvotes=int(article.upvotes or 0),
-                    num_comments=int(article.num_comments or 0),
-                    engagement_score=engagement,
-                    confidence=float(confidence or 0.0),
-                    source=article.source,
-                    matched_terms=normalized_terms,
-                    sentiment=(
-                        float(article.sentiment)
-                        if article.sentiment is not None
-                        else None
-                    ),
-                    subreddit=article.subreddit,
-                    author=article.author,
-                )
+        rows = self._session.execute(
+            select(
+                ranked.c.article_id,
+                ranked.c.ticker,
+                ranked.c.confidence,
+                ranked.c.matched_terms,
+                ranked.c.engagement_score,
+                Article.title,
+                Article.url,
+                # One extra character tells the prompt the text was truncated
+                func.substr(ArticleBody.text, 1, PROMPT_TEXT_CHARS + 1).label("text"),
+                Article.published_at,
+                Article.upvotes,
+                Article.num_comments,
+                Article.source,
+                Article.sentiment,
+                Article.subreddit,
+                Article.author,
             )
+            .join(Article, Article.id == ranked.c.article_id)
+            .outerjoin(ArticleBody, ArticleBody.article_id == Article.id)
+            .where(ranked.c.rank <= self._articles_per_ticker)
+            .order_by(ranked.c.ticker, ranked.c.rank)
+        ).all()
+
+        articles = [
+            DailySummaryArticle(
+                article_id=int(row.article_id),
+                ticker=str(row.ticker).upper(),
+                title=row.title,
+                url=row.url,
+                text=row.text,
+                published_at=self._ensure_utc(row.published_at),
+                upvotes=int(row.upvotes or 0),
+                num_comments=int(row.num_comments or 0),
+                engagement_score=float(row.engagement_score or 0.0),
+                confidence=float(row.confidence or 0.0),
+                source=row.source,
+                matched_terms=tuple(
+                    str(term) for term in (row.matched_terms or ()) if term
+                ),
+                sentiment=float(row.sentiment) if row.sentiment is not None else None,
+                subreddit=row.subreddit,
+                author=row.author,
+            )
+            for row in rows
+        ]
 
         logger.debug(
             "Fetched articles for summary",
@@ -645,28 +739,85 @@ class DailySummaryService:
         )
         return articles
 
+    def _fetch_participant_counts(
+        self, tickers: list[str], window_start: datetime, window_end: datetime
+    ) -> dict[str, int]:
+        """Estimate distinct authors per ticker from the hourly author sketches."""
+        return AuthorSketchRepository(self._session).unique_authors(
+            tickers, window_start, window_end
+        )
+
+    def _fetch_price_snapshot(
+        self, tickers: list[str]
+    ) -> dict[str, tuple[float | None, float | None]]:
+        """Return ``(price, change_percent)`` per ticker from ``stock_price``."""
+        if not tickers:
+            return {}
+        rows = (
+            self._session.query(
+                StockPrice.symbol, StockPrice.price, StockPrice.change_percent
+            )
+            .filter(StockPrice.symbol.in_(tickers))
+            .all()
+        )
+        return {
+            str(row.symbol).upper(): (row.price, row.change_percent) for row in rows
+        }
+
+    def prompt_hash(self, prompt: str) -> str:
+        """Return the cache key for a prompt under the configured model settings."""
+        payload = json.dumps(
+            [
+                settings.daily_summary_llm_model,
+                settings.daily_summary_llm_temperature,
+                settings.daily_summary_llm_max_tokens,
+                prompt,
+            ],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def prompt_hashes(self, summary: DailySummaryResult) -> list[str]:
+        """Return the prompt hash for each ticker in ``summary.tickers`` order."""
+        return [
+            self.prompt_hash(
+                self.build_prompt_for_ticker(
+                    ticker_summary, summary.window_start, summary.window_end
+                )
+            )
+            for ticker_summary in summary.tickers
+        ]
+
     def generate_langchain_summary(
-        self, summary: DailySummaryResult, max_concurrency: int = 5
+        self,
+        summary: DailySummaryResult,
+        max_concurrency: int = 5,
+        force: bool = False,
     ) -> list[SummaryInfo]:
         """Execute the configured LangChain model with one prompt per ticker using batch calls.
 
+        Results are cached by prompt hash: the in-process tier is checked first,
+        then ``daily_ticker_summary.prompt_hash``, and only the remaining distinct
+        prompts are sent to the model. Hit/miss counts accumulate on
+        :attr:`cache_stats`.
+
         Args:
             summary: DailySummaryResult with tickers to summarize
             max_concurrency: Maximum number of parallel API calls (default: 5)
+            force: Skip cache lookups and re-invoke the model for every ticker
 
         Returns:
             List of SummaryInfo objects, one per ticker in the same order as summary.tickers
+
+        Raises:
+            PartialSummaryError: Some (but not all) tickers failed; ``results``
+                holds the successful responses
+            RuntimeError: The model failed for every ticker
         """
 
         if not summary.tickers:
             return []
 
-        api_key = settings.openai_api_key
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY is required to invoke LangChain")
-
-        model_name = settings.daily_summary_llm_model
-
         # Build a prompt for each ticker
         prompts: list[str] = []
         ticker_symbols: list[str] = []
@@ -676,6 +827,94 @@ class DailySummaryService:
             )
             prompts.append(prompt)
             ticker_symbols.append(ticker_summary.ticker)
+        hashes = [self.prompt_hash(prompt) for prompt in prompts]
+
+        results = {} if force else self._cached_results(hashes)
+
+        # Identical prompts (e.g. repeated tickers) are sent once
+        pending: dict[str, tuple[str, str]] = {}
+        for prompt_hash, prompt, ticker in zip(
+            hashes, prompts, ticker_symbols, strict=True
+        ):
+            if prompt_hash not in results and prompt_hash not in pending:
+                pending[prompt_hash] = (ticker, prompt)
+        self.cache_stats.deduplicated += len(hashes) - len(set(hashes))
+        self.cache_stats.misses += len(pending)
+
+        errors: list[Exception] = []
+        if pending:
+            generated, errors = self._invoke_model(pending, max_concurrency)
+            results.update(generated)
+
+        summary_infos = [results.get(prompt_hash) for prompt_hash in hashes]
+        logger.info(
+            "Completed batch LangChain calls",
+            extra={
+                "num_responses": sum(info is not None for info in summary_infos),
+                "tickers": ticker_symbols,
+                "cache_local_hits": self.cache_stats.local_hits,
+                "cache_db_hits": self.cache_stats.db_hits,
+                "cache_misses": self.cache_stats.misses,
+            },
+        )
+
+        if errors:
+            missing = [
+                ticker
+                for ticker, info in zip(ticker_symbols, summary_infos, strict=True)
+                if info is None
+            ]
+            if len(missing) == len(ticker_symbols):
+                raise errors[0]
+            raise PartialSummaryError(
+                f"LLM summary failed for {len(missing)} of {len(ticker_symbols)} "
+                f"tickers: {', '.join(missing)}",
+                results=summary_infos,
+            ) from errors[0]
+
+        return cast(list[SummaryInfo], summary_infos)
+
+    def _cached_results(self, hashes: list[str]) -> dict[str, SummaryInfo]:
+        """Resolve prompt hashes from the local tier, then from stored summaries."""
+        results: dict[str, SummaryInfo] = {}
+        for prompt_hash in set(hashes):
+            cached = self._summary_cache.get(prompt_hash)
+            if cached is not None:
+                results[prompt_hash] = cached
+        self.cache_stats.local_hits += len(results)
+
+        missing = [h for h in set(hashes) if h not in results]
+        stored = DailyTickerSummaryRepository(
+            self._session
+        ).get_llm_results_by_prompt_hash(missing)
+        for prompt_hash, (text, sentiment) in stored.items():
+            info = SummaryInfo(
+                summary=text, sentiment=sentiment or LLMSentimentCategory.NEUTRAL
+            )
+            self._summary_cache.put(prompt_hash, info)
+            results[prompt_hash] = info
+        self.cache_stats.db_hits += len(stored)
+        return results
+
+    def _invoke_model(
+        self, pending: dict[str, tuple[str, str]], max_concurrency: int
+    ) -> tuple[dict[str, SummaryInfo], list[Exception]]:
+        """Run one batch call for the uncached prompts.
+
+        Args:
+            pending: Prompt hash -> (ticker, prompt) for prompts to generate
+            max_concurrency: Maximum number of parallel API calls
+
+        Returns:
+            Responses keyed by prompt hash, and the per-prompt errors (already
+            translated into descriptive RuntimeErrors)
+        """
+        api_key = settings.openai_api_key
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY is required to invoke LangChain")
+
+        model_name = settings.daily_summary_llm_model
+        prompts = [prompt for _, prompt in pending.values()]
 
         # Mask API key for logging (show first 7 and last 4 chars)
         masked_key = f"{api_key[:7]}...{api_key[-4:]}" if len(api_key) > 11 else "***"
@@ -686,9 +925,7 @@ class DailySummaryService:
                 "api_key_preview": masked_key,
                 "num_tickers": len(prompts),
                 "max_concurrency": max_concurrency,
-                "avg_prompt_length": (
-                    sum(len(p) for p in prompts) // len(prompts) if prompts else 0
-                ),
+                "avg_prompt_length": sum(len(p) for p in prompts) // len(prompts),
                 "response_format": "SummaryInfo",
             },
         )
@@ -705,131 +942,138 @@ class DailySummaryService:
         structured_model = model.with_structured_output(SummaryInfo)
 
         try:
-            # Use structured output - responses will be SummaryInfo objects
-            from typing import cast
-
+            # Per-prompt failures come back as exceptions so successful
+            # responses are still cached and persisted
             responses = structured_model.batch(  # type: ignore[attr-defined]
-                cast(Any, prompts), config={"max_concurrency": max_concurrency}
+                cast(Any, prompts),
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True,
             )
         except Exception as e:
-            error_msg = str(e)
-            error_type = type(e).__name__
-
-            # Provide helpful error messages for common issues
-            if (
-                "quota" in error_msg.lower()
-                or "insufficient_quota" in error_msg.lower()
-            ):
-                logger.error(
-                    "OpenAI API quota error",
-                    extra={
-                        "error_type": error_type,
-                        "error_message": error_msg,
-                        "api_key_preview": masked_key,
-                        "model": model_name,
-                    },
-                )
-                raise RuntimeError(
-                    f"OpenAI API quota exceeded. Error: {error_msg}\n"
-                    f"API Key preview: {masked_key}\n"
-                    f"Model: {model_name}\n"
-                    "Please check your OpenAI account billing and quota at https://platform.openai.com/account/billing"
-                ) from e
-            elif "rate_limit" in error_msg.lower() or "429" in error_msg:
-                logger.error(
-                    "OpenAI API rate limit error",
-                    extra={
-                        "error_type": error_type,
-                        "error_message": error_msg,
-                        "api_key_preview": masked_key,
-                        "model": model_name,
-                    },
-                )
-                raise RuntimeError(
-                    f"OpenAI API rate limit exceeded. Error: {error_msg}\n"
-                    f"API Key preview: {masked_key}\n"
-                    f"Model: {model_name}\n"
-                    "Please wait a moment and try again, or check your rate limits at https://platform.openai.com/account/limits"
-                ) from e
-            else:
-                logger.error(
-                    "OpenAI API error",
-                    extra={
-                        "error_type": error_type,
-                        "error_message": error_msg,
-                        "api_key_preview": masked_key,
-                        "model": model_name,
-                    },
-                )
-                raise RuntimeError(
-                    f"OpenAI API error ({error_type}): {error_msg}\n"
-                    f"API Key preview: {masked_key}\n"
-                    f"Model: {model_name}"
-                ) from e
-
-        # Responses are already SummaryInfo objects from structured output
-        summary_infos: list[SummaryInfo] = []
-        for idx, response in enumerate(responses):
+            raise self._llm_error(e, masked_key, model_name) from e
+
+        results: dict[str, SummaryInfo] = {}
+        errors: list[Exception] = []
+        for (prompt_hash, (ticker, _)), response in zip(
+            pending.items(), responses, strict=True
+        ):
+            if isinstance(response, Exception):
+                error = self._llm_error(response, masked_key, model_name)
+                error.__cause__ = response
+                errors.append(error)
+                continue
+
             # Ensure response is SummaryInfo (should be from structured output)
             if isinstance(response, SummaryInfo):
-                summary_infos.append(response)
+                info = response
             else:
                 # Fallback: try to parse if somehow we got a string
                 logger.warning(
                     "Unexpected response type, attempting to parse",
                     extra={
-                        "ticker": (
-                            ticker_symbols[idx]
-                            if idx < len(ticker_symbols)
-                            else "unknown"
-                        ),
+                        "ticker": ticker,
                         "response_type": type(response).__name__,
                     },
                 )
                 # This shouldn't happen with structured output, but handle gracefully
                 parsed = parse_llm_response(str(response))
                 # Use parsed sentiment enum, default to Neutral if None
-                sentiment_enum = parsed.sentiment or LLMSentimentCategory.NEUTRAL
-                summary_infos.append(
-                    SummaryInfo(summary=parsed.summary, sentiment=sentiment_enum)
+                info = SummaryInfo(
+                    summary=parsed.summary,
+                    sentiment=parsed.sentiment or LLMSentimentCategory.NEUTRAL,
                 )
 
             logger.debug(
                 "Received response for ticker",
+                extra={"ticker": ticker, "sentiment": info.sentiment},
+            )
+            self._summary_cache.put(prompt_hash, info)
+            results[prompt_hash] = info
+        return results, errors
+
+    @staticmethod
+    def _llm_error(error: Exception, masked_key: str, model_name: str) -> RuntimeError:
+        """Translate a provider exception into a descriptive RuntimeError."""
+        error_msg = str(error)
+        error_type = type(error).__name__
+
+        # Provide helpful error messages for common issues
+        if "quota" in error_msg.lower() or "insufficient_quota" in error_msg.lower():
+            logger.error(
+                "OpenAI API quota error",
                 extra={
-                    "ticker": (
-                        ticker_symbols[idx] if idx < len(ticker_symbols) else "unknown"
-                    ),
-                    "sentiment": summary_infos[-1].sentiment,
+                    "error_type": error_type,
+                    "error_message": error_msg,
+                    "api_key_preview": masked_key,
+                    "model": model_name,
                 },
             )
-
-        logger.info(
-            "Completed batch LangChain calls",
+            return RuntimeError(
+                f"OpenAI API quota exceeded. Error: {error_msg}\n"
+                f"API Key preview: {masked_key}\n"
+                f"Model: {model_name}\n"
+                "Please check your OpenAI account billing and quota at https://platform.openai.com/account/billing"
+            )
+        if "rate_limit" in error_msg.lower() or "429" in error_msg:
+            logger.error(
+                "OpenAI API rate limit error",
+                extra={
+                    "error_type": error_type,
+                    "error_message": error_msg,
+                    "api_key_preview": masked_key,
+                    "model": model_name,
+                },
+            )
+            return RuntimeError(
+                f"OpenAI API rate limit exceeded. Error: {error_msg}\n"
+                f"API Key preview: {masked_key}\n"
+                f"Model: {model_name}\n"
+                "Please wait a moment and try again, or check your rate limits at https://platform.openai.com/account/limits"
+            )
+        logger.error(
+            "OpenAI API error",
             extra={
-                "num_responses": len(summary_infos),
-                "tickers": ticker_symbols,
+                "error_type": error_type,
+                "error_message": error_msg,
+                "api_key_preview": masked_key,
+                "model": model_name,
             },
         )
+        return RuntimeError(
+            f"OpenAI API error ({error_type}): {error_msg}\n"
+            f"API Key preview: {masked_key}\n"
+            f"Model: {model_name}"
+        )
 
-        return summary_infos
+    def _engagement_score_expr(self) -> ColumnElement[float | None]:
+        """SQL form of the ranking score: weighted engagement times confidence.
+
+        The stored ``article.engagement_score`` is used when the weights are the
+        defaults it was computed with; otherwise the score is recomputed the
+        way :func:`calculate_engagement_score` does.
+        """
+        upvotes = case((Article.upvotes > 0, Article.upvotes), else_=0)
+        comments = case((Article.num_comments > 0, Article.num_comments), else_=0)
+        computed = self._upvote_weight * func.ln(
+            upvotes + 1.0
+        ) + self._comment_weight * func.ln(comments + 1.0)
 
-    def _engagement_score(self, article: Article, confidence: float | None) -> float:
-        conf = max(0.0, float(confidence or 1.0))
-        base_score = article.engagement_score
         weights_match_defaults = math.isclose(
             self._upvote_weight, DEFAULT_UPVOTE_WEIGHT
         ) and math.isclose(self._comment_weight, DEFAULT_COMMENT_WEIGHT)
+        base = (
+            func.coalesce(Article.engagement_score, computed)
+            if weights_match_defaults
+            else computed
+        )
 
-        if base_score is None or not weights_match_defaults:
-            base_score = calculate_engagement_score(
-                article.upvotes,
-                article.num_comments,
-                upvote_weight=self._upvote_weight,
-                comment_weight=self._comment_weight,
-            )
-
-        return float(base_score) * conf
+        confidence = ArticleTicker.confidence
+        weight = case(
+            (or_(confidence.is_(None), confidence == 0), 1.0),
+            (confidence < 0, 0.0),
+            else_=confidence,
+        )
+        return base * weight
 
     def _ensure_utc(self, published_at: datetime) -> datetime:
         if published_at.tzinfo is None:
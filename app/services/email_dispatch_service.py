@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import logging
-import time
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import date, timedelta
 
 from sqlalchemy.orm import Session
@@ -14,10 +14,13 @@ from app.models.dto import (
     EmailCadence,
     EmailSendResult,
     UserDTO,
+    UserProfileDTO,
+    UserTickerFollowDTO,
 )
 from app.repos.email_send_log_repo import EmailSendLogRepository
 from app.repos.summary_repo import DailyTickerSummaryRepository
 from app.repos.user_repo import UserRepository
+from app.services.email_send_pool import ConcurrentEmailSender, SendOutcome
 from app.services.email_service import EmailService
 from app.services.email_utils import generate_unsubscribe_token
 
@@ -35,6 +38,16 @@ class DispatchStats:
     dry_run: bool
 
 
+@dataclass
+class BriefingRecipient:
+    """A user with everything needed to render their daily briefing."""
+
+    user: UserDTO
+    summaries: list[DailyTickerSummaryDTO]
+    profile: UserProfileDTO | None = None
+    follows: list[UserTickerFollowDTO] = field(default_factory=list)
+
+
 class EmailDispatchService:
     """Service for dispatching daily briefing emails to users."""
 
@@ -45,6 +58,7 @@ class EmailDispatchService:
         user_repo: UserRepository | None = None,
         summary_repo: DailyTickerSummaryRepository | None = None,
         send_log_repo: EmailSendLogRepository | None = None,
+        sender: ConcurrentEmailSender | None = None,
     ):
         """Initialize dispatch service.
 
@@ -54,12 +68,14 @@ class EmailDispatchService:
             user_repo: User repository (created if not provided)
             summary_repo: Summary repository (created if not provided)
             send_log_repo: Send log repository (created if not provided)
+            sender: Concurrent sender (sized to the provider quota if not provided)
         """
         self.session = session
         self.email_service = email_service
         self.user_repo = user_repo or UserRepository(session)
         self.summary_repo = summary_repo or DailyTickerSummaryRepository(session)
         self.send_log_repo = send_log_repo or EmailSendLogRepository(session)
+        self._sender = sender
 
     def get_eligible_users(self) -> list[UserDTO]:
         """Get all users eligible for daily briefing emails.
@@ -68,12 +84,8 @@ class EmailDispatchService:
             List of users with daily briefing enabled AND email cadence
             set to 'daily_only' or 'both'
         """
-        users = self.user_repo.get_users_with_daily_briefing_enabled()
-
-        # Filter by email cadence - only include users who want daily emails
         eligible_users = []
-        for user in users:
-            cadence = self.user_repo.get_email_cadence(user.id)
+        for user, cadence in self.user_repo.get_daily_briefing_users_with_cadence():
             if cadence in (EmailCadence.DAILY_ONLY, EmailCadence.BOTH):
                 eligible_users.append(user)
             else:
@@ -86,20 +98,42 @@ class EmailDispatchService:
 
     def filter_users_with_summaries(
         self, users: list[UserDTO], summary_date: date
-    ) -> list[tuple[UserDTO, list[DailyTickerSummaryDTO]]]:
-        """Filter users who have summaries for their followed tickers.
+    ) -> list[BriefingRecipient]:
+        """Plan the dispatch: resolve follows, profiles and summaries in bulk.
+
+        Follows and profiles are loaded with one IN query per chunk of users,
+        and the day's summaries are fetched once for the union of followed
+        tickers and fanned out to users in memory.
 
         Args:
             users: List of eligible users
             summary_date: Target summary date
 
         Returns:
-            List of tuples (user, summaries) for users with summaries
+            Recipients (with profile, follows and summaries) for users who
+            have summaries for their followed tickers
         """
-        result: list[tuple[UserDTO, list[DailyTickerSummaryDTO]]] = []
+        user_ids = [user.id for user in users]
+        follows_by_user = self.user_repo.get_ticker_follows_for_users(user_ids)
+
+        all_tickers = sorted(
+            {
+                follow.ticker.upper()
+                for follows in follows_by_user.values()
+                for follow in follows
+            }
+        )
+        summaries_by_ticker: dict[str, list[DailyTickerSummaryDTO]] = defaultdict(list)
+        for summary in self.summary_repo.get_summaries(
+            tickers=all_tickers, start_date=summary_date, end_date=summary_date
+        ):
+            # Filter to only summaries with llm_summary (not null)
+            if summary.llm_summary is not None:
+                summaries_by_ticker[summary.ticker.upper()].append(summary)
 
+        recipients: list[BriefingRecipient] = []
         for user in users:
-            follows = self.user_repo.get_ticker_follows(user.id)
+            follows = follows_by_user.get(user.id)
             if not follows:
                 logger.debug(
                     "Skipping user - no ticker follows",
@@ -107,14 +141,12 @@ class EmailDispatchService:
                 )
                 continue
 
-            tickers = [follow.ticker.upper() for follow in follows]
-
-            summaries = self.summary_repo.get_summaries(
-                tickers=tickers, start_date=summary_date, end_date=summary_date
-            )
-
-            # Filter to only summaries with llm_summary (not null)
-            summaries_with_content = [s for s in summaries if s.llm_summary is not None]
+            tickers = sorted({follow.ticker.upper() for follow in follows})
+            summaries_with_content = [
+                summary
+                for ticker in tickers
+                for summary in summaries_by_ticker.get(ticker, ())
+            ]
 
             if not summaries_with_content:
                 logger.info(
@@ -127,108 +159,111 @@ class EmailDispatchService:
                 )
                 continue
 
-            result.append((user, summaries_with_content))
+            recipients.append(
+                BriefingRecipient(
+                    user=user, summaries=summaries_with_content, follows=follows
+                )
+            )
 
-        return result
+        profiles = self.user_repo.get_profiles([r.user.id for r in recipients])
+        for recipient in recipients:
+            recipient.profile = profiles.get(recipient.user.id)
+
+        return recipients
+
+    @property
+    def sender(self) -> ConcurrentEmailSender:
+        """Rate-governed concurrent sender, sized on first use."""
+        if self._sender is None:
+            self._sender = ConcurrentEmailSender.for_email_service(self.email_service)
+        return self._sender
+
+    def _send_to_recipient(self, recipient: BriefingRecipient) -> EmailSendResult:
+        """Render and send one briefing (runs on a sender worker thread)."""
+        return self.email_service.send_summary_email(
+            user=recipient.user,
+            ticker_summaries=recipient.summaries,
+            user_profile=recipient.profile,
+            user_ticker_follows=recipient.follows,
+            unsubscribe_token=generate_unsubscribe_token(recipient.user.id),
+        )
 
     def send_batch(
         self,
-        batch: list[tuple[UserDTO, list[DailyTickerSummaryDTO]]],
+        batch: list[BriefingRecipient],
         summary_date: date,
         dry_run: bool = False,
     ) -> tuple[int, int]:
         """Send emails to a batch of users.
 
         Args:
-            batch: List of (user, summaries) tuples
+            batch: Recipients planned by :meth:`filter_users_with_summaries`
             summary_date: Summary date
             dry_run: If True, log but don't send
 
         Returns:
             Tuple of (sent_count, failed_count)
         """
-        sent = 0
-        failed = 0
-        rate_limit_delay = 1.0 / 14.0  # 14 emails per second
-
-        for idx, (user, summaries) in enumerate(batch):
-            try:
-                profile = self.user_repo.get_profile(user.id)
-                follows = self.user_repo.get_ticker_follows(user.id)
-
-                unsubscribe_token = generate_unsubscribe_token(user.id)
-
-                if dry_run:
-                    logger.info(
-                        "DRY RUN: Would send email",
-                        extra={
-                            "user_id": user.id,
-                            "user_email": user.email,
-                            "ticker_count": len(summaries),
-                            "summary_date": summary_date.isoformat(),
-                        },
-                    )
-                    # Create a mock success result for dry run
-                    result = EmailSendResult(
+        if dry_run:
+            for recipient in batch:
+                logger.info(
+                    "DRY RUN: Would send email",
+                    extra={
+                        "user_id": recipient.user.id,
+                        "user_email": recipient.user.email,
+                        "ticker_count": len(recipient.summaries),
+                        "summary_date": summary_date.isoformat(),
+                    },
+                )
+            # Create a mock success result for dry run
+            outcomes = [
+                SendOutcome(
+                    item=recipient,
+                    result=EmailSendResult(
                         success=True,
                         message_id="dry-run-message-id",
                         error=None,
                         provider=self.email_service.provider_name,
-                    )
-                    sent += 1
-                else:
-                    result = self.email_service.send_summary_email(
-                        user=user,
-                        ticker_summaries=summaries,
-                        user_profile=profile,
-                        user_ticker_follows=follows,
-                        unsubscribe_token=unsubscribe_token,
-                    )
-
-                    if result.success:
-                        sent += 1
-                    else:
-                        failed += 1
-
-                    # Rate limiting: sleep between sends (except after last one)
-                    if idx < len(batch) - 1:
-                        time.sleep(rate_limit_delay)
-
-                # Log the send attempt
-                self.send_log_repo.create_log_entry(
-                    user_id=user.id,
-                    email_address=user.email,
-                    summary_date=summary_date,
-                    ticker_count=len(summaries),
-                    result=result,
+                    ),
                 )
+                for recipient in batch
+            ]
+        else:
+            outcomes = self.sender.send_all(batch, self._send_to_recipient)
 
-            except Exception as e:
+        sent = 0
+        failed = 0
+        log_entries = []
+        for outcome in outcomes:
+            user = outcome.item.user
+            result = outcome.result
+            if result is None:
                 logger.error(
                     "Error sending email to user",
                     extra={
                         "user_id": user.id,
                         "user_email": user.email,
-                        "error": str(e),
+                        "error": str(outcome.error),
                     },
-                    exc_info=True,
+                    exc_info=outcome.error,
                 )
-                failed += 1
-
-                # Log the failure
-                error_result = EmailSendResult(
+                result = EmailSendResult(
                     success=False,
                     message_id=None,
-                    error=str(e),
+                    error=str(outcome.error),
                     provider=self.email_service.provider_name,
                 )
-                self.send_log_repo.create_log_entry(
-                    user_id=user.id,
-                    email_address=user.email,
-                    summary_date=summary_date,
-                    ticker_count=len(summaries) if summaries else 0,
-                    result=error_result,
-                )
+
+            if result.success:
+                sent += 1
+            else:
+                failed += 1
+            log_entries.append(
+                (user.id, user.email, len(outcome.item.summaries), result)
+            )
+
+        # Log all send attempts with one flush
+        self.send_log_repo.create_log_entries(summary_date, log_entries)
 
         return sent, failed
 
@@ -294,25 +329,40 @@ class EmailDispatchService:
         failed = 0
         skipped = total_users - len(users_with_summaries)
 
-        for i in range(0, len(users_with_summaries), batch_size):
-            batch = users_with_summaries[i : i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (len(users_with_summaries) + batch_size - 1) // batch_size
-
-            logger.info(
-                "Processing batch",
-                extra={
-                    "batch_num": batch_num,
-                    "total_batches": total_batches,
-                    "batch_size": len(batch),
-                },
+        # Ticker sections are shared across users; render each one once
+        summaries = (
+            []
+            if dry_run
+            else list(
+                {
+                    summary.id: summary
+                    for recipient in users_with_summaries
+                    for summary in recipient.summaries
+                }.values()
             )
+        )
+        with self.email_service.daily_briefing_render_cache(summaries):
+            for i in range(0, len(users_with_summaries), batch_size):
+                batch = users_with_summaries[i : i + batch_size]
+                batch_num = (i // batch_size) + 1
+                total_batches = (
+                    len(users_with_summaries) + batch_size - 1
+                ) // batch_size
 
-            batch_sent, batch_failed = self.send_batch(
-                batch, summary_date, dry_run=dry_run
-            )
-            sent += batch_sent
-            failed += batch_failed
+                logger.info(
+                    "Processing batch",
+                    extra={
+                        "batch_num": batch_num,
+                        "total_batches": total_batches,
+                        "batch_size": len(batch),
+                    },
+                )
+
+                batch_sent, batch_failed = self.send_batch(
+                    batch, summary_date, dry_run=dry_run
+                )
+                sent += batch_sent
+                failed += batch_failed
 
         stats = DispatchStats(
             total_users=total_users,
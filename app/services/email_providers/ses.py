@@ -2,6 +2,7 @@
 
 import logging
 import time
+from contextlib import AbstractContextManager
 from typing import TYPE_CHECKING
 
 import boto3
@@ -245,6 +246,25 @@ class SESEmailService(EmailService):
             text_body=text_body,
         )
 
+    def daily_briefing_render_cache(
+        self, ticker_summaries: list["DailyTickerSummaryDTO"]
+    ) -> AbstractContextManager[None]:
+        """Render each ticker section once for the duration of a dispatch."""
+        return self.template_service.ticker_section_cache(ticker_summaries)
+
+    def get_max_send_rate(self) -> float | None:
+        """Return the account's SES ``MaxSendRate`` (emails per second)."""
+        try:
+            quota = self.client.get_send_quota()
+        except Exception as e:
+            logger.warning(
+                "Failed to read SES send quota",
+                extra={"provider": self.provider_name, "error": str(e)},
+            )
+            return None
+        rate = quota.get("MaxSendRate")
+        return float(rate) if rate else None
+
     def _send_with_retry(
         self,
         source: str,
@@ -0,0 +1,162 @@
+"""Concurrent email sending governed by a token-bucket send-rate limit."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from app.config import settings
+
+if TYPE_CHECKING:
+    from app.services.email_service import EmailService
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class TokenBucket:
+    """Thread-safe token bucket; :meth:`acquire` blocks until a token is free.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``. The
+    default capacity of one token paces sends evenly instead of bursting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                # Tolerate float rounding so a refill of exactly one token counts
+                if self._tokens >= 1 - 1e-9:
+                    self._tokens = max(self._tokens - 1, 0.0)
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+
+@dataclass
+class SendOutcome(Generic[T, R]):
+    """Result of sending one item; exactly one of ``result``/``error`` is set."""
+
+    item: T
+    result: R | None = None
+    error: Exception | None = None
+
+
+class ConcurrentEmailSender:
+    """Send emails from a worker pool without exceeding the provider send rate.
+
+    Each worker takes a token from a shared :class:`TokenBucket` before calling
+    the send function, so throughput approaches ``max_send_rate`` even when a
+    single provider round-trip takes longer than ``1 / max_send_rate``. Retries
+    stay inside the provider (e.g. ``SESEmailService._send_with_retry``).
+    """
+
+    def __init__(self, max_send_rate: float, max_workers: int = 8):
+        """Initialize the sender.
+
+        Args:
+            max_send_rate: Maximum sends per second across all workers
+            max_workers: Number of concurrent sends
+        """
+        self.max_send_rate = max_send_rate
+        self.max_workers = max_workers
+        self.bucket = TokenBucket(max_send_rate)
+
+    @classmethod
+    def for_email_service(
+        cls, email_service: EmailService, max_workers: int | None = None
+    ) -> ConcurrentEmailSender:
+        """Build a sender sized to the provider's quota (or the configured rate)."""
+        rate = email_service.get_max_send_rate()
+        if not isinstance(rate, int | float) or rate <= 0:
+            rate = settings.email_max_send_rate
+        logger.info(
+            "Email sender configured",
+            extra={"provider": email_service.provider_name, "max_send_rate": rate},
+        )
+        return cls(
+            max_send_rate=rate,
+            max_workers=max_workers or settings.email_send_concurrency,
+        )
+
+    def send_all(
+        self, items: Sequence[T], send: Callable[[T], R]
+    ) -> list[SendOutcome[T, R]]:
+        """Send every item, returning outcomes in input order.
+
+        Exceptions raised by ``send`` are captured on the outcome rather than
+        aborting the remaining sends.
+        """
+        if not items:
+            return []
+        if self.max_workers <= 1 or len(items) == 1:
+            return [self._send_one(item, send) for item in items]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items)),
+            thread_name_prefix="email-send",
+        ) as pool:
+            return list(pool.map(lambda item: self._send_one(item, send), items))
+
+    def send_iter(
+        self, items: Sequence[T], send: Callable[[T], R]
+    ) -> Iterator[SendOutcome[T, R]]:
+        """Send every item, yielding each outcome as soon as its send finishes.
+
+        Outcomes arrive in completion order, so callers can record each send
+        before the rest of the batch is done. If the caller stops iterating
+        (or raises), sends that have not started yet are cancelled.
+        """
+        if not items:
+            return
+        if self.max_workers <= 1 or len(items) == 1:
+            for item in items:
+                yield self._send_one(item, send)
+            return
+
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items)),
+            thread_name_prefix="email-send",
+        )
+        try:
+            futures = [pool.submit(self._send_one, item, send) for item in items]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _send_one(self, item: T, send: Callable[[T], R]) -> SendOutcome[T, R]:
+        self.bucket.acquire()
+        try:
+            return SendOutcome(item=item, result=send(item))
+        except Exception as exc:
+            return SendOutcome(item=item, error=exc)
@@ -2,6 +2,7 @@
 
 import logging
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING
 
 from app.models.dto import EmailSendResult
@@ -149,6 +150,20 @@ class EmailService(ABC):
             f"Raw email sending not supported by {self.provider_name} provider"
         )
 
+    def daily_briefing_render_cache(
+        self, ticker_summaries: list["DailyTickerSummaryDTO"]
+    ) -> AbstractContextManager[None]:
+        """Scope per-dispatch rendering caches for a day's summaries.
+
+        Providers that render templates may hydrate and pre-render shared
+        per-ticker content once inside this block. The default is a no-op.
+        """
+        return nullcontext()
+
+    def get_max_send_rate(self) -> float | None:
+        """Return the provider's maximum sends per second, if it exposes one."""
+        return None
+
 
 def get_email_service() -> EmailService:
     """Factory function to get the configured email service.
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Sequence
+from collections import defaultdict
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import UTC, date, datetime, time, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
-from sqlalchemy import func, select
+from markupsafe import Markup
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.db.models import Article, ArticleTicker, StockPrice
+from app.db.models import Article, ArticleBody, StockPrice
 from app.db.session import SessionLocal
 from app.models.dto import (
     DailyTickerSummaryDTO,
@@ -21,6 +25,7 @@ from app.models.dto import (
     UserTickerFollowDTO,
     WeeklyDigestContent,
 )
+from app.repos.author_sketch_repo import AuthorSketchRepository
 from app.services.email_utils import (
     build_unsubscribe_url,
     ensure_plain_text,
@@ -28,12 +33,25 @@ from app.services.email_utils import (
     map_sentiment_to_display,
 )
 
+# Article ids per loader call when priming a dispatch's ticker sections
+ARTICLE_LOAD_CHUNK_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class TickerSection:
+    """Pre-rendered HTML and plain-text fragments for one ticker card."""
+
+    html: Markup
+    text: str
+
 
 class EmailTemplateService:
     """Service responsible for rendering email templates."""
 
     HTML_TEMPLATE = "daily_briefing.html"
     TEXT_TEMPLATE = "daily_briefing.txt"
+    SECTION_HTML_TEMPLATE = "_ticker_section.html"
+    SECTION_TEXT_TEMPLATE = "_ticker_section.txt"
     WEEKLY_HTML_TEMPLATE = "weekly_digest.html"
     WEEKLY_TEXT_TEMPLATE = "weekly_digest.txt"
 
@@ -72,6 +90,92 @@ class EmailTemplateService:
             self._summary_tz = ZoneInfo(settings.daily_summary_window_timezone)
         except ZoneInfoNotFoundError:
             self._summary_tz = ZoneInfo("UTC")
+        # Per-dispatch caches; None outside of ticker_section_cache()
+        self._ticker_data: dict[tuple[str, date | None], dict] | None = None
+        self._sections: dict[tuple[str, str], TickerSection] | None = None
+
+    @contextmanager
+    def ticker_section_cache(
+        self, ticker_summaries: Sequence[DailyTickerSummaryDTO]
+    ) -> Iterator[None]:
+        """Hydrate and render each ticker's section once for a dispatch run.
+
+        Inside the block, daily briefings reuse the cached ticker data and
+        fragments, so each email only renders its personalised header and
+        footer. Article metadata (and participant counts and last prices for
+        summaries stored before the job persisted them) are loaded with a few
+        batched queries up front.
+        """
+        self.prime_ticker_sections(ticker_summaries)
+        try:
+            yield
+        finally:
+            self._ticker_data = None
+            self._sections = None
+
+    def prime_ticker_sections(
+        self, ticker_summaries: Sequence[DailyTickerSummaryDTO]
+    ) -> None:
+        """Start a fresh section cache and hydrate ``ticker_summaries`` in bulk."""
+        self._ticker_data = {}
+        self._sections = {}
+        summaries = list(
+            {
+                self._summary_key(summary): summary for summary in ticker_summaries
+            }.values()
+        )
+        if not summaries:
+            return
+
+        article_ids = sorted(
+            {
+                article_id
+                for summary in summaries
+                for article_id in self._article_ids(summary.top_articles)
+            }
+        )
+        article_map: dict[int, dict] = {}
+        for i in range(0, len(article_ids), ARTICLE_LOAD_CHUNK_SIZE):
+            article_map.update(
+                self._article_loader(article_ids[i : i + ARTICLE_LOAD_CHUNK_SIZE])
+            )
+
+        # Only summaries written before the job stored these need live lookups
+        tickers_by_date: dict[date, set[str]] = defaultdict(set)
+        for summary in summaries:
+            if summary.summary_date and summary.participant_count is None:
+                tickers_by_date[summary.summary_date].add(summary.ticker)
+        participants = {
+            (ticker, summary_date): count
+            for summary_date, tickers in tickers_by_date.items()
+            for ticker, count in self._get_participant_counts(
+                sorted(tickers), summary_date
+            ).items()
+        }
+        unpriced = sorted({s.ticker for s in summaries if s.last_price is None})
+        prices = self._get_last_prices(unpriced) if unpriced else {}
+
+        for summary in summaries:
+            key = self._summary_key(summary)
+            participant_count = summary.participant_count
+            if participant_count is None and summary.summary_date:
+                participant_count = participants.get(
+                    (summary.ticker, summary.summary_date), 0
+                )
+            self._ticker_data[key] = self._hydrate_summary(
+                summary,
+                articles=self._normalize_articles(
+                    summary.top_articles,
+                    summary.summary_date,
+                    article_map=article_map,
+                ),
+                participant_count=participant_count,
+                last_price=(
+                    round(summary.last_price, 2)
+                    if summary.last_price is not None
+                    else prices.get(summary.ticker)
+                ),
+            )
 
     def render_daily_briefing(
         self,
@@ -250,6 +354,7 @@ class EmailTemplateService:
             "date_display": format_summary_date(summary_date, timezone),
             "timezone": timezone or settings.daily_summary_window_timezone,
             "tickers": tickers,
+            "ticker_sections": [self._ticker_section(ticker) for ticker in tickers],
             "has_tickers": bool(tickers),
             "unsubscribe_url": build_unsubscribe_url(unsubscribe_token),
             "company_name": settings.email_company_name,
@@ -296,8 +401,49 @@ class EmailTemplateService:
         summary: DailyTickerSummaryDTO,
         follow: UserTickerFollowDTO | None,
     ) -> dict:
+        cache = self._ticker_data
+        key = self._summary_key(summary)
+        shared = cache.get(key) if cache is not None else None
+        if shared is None:
+            shared = self._hydrate_summary(
+                summary,
+                articles=self._normalize_articles(
+                    summary.top_articles, summary.summary_date
+                ),
+                participant_count=(
+                    summary.participant_count
+                    if summary.participant_count is not None
+                    else self._get_participant_count(
+                        summary.ticker, summary.summary_date
+                    )
+                ),
+                last_price=(
+                    round(summary.last_price, 2)
+                    if summary.last_price is not None
+                    else self._get_last_price(summary.ticker)
+                ),
+            )
+            if cache is not None:
+                cache[key] = shared
+
+        return {
+            **shared,
+            "name": (
+                follow.ticker_name if follow and follow.ticker_name else summary.ticker
+            ),
+            "follow_order": follow.order if follow else None,
+        }
+
+    def _hydrate_summary(
+        self,
+        summary: DailyTickerSummaryDTO,
+        *,
+        articles: list[dict],
+        participant_count: int | None,
+        last_price: float | None,
+    ) -> dict:
+        """Build the user-independent part of a ticker's template data."""
         sentiment = map_sentiment_to_display(summary.llm_sentiment)
-        articles = self._normalize_articles(summary.top_articles, summary.summary_date)
         summary_text = summary.llm_summary or ""
         bullets = summary.llm_summary_bullets or []
         bullets_plain = []
@@ -308,9 +454,6 @@ class EmailTemplateService:
 
         return {
             "symbol": summary.ticker,
-            "name": (
-                follow.ticker_name if follow and follow.ticker_name else summary.ticker
-            ),
             "sentiment": sentiment.key,
             "sentiment_label": sentiment.label,
             "sentiment_text_label": sentiment.text_label,
@@ -324,15 +467,37 @@ class EmailTemplateService:
             "engagement_count": summary.engagement_count,
             "avg_sentiment": summary.avg_sentiment,
             "top_articles": articles,
-            "follow_order": follow.order if follow else None,
-            "participant_count": self._get_participant_count(
-                summary.ticker, summary.summary_date
-            ),
-            "last_price": self._get_last_price(summary.ticker),
+            "participant_count": participant_count,
+            "last_price": last_price,
+            "price_change_percent": summary.price_change_percent,
         }
 
+    def _ticker_section(self, ticker: dict) -> TickerSection:
+        """Return the rendered card for ``ticker``, cached during a dispatch."""
+        cache = self._sections
+        key = (ticker["symbol"], ticker["name"])
+        section = cache.get(key) if cache is not None else None
+        if section is None:
+            section = TickerSection(
+                html=Markup(
+                    self._html_env.get_template(self.SECTION_HTML_TEMPLATE).render(
+                        ticker=ticker
+                    )
+                ),
+                text=self._text_env.get_template(self.SECTION_TEXT_TEMPLATE).render(
+                    ticker=ticker
+                ),
+            )
+            # Concurrent send workers may race here; the loser just renders twice
+            if cache is not None:
+                cache[key] = section
+        return section
+
     def _normalize_articles(
-        self, articles_raw, summary_date: date | None
+        self,
+        articles_raw,
+        summary_date: date | None,
+        article_map: dict[int, dict] | None = None,
     ) -> list[dict]:
         normalized: list[dict] = []
         if not articles_raw:
@@ -343,19 +508,12 @@ class EmailTemplateService:
         if summary_date:
             window_start, window_end = self._summary_window_bounds(summary_date)
 
-        article_ids: list[int] = []
-        for article in articles_raw:
-            if isinstance(article, int):
-                article_ids.append(article)
-            elif isinstance(article, dict):
-                article_id = article.get("article_id")
-                if isinstance(article_id, int):
-                    article_ids.append(article_id)
-
+        article_ids = self._article_ids(articles_raw)
         if not article_ids:
             return normalized
 
-        article_map = self._article_loader(article_ids)
+        if article_map is None:
+            article_map = self._article_loader(article_ids)
 
         for article_id in article_ids:
             meta = article_map.get(article_id)
@@ -387,6 +545,18 @@ class EmailTemplateService:
 
         return normalized
 
+    @staticmethod
+    def _article_ids(articles_raw) -> list[int]:
+        article_ids: list[int] = []
+        for article in articles_raw or []:
+            if isinstance(article, int):
+                article_ids.append(article)
+            elif isinstance(article, dict):
+                article_id = article.get("article_id")
+                if isinstance(article_id, int):
+                    article_ids.append(article_id)
+        return article_ids
+
     def _load_articles_from_db(self, article_ids: Sequence[int]) -> dict[int, dict]:
         if not article_ids:
             return {}
@@ -399,9 +569,10 @@ class EmailTemplateService:
                     Article.url,
                     Article.engagement_score,
                     Article.source,
-                    Article.text,
+                    ArticleBody.text,
                     Article.published_at,
                 )
+                .outerjoin(ArticleBody, ArticleBody.article_id == Article.id)
                 .filter(Article.id.in_(article_ids))
                 .all()
             )
@@ -423,19 +594,34 @@ class EmailTemplateService:
     ) -> int | None:
         if not summary_date:
             return None
+        return self._get_participant_counts([ticker], summary_date).get(ticker, 0)
+
+    def _get_participant_counts(
+        self, tickers: Sequence[str], summary_date: date
+    ) -> dict[str, int]:
+        """Estimate distinct authors per ticker from the hourly author sketches."""
+        if not tickers:
+            return {}
         start, end = self._summary_window_bounds(summary_date)
         with self._session_factory() as session:
-            stmt = (
-                select(func.count(func.distinct(Article.author)))
-                .join(ArticleTicker, ArticleTicker.article_id == Article.id)
-                .where(
-                    ArticleTicker.ticker == ticker,
-                    Article.published_at >= start,
-                    Article.published_at < end,
-                )
+            return AuthorSketchRepository(session).unique_authors(
+                list(tickers), start, end
             )
-            result = session.execute(stmt).scalar()
-        return int(result or 0)
+
+    def _get_last_prices(self, tickers: Sequence[str]) -> dict[str, float | None]:
+        """Load the current price for each ticker in one query."""
+        if not tickers:
+            return {}
+        with self._session_factory() as session:
+            rows = session.execute(
+                select(StockPrice.symbol, StockPrice.price).where(
+                    StockPrice.symbol.in_(tickers)
+                )
+            ).all()
+        return {
+            symbol: round(price, 2) if price is not None else None
+            for symbol, price in rows
+        }
 
     def _get_last_price(self, ticker: str) -> float | None:
         with self._session_factory() as session:
@@ -466,6 +652,10 @@ class EmailTemplateService:
             end_local += timedelta(days=1)
         return start_local.astimezone(UTC), end_local.astimezone(UTC)
 
+    @staticmethod
+    def _summary_key(summary: DailyTickerSummaryDTO) -> tuple[str, date | None]:
+        return summary.ticker, summary.summary_date
+
     @staticmethod
     def _resolve_summary_date(
         ticker_summaries: Sequence[DailyTickerSummaryDTO],
@@ -0,0 +1,208 @@
+"""Mergeable HyperLogLog sketches for approximate distinct counts.
+
+A sketch holds ``2**precision`` one-byte registers. Merging two sketches
+(register-wise max) gives the sketch of the union, so per-hour sketches
+combine into any day, week or month window without revisiting the rows.
+
+Error bound: the standard error of :meth:`HyperLogLog.count` is
+``1.04 / sqrt(2**precision)``, about 1.6% at the default precision of 12,
+so about 95% of estimates fall within 3.3% of the true count. Small
+counts are nearly exact: n values collide in a register only about
+n**2 / 8192 times at precision 12. Estimates use
+Ertl's improved raw estimator (arXiv:1702.01284), which needs no bias
+tables and stays accurate from empty sketches up.
+
+Sketches serialize to a compact byte string: sparse ``(index, rank)``
+pairs while few registers are set, all registers once that is smaller.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections.abc import Iterable
+
+import numpy as np
+
+DEFAULT_PRECISION = 12
+MIN_PRECISION = 4
+MAX_PRECISION = 16
+
+_SPARSE = 1
+_DENSE = 2
+# Sparse entries: uint16 register index + uint8 rank
+_SPARSE_ENTRY = 3
+
+
+def standard_error(precision: int = DEFAULT_PRECISION) -> float:
+    """Relative standard error of counts at ``precision``."""
+    return 1.04 / math.sqrt(1 << precision)
+
+
+def _hash(value: str | int) -> int:
+    # Stable across processes, unlike hash()
+    data = (
+        value.to_bytes(8, "big", signed=True)
+        if isinstance(value, int)
+        else value.encode("utf-8")
+    )
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def _sigma(x: float) -> float:
+    if x == 1.0:
+        return math.inf
+    y, z = 1.0, x
+    while True:
+        x *= x
+        previous = z
+        z += x * y
+        y += y
+        if z == previous:
+            return z
+
+
+def _tau(x: float) -> float:
+    if x == 0.0 or x == 1.0:
+        return 0.0
+    y, z = 1.0, 1.0 - x
+    while True:
+        x = math.sqrt(x)
+        previous = z
+        y *= 0.5
+        z -= (1.0 - x) ** 2 * y
+        if z == previous:
+            return z / 3
+
+
+class HyperLogLog:
+    """A HyperLogLog sketch of distinct strings or 64-bit integers."""
+
+    def __init__(self, precision: int = DEFAULT_PRECISION) -> None:
+        if not MIN_PRECISION <= precision <= MAX_PRECISION:
+            raise ValueError(
+                f"precision must be between {MIN_PRECISION} and {MAX_PRECISION}"
+            )
+        self.precision = precision
+        # Sparse registers until dense storage is smaller
+        self._sparse: dict[int, int] | None = {}
+        self._dense: np.ndarray | None = None
+
+    @property
+    def registers(self) -> int:
+        return 1 << self.precision
+
+    def _set(self, index: int, rank: int) -> None:
+        if self._dense is not None:
+            if rank > self._dense[index]:
+                self._dense[index] = rank
+            return
+        assert self._sparse is not None
+        if rank > self._sparse.get(index, 0):
+            self._sparse[index] = rank
+            if len(self._sparse) * _SPARSE_ENTRY >= self.registers:
+                self._densify()
+
+    def _densify(self) -> None:
+        if self._dense is not None:
+            return
+        assert self._sparse is not None
+        dense = np.zeros(self.registers, dtype=np.uint8)
+        if self._sparse:
+            dense[list(self._sparse)] = list(self._sparse.values())
+        self._dense, self._sparse = dense, None
+
+    def add(self, value: str | int) -> None:
+        """Add one value."""
+        hashed = _hash(value)
+        width = 64 - self.precision
+        remainder = hashed & ((1 << width) - 1)
+        self._set(hashed >> width, width - remainder.bit_length() + 1)
+
+    def update(self, values: Iterable[str | int]) -> None:
+        """Add many values."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: HyperLogLog) -> None:
+        """Fold ``other`` into this sketch, making it the sketch of the union."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches of different precision")
+        if other._dense is not None:
+            self._densify()
+            assert self._dense is not None
+            np.maximum(self._dense, other._dense, out=self._dense)
+            return
+        assert other._sparse is not None
+        for index, rank in other._sparse.items():
+            self._set(index, rank)
+
+    def count(self) -> int:
+        """Estimated number of distinct values added."""
+        width = 64 - self.precision
+        m = self.registers
+        if self._dense is not None:
+            histogram = np.bincount(self._dense, minlength=width + 2)
+        else:
+            assert self._sparse is not None
+            if not self._sparse:
+                return 0
+            histogram = np.bincount(
+                np.fromiter(self._sparse.values(), dtype=np.int64),
+                minlength=width + 2,
+            )
+            histogram[0] = m - len(self._sparse)
+        z = m * _tau(1 - histogram[width + 1] / m)
+        for k in range(width, 0, -1):
+            z = 0.5 * (z + histogram[k])
+        z += m * _sigma(histogram[0] / m)
+        return round(m * m / (2 * math.log(2)) / z)
+
+    # Serialization -----------------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        """Serialize for storage (``bytea``)."""
+        if self._dense is not None:
+            return bytes((_DENSE, self.precision)) + self._dense.tobytes()
+        assert self._sparse is not None
+        entries = bytearray((_SPARSE, self.precision))
+        for index in sorted(self._sparse):
+            entries += index.to_bytes(2, "big")
+            entries.append(self._sparse[index])
+        return bytes(entries)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> HyperLogLog:
+        """Load a sketch written by :meth:`to_bytes`."""
+        if len(data) < 2:
+            raise ValueError("Truncated HyperLogLog sketch")
+        kind, precision = data[0], data[1]
+        sketch = cls(precision)
+        body = data[2:]
+        if kind == _DENSE:
+            if len(body) != sketch.registers:
+                raise ValueError("Dense HyperLogLog sketch has the wrong size")
+            sketch._dense = np.frombuffer(body, dtype=np.uint8).copy()
+            sketch._sparse = None
+        elif kind == _SPARSE:
+            if len(body) % _SPARSE_ENTRY:
+                raise ValueError("Truncated sparse HyperLogLog sketch")
+            for offset in range(0, len(body), _SPARSE_ENTRY):
+                sketch._set(
+                    int.from_bytes(body[offset : offset + 2], "big"),
+                    body[offset + 2],
+                )
+        else:
+            raise ValueError(f"Unknown HyperLogLog sketch format: {kind}")
+        return sketch
+
+
+def merge_sketches(
+    sketches: Iterable[bytes | None], precision: int = DEFAULT_PRECISION
+) -> HyperLogLog:
+    """Union of serialized sketches; ``None`` entries are skipped."""
+    merged = HyperLogLog(precision)
+    for data in sketches:
+        if data:
+            merged.merge(HyperLogLog.from_bytes(data))
+    return merged
@@ -0,0 +1,297 @@
+"""Precomputed homepage dataset.
+
+The scraper and sentiment jobs call :func:`refresh_homepage_snapshot` when
+they finish, so the ``home`` view renders from one snapshot read instead of
+re-running the top-tickers, sentiment, lean and velocity queries per view.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.models import (
+    Article,
+    ArticleTicker,
+    HomepageSnapshot,
+    ScrapingStatus,
+    StockPrice,
+    Ticker,
+)
+from app.repos.homepage_snapshot_repo import HomepageSnapshotRepository
+from app.services.sentiment_analytics import get_sentiment_analytics_service
+from app.services.velocity import get_velocity_service
+
+logger = logging.getLogger(__name__)
+
+# Bump when the payload layout changes; older snapshots are then ignored
+HOMEPAGE_SNAPSHOT_VERSION = 1
+
+HOMEPAGE_TICKER_LIMIT = 50
+
+
+def build_homepage_data(db: Session) -> dict[str, Any]:
+    """Compute the user-independent homepage dataset (JSON-serializable).
+
+    Covers the top tickers of the last 24h with price, sentiment, lean and
+    velocity, the mention surge lists, the overall sentiment histogram and
+    lean, and the Reddit scraping status.
+    """
+    twenty_four_hours_ago = datetime.utcnow() - timedelta(hours=24)
+
+    # Top 50 most discussed non-ETF tickers in the last 24h
+    top_tickers_subquery = (
+        db.query(
+            ArticleTicker.ticker,
+            func.count(ArticleTicker.article_id).label("recent_article_count"),
+        )
+        .join(Article, ArticleTicker.article_id == Article.id)
+        .join(Ticker, Ticker.symbol == ArticleTicker.ticker)
+        .filter(
+            Article.published_at >= twenty_four_hours_ago,
+            or_(Ticker.name.is_(None), ~Ticker.name.ilike("%ETF%")),
+        )
+        .group_by(ArticleTicker.ticker)
+        .order_by(func.count(ArticleTicker.article_id).desc())
+        .limit(HOMEPAGE_TICKER_LIMIT)
+        .subquery()
+    )
+
+    # Full data for these top tickers
+    tickers_query = (
+        db.query(
+            Ticker.symbol,
+            Ticker.name,
+            func.count(ArticleTicker.article_id).label("article_count"),
+            func.avg(Article.sentiment).label("avg_sentiment"),
+            top_tickers_subquery.c.recent_article_count,
+            StockPrice.price,
+            StockPrice.previous_close,
+            StockPrice.change,
+            StockPrice.change_percent,
+            StockPrice.market_state,
+            StockPrice.currency,
+            StockPrice.exchange,
+            StockPrice.updated_at,
+        )
+        .join(top_tickers_subquery, Ticker.symbol == top_tickers_subquery.c.ticker)
+        .outerjoin(
+            ArticleTicker,
+            and_(
+                Ticker.symbol == ArticleTicker.ticker,
+                ArticleTicker.article_id.in_(
+                    db.query(Article.id).filter(
+                        Article.published_at >= twenty_four_hours_ago
+                    )
+                ),
+            ),
+        )
+        .outerjoin(Article, ArticleTicker.article_id == Article.id)
+        .outerjoin(StockPrice, Ticker.symbol == StockPrice.symbol)
+        .group_by(
+            Ticker.symbol,
+            Ticker.name,
+            top_tickers_subquery.c.recent_article_count,
+            StockPrice.price,
+            StockPrice.previous_close,
+            StockPrice.change,
+            StockPrice.change_percent,
+            StockPrice.market_state,
+            StockPrice.currency,
+            StockPrice.exchange,
+            StockPrice.updated_at,
+        )
+        .order_by(top_tickers_subquery.c.recent_article_count.desc(), Ticker.symbol)
+    )
+
+    velocity_service = get_velocity_service(db)
+
+    # Overall sentiment (24h)
+    sentiment_analytics = get_sentiment_analytics_service()
+    overall_sentiment_data = sentiment_analytics.get_sentiment_distribution_data(
+        db, days=1
+    )
+    overall_lean = sentiment_analytics.get_sentiment_lean_data(db, days=1)
+
+    ticker_rows = tickers_query.all()
+    top_symbols = [row[0] for row in ticker_rows]
+    lean_map = sentiment_analytics.get_ticker_lean_map(db, top_symbols, days=1)
+
+    tickers = []
+    default_mention_symbols: list[str] = []
+    for row in ticker_rows:
+        (
+            symbol,
+            name,
+            article_count,
+            avg_sentiment,
+            recent_article_count,
+            price,
+            previous_close,
+            change,
+            change_percent,
+            market_state,
+            currency,
+            exchange,
+            updated_at,
+        ) = row
+
+        # Skip ETFs from the homepage display to focus on individual equities
+        if name and "ETF" in name.upper():
+            continue
+
+        velocity_data = velocity_service.calculate_velocity(symbol)
+
+        stock_data = None
+        if price is not None:
+            stock_data = {
+                "symbol": symbol,
+                "price": price,
+                "previous_close": previous_close,
+                "change": change,
+                "change_percent": change_percent,
+                "market_state": market_state,
+                "currency": currency,
+                "exchange": exchange,
+                "last_updated": updated_at.isoformat() if updated_at else None,
+            }
+
+        tickers.append(
+            {
+                "symbol": symbol,
+                "name": name,
+                "article_count": recent_article_count,  # Use 24h count for display
+                "avg_sentiment": (
+                    float(avg_sentiment) if avg_sentiment is not None else None
+                ),
+                "velocity": velocity_data,
+                "stock_data": stock_data,
+                "sentiment_lean": lean_map.get(symbol, None),
+            }
+        )
+        if len(default_mention_symbols) < 7:
+            default_mention_symbols.append(symbol)
+
+    mention_surge_tickers: list[dict] = []
+    positive_mention_surge_tickers: list[dict] = []
+    negative_mention_surge_tickers: list[dict] = []
+    mention_candidates = [
+        t
+        for t in tickers
+        if t.get("velocity") and t["velocity"].get("velocity_score") is not None
+    ]
+    if mention_candidates:
+        mention_surge_tickers = sorted(
+            mention_candidates,
+            key=lambda t: t["velocity"].get("velocity_score", 0),
+            reverse=True,
+        )[:5]
+        positive_mention_surge_tickers = sorted(
+            [
+                t
+                for t in mention_candidates
+                if t.get("avg_sentiment") is not None and t["avg_sentiment"] > 0
+            ],
+            key=lambda t: t.get("avg_sentiment", float("-inf")),
+            reverse=True,
+        )[:5]
+        negative_mention_surge_tickers = sorted(
+            [
+                t
+                for t in mention_candidates
+                if t.get("avg_sentiment") is not None and t["avg_sentiment"] < 0
+            ],
+            key=lambda t: t.get("avg_sentiment", float("inf")),
+        )[:5]
+
+    scraping_status = (
+        db.query(ScrapingStatus).filter(ScrapingStatus.source == "reddit").first()
+    )
+    scraping_info = None
+    if scraping_status:
+        scraping_info = {
+            "last_scrape_at": scraping_status.last_scrape_at.isoformat(),
+            "items_scraped": scraping_status.items_scraped,
+            "status": scraping_status.status,
+        }
+
+    return {
+        "tickers": tickers,
+        "sentiment_histogram": overall_sentiment_data,
+        "overall_lean": overall_lean,
+        "scraping_status": scraping_info,
+        "default_mention_symbols": default_mention_symbols,
+        "mention_surge_tickers": mention_surge_tickers,
+        "positive_mention_surge_tickers": positive_mention_surge_tickers,
+        "negative_mention_surge_tickers": negative_mention_surge_tickers,
+    }
+
+
+def save_homepage_snapshot(db: Session) -> HomepageSnapshot:
+    """Build the homepage dataset and store it as the latest snapshot."""
+    snapshot = HomepageSnapshotRepository(db).add(
+        build_homepage_data(db), schema_version=HOMEPAGE_SNAPSHOT_VERSION
+    )
+    db.commit()
+    return snapshot
+
+
+def refresh_homepage_snapshot() -> bool:
+    """Rebuild the snapshot in its own session; for use at the end of jobs.
+
+    Failures are logged and reported as False so they never fail the job;
+    the homepage falls back to live computation until the next rebuild.
+    """
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        snapshot = save_homepage_snapshot(db)
+        logger.info(
+            "homepage_snapshot_built",
+            extra={
+                "snapshot_id": snapshot.id,
+                "tickers": len(snapshot.payload["tickers"]),
+            },
+        )
+        return True
+    except Exception as e:
+        db.rollback()
+        logger.error("homepage_snapshot_build_failed", extra={"error": str(e)})
+        return False
+    finally:
+        db.close()
+
+
+def _is_fresh(snapshot: HomepageSnapshot, max_age: timedelta) -> bool:
+    if snapshot.schema_version != HOMEPAGE_SNAPSHOT_VERSION:
+        return False
+    built_at = snapshot.built_at
+    if built_at.tzinfo is None:
+        built_at = built_at.replace(tzinfo=UTC)
+    return datetime.now(UTC) - built_at <= max_age
+
+
+def get_homepage_data(db: Session) -> dict[str, Any]:
+    """Return the latest fresh snapshot payload, else compute it live.
+
+    A snapshot older than HOMEPAGE_SNAPSHOT_MAX_AGE_MINUTES (e.g. when the
+    jobs have stalled) is ignored so the page never shows stale data.
+    """
+    max_age_minutes = settings.HOMEPAGE_SNAPSHOT_MAX_AGE_MINUTES
+    if max_age_minutes > 0:
+        snapshot = HomepageSnapshotRepository(db).get_latest()
+        if snapshot is not None and _is_fresh(
+            snapshot, timedelta(minutes=max_age_minutes)
+        ):
+            return snapshot.payload
+        logger.info(
+            "homepage_snapshot_miss",
+            extra={"snapshot_id": snapshot.id if snapshot else None},
+        )
+    return build_homepage_data(db)
@@ -15,7 +15,7 @@ from datetime import UTC, datetime, timedelta
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.db.models import Article, ArticleTicker
+from app.db.models import ArticleTicker
 from app.models.dto import MentionsHourlyResponseDTO, MentionsSeriesDTO
 
 logger = logging.getLogger(__name__)
@@ -67,24 +67,23 @@ class MentionStatsService:
             rows = (
                 self.session.query(
                     ArticleTicker.ticker.label("ticker"),
-                    func.strftime("%Y", Article.published_at).label("y"),
-                    func.strftime("%m", Article.published_at).label("m"),
-                    func.strftime("%d", Article.published_at).label("d"),
-                    func.strftime("%H", Article.published_at).label("h"),
-                    func.count(Article.id).label("cnt"),
+                    func.strftime("%Y", ArticleTicker.published_at).label("y"),
+                    func.strftime("%m", ArticleTicker.published_at).label("m"),
+                    func.strftime("%d", ArticleTicker.published_at).label("d"),
+                    func.strftime("%H", ArticleTicker.published_at).label("h"),
+                    func.count(ArticleTicker.article_id).label("cnt"),
                 )
-                .join(Article, Article.id == ArticleTicker.article_id)
                 .filter(
                     ArticleTicker.ticker.in_(normalized),
-                    Article.published_at >= window_start,
-                    Article.published_at < window_exclusive_end,
+                    ArticleTicker.published_at >= window_start,
+                    ArticleTicker.published_at < window_exclusive_end,
                 )
                 .group_by(
                     ArticleTicker.ticker,
-                    func.strftime("%Y", Article.published_at),
-                    func.strftime("%m", Article.published_at),
-                    func.strftime("%d", Article.published_at),
-                    func.strftime("%H", Article.published_at),
+                    func.strftime("%Y", ArticleTicker.published_at),
+                    func.strftime("%m", ArticleTicker.published_at),
+                    func.strftime("%d", ArticleTicker.published_at),
+                    func.strftime("%H", ArticleTicker.published_at),
                 )
                 .all()
             )
@@ -104,18 +103,17 @@ class MentionStatsService:
                 )
         else:
             # Postgres and others supporting date_trunc
-            hour_expr = func.date_trunc("hour", Article.published_at)
+            hour_expr = func.date_trunc("hour", ArticleTicker.published_at)
             rows = (
                 self.session.query(
                     ArticleTicker.ticker.label("ticker"),
                     hour_expr.label("hour"),
-                    func.count(Article.id).label("cnt"),
+                    func.count(ArticleTicker.article_id).label("cnt"),
                 )
-                .join(Article, Article.id == ArticleTicker.article_id)
                 .filter(
                     ArticleTicker.ticker.in_(normalized),
-                    Article.published_at >= window_start,
-                    Article.published_at < window_exclusive_end,
+                    ArticleTicker.published_at >= window_start,
+                    ArticleTicker.published_at < window_exclusive_end,
                 )
                 .group_by(ArticleTicker.ticker, hour_expr)
                 .all()
@@ -2,14 +2,23 @@
 
 Design:
 - Key format: rl:{endpoint_key}:{client_ip}
-- On request: INCR → if 1 then EXPIRE window; if value > quota → raise 429
+- Algorithm: GCRA (a smoothed sliding window) in one atomic Lua script, so a
+  check costs a single round-trip and window edges never allow 2x bursts
+- Local pre-check: a client well under quota is granted a lease of several
+  requests per round-trip, served in-process until used up; a blocked client
+  is rejected locally until its retry-after passes
 - Fallback: if Redis unavailable, allow request and log a warning
 """
 
 from __future__ import annotations
 
 import logging
+import math
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
 from fastapi import HTTPException, Request, status
@@ -22,6 +31,37 @@ _redis_client: Any | None = (
     None  # lazy-initialized; connection pool is internal to client
 )
 
+# KEYS[1]: limiter key holding the theoretical arrival time (TAT) in ms
+# ARGV: now_ms, interval_ms (window / quota), window_ms, lease
+# Returns {granted, retry_after_ms}. `lease` requests are granted at once
+# only while at least twice that many remain, otherwise one (or none).
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local window = tonumber(ARGV[3])
+local lease = tonumber(ARGV[4])
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then
+  tat = now
+end
+local remaining = math.floor((now + window - tat) / interval)
+local granted = 0
+if remaining >= 2 * lease then
+  granted = lease
+elseif remaining >= 1 then
+  granted = 1
+end
+if granted == 0 then
+  return {0, tat + interval - window - now}
+end
+tat = tat + granted * interval
+redis.call('SET', KEYS[1], tat, 'PX', math.ceil(tat - now))
+return {granted, 0}
+"""
+
+# Bound on locally tracked (endpoint, client) pairs per process
+LOCAL_STATE_MAX_ENTRIES = 10_000
+
 
 def _get_client():
     global _redis_client
@@ -52,11 +92,113 @@ def _extract_client_ip(request: Request) -> str:
     return client.host if client else "unknown"
 
 
+@dataclass
+class _LocalState:
+    """Leased requests and block deadline for one key (monotonic seconds)."""
+
+    leased: int = 0
+    lease_expires_at: float = 0.0
+    blocked_until: float = 0.0
+
+
+class LocalRateLimitCache:
+    """In-process leases and blocks in front of the Redis limiter.
+
+    Leased requests were already counted in Redis, so serving them locally
+    never exceeds the global quota; unused leases expire with the window.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = LOCAL_STATE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._states: OrderedDict[str, _LocalState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check(self, key: str) -> int | None:
+        """Consume a leased request or report a local block.
+
+        Returns:
+            0 when a leased request was consumed, seconds to wait when the key
+            is blocked, or None when Redis must be consulted
+        """
+        now = self._clock()
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                return None
+            if state.blocked_until > now:
+                return max(1, math.ceil(state.blocked_until - now))
+            if state.leased > 0 and state.lease_expires_at > now:
+                state.leased -= 1
+                return 0
+            return None
+
+    def grant(self, key: str, leased: int, ttl_seconds: float) -> None:
+        """Store requests granted by Redis beyond the current one."""
+        if leased <= 0:
+            return
+        with self._lock:
+            state = self._touch(key)
+            state.leased = leased
+            state.lease_expires_at = self._clock() + ttl_seconds
+
+    def block(self, key: str, retry_after_seconds: float) -> None:
+        """Reject the key locally until ``retry_after_seconds`` pass."""
+        with self._lock:
+            state = self._touch(key)
+            state.leased = 0
+            state.blocked_until = self._clock() + retry_after_seconds
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+    def _touch(self, key: str) -> _LocalState:
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _LocalState()
+            while len(self._states) > self.max_entries:
+                self._states.popitem(last=False)
+        self._states.move_to_end(key)
+        return state
+
+
+local_rate_limits = LocalRateLimitCache()
+
+
+def _too_many_requests(
+    endpoint_key: str, client_ip: str, quota: int, retry_after: int
+) -> HTTPException:
+    logger.warning(
+        "rate_limit_block",
+        extra={
+            "endpoint": endpoint_key,
+            "ip": client_ip,
+            "quota": quota,
+            "retry_after": retry_after,
+        },
+    )
+    # Raise HTTP 429 with Retry-After header and JSON body
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail={
+            "error": "Too Many Requests",
+            "retry_after": retry_after,
+        },
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
 def rate_limit(
     endpoint_key: str,
     *,
     requests: int | None = None,
     window_seconds: int | None = None,
+    lease: int | None = None,
 ) -> Callable[[Request], Awaitable[None]]:
     """Create a FastAPI dependency that enforces a Redis-backed rate limit.
 
@@ -64,15 +206,28 @@ def rate_limit(
         endpoint_key: Stable identifier for this endpoint (e.g., "ticker_articles").
         requests: Max requests within the window. Defaults to settings.rl_requests_per_minute.
         window_seconds: Window size in seconds. Defaults to settings.rl_window_seconds.
+        lease: Requests granted per Redis round-trip to a client well under
+            quota. Defaults to settings.rl_local_lease; 1 disables leasing.
     """
 
     max_requests = requests or settings.rl_requests_per_minute
     window = window_seconds or settings.rl_window_seconds
+    window_ms = window * 1000
+    interval_ms = window_ms / max_requests
+    lease_size = max(1, min(lease or settings.rl_local_lease, max_requests // 4))
+    script: Any | None = None
 
     async def _dependency(request: Request) -> None:
+        nonlocal script
         client_ip = _extract_client_ip(request)
         key = f"rl:{endpoint_key}:{client_ip}"
 
+        local = local_rate_limits.check(key)
+        if local == 0:
+            return
+        if local is not None:
+            raise _too_many_requests(endpoint_key, client_ip, max_requests, local)
+
         client = _get_client()
         if client is None:
             # Fail-open if Redis is not available
@@ -83,34 +238,12 @@ def rate_limit(
             return
 
         try:
-            # Atomically increment; set TTL on first hit in the window
-            current = await client.incr(key)
-            if current == 1:
-                await client.expire(key, window)
-
-            if current > max_requests:
-                ttl = await client.ttl(key)
-                retry_after = ttl if isinstance(ttl, int) and ttl > 0 else window
-                logger.warning(
-                    "rate_limit_block",
-                    extra={
-                        "endpoint": endpoint_key,
-                        "ip": client_ip,
-                        "quota": max_requests,
-                        "retry_after": retry_after,
-                    },
-                )
-                # Raise HTTP 429 with Retry-After header and JSON body
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail={
-                        "error": "Too Many Requests",
-                        "retry_after": retry_after,
-                    },
-                    headers={"Retry-After": str(retry_after)},
-                )
-        except HTTPException:
-            raise
+            if script is None:
+                script = client.register_script(GCRA_SCRIPT)
+            granted, retry_after_ms = await script(
+                keys=[key],
+                args=[int(time.time() * 1000), interval_ms, window_ms, lease_size],
+            )
         except Exception as exc:
             # On Redis errors, fail-open but log the error
             logger.error(
@@ -119,4 +252,13 @@ def rate_limit(
             )
             return
 
+        granted = int(granted)
+        if granted > 0:
+            local_rate_limits.grant(key, granted - 1, window)
+            return
+
+        retry_after = max(1, math.ceil(float(retry_after_ms) / 1000))
+        local_rate_limits.block(key, retry_after)
+        raise _too_many_requests(endpoint_key, client_ip, max_requests, retry_after)
+
     return _dependency
@@ -31,8 +31,10 @@ class SentimentAnalyticsService:
             Dictionary with sentiment counts: {"positive": x, "neutral": y, "negative": z}
         """
         try:
-            # Base query for articles with sentiment
-            base_query = db.query(Article).filter(Article.sentiment.isnot(None))
+            # Only the score is needed, so load the column rather than entities
+            base_query = db.query(Article.sentiment).filter(
+                Article.sentiment.isnot(None)
+            )
 
             # Filter by ticker if specified
             if ticker:
@@ -95,30 +97,31 @@ class SentimentAnalyticsService:
             positive_threshold = 0.05
             negative_threshold = -0.05
 
-            # Base query
-            base_query = db.query(Article).filter(Article.sentiment.isnot(None))
+            # Per-ticker counts read the copies on article_ticker (no join)
+            if ticker:
+                base_query = db.query(ArticleTicker).filter(
+                    ArticleTicker.ticker == ticker.upper()
+                )
+                sentiment, published_at = (
+                    ArticleTicker.sentiment,
+                    ArticleTicker.published_at,
+                )
+            else:
+                base_query = db.query(Article)
+                sentiment, published_at = Article.sentiment, Article.published_at
+            base_query = base_query.filter(sentiment.isnot(None))
 
             # Filter by date if specified
             if days is not None:
                 cutoff_date = datetime.utcnow() - timedelta(days=days)
-                base_query = base_query.filter(Article.published_at >= cutoff_date)
-
-            # Filter by ticker if specified
-            if ticker:
-                base_query = base_query.join(
-                    ArticleTicker, Article.id == ArticleTicker.article_id
-                ).filter(ArticleTicker.ticker == ticker.upper())
+                base_query = base_query.filter(published_at >= cutoff_date)
 
             # Count using SQL aggregation
-            positive_count = base_query.filter(
-                Article.sentiment >= positive_threshold
-            ).count()
-            negative_count = base_query.filter(
-                Article.sentiment <= negative_threshold
-            ).count()
+            positive_count = base_query.filter(sentiment >= positive_threshold).count()
+            negative_count = base_query.filter(sentiment <= negative_threshold).count()
             neutral_count = base_query.filter(
-                Article.sentiment > negative_threshold,
-                Article.sentiment < positive_threshold,
+                sentiment > negative_threshold,
+                sentiment < positive_threshold,
             ).count()
 
             histogram = {
@@ -215,20 +218,26 @@ class SentimentAnalyticsService:
 
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
-        base = db.query(Article)
-        base = base.filter(Article.sentiment.isnot(None))
-        base = base.filter(Article.published_at >= cutoff_date)
-
+        # Per-ticker counts read the copies on article_ticker (no join)
         if ticker:
-            base = base.join(
-                ArticleTicker, Article.id == ArticleTicker.article_id
-            ).filter(ArticleTicker.ticker == ticker.upper())
+            base = db.query(ArticleTicker).filter(
+                ArticleTicker.ticker == ticker.upper()
+            )
+            sentiment, published_at = (
+                ArticleTicker.sentiment,
+                ArticleTicker.published_at,
+            )
+        else:
+            base = db.query(Article)
+            sentiment, published_at = Article.sentiment, Article.published_at
+        base = base.filter(sentiment.isnot(None))
+        base = base.filter(published_at >= cutoff_date)
 
-        positive_count = base.filter(Article.sentiment >= positive_threshold).count()
-        negative_count = base.filter(Article.sentiment <= negative_threshold).count()
+        positive_count = base.filter(sentiment >= positive_threshold).count()
+        negative_count = base.filter(sentiment <= negative_threshold).count()
         neutral_count = base.filter(
-            Article.sentiment > negative_threshold,
-            Article.sentiment < positive_threshold,
+            sentiment > negative_threshold,
+            sentiment < positive_threshold,
         ).count()
 
         total = positive_count + negative_count + neutral_count
@@ -325,26 +334,25 @@ class SentimentAnalyticsService:
             db.query(
                 ArticleTicker.ticker.label("ticker"),
                 func.sum(
-                    case((Article.sentiment >= positive_threshold, 1), else_=0)
+                    case((ArticleTicker.sentiment >= positive_threshold, 1), else_=0)
                 ).label("positive"),
                 func.sum(
-                    case((Article.sentiment <= negative_threshold, 1), else_=0)
+                    case((ArticleTicker.sentiment <= negative_threshold, 1), else_=0)
                 ).label("negative"),
                 func.sum(
                     case(
                         (
-                            (Article.sentiment > negative_threshold)
-                            & (Article.sentiment < positive_threshold),
+                            (ArticleTicker.sentiment > negative_threshold)
+                            & (ArticleTicker.sentiment < positive_threshold),
                             1,
                         ),
                         else_=0,
                     )
                 ).label("neutral"),
             )
-            .join(Article, Article.id == ArticleTicker.article_id)
             .filter(ArticleTicker.ticker.in_([t.upper() for t in tickers]))
-            .filter(Article.published_at >= cutoff_date)
-            .filter(Article.sentiment.isnot(None))
+            .filter(ArticleTicker.published_at >= cutoff_date)
+            .filter(ArticleTicker.sentiment.isnot(None))
             .group_by(ArticleTicker.ticker)
             .all()
         )
@@ -0,0 +1,230 @@
+"""Short-TTL cache of signed-in users keyed by session token ``sub`` + ``iat``."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.models import User
+
+logger = logging.getLogger(__name__)
+
+# Session.info key holding user ids to invalidate once the transaction commits
+_PENDING_KEY = "session_user_cache_invalidations"
+
+
+@dataclass(frozen=True)
+class SessionUser:
+    """Detached snapshot of the authenticated user for one session token."""
+
+    id: int
+    email: str
+    auth_provider: str | None
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> SessionUser:
+        return cls(
+            id=user.id,
+            email=user.email,
+            auth_provider=user.auth_provider,
+            is_active=user.is_active,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["created_at"] = self.created_at.isoformat()
+        data["updated_at"] = self.updated_at.isoformat()
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str) -> SessionUser:
+        data = json.loads(raw)
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        return cls(**data)
+
+
+class SessionUserCache:
+    """In-process LRU of session users with an optional shared Redis tier.
+
+    Entries are keyed by ``(user_id, iat)`` so a new login never reuses another
+    token's entry, and are dropped after ``ttl_seconds``. Redis stores one hash
+    per user (field = ``iat``) so :meth:`invalidate_user` is a single DEL.
+    Other processes' local tiers are not notified of invalidations; the short
+    TTL bounds how long they can serve a blocked or deleted user.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        max_entries: int = 10_000,
+        redis_client: Any | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.redis_client = redis_client
+        self._clock = clock
+        self._entries: OrderedDict[tuple[int, int], tuple[float, SessionUser]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, user_id: int, issued_at: int) -> SessionUser | None:
+        """Return the cached user for a token, or None on a miss or expiry."""
+        if not self.enabled:
+            return None
+        key = (user_id, issued_at)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, cached = entry
+                if self._clock() - stored_at <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    return cached
+                del self._entries[key]
+
+        user = self._redis_get(user_id, issued_at)
+        if user is not None:
+            self._store_local(key, user)
+        return user
+
+    def set(self, user_id: int, issued_at: int, user: SessionUser) -> None:
+        """Cache the user resolved for a token."""
+        if not self.enabled:
+            return
+        self._store_local((user_id, issued_at), user)
+        self._redis_set(user_id, issued_at, user)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop every cached session of ``user_id`` (local and Redis)."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == user_id]:
+                del self._entries[key]
+        if self.redis_client is not None:
+            try:
+                self.redis_client.delete(self._redis_key(user_id))
+            except Exception as exc:
+                logger.warning(
+                    "session_cache_redis_error",
+                    extra={"operation": "delete", "error": str(exc)},
+                )
+
+    def clear(self) -> None:
+        """Drop all locally cached sessions."""
+        with self._lock:
+            self._entries.clear()
+
+    def _store_local(self, key: tuple[int, int], user: SessionUser) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), user)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _redis_key(user_id: int) -> str:
+        return f"session_user:{user_id}"
+
+    def _redis_get(self, user_id: int, issued_at: int) -> SessionUser | None:
+        if self.redis_client is None:
+            return None
+        try:
+            raw = self.redis_client.hget(self._redis_key(user_id), str(issued_at))
+            if raw is None:
+                return None
+            entry = json.loads(raw)
+            if time.time() - entry["stored_at"] > self.ttl_seconds:
+                return None
+            return SessionUser.from_json(entry["user"])
+        except Exception as exc:
+            logger.warning(
+                "session_cache_redis_error",
+                extra={"operation": "get", "error": str(exc)},
+            )
+            return None
+
+    def _redis_set(self, user_id: int, issued_at: int, user: SessionUser) -> None:
+        if self.redis_client is None:
+            return
+        key = self._redis_key(user_id)
+        entry = json.dumps({"stored_at": time.time(), "user": user.to_json()})
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.hset(key, str(issued_at), entry)
+            pipe.expire(key, max(1, int(self.ttl_seconds)))
+            pipe.execute()
+        except Exception as exc:
+            logger.warning(
+                "session_cache_redis_error",
+                extra={"operation": "set", "error": str(exc)},
+            )
+
+
+def _redis_client_from_settings() -> Any | None:
+    if not settings.SESSION_USER_CACHE_REDIS:
+        return None
+    try:
+        from redis import Redis  # type: ignore
+
+        return Redis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_timeout=0.1,
+            socket_connect_timeout=0.1,
+        )
+    except Exception as exc:  # pragma: no cover - only hit if import fails
+        logger.warning("redis_client_init_failed", extra={"error": str(exc)})
+        return None
+
+
+session_user_cache = SessionUserCache(
+    ttl_seconds=settings.SESSION_USER_CACHE_TTL_SECONDS,
+    max_entries=settings.SESSION_USER_CACHE_MAX_ENTRIES,
+    redis_client=_redis_client_from_settings(),
+)
+
+
+def invalidate_session_user(db: Session, user_id: int) -> None:
+    """Invalidate ``user_id``'s cached sessions now and again after commit.
+
+    The second pass covers a concurrent request that re-cached the old row
+    between this call and the commit.
+    """
+    session_user_cache.invalidate_user(user_id)
+    db.info.setdefault(_PENDING_KEY, set()).add(user_id)
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        session_user_cache.invalidate_user(user_id)
+
+
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# (event, handler, insert) registered by app.db.events.install_session_hooks
+SESSION_HOOKS = (
+    ("after_commit", _invalidate_after_commit, False),
+    ("after_rollback", _discard_pending, False),
+)
@@ -4,13 +4,15 @@ import asyncio
 import logging
 import time
 from datetime import UTC, datetime, timedelta
+from functools import partial
 
 import pandas as pd
 import yfinance as yf
-from sqlalchemy import and_, desc
+from sqlalchemy import desc
 from sqlalchemy.orm import Session
 
 from app.db.models import StockPriceHistory
+from app.repos.stock_price_repo import StockPriceRepository
 
 logger = logging.getLogger(__name__)
 
@@ -366,6 +368,123 @@ class StockDataService:
         # Convert list of tuples to dict
         return dict(results)
 
+    async def get_bulk_quotes(
+        self, symbols: list[str], chunk_size: int = 200
+    ) -> dict[str, dict | None]:
+        """
+        Get current quotes for many symbols using yfinance multi-symbol downloads.
+
+        Unlike ``get_multiple_prices`` (one ``Ticker.info`` call per symbol), this
+        issues a single ``yf.download`` request per chunk of symbols and derives
+        the quote from the last daily bars. Only the price/intraday subset of the
+        ``StockPrice`` fields is populated; bid/ask and market metrics stay None.
+
+        Args:
+            symbols: List of ticker symbols to fetch
+            chunk_size: Number of symbols per download request (default: 200)
+
+        Returns:
+            Dict mapping each requested symbol to quote data (or None if unavailable).
+        """
+        if not symbols:
+            return {}
+
+        results: dict[str, dict | None] = {}
+        loop = asyncio.get_event_loop()
+
+        for i in range(0, len(symbols), chunk_size):
+            chunk = symbols[i : i + chunk_size]
+            yahoo_symbols = {self._normalize_symbol(s): s for s in chunk}
+
+            try:
+                await self._rate_limit()
+                frame = await loop.run_in_executor(
+                    None,
+                    partial(
+                        yf.download,
+                        tickers=" ".join(yahoo_symbols),
+                        period="5d",
+                        interval="1d",
+                        group_by="ticker",
+                        auto_adjust=False,
+                        threads=True,
+                        progress=False,
+                        timeout=self.timeout,
+                    ),
+                )
+            except Exception as e:
+                logger.error(
+                    f"Bulk quote download failed for {len(chunk)} symbols: {e}"
+                )
+                frame = None
+
+            for yahoo_symbol, symbol in yahoo_symbols.items():
+                results[symbol] = self._parse_bulk_quote(frame, yahoo_symbol)
+
+        return results
+
+    def _parse_bulk_quote(self, frame: pd.DataFrame | None, symbol: str) -> dict | None:
+        """Build a quote dict for one symbol from a ``yf.download`` result frame."""
+        if frame is None or frame.empty:
+            return None
+
+        try:
+            if isinstance(frame.columns, pd.MultiIndex):
+                if symbol not in frame.columns.get_level_values(0):
+                    return None
+                bars = frame[symbol]
+            else:
+                bars = frame
+
+            bars = bars.dropna(subset=["Close"])
+            if bars.empty:
+                return None
+
+            last = bars.iloc[-1]
+            current_price = float(last["Close"])
+            previous_close = (
+                float(bars.iloc[-2]["Close"]) if len(bars) > 1 else current_price
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Could not parse bulk quote for {symbol}: {e}")
+            return None
+
+        if current_price <= 0:
+            logger.warning(f"Invalid price ({current_price}) for {symbol}")
+            return None
+
+        change = current_price - previous_close
+        change_percent = (change / previous_close * 100) if previous_close > 0 else 0
+
+        def _price(value) -> float | None:
+            return round(float(value), 2) if not pd.isna(value) and value else None
+
+        volume = last.get("Volume")
+        last_bar_date = pd.Timestamp(bars.index[-1]).date()
+        market_state = (
+            "REGULAR" if last_bar_date == datetime.now(UTC).date() else "CLOSED"
+        )
+
+        return {
+            "symbol": symbol,
+            # Basic price data
+            "price": round(current_price, 2),
+            "previous_close": round(previous_close, 2),
+            "change": round(change, 2),
+            "change_percent": round(change_percent, 2),
+            # Intraday trading data
+            "open": _price(last.get("Open")),
+            "day_high": _price(last.get("High")),
+            "day_low": _price(last.get("Low")),
+            "volume": (
+                int(volume) if volume is not None and not pd.isna(volume) else None
+            ),
+            # Metadata
+            "currency": "USD",
+            "market_state": market_state,
+            "last_updated": datetime.now().isoformat(),
+        }
+
     async def get_historical_data(
         self, symbol: str, period: str = "1mo"
     ) -> dict | None:
@@ -492,34 +611,27 @@ class StockDataService:
                 )
 
                 if new_data:
-                    new_rows_count = 0
-                    for point in new_data:
-                        # Upsert logic (check if exists first to avoid error)
-                        exists = (
-                            db.query(StockPriceHistory)
-                            .filter(
-                                and_(
-                                    StockPriceHistory.symbol == symbol.upper(),
-                                    StockPriceHistory.date == point["timestamp"],
-                                )
-                            )
-                            .first()
-                        )
-
-                        if not exists:
-                            history = StockPriceHistory(
-                                symbol=symbol.upper(),
-                                date=point["timestamp"],
-                                open_price=point["open"],
-                                high_price=point["high"],
-                                low_price=point["low"],
-                                close_price=point["close"],
-                                volume=point["volume"],
-                            )
-                            db.add(history)
-                            new_rows_count += 1
+                    price_repo = StockPriceRepository(db)
+                    new_rows_count = price_repo.insert_history(
+                        [
+                            {
+                                "symbol": symbol.upper(),
+                                "date": point["timestamp"],
+                                "open_price": point["open"],
+                                "high_price": point["high"],
+                                "low_price": point["low"],
+                                "close_price": point["close"],
+                                "volume": point["volume"],
+                            }
+                            for point in new_data
+                        ]
+                    )
 
                     if new_rows_count > 0:
+                        price_repo.refresh_rollups(
+                            [symbol.upper()],
+                            since=min(point["timestamp"] for point in new_data),
+                        )
                         db.commit()
                         logger.info(
                             f"Added {new_rows_count} new history rows for {symbol}"
@@ -2,17 +2,102 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
 
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.db.models import StockPrice
+from app.repos.stock_price_repo import StockPriceRepository, price_row_from_quote
 from app.services.stock_data import stock_service
 
 logger = logging.getLogger(__name__)
 
 
+class QuoteCache:
+    """Short-TTL in-process quote cache with single-flight fetching.
+
+    Concurrent callers asking for the same symbol share one in-flight fetch
+    instead of each hitting Yahoo Finance (and queueing behind the service's
+    rate limiter). Successful quotes are kept for ``ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: dict[str, tuple[float, dict]] = {}
+        self._inflight: dict[str, asyncio.Future[dict | None]] = {}
+
+    def get(self, symbol: str) -> dict | None:
+        """Return a cached quote if it is younger than the TTL."""
+        entry = self._entries.get(symbol)
+        if entry is None:
+            return None
+        fetched_at, data = entry
+        if self._clock() - fetched_at > self.ttl_seconds:
+            del self._entries[symbol]
+            return None
+        return data
+
+    def clear(self) -> None:
+        """Drop all cached quotes (in-flight fetches are unaffected)."""
+        self._entries.clear()
+
+    async def fetch(
+        self,
+        symbol: str,
+        fetcher: Callable[[str], Awaitable[dict | None]],
+        *,
+        use_cache: bool = True,
+    ) -> dict | None:
+        """Return a quote for ``symbol``, coalescing concurrent fetches.
+
+        Args:
+            symbol: Upper-cased ticker symbol
+            fetcher: Coroutine function performing the actual fetch
+            use_cache: Serve a cached quote when one is still within the TTL
+
+        Returns:
+            Quote dict, or None when the fetch failed or returned nothing
+        """
+        if use_cache:
+            cached = self.get(symbol)
+            if cached is not None:
+                return cached
+
+        inflight = self._inflight.get(symbol)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[dict | None] = asyncio.get_running_loop().create_future()
+        self._inflight[symbol] = future
+        data: dict | None = None
+        try:
+            data = await fetcher(symbol)
+        except Exception as exc:
+            logger.error("Failed to fetch price for %s: %s", symbol, exc)
+        finally:
+            self._inflight.pop(symbol, None)
+            if data:
+                self._entries[symbol] = (self._clock(), data)
+            future.set_result(data or None)
+        return data or None
+
+
+quote_cache = QuoteCache(ttl_seconds=settings.STOCK_PRICE_QUOTE_CACHE_TTL_SECONDS)
+
+# Pending background refreshes by symbol; also keeps tasks from being GC'd
+_background_refreshes: dict[str, asyncio.Task] = {}
+
+
 def _is_fresh(
     record: StockPrice | None, cutoff: datetime, force_refresh: bool = False
 ) -> bool:
@@ -28,86 +113,87 @@ def _is_fresh(
     return updated_at >= cutoff
 
 
+async def _refresh_stock_price(
+    db: Session, symbol: str, *, force_refresh: bool = False
+) -> bool:
+    """Fetch a quote (single-flight) and upsert it. Returns True when written."""
+    data = await quote_cache.fetch(
+        symbol, stock_service.get_stock_price, use_cache=not force_refresh
+    )
+
+    if not data:
+        logger.warning("No stock price data returned for %s", symbol)
+        return False
+
+    if data.get("price") is None:
+        logger.error("No price data available for %s", symbol)
+        return False
+
+    try:
+        StockPriceRepository(db).upsert_prices(
+            [price_row_from_quote(symbol, data, datetime.now(UTC))]
+        )
+        db.commit()
+    except Exception as exc:  # pragma: no cover - DB failure path
+        logger.error("Failed to commit stock price for %s: %s", symbol, exc)
+        db.rollback()
+        return False
+
+    return True
+
+
+async def _refresh_in_background(db: Session, symbol: str) -> None:
+    """Refresh a symbol using a private session bound to the caller's engine."""
+    with Session(bind=db.get_bind()) as background_db:
+        await _refresh_stock_price(background_db, symbol)
+
+
+def _schedule_background_refresh(db: Session, symbol: str) -> None:
+    """Start a background refresh unless one is already pending for the symbol."""
+    if symbol in _background_refreshes:
+        return
+    task = asyncio.create_task(_refresh_in_background(db, symbol))
+    _background_refreshes[symbol] = task
+    task.add_done_callback(lambda _: _background_refreshes.pop(symbol, None))
+
+
 async def ensure_fresh_stock_price(
     db: Session,
     symbol: str,
     *,
     freshness_minutes: int = 15,
     force_refresh: bool = False,
+    stale_while_revalidate: bool = False,
 ) -> StockPrice | None:
     """
     Ensure the given symbol has a fresh StockPrice row in the database.
 
+    With ``stale_while_revalidate`` a stale row is returned immediately and the
+    refresh runs in a background task; a missing row is still fetched inline.
+
     Returns the up-to-date StockPrice instance (or None when data is unavailable).
     """
     symbol = symbol.upper()
-    now = datetime.now(UTC)
-    freshness_cutoff = now - timedelta(minutes=freshness_minutes)
+    freshness_cutoff = datetime.now(UTC) - timedelta(minutes=freshness_minutes)
 
     existing = db.query(StockPrice).filter(StockPrice.symbol == symbol).first()
     if _is_fresh(existing, freshness_cutoff, force_refresh):
         return existing
 
+    if stale_while_revalidate and existing is not None and not force_refresh:
+        logger.info(
+            "Serving stale stock price for %s, refreshing in background", symbol
+        )
+        _schedule_background_refresh(db, symbol)
+        return existing
+
     logger.info(
         "Refreshing stock price for %s (stale or missing, force=%s)",
         symbol,
         force_refresh,
     )
 
-    try:
-        data = await stock_service.get_stock_price(symbol)
-    except Exception as exc:  # pragma: no cover - defensive logging
-        logger.error("Failed to fetch price for %s: %s", symbol, exc)
-        return existing
-
-    if not data:
-        logger.warning("No stock price data returned for %s", symbol)
-        return existing
-
-    if existing is None:
-        existing = StockPrice(symbol=symbol)
-        db.add(existing)
-
-    # Basic price data
-    price = data.get("price")
-    if price is None:
-        logger.error("No price data available for %s", symbol)
-        return existing
-    existing.price = price
-    existing.previous_close = data.get("previous_close")
-    existing.change = data.get("change")
-    existing.change_percent = data.get("change_percent")
-
-    # Intraday trading data
-    existing.open = data.get("open")
-    existing.day_high = data.get("day_high")
-    existing.day_low = data.get("day_low")
-    existing.volume = data.get("volume")
-
-    # Bid/Ask spread
-    existing.bid = data.get("bid")
-    existing.ask = data.get("ask")
-    existing.bid_size = data.get("bid_size")
-    existing.ask_size = data.get("ask_size")
-
-    # Market metrics
-    existing.market_cap = data.get("market_cap")
-    existing.shares_outstanding = data.get("shares_outstanding")
-    existing.average_volume = data.get("average_volume")
-    existing.average_volume_10d = data.get("average_volume_10d")
-
-    # Metadata
-    existing.market_state = data.get("market_state")
-    existing.currency = data.get("currency", "USD")
-    existing.exchange = data.get("exchange")
-    existing.updated_at = now
-
-    try:
-        db.commit()
-    except Exception as exc:  # pragma: no cover - DB failure path
-        logger.error("Failed to commit stock price for %s: %s", symbol, exc)
-        db.rollback()
+    if not await _refresh_stock_price(db, symbol, force_refresh=force_refresh):
         return existing
 
-    db.refresh(existing)
-    return existing
+    return db.get(StockPrice, symbol, populate_existing=True)
@@ -0,0 +1,197 @@
+"""Ticker page header metrics, shared by ``/t/{ticker}`` and the overview API.
+
+The ticker row, latest price, lifetime total and today/yesterday mention
+counts come from one statement: the day counts are conditional aggregates
+over one index range of the ticker's last two days of links, and the total is
+read from ``ticker_stats``. Unique authors per day come from one read of the
+hourly author sketches (app.repos.author_sketch_repo), and the 30-day price
+history from one more indexed read.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import ColumnElement, case, func, select, true
+from sqlalchemy.orm import Session
+
+from app.db.models import (
+    ArticleTicker,
+    StockPrice,
+    StockPriceHistory,
+    Ticker,
+    TickerStats,
+)
+from app.repos.author_sketch_repo import AuthorSketchRepository
+
+PRICE_HISTORY_POINTS = 30
+
+
+@dataclass
+class TickerOverview:
+    """Header metrics for one ticker."""
+
+    symbol: str
+    name: str
+    exchange: str | None
+    total_articles: int
+    today_articles: int
+    yesterday_articles: int
+    unique_users_today: int
+    unique_users_yesterday: int
+    stock_data: dict[str, Any] | None = None
+    # Daily closes, oldest first
+    price_history: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def article_change(self) -> int:
+        return self.today_articles - self.yesterday_articles
+
+    @property
+    def article_change_percent(self) -> float:
+        return _change_percent(self.today_articles, self.yesterday_articles)
+
+    @property
+    def users_change(self) -> int:
+        return self.unique_users_today - self.unique_users_yesterday
+
+    @property
+    def users_change_percent(self) -> float:
+        return _change_percent(self.unique_users_today, self.unique_users_yesterday)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data.update(
+            article_change=self.article_change,
+            article_change_percent=self.article_change_percent,
+            users_change=self.users_change,
+            users_change_percent=self.users_change_percent,
+        )
+        return data
+
+
+def _change_percent(current: int, previous: int) -> float:
+    if previous > 0:
+        return (current - previous) / previous * 100
+    # Any activity after none counts as a 100% increase
+    return 100.0 if current > 0 else 0.0
+
+
+def _count_if(condition: ColumnElement[bool], postgres: bool) -> ColumnElement:
+    if postgres:
+        return func.count().filter(condition)
+    return func.count(case((condition, 1)))
+
+
+def get_ticker_overview(
+    db: Session, symbol: str, now: datetime | None = None
+) -> TickerOverview | None:
+    """Compute the header metrics for ``symbol``, or None if it is unknown.
+
+    Days are local calendar days, as shown on the ticker page.
+    """
+    symbol = symbol.upper()
+    today_start = datetime.combine((now or datetime.now()).date(), datetime.min.time())
+    yesterday_start = today_start - timedelta(days=1)
+    postgres = db.get_bind().dialect.name == "postgresql"
+
+    is_today = ArticleTicker.published_at >= today_start
+    is_yesterday = ArticleTicker.published_at < today_start
+    window = (
+        select(
+            _count_if(is_today, postgres).label("today_articles"),
+            _count_if(is_yesterday, postgres).label("yesterday_articles"),
+        )
+        .where(
+            ArticleTicker.ticker == symbol,
+            ArticleTicker.published_at >= yesterday_start,
+        )
+        .subquery()
+    )
+    # Tickers without a stats row yet are counted exactly
+    exact_total = (
+        select(func.count())
+        .select_from(ArticleTicker)
+        .where(ArticleTicker.ticker == symbol)
+        .scalar_subquery()
+    )
+
+    row = db.execute(
+        select(
+            Ticker.symbol,
+            Ticker.name,
+            Ticker.exchange,
+            func.coalesce(TickerStats.live_mentions, exact_total).label(
+                "total_articles"
+            ),
+            window.c.today_articles,
+            window.c.yesterday_articles,
+            StockPrice.price,
+            StockPrice.previous_close,
+            StockPrice.change,
+            StockPrice.change_percent,
+            StockPrice.market_state,
+            StockPrice.currency,
+            StockPrice.exchange.label("price_exchange"),
+            StockPrice.updated_at,
+        )
+        .select_from(Ticker)
+        .join(window, true())
+        .outerjoin(TickerStats, TickerStats.ticker == Ticker.symbol)
+        .outerjoin(StockPrice, StockPrice.symbol == Ticker.symbol)
+        .where(Ticker.symbol == symbol)
+    ).first()
+    if row is None:
+        return None
+
+    users_today, users_yesterday = AuthorSketchRepository(db).unique_authors_in_windows(
+        symbol,
+        [
+            (today_start, today_start + timedelta(days=1)),
+            (yesterday_start, today_start),
+        ],
+    )
+    overview = TickerOverview(
+        symbol=row.symbol,
+        name=row.name,
+        exchange=row.exchange,
+        total_articles=row.total_articles or 0,
+        today_articles=row.today_articles or 0,
+        yesterday_articles=row.yesterday_articles or 0,
+        unique_users_today=users_today,
+        unique_users_yesterday=users_yesterday,
+    )
+    if row.price is not None:
+        overview.stock_data = {
+            "symbol": row.symbol,
+            "price": row.price,
+            "previous_close": row.previous_close,
+            "change": row.change,
+            "change_percent": row.change_percent,
+            "market_state": row.market_state,
+            "currency": row.currency,
+            "exchange": row.price_exchange,
+            "last_updated": row.updated_at.isoformat() if row.updated_at else None,
+        }
+
+    history = db.execute(
+        select(
+            StockPriceHistory.date,
+            StockPriceHistory.close_price,
+            StockPriceHistory.volume,
+        )
+        .where(StockPriceHistory.symbol == symbol)
+        .order_by(StockPriceHistory.date.desc())
+        .limit(PRICE_HISTORY_POINTS)
+    ).all()
+    overview.price_history = [
+        {
+            "date": point.date.strftime("%Y-%m-%d"),
+            "price": point.close_price,
+            "volume": point.volume or 0,
+        }
+        for point in reversed(history)
+    ]
+    return overview
@@ -0,0 +1,220 @@
+"""In-memory typeahead index over the ticker universe.
+
+Matches are case-insensitive substrings of the symbol or name, ranked like
+the original ILIKE query: exact symbol, symbol prefix, symbol substring, then
+name substring, each tier ordered by symbol.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.models import Ticker
+
+logger = logging.getLogger(__name__)
+
+# Longest n-gram indexed; queries use their rarest gram of this length
+NGRAM_SIZE = 3
+
+# Session.info flag set when a flush touched a Ticker row
+_DIRTY_KEY = "ticker_search_index_dirty"
+
+
+@dataclass(frozen=True)
+class TickerSearchEntry:
+    """Ticker fields returned by typeahead search."""
+
+    symbol: str
+    name: str
+    exchange: str | None
+
+    def to_dict(self) -> dict[str, str | None]:
+        return {"symbol": self.symbol, "name": self.name, "exchange": self.exchange}
+
+
+def _ngrams(text: str) -> set[str]:
+    """Every substring of ``text`` up to NGRAM_SIZE characters long."""
+    return {
+        text[start : start + size]
+        for size in range(1, NGRAM_SIZE + 1)
+        for start in range(len(text) - size + 1)
+    }
+
+
+class TickerSearchIndex:
+    """Immutable search snapshot of the ticker table.
+
+    Entries are numbered in symbol order, so the sorted symbol array serves
+    prefix lookups by bisection and every n-gram posting list (ascending ids)
+    is already in result order. A substring query walks the posting list of
+    its rarest n-gram, verifies candidates and stops once ``limit`` are found.
+    """
+
+    def __init__(self, entries: Iterable[TickerSearchEntry]):
+        self.entries = sorted(entries, key=lambda entry: entry.symbol)
+        self._symbols = [entry.symbol.lower() for entry in self.entries]
+        self._names = [(entry.name or "").lower() for entry in self.entries]
+        self._by_symbol = {symbol: i for i, symbol in enumerate(self._symbols)}
+        self._symbol_grams = self._build_postings(self._symbols)
+        self._name_grams = self._build_postings(self._names)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def _build_postings(texts: list[str]) -> dict[str, list[int]]:
+        postings: dict[str, list[int]] = {}
+        for i, text in enumerate(texts):
+            for gram in _ngrams(text):
+                postings.setdefault(gram, []).append(i)
+        return postings
+
+    def search(self, query: str, limit: int = 20) -> list[TickerSearchEntry]:
+        """Return up to ``limit`` tickers matching ``query`` in relevance order."""
+        needle = query.strip().lower()
+        if not needle or limit <= 0:
+            return []
+
+        seen: set[int] = set()
+        results: list[TickerSearchEntry] = []
+        for i in self._ranked_matches(needle):
+            if i in seen:
+                continue
+            seen.add(i)
+            results.append(self.entries[i])
+            if len(results) >= limit:
+                break
+        return results
+
+    def _ranked_matches(self, needle: str) -> Iterator[int]:
+        # 0: exact symbol
+        exact = self._by_symbol.get(needle)
+        if exact is not None:
+            yield exact
+        # 1: symbol prefix (contiguous range of the sorted symbol array)
+        start = bisect.bisect_left(self._symbols, needle)
+        end = start
+        while end < len(self._symbols) and self._symbols[end].startswith(needle):
+            yield end
+            end += 1
+        # 2: symbol substring, 3: name substring
+        yield from self._substring_matches(needle, self._symbols, self._symbol_grams)
+        yield from self._substring_matches(needle, self._names, self._name_grams)
+
+    @staticmethod
+    def _substring_matches(
+        needle: str, texts: list[str], postings: dict[str, list[int]]
+    ) -> Iterator[int]:
+        size = min(len(needle), NGRAM_SIZE)
+        candidates: list[int] | None = None
+        for start in range(len(needle) - size + 1):
+            posting = postings.get(needle[start : start + size])
+            if posting is None:
+                return
+            if candidates is None or len(posting) < len(candidates):
+                candidates = posting
+        exact_gram = len(needle) <= NGRAM_SIZE
+        for i in candidates or ():
+            if exact_gram or needle in texts[i]:
+                yield i
+
+
+class TickerSearchCache:
+    """Process-wide :class:`TickerSearchIndex`, rebuilt when stale.
+
+    The index is rebuilt after ``ttl_seconds`` or after :meth:`invalidate`,
+    which runs automatically when a session in this process commits a
+    Ticker change. The TTL picks up changes made by other processes
+    (ingestion jobs and scripts).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._index: TickerSearchIndex | None = None
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_index(self, db: Session) -> TickerSearchIndex:
+        """Return the current index, rebuilding it from ``db`` if stale."""
+        index = self._index
+        if index is not None and self._clock() - self._built_at < self.ttl_seconds:
+            return index
+        with self._lock:
+            if (
+                self._index is None
+                or self._clock() - self._built_at >= self.ttl_seconds
+            ):
+                self._index = self._build(db)
+                self._built_at = self._clock()
+            return self._index
+
+    def search(
+        self, db: Session, query: str, limit: int = 20
+    ) -> list[TickerSearchEntry]:
+        return self.get_index(db).search(query, limit)
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next lookup."""
+        with self._lock:
+            self._index = None
+
+    @staticmethod
+    def _build(db: Session) -> TickerSearchIndex:
+        started = time.perf_counter()
+        rows = db.execute(select(Ticker.symbol, Ticker.name, Ticker.exchange)).all()
+        index = TickerSearchIndex(
+            TickerSearchEntry(symbol=row.symbol, name=row.name, exchange=row.exchange)
+            for row in rows
+        )
+        logger.info(
+            "ticker_search_index_built",
+            extra={
+                "tickers": len(index),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            },
+        )
+        return index
+
+
+ticker_search_cache = TickerSearchCache(
+    ttl_seconds=settings.TICKER_SEARCH_INDEX_TTL_SECONDS
+)
+
+
+def _mark_ticker_changes(session: Session, flush_context) -> None:
+    if any(
+        isinstance(obj, Ticker)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        session.info[_DIRTY_KEY] = True
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    if session.info.pop(_DIRTY_KEY, False):
+        ticker_search_cache.invalidate()
+
+
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_DIRTY_KEY, None)
+
+
+# (event, handler, insert) registered by app.db.events.install_session_hooks
+SESSION_HOOKS = (
+    ("after_flush", _mark_ticker_changes, False),
+    ("after_commit", _invalidate_after_commit, False),
+    ("after_rollback", _discard_pending, False),
+)
@@ -0,0 +1,114 @@
+"""Incremental maintenance of ``ticker_stats`` counters.
+
+ORM-added ArticleTicker rows are picked up by session hooks (installed with
+app.db.events.install_session_hooks): links flushed in a transaction are
+applied to the counters just before it commits, so counters move with the
+data and roll back with it. Writers that bypass the unit of
+work (bulk saves, Core UPDATEs) report their rows with
+:func:`record_article_links` / :func:`record_sentiment_scores`. Anything else
+(deletes, sentiment overrides, backfills) is corrected by the nightly
+reconcile job.
+
+The same pending links and scores add their authors to the hourly
+distinct-author sketches (app.repos.author_sketch_repo).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Mapping
+
+from sqlalchemy.orm import Session
+
+from app.db.models import ArticleTicker
+from app.repos.author_sketch_repo import AuthorSketchRepository
+from app.repos.ticker_stats_repo import TickerStatsDelta, TickerStatsRepository
+
+logger = logging.getLogger(__name__)
+
+# Session.info keys holding pending work for the current transaction
+_LINKS_KEY = "ticker_stats_pending_links"
+_SCORES_KEY = "ticker_stats_pending_scores"
+
+
+def record_article_links(session: Session, links: Iterable[tuple[int, str]]) -> None:
+    """Count (article_id, ticker) links written outside the ORM unit of work."""
+    session.info.setdefault(_LINKS_KEY, set()).update(links)
+
+
+def record_sentiment_scores(session: Session, scores: Mapping[int, float]) -> None:
+    """Count first-time sentiment scores (the article's sentiment was NULL)."""
+    session.info.setdefault(_SCORES_KEY, {}).update(scores)
+
+
+def refresh_recent_ticker_mentions() -> bool:
+    """Recount trailing-24h mentions in their own session; for use by jobs.
+
+    Failures are logged and reported as False so they never fail the job.
+    """
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        tickers = TickerStatsRepository(db).refresh_recent_mentions()
+        db.commit()
+        logger.info("ticker_stats_recent_refreshed", extra={"tickers": tickers})
+        return True
+    except Exception as e:
+        db.rollback()
+        logger.error("ticker_stats_recent_refresh_failed", extra={"error": str(e)})
+        return False
+    finally:
+        db.close()
+
+
+def _collect_new_links(session: Session, flush_context) -> None:
+    links = [
+        (obj.article_id, obj.ticker)
+        for obj in session.new
+        if isinstance(obj, ArticleTicker)
+    ]
+    if links:
+        record_article_links(session, links)
+
+
+def _apply_pending(session: Session) -> None:
+    if session.new or session.dirty or session.deleted:
+        # Links still pending flush are collected by _collect_new_links
+        session.flush()
+    links = session.info.pop(_LINKS_KEY, None)
+    scores = session.info.pop(_SCORES_KEY, None)
+    if not links and not scores:
+        return
+
+    repo = TickerStatsRepository(session)
+    deltas: dict[str, TickerStatsDelta] = repo.link_deltas(links) if links else {}
+    if scores and links:
+        # New links already counted their article's current sentiment
+        linked = {article_id for article_id, _ in links}
+        scores = {k: v for k, v in scores.items() if k not in linked}
+    if scores:
+        for ticker, delta in repo.sentiment_deltas(scores).items():
+            merged = deltas.setdefault(ticker, TickerStatsDelta())
+            merged.sentiment_sum += delta.sentiment_sum
+            merged.sentiment_count += delta.sentiment_count
+    repo.apply_deltas(deltas)
+
+    sketches = AuthorSketchRepository(session)
+    if links:
+        sketches.add_links(links)
+    if scores:
+        sketches.add_scores(scores)
+
+
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_LINKS_KEY, None)
+    session.info.pop(_SCORES_KEY, None)
+
+
+# (event, handler, insert) registered by app.db.events.install_session_hooks
+SESSION_HOOKS = (
+    ("after_flush", _collect_new_links, False),
+    ("before_commit", _apply_pending, False),
+    ("after_rollback", _discard_pending, False),
+)
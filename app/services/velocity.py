@@ -8,7 +8,7 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.db.models import Article, ArticleTicker
+from app.db.models import ArticleTicker
 
 logger = logging.getLogger(__name__)
 
@@ -36,11 +36,10 @@ class VelocityService:
 
         # Get recent count (last 24h by default)
         recent_count = (
-            self.session.query(func.count(Article.id))
-            .join(ArticleTicker, Article.id == ArticleTicker.article_id)
+            self.session.query(func.count(ArticleTicker.article_id))
             .filter(
                 ArticleTicker.ticker == ticker.upper(),
-                Article.published_at >= recent_window,
+                ArticleTicker.published_at >= recent_window,
             )
             .scalar()
             or 0
@@ -48,12 +47,11 @@ class VelocityService:
 
         # Get baseline average (daily average over baseline period)
         baseline_total = (
-            self.session.query(func.count(Article.id))
-            .join(ArticleTicker, Article.id == ArticleTicker.article_id)
+            self.session.query(func.count(ArticleTicker.article_id))
             .filter(
                 ArticleTicker.ticker == ticker.upper(),
-                Article.published_at >= baseline_start,
-                Article.published_at < recent_window,
+                ArticleTicker.published_at >= baseline_start,
+                ArticleTicker.published_at < recent_window,
             )
             .scalar()
             or 0
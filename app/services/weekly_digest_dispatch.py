@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import logging
-import time
 from dataclasses import dataclass
 from datetime import date
+from typing import Any
 
 from sqlalchemy.orm import Session
 
 from app.models.dto import (
+    EmailSendResult,
     UserDTO,
+    UserProfileDTO,
+    WeeklyDigestContent,
+    WeeklyTickerAggregate,
 )
 from app.repos.user_repo import UserRepository
 from app.repos.weekly_digest_repo import WeeklyDigestRepository
+from app.services.email_send_pool import ConcurrentEmailSender
 from app.services.email_service import EmailService
 from app.services.email_utils import generate_unsubscribe_token
 from app.services.weekly_summary import WeeklySummaryService, get_week_boundaries
@@ -21,6 +26,15 @@ from app.services.weekly_summary import WeeklySummaryService, get_week_boundarie
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PreparedDigest:
+    """A user's rendered-ready weekly digest awaiting send."""
+
+    user: UserDTO
+    profile: UserProfileDTO | None
+    content: WeeklyDigestContent
+
+
 @dataclass
 class WeeklyDispatchStats:
     """Statistics from a weekly dispatch run."""
@@ -44,6 +58,7 @@ class WeeklyDigestDispatchService:
         user_repo: UserRepository | None = None,
         digest_repo: WeeklyDigestRepository | None = None,
         summary_service: WeeklySummaryService | None = None,
+        sender: ConcurrentEmailSender | None = None,
     ):
         """Initialize dispatch service.
 
@@ -53,12 +68,24 @@ class WeeklyDigestDispatchService:
             user_repo: User repository (created if not provided)
             digest_repo: Weekly digest repository (created if not provided)
             summary_service: Weekly summary service (created if not provided)
+            sender: Concurrent sender (sized to the provider quota if not provided)
         """
         self.session = session
         self.email_service = email_service
         self.user_repo = user_repo or UserRepository(session)
         self.digest_repo = digest_repo or WeeklyDigestRepository(session)
         self.summary_service = summary_service or WeeklySummaryService(session)
+        self._sender = sender
+        # Per-dispatch state shared across batches
+        self._aggregates: dict[str, WeeklyTickerAggregate] = {}
+        self._sample_tickers: list[str] | None = None
+
+    @property
+    def sender(self) -> ConcurrentEmailSender:
+        """Rate-governed concurrent sender, sized on first use."""
+        if self._sender is None:
+            self._sender = ConcurrentEmailSender.for_email_service(self.email_service)
+        return self._sender
 
     def get_eligible_users(self) -> list[UserDTO]:
         """Get all users eligible for weekly digest emails.
@@ -169,55 +196,27 @@ class WeeklyDigestDispatchService:
             extra={"count": total_eligible},
         )
 
-        # Process users
+        # Each batch runs in phases: plan recipients in bulk, aggregate the
+        # tickers not seen in earlier batches, synthesise each distinct ticker
+        # set once, then send concurrently, recording each send as it returns
         sent = 0
         skipped = 0
         failed = 0
-        rate_limit_delay = 1.0 / 14.0  # 14 emails per second
+        self._aggregates = {}
+        self._sample_tickers = None
 
-        for idx, user in enumerate(eligible_users):
-            try:
-                result = self._process_user(
-                    user=user,
+        with self.summary_service.synthesis_cache():
+            for i in range(0, len(eligible_users), batch_size):
+                batch_stats = self._dispatch_batch(
+                    eligible_users[i : i + batch_size],
                     week_start=week_start,
                     week_end=week_end,
                     dry_run=dry_run,
                     force=force,
                 )
-
-                if result == "sent":
-                    sent += 1
-                elif result == "skipped":
-                    skipped += 1
-                else:
-                    failed += 1
-
-                # Rate limiting
-                if not dry_run and idx < len(eligible_users) - 1:
-                    time.sleep(rate_limit_delay)
-
-            except Exception as e:
-                logger.error(
-                    "Error processing user for weekly digest",
-                    extra={
-                        "user_id": user.id,
-                        "user_email": user.email,
-                        "error": str(e),
-                    },
-                    exc_info=True,
-                )
-                failed += 1
-
-                # Record failure
-                try:
-                    self.digest_repo.mark_failed(
-                        user_id=user.id,
-                        week_start=week_start,
-                        error=str(e),
-                    )
-                    self.session.commit()
-                except Exception:
-                    pass
+                sent += batch_stats["sent"]
+                skipped += batch_stats["skipped"]
+                failed += batch_stats["failed"]
 
         stats = WeeklyDispatchStats(
             week_start=week_start,
@@ -244,144 +243,213 @@ class WeeklyDigestDispatchService:
 
         return stats
 
-    def _process_user(
+    def _dispatch_batch(
         self,
-        user: UserDTO,
+        users: list[UserDTO],
         week_start: date,
         week_end: date,
         dry_run: bool,
         force: bool = False,
-    ) -> str:
-        """Process a single user for weekly digest.
+    ) -> dict[str, int]:
+        """Plan, synthesise, send and record one batch of users.
+
+        Skip and preparation-failure records are written before any email is
+        sent; each send's record is committed as soon as that send returns.
 
         Args:
-            user: User to process
+            users: Users in this batch
             week_start: Start of week
             week_end: End of week
-            dry_run: If True, don't actually send
+            dry_run: If True, don't send or write records
             force: If True, bypass idempotency and skip checks (for testing)
 
         Returns:
-            "sent", "skipped", or "failed"
+            Counts of ``sent``, ``skipped`` and ``failed`` users
         """
-        # Check idempotency - already sent? (bypass if force=True)
-        if not force and self.digest_repo.check_already_sent(user.id, week_start):
-            logger.debug(
-                "Skipping user - digest already sent",
-                extra={"user_id": user.id, "week_start": week_start.isoformat()},
-            )
-            return "skipped"
-
-        # Get user's followed tickers
-        follows = self.user_repo.get_ticker_follows(user.id)
-        if not follows:
-            if force:
-                logger.warning(
-                    "Force mode: user has no ticker follows, using sample tickers",
-                    extra={"user_id": user.id},
-                )
-                # Use sample tickers for testing
-                follows = []
-            else:
-                logger.debug(
-                    "Skipping user - no ticker follows",
-                    extra={"user_id": user.id},
-                )
-                self.digest_repo.mark_skipped(
-                    user_id=user.id,
-                    week_start=week_start,
-                    skip_reason="no_ticker_follows",
+        counts = {"sent": 0, "skipped": 0, "failed": 0}
+        records: list[dict] = []
+
+        # Phase 1: idempotency, follows and profiles with one query each
+        user_ids = [user.id for user in users]
+        finalized = (
+            set()
+            if force
+            else self.digest_repo.get_finalized_user_ids(user_ids, week_start)
+        )
+        pending = [user for user in users if user.id not in finalized]
+        counts["skipped"] += len(users) - len(pending)
+        follows_by_user = self.user_repo.get_ticker_follows_for_users(
+            [user.id for user in pending]
+        )
+        profiles = self.user_repo.get_profiles([user.id for user in pending])
+
+        tickers_by_user: dict[int, list[str]] = {}
+        for user in pending:
+            tickers = [f.ticker.upper() for f in follows_by_user.get(user.id, [])]
+            if not tickers:
+                if not force:
+                    logger.debug(
+                        "Skipping user - no ticker follows",
+                        extra={"user_id": user.id},
+                    )
+                    records.append(self._skip_record(user, "no_ticker_follows"))
+                    continue
+                # In force mode with no tickers, use popular tickers for testing
+                if self._sample_tickers is None:
+                    self._sample_tickers = self._get_sample_tickers_for_testing()
+                tickers = list(self._sample_tickers)
+                logger.info(
+                    "Force mode: using sample tickers for testing",
+                    extra={"user_id": user.id, "sample_tickers": tickers},
                 )
-                self.session.commit()
-                return "skipped"
-
-        tickers = [f.ticker.upper() for f in follows] if follows else []
+            tickers_by_user[user.id] = tickers
 
-        # In force mode with no tickers, get some popular tickers for testing
-        if force and not tickers:
-            tickers = self._get_sample_tickers_for_testing()
-            logger.info(
-                "Force mode: using sample tickers for testing",
-                extra={"user_id": user.id, "sample_tickers": tickers},
-            )
-
-        # Aggregate weekly summaries
-        aggregates = self.summary_service.aggregate_weekly_summaries(
-            tickers=tickers,
-            week_start=week_start,
-            week_end=week_end,
+        # Phase 2: aggregate the week once per ticker across the whole run
+        new_tickers = sorted(
+            {t for tickers in tickers_by_user.values() for t in tickers}
+            - self._aggregates.keys()
         )
-
-        if not aggregates:
-            if force:
-                logger.warning(
-                    "Force mode: no weekly data for tickers, sending empty digest",
-                    extra={"user_id": user.id, "tickers": tickers},
-                )
-                # Continue with empty aggregates - will get fallback content
-            else:
+        if new_tickers:
+            for aggregate in self.summary_service.aggregate_weekly_summaries(
+                tickers=new_tickers, week_start=week_start, week_end=week_end
+            ):
+                self._aggregates[aggregate.ticker] = aggregate
+
+        aggregates_by_user: dict[int, list[WeeklyTickerAggregate]] = {}
+        for user in pending:
+            followed = tickers_by_user.get(user.id)
+            if followed is None:
+                continue
+            aggregates = [
+                self._aggregates[t] for t in followed if t in self._aggregates
+            ]
+            aggregates.sort(key=lambda a: a.total_mentions, reverse=True)
+            if not aggregates and not force:
                 logger.debug(
                     "Skipping user - no weekly data for tickers",
-                    extra={"user_id": user.id, "tickers": tickers},
-                )
-                self.digest_repo.mark_skipped(
-                    user_id=user.id,
-                    week_start=week_start,
-                    skip_reason="no_weekly_data",
+                    extra={"user_id": user.id, "tickers": followed},
                 )
-                self.session.commit()
-                return "skipped"
-
-        # Get user profile
-        profile = self.user_repo.get_profile(user.id)
-        user_timezone = profile.timezone if profile else "UTC"
+                records.append(self._skip_record(user, "no_weekly_data"))
+                continue
+            aggregates_by_user[user.id] = aggregates
 
-        # Generate digest content
-        digest_content = self.summary_service.generate_weekly_digest(
-            aggregates=aggregates,
-            week_start=week_start,
-            week_end=week_end,
-            user_timezone=user_timezone,
+        # Phase 3: one LLM synthesis per distinct ticker set, run concurrently
+        self.summary_service.prefetch_syntheses(
+            list(aggregates_by_user.values()), week_start, week_end
         )
 
-        if dry_run:
-            logger.info(
-                "DRY RUN: Would send weekly digest",
-                extra={
-                    "user_id": user.id,
-                    "user_email": user.email,
-                    "ticker_count": digest_content.total_tickers,
-                    "days_with_data": digest_content.days_with_data,
-                },
-            )
-            return "sent"
-
-        # Send email
-        unsubscribe_token = generate_unsubscribe_token(user.id)
-        result = self.email_service.send_weekly_digest(
-            user=user,
-            digest_content=digest_content,
-            user_profile=profile,
-            unsubscribe_token=unsubscribe_token,
+        ready: list[PreparedDigest] = []
+        for user in pending:
+            user_aggregates = aggregates_by_user.get(user.id)
+            if user_aggregates is None:
+                continue
+            profile = profiles.get(user.id)
+            try:
+                content = self.summary_service.generate_weekly_digest(
+                    aggregates=user_aggregates,
+                    week_start=week_start,
+                    week_end=week_end,
+                    user_timezone=profile.timezone if profile else "UTC",
+                )
+            except Exception as e:
+                records.append(self._error_record(user, e))
+                continue
+
+            if dry_run:
+                logger.info(
+                    "DRY RUN: Would send weekly digest",
+                    extra={
+                        "user_id": user.id,
+                        "user_email": user.email,
+                        "ticker_count": content.total_tickers,
+                        "days_with_data": content.days_with_data,
+                    },
+                )
+                counts["sent"] += 1
+                continue
+            ready.append(PreparedDigest(user=user, profile=profile, content=content))
+
+        for record in records:
+            counts[record["status"]] += 1
+        if not dry_run:
+            self._write_records(week_start, records)
+
+        # Phase 4: send under the provider rate limit, committing each record
+        # as its send returns so a crash mid-batch cannot leave a delivered
+        # digest unrecorded (and resent by the next run)
+        for outcome in self.sender.send_iter(ready, self._send_digest):
+            if outcome.error is not None:
+                record = self._error_record(outcome.item.user, outcome.error)
+            else:
+                assert outcome.result is not None
+                record = self._result_record(outcome.item, outcome.result)
+            counts[record["status"]] += 1
+            self._write_records(week_start, [record])
+        return counts
+
+    def _send_digest(self, prepared: PreparedDigest) -> EmailSendResult:
+        """Render and send one digest (runs on a sender worker thread)."""
+        return self.email_service.send_weekly_digest(
+            user=prepared.user,
+            digest_content=prepared.content,
+            user_profile=prepared.profile,
+            unsubscribe_token=generate_unsubscribe_token(prepared.user.id),
         )
 
+    @staticmethod
+    def _skip_record(user: UserDTO, skip_reason: str) -> dict:
+        return {"user_id": user.id, "status": "skipped", "skip_reason": skip_reason}
+
+    @staticmethod
+    def _result_record(prepared: PreparedDigest, result: EmailSendResult) -> dict:
+        record: dict[str, Any] = {
+            "user_id": prepared.user.id,
+            "ticker_count": prepared.content.total_tickers,
+            "days_with_data": prepared.content.days_with_data,
+        }
         if result.success:
-            self.digest_repo.mark_sent(
-                user_id=user.id,
-                week_start=week_start,
-                message_id=result.message_id,
-                ticker_count=digest_content.total_tickers,
-                days_with_data=digest_content.days_with_data,
-            )
-            self.session.commit()
-            return "sent"
+            record.update(status="sent", message_id=result.message_id)
         else:
-            self.digest_repo.mark_failed(
-                user_id=user.id,
-                week_start=week_start,
-                error=result.error or "Unknown error",
-                ticker_count=digest_content.total_tickers,
-                days_with_data=digest_content.days_with_data,
-            )
-            self.session.commit()
-            return "failed"
+            record.update(status="failed", error=result.error or "Unknown error")
+        return record
+
+    @staticmethod
+    def _error_record(user: UserDTO, error: Exception) -> dict:
+        """Log a failure raised while preparing or sending and build its record."""
+        logger.error(
+            "Error processing user for weekly digest",
+            extra={
+                "user_id": user.id,
+                "user_email": user.email,
+                "error": str(error),
+            },
+            exc_info=error,
+        )
+        return {"user_id": user.id, "status": "failed", "error": str(error)}
+
+    def _write_records(self, week_start: date, records: list[dict]) -> None:
+        """Persist send records, falling back to per-row writes."""
+        if len(records) > 1:
+            try:
+                self.digest_repo.upsert_records(week_start, records)
+                self.session.commit()
+                return
+            except Exception as e:
+                self.session.rollback()
+                logger.error(
+                    "Bulk weekly digest record write failed, retrying per user",
+                    extra={"records": len(records), "error": str(e)},
+                    exc_info=True,
+                )
+
+        for record in records:
+            try:
+                self.digest_repo.upsert_records(week_start, [record])
+                self.session.commit()
+            except Exception:
+                self.session.rollback()
+                logger.error(
+                    "Failed to record weekly digest result",
+                    extra={"user_id": record["user_id"], "status": record["status"]},
+                    exc_info=True,
+                )
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 
@@ -26,6 +29,8 @@ from app.services.email_utils import map_sentiment_to_display
 
 logger = logging.getLogger(__name__)
 
+SynthesisKey = tuple[date, date, tuple[str, ...]]
+
 
 class TopSignalItem(BaseModel):
     """A single top signal/theme from the week."""
@@ -131,6 +136,66 @@ class WeeklySummaryService:
         self._session = session
         self._summary_repo = DailyTickerSummaryRepository(session)
         self._user_repo = UserRepository(session)
+        # LLM syntheses by ticker set; None outside of synthesis_cache()
+        self._syntheses: dict[SynthesisKey, WeeklySummaryInfo | None] | None = None
+
+    @contextmanager
+    def synthesis_cache(self) -> Iterator[None]:
+        """Reuse one LLM synthesis for every user with the same ticker set.
+
+        Inside the block, :meth:`generate_weekly_digest` looks syntheses up by
+        the sorted set of tickers it covers (failures are cached too, so a
+        failing set falls back without re-invoking the model per user).
+        """
+        self._syntheses = {}
+        try:
+            yield
+        finally:
+            self._syntheses = None
+
+    def prefetch_syntheses(
+        self,
+        aggregate_sets: Sequence[list[WeeklyTickerAggregate]],
+        week_start: date,
+        week_end: date,
+        max_tickers: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> int:
+        """Run the LLM synthesis once per distinct ticker set, concurrently.
+
+        Requires an active :meth:`synthesis_cache`. Sets already cached are not
+        re-run.
+
+        Returns:
+            Number of syntheses run
+        """
+        if self._syntheses is None:
+            raise RuntimeError("prefetch_syntheses requires synthesis_cache()")
+        max_tickers = max_tickers or settings.weekly_digest_max_tickers_per_user
+        max_concurrency = max_concurrency or settings.weekly_digest_llm_concurrency
+
+        pending: dict[SynthesisKey, list[WeeklyTickerAggregate]] = {}
+        for aggregates in aggregate_sets:
+            limited = aggregates[:max_tickers]
+            if not limited:
+                continue
+            key = self._synthesis_key(limited, week_start, week_end)
+            if key not in self._syntheses:
+                pending.setdefault(key, limited)
+        if not pending:
+            return 0
+
+        # The synthesis only builds a prompt and calls the model; no session use
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(pending)),
+            thread_name_prefix="weekly-llm",
+        ) as pool:
+            results = pool.map(
+                lambda limited: self._synthesize(limited, week_start, week_end),
+                pending.values(),
+            )
+            self._syntheses.update(zip(pending.keys(), results, strict=True))
+        return len(pending)
 
     def aggregate_weekly_summaries(
         self,
@@ -283,17 +348,16 @@ class WeeklySummaryService:
         # Limit tickers
         limited_aggregates = aggregates[:max_tickers]
 
-        # Build prompt and call LLM
-        try:
-            llm_response = self._generate_llm_synthesis(
-                limited_aggregates, week_start, week_end
-            )
-        except Exception as e:
-            logger.error(
-                "LLM synthesis failed, using fallback",
-                extra={"error": str(e)},
-                exc_info=True,
-            )
+        # Build prompt and call LLM (or reuse the synthesis for this ticker set)
+        key = self._synthesis_key(limited_aggregates, week_start, week_end)
+        if self._syntheses is not None and key in self._syntheses:
+            llm_response = self._syntheses[key]
+        else:
+            llm_response = self._synthesize(limited_aggregates, week_start, week_end)
+            if self._syntheses is not None:
+                self._syntheses[key] = llm_response
+
+        if llm_response is None:
             return self._fallback_digest(
                 limited_aggregates, week_start, week_end, user_timezone
             )
@@ -306,6 +370,29 @@ class WeeklySummaryService:
             user_timezone=user_timezone,
         )
 
+    @staticmethod
+    def _synthesis_key(
+        aggregates: list[WeeklyTickerAggregate], week_start: date, week_end: date
+    ) -> SynthesisKey:
+        return week_start, week_end, tuple(sorted({a.ticker for a in aggregates}))
+
+    def _synthesize(
+        self,
+        aggregates: list[WeeklyTickerAggregate],
+        week_start: date,
+        week_end: date,
+    ) -> WeeklySummaryInfo | None:
+        """Run the LLM synthesis, returning None (and logging) on failure."""
+        try:
+            return self._generate_llm_synthesis(aggregates, week_start, week_end)
+        except Exception as e:
+            logger.error(
+                "LLM synthesis failed, using fallback",
+                extra={"error": str(e)},
+                exc_info=True,
+            )
+            return None
+
     def _generate_llm_synthesis(
         self,
         aggregates: list[WeeklyTickerAggregate],
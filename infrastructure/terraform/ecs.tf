@@ -77,6 +77,20 @@ resource "aws_cloudwatch_log_group" "daily_status" {
   tags = local.common_tags
 }
 
+resource "aws_cloudwatch_log_group" "reconcile_ticker_stats" {
+  name              = "/ecs/${var.project_name}-jobs/reconcile-ticker-stats"
+  retention_in_days = var.log_retention_days
+
+  tags = local.common_tags
+}
+
+resource "aws_cloudwatch_log_group" "maintain_article_partitions" {
+  name              = "/ecs/${var.project_name}-jobs/maintain-article-partitions"
+  retention_in_days = var.log_retention_days
+
+  tags = local.common_tags
+}
+
 resource "aws_cloudwatch_log_group" "stock_price_collector" {
   name              = "/ecs/${var.project_name}-jobs/stock-price-collector"
   retention_in_days = var.log_retention_days
@@ -315,6 +329,118 @@ resource "aws_ecs_task_definition" "daily_status" {
   tags = local.common_tags
 }
 
+# ECS Task Definition: Nightly ticker_stats reconciliation
+resource "aws_ecs_task_definition" "reconcile_ticker_stats" {
+  family                   = "${var.project_name}-reconcile-ticker-stats"
+  requires_compatibilities = ["FARGATE"]
+  network_mode             = "awsvpc"
+  cpu                      = var.task_cpu
+  memory                   = var.task_memory
+  execution_role_arn       = aws_iam_role.ecs_task_execution.arn
+  task_role_arn            = aws_iam_role.ecs_task.arn
+
+  container_definitions = jsonencode([{
+    name      = "reconcile-ticker-stats"
+    image     = "${local.ecr_repository_url}:${var.ecr_image_tag}"
+    essential = true
+
+    command = [
+      "python", "jobs/reconcile_ticker_stats.py"
+    ]
+
+    environment = [
+      {
+        name  = "ENVIRONMENT"
+        value = var.environment
+      }
+    ]
+
+    secrets = [
+      {
+        name      = "POSTGRES_URL"
+        valueFrom = data.aws_secretsmanager_secret.postgres_url.arn
+      },
+      {
+        name      = "SLACK_BOT_TOKEN"
+        valueFrom = data.aws_secretsmanager_secret.slack_bot_token.arn
+      },
+      {
+        name      = "SLACK_DEFAULT_CHANNEL"
+        valueFrom = data.aws_secretsmanager_secret.slack_default_channel.arn
+      }
+    ]
+
+    logConfiguration = {
+      logDriver = "awslogs"
+      options = {
+        "awslogs-group"         = aws_cloudwatch_log_group.reconcile_ticker_stats.name
+        "awslogs-region"        = var.aws_region
+        "awslogs-stream-prefix" = "ecs"
+      }
+    }
+
+    stopTimeout = 120
+  }])
+
+  tags = local.common_tags
+}
+
+# ECS Task Definition: Daily article partition maintenance
+resource "aws_ecs_task_definition" "maintain_article_partitions" {
+  family                   = "${var.project_name}-maintain-article-partitions"
+  requires_compatibilities = ["FARGATE"]
+  network_mode             = "awsvpc"
+  cpu                      = var.task_cpu
+  memory                   = var.task_memory
+  execution_role_arn       = aws_iam_role.ecs_task_execution.arn
+  task_role_arn            = aws_iam_role.ecs_task.arn
+
+  container_definitions = jsonencode([{
+    name      = "maintain-article-partitions"
+    image     = "${local.ecr_repository_url}:${var.ecr_image_tag}"
+    essential = true
+
+    command = [
+      "python", "jobs/maintain_article_partitions.py"
+    ]
+
+    environment = [
+      {
+        name  = "ENVIRONMENT"
+        value = var.environment
+      }
+    ]
+
+    secrets = [
+      {
+        name      = "POSTGRES_URL"
+        valueFrom = data.aws_secretsmanager_secret.postgres_url.arn
+      },
+      {
+        name      = "SLACK_BOT_TOKEN"
+        valueFrom = data.aws_secretsmanager_secret.slack_bot_token.arn
+      },
+      {
+        name      = "SLACK_DEFAULT_CHANNEL"
+        valueFrom = data.aws_secretsmanager_secret.slack_default_channel.arn
+      }
+    ]
+
+    logConfiguration = {
+      logDriver = "awslogs"
+      options = {
+        "awslogs-group"         = aws_cloudwatch_log_group.maintain_article_partitions.name
+        "awslogs-region"        = var.aws_region
+        "awslogs-stream-prefix" = "ecs"
+      }
+    }
+
+    stopTimeout = 120
+  }])
+
+  tags = local.common_tags
+}
+
 # ECS Task Definition: Stock Price Collector
 resource "aws_ecs_task_definition" "stock_price_collector" {
   family                   = "${var.project_name}-stock-price-collector"
@@ -705,6 +831,16 @@ output "daily_status_task_definition_arn" {
   value       = aws_ecs_task_definition.daily_status.arn
 }
 
+output "reconcile_ticker_stats_task_definition_arn" {
+  description = "Ticker stats reconciliation task definition ARN"
+  value       = aws_ecs_task_definition.reconcile_ticker_stats.arn
+}
+
+output "maintain_article_partitions_task_definition_arn" {
+  description = "Article partition maintenance task definition ARN"
+  value       = aws_ecs_task_definition.maintain_article_partitions.arn
+}
+
 output "stock_price_collector_task_definition_arn" {
   description = "Stock price collector task definition ARN"
   value       = aws_ecs_task_definition.stock_price_collector.arn
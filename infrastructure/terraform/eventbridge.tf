@@ -137,6 +137,96 @@ resource "aws_scheduler_schedule" "daily_status" {
   description = "Run daily status check at 4:00 UTC"
 }
 
+resource "aws_scheduler_schedule" "reconcile_ticker_stats" {
+  name       = "${var.project_name}-reconcile-ticker-stats"
+  group_name = "default"
+
+  flexible_time_window {
+    mode = "OFF"
+  }
+
+  schedule_expression = "cron(30 3 * * ? *)"
+
+  target {
+    arn      = aws_ecs_cluster.jobs.arn
+    role_arn = aws_iam_role.eventbridge_scheduler.arn
+
+    ecs_parameters {
+      task_definition_arn = aws_ecs_task_definition.reconcile_ticker_stats.arn
+      platform_version    = "LATEST"
+
+      network_configuration {
+        subnets          = var.private_subnet_ids
+        security_groups  = [aws_security_group.ecs_tasks.id]
+        assign_public_ip = true  # Set to true for public subnets (no NAT Gateway)
+      }
+
+      # Enable Fargate Spot for cost savings
+      capacity_provider_strategy {
+        capacity_provider = "FARGATE_SPOT"
+        weight            = 1
+        base              = 0
+      }
+    }
+
+    retry_policy {
+      maximum_retry_attempts       = 2
+      maximum_event_age_in_seconds = 3600
+    }
+
+    dead_letter_config {
+      arn = aws_sqs_queue.reconcile_ticker_stats_dlq.arn
+    }
+  }
+
+  description = "Reconcile ticker_stats counters at 3:30 UTC"
+}
+
+resource "aws_scheduler_schedule" "maintain_article_partitions" {
+  name       = "${var.project_name}-maintain-article-partitions"
+  group_name = "default"
+
+  flexible_time_window {
+    mode = "OFF"
+  }
+
+  schedule_expression = "cron(15 3 * * ? *)"
+
+  target {
+    arn      = aws_ecs_cluster.jobs.arn
+    role_arn = aws_iam_role.eventbridge_scheduler.arn
+
+    ecs_parameters {
+      task_definition_arn = aws_ecs_task_definition.maintain_article_partitions.arn
+      platform_version    = "LATEST"
+
+      network_configuration {
+        subnets          = var.private_subnet_ids
+        security_groups  = [aws_security_group.ecs_tasks.id]
+        assign_public_ip = true  # Set to true for public subnets (no NAT Gateway)
+      }
+
+      # Enable Fargate Spot for cost savings
+      capacity_provider_strategy {
+        capacity_provider = "FARGATE_SPOT"
+        weight            = 1
+        base              = 0
+      }
+    }
+
+    retry_policy {
+      maximum_retry_attempts       = 2
+      maximum_event_age_in_seconds = 3600
+    }
+
+    dead_letter_config {
+      arn = aws_sqs_queue.maintain_article_partitions_dlq.arn
+    }
+  }
+
+  description = "Create upcoming article partitions at 3:15 UTC"
+}
+
 # EventBridge Scheduler: Stock Price Collector (every 15 minutes)
 # Runs continuously and job code enforces market-hour logic
 resource "aws_scheduler_schedule" "stock_price_collector" {
@@ -395,6 +485,20 @@ resource "aws_sqs_queue" "daily_status_dlq" {
   tags = local.common_tags
 }
 
+resource "aws_sqs_queue" "reconcile_ticker_stats_dlq" {
+  name                      = "${var.project_name}-reconcile-ticker-stats-dlq"
+  message_retention_seconds = 259200 # 3 days
+
+  tags = local.common_tags
+}
+
+resource "aws_sqs_queue" "maintain_article_partitions_dlq" {
+  name                      = "${var.project_name}-maintain-article-partitions-dlq"
+  message_retention_seconds = 259200 # 3 days
+
+  tags = local.common_tags
+}
+
 resource "aws_sqs_queue" "stock_price_collector_dlq" {
   name                      = "${var.project_name}-stock-price-collector-dlq"
   message_retention_seconds = 259200 # 3 days
@@ -479,6 +583,38 @@ resource "aws_sqs_queue_policy" "daily_status_dlq" {
   })
 }
 
+resource "aws_sqs_queue_policy" "reconcile_ticker_stats_dlq" {
+  queue_url = aws_sqs_queue.reconcile_ticker_stats_dlq.url
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [{
+      Effect = "Allow"
+      Principal = {
+        Service = "scheduler.amazonaws.com"
+      }
+      Action   = "sqs:SendMessage"
+      Resource = aws_sqs_queue.reconcile_ticker_stats_dlq.arn
+    }]
+  })
+}
+
+resource "aws_sqs_queue_policy" "maintain_article_partitions_dlq" {
+  queue_url = aws_sqs_queue.maintain_article_partitions_dlq.url
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [{
+      Effect = "Allow"
+      Principal = {
+        Service = "scheduler.amazonaws.com"
+      }
+      Action   = "sqs:SendMessage"
+      Resource = aws_sqs_queue.maintain_article_partitions_dlq.arn
+    }]
+  })
+}
+
 resource "aws_sqs_queue_policy" "stock_price_collector_dlq" {
   queue_url = aws_sqs_queue.stock_price_collector_dlq.url
 
@@ -575,6 +711,16 @@ output "daily_status_schedule_name" {
   value       = aws_scheduler_schedule.daily_status.name
 }
 
+output "reconcile_ticker_stats_schedule_name" {
+  description = "Ticker stats reconciliation schedule name"
+  value       = aws_scheduler_schedule.reconcile_ticker_stats.name
+}
+
+output "maintain_article_partitions_schedule_name" {
+  description = "Article partition maintenance schedule name"
+  value       = aws_scheduler_schedule.maintain_article_partitions.name
+}
+
 output "stock_price_collector_schedule_name" {
   description = "Stock price collector schedule name"
   value       = aws_scheduler_schedule.stock_price_collector.name
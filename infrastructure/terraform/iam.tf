@@ -130,6 +130,8 @@ resource "aws_iam_role_policy" "eventbridge_ecs" {
           aws_ecs_task_definition.reddit_scraper.arn,
           aws_ecs_task_definition.sentiment_analysis.arn,
           aws_ecs_task_definition.daily_status.arn,
+          aws_ecs_task_definition.reconcile_ticker_stats.arn,
+          aws_ecs_task_definition.maintain_article_partitions.arn,
           aws_ecs_task_definition.stock_price_collector.arn,
           aws_ecs_task_definition.send_daily_emails.arn,
           aws_ecs_task_definition.daily_historical_append.arn,
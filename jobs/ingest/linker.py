@@ -796,7 +796,11 @@ class TickerLinker:
                     article.text = scraped_content[article.url]
                     # Use full content (not title-only) for re-linking
                     ticker_links = self.link_article(article, use_title_only=False)
-                    article.text = original_text  # Restore original text
+                    if original_text is None:
+                        # Drop the temporary body instead of saving an empty one
+                        article.body = None
+                    else:
+                        article.text = original_text  # Restore original text
                     initial_results[i] = (article, ticker_links)
 
         # Log summary
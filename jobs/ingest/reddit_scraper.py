@@ -39,7 +39,10 @@ from app.db.models import (  # noqa: E402
     Ticker,
 )
 from app.db.session import SessionLocal  # noqa: E402
+from app.services.article_ticker_sync import copy_article_fields  # noqa: E402
+from app.services.author_ids import assign_author_ids  # noqa: E402
 from app.services.engagement import calculate_engagement_score  # noqa: E402
+from app.services.ticker_stats import record_article_links  # noqa: E402
 
 from .linker import TickerLinker  # noqa: E402
 from .reddit_config import (  # noqa: E402
@@ -536,8 +539,18 @@ class RedditScraper:
             )
             articles_to_add.append(article)
 
+        # Bulk saves skip the flush hook that assigns author ids
+        assign_author_ids(db, articles_to_add)
         # Bulk insert articles
         db.bulk_save_objects(articles_to_add, return_defaults=True)
+        # Bulk saves do not cascade, so bodies are saved once ids are known
+        bodies = []
+        for article in articles_to_add:
+            if article.body is not None:
+                article.body.article_id = article.id
+                bodies.append(article.body)
+        if bodies:
+            db.bulk_save_objects(bodies)
         db.flush()
 
         # Now link tickers for all articles
@@ -552,13 +565,18 @@ class RedditScraper:
                     confidence=link.confidence,
                     matched_terms=link.matched_terms,
                 )
+                # Bulk saves skip the flush hooks that fill these copies
+                copy_article_fields(article_ticker, article)
                 article_tickers_to_add.append(article_ticker)
 
             total_ticker_links += len(ticker_links)
 
-        # Bulk insert ticker links
+        # Bulk insert ticker links (bulk saves bypass the ticker_stats hooks)
         if article_tickers_to_add:
             db.bulk_save_objects(article_tickers_to_add)
+            record_article_links(
+                db, [(link.article_id, link.ticker) for link in article_tickers_to_add]
+            )
 
         db.commit()
 
@@ -27,6 +27,10 @@ load_dotenv(dotenv_path=Path(__file__).parent.parent.parent / ".env")
 
 from jobs.slack_wrapper import run_with_slack  # noqa: E402
 
+from app.db.events import install_session_hooks  # noqa: E402
+from app.services.homepage_snapshot import refresh_homepage_snapshot  # noqa: E402
+from app.services.ticker_stats import refresh_recent_ticker_mentions  # noqa: E402
+
 from .reddit_discussion_scraper import get_reddit_credentials  # noqa: E402
 from .reddit_scraper import RedditScraper  # noqa: E402
 
@@ -101,6 +105,10 @@ def run_incremental(
 
         print("\n✅ Incremental scraping completed successfully")
 
+        # Decay 24h mention counts and precompute the homepage
+        refresh_recent_ticker_mentions()
+        refresh_homepage_snapshot()
+
         # Return stats for Slack summary
         return {
             "threads_processed": stats.threads_processed,
@@ -275,6 +283,7 @@ def show_status(
 
 def main() -> None:
     """Main CLI entry point."""
+    install_session_hooks()
     parser = argparse.ArgumentParser(
         description="Production Reddit Scraper CLI - Multi-subreddit support with YAML config",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -10,7 +10,7 @@ from typing import Any
 
 from dotenv import load_dotenv
 from sqlalchemy import select, update
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from tqdm import tqdm
 
 # Load .env BEFORE importing app modules that use settings
@@ -19,10 +19,14 @@ load_dotenv()
 # Add project root to path
 sys.path.append(".")
 
+from app.db.events import install_session_hooks  # noqa: E402
 from app.db.models import Article  # noqa: E402
 from app.db.session import SessionLocal  # noqa: E402
+from app.services.article_ticker_sync import sync_link_sentiment  # noqa: E402
+from app.services.homepage_snapshot import refresh_homepage_snapshot  # noqa: E402
 from app.services.llm_sentiment import get_llm_sentiment_service  # noqa: E402
 from app.services.sentiment import get_sentiment_service_hybrid  # noqa: E402
+from app.services.ticker_stats import record_sentiment_scores  # noqa: E402
 
 # Import slack_wrapper - handle both local (jobs.jobs) and Docker (jobs) contexts
 try:
@@ -85,6 +89,9 @@ def get_articles_without_sentiment(
     if limit:
         query = query.limit(limit)
 
+    # Bodies are read in worker threads, so load them up front
+    query = query.options(selectinload(Article.body))
+
     return list(db.execute(query).scalars().all())
 
 
@@ -193,15 +200,25 @@ def analyze_articles_parallel(
                 batch = sentiment_results[i : i + batch_size]
 
                 try:
+                    scored: dict[int, float] = {}
                     for article_id, sentiment_score in batch:
                         if sentiment_score is not None:
-                            db.execute(
+                            # Skip articles scored meanwhile (e.g. by an override job)
+                            updated = db.execute(
                                 update(Article)
-                                .where(Article.id == article_id)
+                                .where(
+                                    Article.id == article_id,
+                                    Article.sentiment.is_(None),
+                                )
                                 .values(sentiment=sentiment_score)
-                            )
+                                .returning(Article.id)
+                            ).scalar_one_or_none()
+                            if updated is not None:
+                                scored[article_id] = sentiment_score
                             successful_updates += 1
 
+                    sync_link_sentiment(db, scored)
+                    record_sentiment_scores(db, scored)
                     db.commit()
                     pbar.update(len(batch))
 
@@ -282,6 +299,10 @@ def run_sentiment_analysis(
 
         failed_count = len(articles) - successful_count
 
+        if successful_count:
+            # Homepage sentiment, lean and surge lists depend on these scores
+            refresh_homepage_snapshot()
+
         logger.info(
             f"Sentiment analysis complete: {successful_count}/{len(articles)} articles processed successfully"
         )
@@ -302,6 +323,7 @@ def run_sentiment_analysis(
 
 def main() -> None:
     """Main CLI entry point."""
+    install_session_hooks()
     parser = argparse.ArgumentParser(
         description="Analyze sentiment for articles without sentiment data"
     )
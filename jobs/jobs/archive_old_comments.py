@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Move Reddit comments older than the archive horizon to Parquet.
+
+Comments, their bodies and ticker links are written to date-partitioned
+zstd Parquet under COMMENT_ARCHIVE_URI (local path or s3:// URI) and then
+deleted from the database. ticker_stats keeps counting them.
+
+Usage:
+    uv run python -m jobs.jobs.archive_old_comments [--horizon-days 180]
+        [--uri s3://bucket/archive] [--dry-run]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from typing import Any
+
+from dotenv import load_dotenv
+
+# Load .env BEFORE importing app modules that use settings
+load_dotenv()
+
+# Add project root to path
+sys.path.append(".")
+
+from app.config import settings  # noqa: E402
+from app.db.events import install_session_hooks  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.services.comment_archive import CommentArchiver  # noqa: E402
+
+# Import slack_wrapper - handle both local (jobs.jobs) and Docker (jobs) contexts
+try:
+    from jobs.slack_wrapper import run_with_slack  # Docker context  # noqa: E402
+except ImportError:
+    from jobs.jobs.slack_wrapper import run_with_slack  # Local context  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+def setup_logging(verbose: bool = False) -> None:
+    """Setup logging configuration."""
+    level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+
+
+def archive_old_comments(
+    horizon_days: int | None = None,
+    uri: str | None = None,
+    dry_run: bool = False,
+    verbose: bool = False,
+) -> dict[str, Any]:
+    """Archive comments older than the horizon.
+
+    Returns:
+        Dictionary with stats for Slack notification
+    """
+    setup_logging(verbose)
+    start = time.monotonic()
+
+    db = SessionLocal()
+    try:
+        archiver = CommentArchiver(db, uri=uri, horizon_days=horizon_days)
+        result = archiver.run(dry_run=dry_run)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    duration = time.monotonic() - start
+    logger.info(
+        f"{'Would archive' if dry_run else 'Archived'} {result.articles} comments "
+        f"and {result.links} links from {len(result.days)} days before "
+        f"{result.cutoff.date()} in {duration:.1f}s"
+    )
+    return {
+        "articles": result.articles,
+        "links": result.links,
+        "days": len(result.days),
+        "cutoff": result.cutoff.date().isoformat(),
+        "dry_run": dry_run,
+        "duration": round(duration, 1),
+    }
+
+
+def main() -> None:
+    """Main CLI entry point."""
+    install_session_hooks()
+    parser = argparse.ArgumentParser(
+        description="Move old Reddit comments to Parquet cold storage"
+    )
+    parser.add_argument(
+        "--horizon-days",
+        type=int,
+        default=settings.COMMENT_ARCHIVE_HORIZON_DAYS,
+        help="Archive comments older than this many days",
+    )
+    parser.add_argument(
+        "--uri",
+        default=settings.COMMENT_ARCHIVE_URI,
+        help="Archive root: local directory or s3:// URI",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Count what would be archived"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
+    args = parser.parse_args()
+
+    run_with_slack(
+        job_name="archive_old_comments",
+        job_func=lambda: archive_old_comments(
+            horizon_days=args.horizon_days,
+            uri=args.uri,
+            dry_run=args.dry_run,
+            verbose=args.verbose,
+        ),
+        metadata={"horizon_days": args.horizon_days, "dry_run": args.dry_run},
+    )
+
+
+if __name__ == "__main__":
+    main()
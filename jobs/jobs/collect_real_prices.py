@@ -3,12 +3,12 @@
 import asyncio
 import logging
 import sys
-from datetime import datetime
 
 sys.path.append(".")
 
-from app.db.models import StockPrice, Ticker
+from app.db.models import Ticker
 from app.db.session import SessionLocal
+from app.repos.stock_price_repo import StockPriceRepository, price_row_from_quote
 from app.services.stock_data import StockDataService
 
 logging.basicConfig(level=logging.INFO)
@@ -46,33 +46,23 @@ async def collect_real_yahoo_prices():
                         logger.info(f"Got real data for {symbol}: ${data['price']}")
 
                         # Update database
-                        existing = (
-                            db.query(StockPrice)
-                            .filter(StockPrice.symbol == symbol)
-                            .first()
+                        StockPriceRepository(db).upsert_prices(
+                            [
+                                price_row_from_quote(
+                                    symbol,
+                                    data,
+                                    fields=(
+                                        "price",
+                                        "previous_close",
+                                        "change",
+                                        "change_percent",
+                                        "market_state",
+                                        "currency",
+                                        "exchange",
+                                    ),
+                                )
+                            ]
                         )
-                        if existing:
-                            existing.price = data["price"]
-                            existing.previous_close = data["previous_close"]
-                            existing.change = data["change"]
-                            existing.change_percent = data["change_percent"]
-                            existing.market_state = data["market_state"]
-                            existing.currency = data["currency"]
-                            existing.exchange = data["exchange"]
-                            existing.updated_at = datetime.now()
-                        else:
-                            new_price = StockPrice(
-                                symbol=symbol,
-                                price=data["price"],
-                                previous_close=data["previous_close"],
-                                change=data["change"],
-                                change_percent=data["change_percent"],
-                                market_state=data["market_state"],
-                                currency=data["currency"],
-                                exchange=data["exchange"],
-                            )
-                            db.add(new_price)
-
                         db.commit()
                         success_count += 1
                     else:
@@ -27,7 +27,7 @@ async def collect_current_prices():
     db = SessionLocal()
 
     try:
-        result = await collector.collect_current_prices(db)
+        result = await collector.collect_current_prices(db, bulk=True)
 
         logger.info(
             f"Stock price collection completed: "
@@ -30,6 +30,7 @@ from app.repos.summary_repo import DailyTickerSummaryRepository  # noqa: E402
 from app.services.daily_summary import (  # noqa: E402
     DailySummaryResult,
     DailySummaryService,
+    PartialSummaryError,
     SummaryInfo,
 )
 from app.services.slack_service import SlackService  # noqa: E402
@@ -51,11 +52,16 @@ def setup_logging(verbose: bool = False) -> None:
 
 def generate_daily_summary(
     max_tickers: int | None = None,
-) -> tuple[DailySummaryResult | None, list[SummaryInfo]]:
+    force: bool = False,
+) -> tuple[DailySummaryResult | None, list[SummaryInfo | None]]:
     """Generate daily summary with LLM responses.
 
+    Responses are aligned with ``summary.tickers``; a ticker whose LLM call
+    failed has None so the remaining summaries can still be persisted.
+
     Args:
         max_tickers: Maximum number of tickers to include. If None, uses default from settings.
+        force: Bypass the prompt cache and re-invoke the model for every ticker.
     """
     session = SessionLocal()
     try:
@@ -65,10 +71,23 @@ def generate_daily_summary(
             return summary, []
 
         try:
-            responses = service.generate_langchain_summary(summary)
+            responses: list[SummaryInfo | None] = list(
+                service.generate_langchain_summary(summary, force=force)
+            )
+        except PartialSummaryError as exc:
+            logger.warning("LangChain invocation partially failed: %s", exc)
+            responses = exc.results
         except (RuntimeError, ValueError) as exc:
             logger.warning("LangChain invocation skipped: %s", exc)
             responses = []
+        logger.info(
+            "LLM summary cache",
+            extra={
+                "local_hits": service.cache_stats.local_hits,
+                "db_hits": service.cache_stats.db_hits,
+                "misses": service.cache_stats.misses,
+            },
+        )
         return summary, responses
     finally:
         session.close()
@@ -76,7 +95,7 @@ def generate_daily_summary(
 
 def format_summary_for_slack(
     summary: DailySummaryResult | None,
-    responses: list[SummaryInfo],
+    responses: list[SummaryInfo | None],
 ) -> str:
     """Format the daily summary for Slack."""
     lines = ["Daily Summary"]
@@ -95,6 +114,8 @@ def format_summary_for_slack(
         lines.append("\nLLM summary:")
         # Format responses with ticker labels
         for idx, response in enumerate(responses):
+            if response is None:
+                continue
             if summary and idx < len(summary.tickers):
                 ticker_symbol = summary.tickers[idx].ticker
                 lines.append(f"\n**{ticker_symbol}:**")
@@ -108,11 +129,13 @@ def format_summary_for_slack(
 
 def run_daily_status_job(
     verbose: bool = False,
+    force: bool = False,
 ) -> dict[str, Any]:
     """Run the daily status check with Slack and LLM summaries.
 
     Args:
         verbose: Enable verbose logging
+        force: Regenerate LLM summaries even when a cached result exists
     """
 
     setup_logging(verbose)
@@ -123,7 +146,7 @@ def run_daily_status_job(
 
     try:
         # Generate daily summary (uses default from settings)
-        summary, responses = generate_daily_summary(max_tickers=None)
+        summary, responses = generate_daily_summary(max_tickers=None, force=force)
         if summary:
             print("Daily summary tickers:")
             for ticker_summary in summary.tickers:
@@ -131,6 +154,8 @@ def run_daily_status_job(
         if responses:
             print("\nLangChain responses:")
             for idx, response in enumerate(responses):
+                if response is None:
+                    continue
                 if summary and idx < len(summary.tickers):
                     ticker_symbol = summary.tickers[idx].ticker
                     print(f"\n[{ticker_symbol}]")
@@ -147,6 +172,7 @@ def run_daily_status_job(
                 except ZoneInfoNotFoundError:
                     summary_tz = ZoneInfo("UTC")
                 summary_date = summary.window_start.astimezone(summary_tz).date()
+                prompt_hashes = DailySummaryService(session).prompt_hashes(summary)
 
                 for idx, ticker_summary in enumerate(summary.tickers):
                     if idx >= len(responses):
@@ -160,7 +186,10 @@ def run_daily_status_job(
                         )
                         continue
 
-                    summary_info: SummaryInfo = responses[idx]
+                    summary_info = responses[idx]
+                    if summary_info is None:
+                        # Left without prompt_hash so a rerun regenerates it
+                        continue
 
                     # Calculate sentiment stats from articles
                     article_sentiments = [
@@ -222,6 +251,10 @@ def run_daily_status_job(
                         llm_sentiment=sentiment_enum,
                         llm_model=settings.daily_summary_llm_model,
                         llm_version=None,  # Can be enhanced later if needed
+                        participant_count=ticker_summary.participants,
+                        last_price=ticker_summary.last_price,
+                        price_change_percent=ticker_summary.price_change_percent,
+                        prompt_hash=prompt_hashes[idx],
                     )
 
                     try:
@@ -256,7 +289,7 @@ def run_daily_status_job(
         summary_metrics = {
             "tickers": len(summary.tickers) if summary else 0,
             "mentions": summary.total_mentions if summary else 0,
-            "responses": len(responses),
+            "responses": sum(response is not None for response in responses),
         }
         slack.notify_job_complete(
             job_name=JOB_NAME,
@@ -294,6 +327,11 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Enable verbose logging",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate LLM summaries instead of reusing cached results",
+    )
 
     return parser.parse_args(argv)
 
@@ -302,7 +340,7 @@ def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
     args = parse_args(argv)
     try:
-        run_daily_status_job(verbose=args.verbose)
+        run_daily_status_job(verbose=args.verbose, force=args.force)
         return 0
     except Exception as exc:  # noqa: BLE001
         logger.error("Daily status job failed: %s", exc, exc_info=args.verbose)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Create upcoming monthly partitions of article and article_ticker.
+
+Keeps the current month and the next few months partitioned so inserts never
+land in the DEFAULT partition. Safe to run repeatedly; existing partitions
+are left alone. A no-op on databases that are not PostgreSQL.
+
+Usage:
+    uv run python -m jobs.jobs.maintain_article_partitions [--months-ahead 3]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from typing import Any
+
+from dotenv import load_dotenv
+
+# Load .env BEFORE importing app modules that use settings
+load_dotenv()
+
+# Add project root to path
+sys.path.append(".")
+
+from app.db.partitions import (  # noqa: E402
+    DEFAULT_MONTHS_AHEAD,
+    ensure_partitions,
+    upcoming_months,
+)
+from app.db.session import SessionLocal  # noqa: E402
+
+# Import slack_wrapper - handle both local (jobs.jobs) and Docker (jobs) contexts
+try:
+    from jobs.slack_wrapper import run_with_slack  # Docker context  # noqa: E402
+except ImportError:
+    from jobs.jobs.slack_wrapper import run_with_slack  # Local context  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+def setup_logging(verbose: bool = False) -> None:
+    """Setup logging configuration."""
+    level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+
+
+def maintain_article_partitions(
+    months_ahead: int = DEFAULT_MONTHS_AHEAD, verbose: bool = False
+) -> dict[str, Any]:
+    """Create any missing partitions for the upcoming months.
+
+    Returns:
+        Dictionary with stats for Slack notification
+    """
+    setup_logging(verbose)
+    start = time.monotonic()
+
+    db = SessionLocal()
+    try:
+        created = ensure_partitions(
+            db.connection(), upcoming_months(None, months_ahead)
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    duration = time.monotonic() - start
+    logger.info(
+        f"Article partitions checked: {len(created)} created in {duration:.1f}s"
+    )
+    return {"created": len(created), "partitions": created}
+
+
+def main() -> None:
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Create upcoming monthly partitions of the article tables"
+    )
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=DEFAULT_MONTHS_AHEAD,
+        help="Months to partition past the current one",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
+    args = parser.parse_args()
+
+    run_with_slack(
+        job_name="maintain_article_partitions",
+        job_func=lambda: maintain_article_partitions(
+            months_ahead=args.months_ahead, verbose=args.verbose
+        ),
+        metadata={"months_ahead": args.months_ahead},
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -12,11 +12,13 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime, timedelta
 
 from sqlalchemy import select, update
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from tqdm import tqdm
 
+from app.db.events import install_session_hooks
 from app.db.models import Article
 from app.db.session import SessionLocal
+from app.services.article_ticker_sync import sync_link_sentiment
 from app.services.sentiment import get_sentiment_service_hybrid
 
 logger = logging.getLogger(__name__)
@@ -81,6 +83,9 @@ def get_articles_for_dual_model_override(
     if limit:
         query = query.limit(limit)
 
+    # Bodies are read in worker threads, so load them up front
+    query = query.options(selectinload(Article.body))
+
     return list(db.execute(query).scalars().all())
 
 
@@ -179,6 +184,7 @@ def override_articles_parallel(
             # Process in batches
             for i in range(0, len(sentiment_results), batch_size):
                 batch = sentiment_results[i : i + batch_size]
+                updated: dict[int, float] = {}
 
                 for article_id, sentiment_score in batch:
                     if sentiment_score is not None:
@@ -188,6 +194,7 @@ def override_articles_parallel(
                                 .where(Article.id == article_id)
                                 .values(sentiment=sentiment_score)
                             )
+                            updated[article_id] = sentiment_score
                             successful_updates += 1
                         except Exception as e:
                             logger.warning(
@@ -198,6 +205,7 @@ def override_articles_parallel(
 
                 # Commit batch
                 try:
+                    sync_link_sentiment(db, updated)
                     db.commit()
                     logger.debug(f"Committed batch of {len(batch)} updates")
                 except Exception as e:
@@ -213,6 +221,7 @@ def override_articles_parallel(
 
 def main():
     """Main function to run dual model sentiment override."""
+    install_session_hooks()
     parser = argparse.ArgumentParser(
         description="Override sentiment analysis with dual model approach"
     )
@@ -8,11 +8,13 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime, timedelta
 
 from sqlalchemy import select, update
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from tqdm import tqdm
 
+from app.db.events import install_session_hooks
 from app.db.models import Article
 from app.db.session import SessionLocal
+from app.services.article_ticker_sync import sync_link_sentiment
 from app.services.llm_sentiment import get_llm_sentiment_service
 
 logger = logging.getLogger(__name__)
@@ -80,6 +82,9 @@ def get_articles_for_llm_override(
     if limit:
         query = query.limit(limit)
 
+    # Bodies are read in worker threads, so load them up front
+    query = query.options(selectinload(Article.body))
+
     return list(db.execute(query).scalars().all())
 
 
@@ -177,6 +182,7 @@ def override_articles_parallel(
                 batch = sentiment_results[i : i + batch_size]
 
                 try:
+                    updated: dict[int, float] = {}
                     for article_id, sentiment_score in batch:
                         if sentiment_score is not None:
                             db.execute(
@@ -184,8 +190,10 @@ def override_articles_parallel(
                                 .where(Article.id == article_id)
                                 .values(sentiment=sentiment_score)
                             )
+                            updated[article_id] = sentiment_score
                             successful_updates += 1
 
+                    sync_link_sentiment(db, updated)
                     db.commit()
                     pbar.update(len(batch))
 
@@ -295,6 +303,7 @@ def run_llm_sentiment_override(
 
 def main() -> None:
     """Main CLI entry point."""
+    install_session_hooks()
     parser = argparse.ArgumentParser(
         description="Override existing sentiment with LLM sentiment"
     )
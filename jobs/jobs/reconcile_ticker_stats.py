@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Nightly reconciliation of the ticker_stats counters.
+
+The counters are maintained incrementally by the ingest and sentiment
+writers; this job recomputes them from the corpus to correct drift from
+deletes, sentiment overrides and backfills. It also rebuilds the last two
+days of hourly author sketches, which cannot forget deleted or re-scored
+comments incrementally.
+
+Usage:
+    uv run python -m jobs.jobs.reconcile_ticker_stats
+"""
+
+import argparse
+import logging
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from dotenv import load_dotenv
+
+# Load .env BEFORE importing app modules that use settings
+load_dotenv()
+
+# Add project root to path
+sys.path.append(".")
+
+from app.db.events import install_session_hooks  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.repos.author_sketch_repo import AuthorSketchRepository  # noqa: E402
+from app.repos.ticker_stats_repo import TickerStatsRepository  # noqa: E402
+
+# Import slack_wrapper - handle both local (jobs.jobs) and Docker (jobs) contexts
+try:
+    from jobs.slack_wrapper import run_with_slack  # Docker context  # noqa: E402
+except ImportError:
+    from jobs.jobs.slack_wrapper import run_with_slack  # Local context  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# Recent hours whose author sketches are recomputed from the links
+SKETCH_REBUILD_WINDOW = timedelta(days=2)
+
+
+def setup_logging(verbose: bool = False) -> None:
+    """Setup logging configuration."""
+    level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+
+
+def reconcile_ticker_stats(verbose: bool = False) -> dict[str, Any]:
+    """Recompute all ticker counters and report how many had drifted.
+
+    Returns:
+        Dictionary with stats for Slack notification
+    """
+    setup_logging(verbose)
+    start = time.monotonic()
+
+    db = SessionLocal()
+    try:
+        repo = TickerStatsRepository(db)
+        repo.ensure_rows()
+        corrected = repo.reconcile()
+        sketches = AuthorSketchRepository(db).rebuild(
+            datetime.now(UTC) - SKETCH_REBUILD_WINDOW
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    duration = time.monotonic() - start
+    logger.info(
+        f"Ticker stats reconciled: {corrected} tickers corrected, "
+        f"{sketches} author sketches rebuilt in {duration:.1f}s"
+    )
+    return {
+        "corrected": corrected,
+        "sketches_rebuilt": sketches,
+        "duration": round(duration, 1),
+    }
+
+
+def main() -> None:
+    """Main CLI entry point."""
+    install_session_hooks()
+    parser = argparse.ArgumentParser(
+        description="Recompute ticker_stats counters from articles"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
+    args = parser.parse_args()
+
+    run_with_slack(
+        job_name="reconcile_ticker_stats",
+        job_func=lambda: reconcile_ticker_stats(verbose=args.verbose),
+        metadata={},
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,7 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.db.events import install_session_hooks
 from app.db.models import Article, ArticleTicker, RedditThread, Ticker
 from app.db.session import SessionLocal
 from jobs.ingest.linker import TickerLinker
@@ -645,6 +646,7 @@ def run_monthly_scraping(
 
 def main() -> None:
     """Main CLI entry point."""
+    install_session_hooks()
     parser = argparse.ArgumentParser(
         description="Monthly Reddit discussion scraping CLI"
     )
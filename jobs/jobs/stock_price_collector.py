@@ -20,8 +20,8 @@ sys.path.append(".")
 # Now import app modules
 from sqlalchemy.orm import Session
 
-from app.db.models import StockPrice
 from app.db.session import SessionLocal
+from app.repos.stock_price_repo import StockPriceRepository, price_row_from_quote
 from app.services.stock_data import StockDataService
 
 # Import slack_wrapper - handle both local (jobs.jobs) and Docker (jobs) contexts
@@ -101,6 +101,7 @@ class StockPriceCollector:
 
         # Process results and update database
         now = datetime.now(UTC)
+        rows = []
         for symbol, data in price_data.items():
             try:
                 if not data or not self.validate_price_data(data):
@@ -110,68 +111,7 @@ class StockPriceCollector:
                     logger.warning(error_msg)
                     continue
 
-                # Update or create database record
-                existing = (
-                    db.query(StockPrice).filter(StockPrice.symbol == symbol).first()
-                )
-
-                if existing:
-                    # Basic price data
-                    existing.price = data["price"]
-                    existing.previous_close = data.get("previous_close")
-                    existing.change = data.get("change")
-                    existing.change_percent = data.get("change_percent")
-                    # Intraday trading data
-                    existing.open = data.get("open")
-                    existing.day_high = data.get("day_high")
-                    existing.day_low = data.get("day_low")
-                    existing.volume = data.get("volume")
-                    # Bid/Ask spread
-                    existing.bid = data.get("bid")
-                    existing.ask = data.get("ask")
-                    existing.bid_size = data.get("bid_size")
-                    existing.ask_size = data.get("ask_size")
-                    # Market metrics
-                    existing.market_cap = data.get("market_cap")
-                    existing.shares_outstanding = data.get("shares_outstanding")
-                    existing.average_volume = data.get("average_volume")
-                    existing.average_volume_10d = data.get("average_volume_10d")
-                    # Metadata
-                    existing.market_state = data.get("market_state")
-                    existing.currency = data.get("currency", "USD")
-                    existing.exchange = data.get("exchange")
-                    existing.updated_at = now
-                else:
-                    new_price = StockPrice(
-                        symbol=symbol,
-                        # Basic price data
-                        price=data["price"],
-                        previous_close=data.get("previous_close"),
-                        change=data.get("change"),
-                        change_percent=data.get("change_percent"),
-                        # Intraday trading data
-                        open=data.get("open"),
-                        day_high=data.get("day_high"),
-                        day_low=data.get("day_low"),
-                        volume=data.get("volume"),
-                        # Bid/Ask spread
-                        bid=data.get("bid"),
-                        ask=data.get("ask"),
-                        bid_size=data.get("bid_size"),
-                        ask_size=data.get("ask_size"),
-                        # Market metrics
-                        market_cap=data.get("market_cap"),
-                        shares_outstanding=data.get("shares_outstanding"),
-                        average_volume=data.get("average_volume"),
-                        average_volume_10d=data.get("average_volume_10d"),
-                        # Metadata
-                        market_state=data.get("market_state"),
-                        currency=data.get("currency", "USD"),
-                        exchange=data.get("exchange"),
-                        updated_at=now,
-                    )
-                    db.add(new_price)
-
+                rows.append(price_row_from_quote(symbol, data, now))
                 success_count += 1
                 logger.info(f"✓ {symbol}: ${data['price']}")
 
@@ -181,8 +121,10 @@ class StockPriceCollector:
                 errors.append(error_msg)
                 logger.error(error_msg)
 
-        # Commit all changes at once
+        # Write all rows in one bulk upsert and commit at once
         try:
+            if rows:
+                StockPriceRepository(db).upsert_prices(rows)
             db.commit()
             logger.info(f"Successfully committed {success_count} price updates")
         except Exception as e:
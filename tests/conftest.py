@@ -2,14 +2,23 @@
 
 import os
 import tempfile
+from contextlib import contextmanager
 from unittest.mock import Mock, patch
 
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from app.db.events import install_session_hooks
 from app.db.models import Article, Base, Ticker
+from app.services.author_ids import author_id_cache
+
+
+@pytest.fixture(scope="session", autouse=True)
+def session_hooks():
+    """Install the ORM session hooks, as the app and jobs do at startup."""
+    install_session_hooks()
 
 
 @pytest.fixture(scope="session")
@@ -66,11 +75,18 @@ def db_session(test_engine, test_db_session):
                 "user_profiles",
                 "users",
                 "weekly_digest_send_record",
+                "homepage_snapshot",
                 "article_ticker",
+                "article_body",
                 "article",
+                "author",
+                "ticker_stats",
+                "ticker_author_sketch",
                 "ticker",
                 "reddit_thread",
                 "stock_price",
+                "stock_price_rollup_state",
+                "stock_price_rollup",
                 "stock_price_history",
                 "stock_data_collection",
             ]:
@@ -80,6 +96,31 @@ def db_session(test_engine, test_db_session):
                     pass  # Table might not exist yet
     except Exception:
         pass  # Ignore cleanup errors
+    # Author ids restart once the table is emptied
+    author_id_cache.clear()
+
+
+@pytest.fixture
+def count_queries(test_engine):
+    """Record SQL statements run on the test engine inside a ``with`` block.
+
+    Usage: ``with count_queries() as statements: ...``
+    """
+
+    @contextmanager
+    def capture():
+        statements: list[str] = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(test_engine, "before_cursor_execute", before_cursor_execute)
+
+    return capture
 
 
 @pytest.fixture
@@ -236,6 +277,26 @@ def mock_environment_variables():
         yield
 
 
+@pytest.fixture(autouse=True)
+def clear_session_user_cache():
+    """Keep cached session users (keyed by user id + iat) from leaking across tests."""
+    from app.services.session_cache import session_user_cache
+
+    session_user_cache.clear()
+    yield
+    session_user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def invalidate_ticker_search_index():
+    """Rebuild the typeahead index per test; tickers are deleted with raw SQL."""
+    from app.services.ticker_search import ticker_search_cache
+
+    ticker_search_cache.invalidate()
+    yield
+    ticker_search_cache.invalidate()
+
+
 @pytest.fixture
 def temp_file():
     """Create a temporary file for testing."""
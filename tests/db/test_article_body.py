@@ -0,0 +1,156 @@
+"""Tests for article bodies stored in the article_body side table."""
+
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Article, ArticleBody, ArticleTicker, Base, Ticker
+from app.repos.article_feed_repo import ArticleFeedRepository
+
+NOW = datetime(2026, 1, 5, 12, tzinfo=UTC)
+
+
+def make_article(n: int, **fields) -> Article:
+    values = {
+        "source": "reddit_comment",
+        "url": f"https://reddit.com/{n}",
+        "published_at": NOW - timedelta(minutes=n),
+        "title": f"article {n}",
+    }
+    values.update(fields)
+    return Article(id=n, **values)
+
+
+def test_text_is_stored_in_article_body(db_session):
+    db_session.add_all(
+        [make_article(1, text="full comment body"), make_article(2, text=None)]
+    )
+    db_session.commit()
+
+    bodies = db_session.execute(select(ArticleBody.article_id, ArticleBody.text)).all()
+    assert bodies == [(1, "full comment body")]
+
+    db_session.expunge_all()
+    assert db_session.get(Article, 1).text == "full comment body"
+    assert db_session.get(Article, 2).text is None
+
+
+def test_assigning_text_updates_or_creates_body(db_session):
+    db_session.add_all([make_article(1, text="old"), make_article(2)])
+    db_session.commit()
+
+    db_session.get(Article, 1).text = "new"
+    db_session.get(Article, 2).text = "added later"
+    db_session.commit()
+
+    bodies = dict(
+        db_session.execute(select(ArticleBody.article_id, ArticleBody.text)).all()
+    )
+    assert bodies == {1: "new", 2: "added later"}
+
+
+def test_deleting_article_deletes_body(db_session):
+    db_session.add(make_article(1, text="body"))
+    db_session.commit()
+
+    db_session.delete(db_session.get(Article, 1))
+    db_session.commit()
+
+    assert db_session.scalar(select(ArticleBody.article_id)) is None
+
+
+def test_metadata_reads_do_not_touch_bodies(db_session, count_queries):
+    db_session.add_all([make_article(n, text="x" * 500) for n in range(1, 6)])
+    db_session.commit()
+    db_session.expunge_all()
+
+    with count_queries() as statements:
+        articles = db_session.execute(select(Article)).scalars().all()
+        titles = [article.title for article in articles]
+
+    assert len(titles) == 5
+    assert len(statements) == 1
+    assert "article_body" not in statements[0]
+
+
+def test_feed_loads_page_bodies_in_one_query(db_session, count_queries):
+    db_session.add(Ticker(symbol="AAPL", name="Apple", aliases=[], sources=[]))
+    db_session.add_all(
+        [make_article(n, text=f"comment {n}") for n in range(1, 11)]
+        + [ArticleTicker(article_id=n, ticker="AAPL") for n in range(1, 11)]
+    )
+    db_session.commit()
+    db_session.expunge_all()
+
+    repo = ArticleFeedRepository(db_session)
+    with count_queries() as statements:
+        page = repo.fetch_page(repo.ticker_feed_query("AAPL"), limit=5)
+        texts = [article.text for article, _, _ in page.rows]
+
+    assert texts == [f"comment {n}" for n in range(1, 6)]
+    assert len(statements) == 2
+    assert "article_body" in statements[1]
+
+
+@pytest.mark.performance
+def test_aggregate_scan_on_slim_table_beats_wide_table():
+    """Scanning article metadata without bodies reads far fewer pages."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    rows = 5000
+    session.execute(
+        insert(Article),
+        [
+            {
+                "id": n,
+                "source": ("reddit_comment", "reddit_post")[n % 2],
+                "url": f"https://reddit.com/{n}",
+                "published_at": NOW,
+                "title": f"article {n}",
+                "sentiment": (n % 21 - 10) / 10,
+            }
+            for n in range(1, rows + 1)
+        ],
+    )
+    session.execute(
+        insert(ArticleBody),
+        [{"article_id": n, "text": "x" * 2000} for n in range(1, rows + 1)],
+    )
+    # The pre-split layout: bodies inline with the scanned metadata
+    session.execute(
+        text(
+            """
+            CREATE TABLE article_wide AS
+            SELECT a.*, b.text
+            FROM article a LEFT JOIN article_body b ON b.article_id = a.id
+            """
+        )
+    )
+    session.commit()
+
+    def best_scan_ms(table: str) -> float:
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            session.execute(
+                text(
+                    f"SELECT source, COUNT(*), AVG(sentiment) "
+                    f"FROM {table} GROUP BY source"
+                )
+            ).all()
+            timings.append((time.perf_counter() - start) * 1000)
+        return min(timings)
+
+    wide_ms = best_scan_ms("article_wide")
+    slim_ms = best_scan_ms("article")
+    session.close()
+
+    print(
+        f"\nAggregate scan over {rows} rows: "
+        f"wide={wide_ms:.2f}ms slim={slim_ms:.2f}ms"
+    )
+    assert slim_ms < wide_ms
@@ -0,0 +1,212 @@
+"""Tests for the monthly partitions of the article tables."""
+
+import importlib.util
+import os
+import uuid
+from datetime import UTC, date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, func, insert, select, text
+
+from app.db.models import Article, ArticleTicker, Base, Ticker
+from app.db.partitions import (
+    MonthPartition,
+    add_months,
+    default_partition_name,
+    ensure_partitions,
+    existing_partitions,
+    month_floor,
+    month_range,
+    upcoming_months,
+)
+
+# Partitioning needs a real PostgreSQL server; CI provides one as DATABASE_URL
+POSTGRES_URL = next(
+    (
+        url
+        for url in (os.getenv("TEST_POSTGRES_URL"), os.getenv("DATABASE_URL"))
+        if url and url.startswith("postgresql")
+    ),
+    None,
+)
+requires_postgres = pytest.mark.skipif(
+    not POSTGRES_URL, reason="no PostgreSQL DATABASE_URL or TEST_POSTGRES_URL"
+)
+
+PARTITION_MIGRATION = (
+    Path(__file__).resolve().parents[2]
+    / "alembic"
+    / "versions"
+    / "f4d1b8c3a6e9_partition_article_tables_by_month.py"
+)
+
+NOW = datetime.now(UTC)
+# (id, published_at) of the seeded articles, each linked to AAPL
+SEEDED = [(1, NOW - timedelta(days=400)), (2, NOW - timedelta(days=40)), (3, NOW)]
+
+
+def test_month_floor_uses_utc_for_aware_datetimes():
+    new_york = timezone(timedelta(hours=-5))
+    assert month_floor(datetime(2026, 1, 31, 20, tzinfo=new_york)) == date(2026, 2, 1)
+    assert month_floor(date(2026, 2, 17)) == date(2026, 2, 1)
+
+
+def test_add_months_crosses_years():
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_month_range_is_inclusive():
+    assert month_range(datetime(2025, 11, 20), date(2026, 2, 3)) == [
+        date(2025, 11, 1),
+        date(2025, 12, 1),
+        date(2026, 1, 1),
+        date(2026, 2, 1),
+    ]
+
+
+def test_month_partition_bounds_and_ddl():
+    partition = MonthPartition("article", date(2026, 12, 1))
+
+    assert partition.name == "article_y2026m12"
+    assert partition.lower == datetime(2026, 12, 1, tzinfo=UTC)
+    assert partition.upper == datetime(2027, 1, 1, tzinfo=UTC)
+    assert partition.create_sql() == (
+        "CREATE TABLE IF NOT EXISTS article_y2026m12 PARTITION OF article "
+        "FOR VALUES FROM ('2026-12-01T00:00:00+00:00') "
+        "TO ('2027-01-01T00:00:00+00:00')"
+    )
+
+
+def test_upcoming_months_starts_at_current_month():
+    assert upcoming_months(date(2026, 10, 18), months_ahead=2) == [
+        date(2026, 10, 1),
+        date(2026, 11, 1),
+        date(2026, 12, 1),
+    ]
+
+
+def test_ensure_partitions_is_a_noop_off_postgres(db_session):
+    assert ensure_partitions(db_session.connection(), [date(2026, 10, 1)]) == []
+
+
+def _scanned_relations(plan: dict) -> set[str]:
+    relations = {plan["Relation Name"]} if "Relation Name" in plan else set()
+    for child in plan.get("Plans", []):
+        relations |= _scanned_relations(child)
+    return relations
+
+
+def _run_partition_migration(engine) -> None:
+    spec = importlib.util.spec_from_file_location(
+        "partition_migration", PARTITION_MIGRATION
+    )
+    assert spec is not None and spec.loader is not None
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    with engine.connect() as conn:
+        context = MigrationContext.configure(conn)
+        with context.begin_transaction(), Operations.context(context):
+            migration.upgrade()
+
+
+@pytest.fixture(scope="module")
+def partitioned_engine():
+    """A scratch database with the model tables converted by the real migration."""
+    assert POSTGRES_URL is not None
+    admin = create_engine(POSTGRES_URL, isolation_level="AUTOCOMMIT")
+    name = f"partition_test_{uuid.uuid4().hex[:8]}"
+    with admin.connect() as conn:
+        conn.execute(text(f"CREATE DATABASE {name}"))
+    engine = create_engine(admin.url.set(database=name))
+    try:
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(insert(Ticker), [{"symbol": "AAPL", "name": "Apple"}])
+            conn.execute(
+                insert(Article),
+                [
+                    {
+                        "id": n,
+                        "source": "reddit_comment",
+                        "url": f"https://reddit.com/{n}",
+                        "published_at": published_at,
+                        "title": f"comment {n}",
+                        "sentiment": 0.1 * n,
+                    }
+                    for n, published_at in SEEDED
+                ],
+            )
+            conn.execute(
+                insert(ArticleTicker),
+                [{"article_id": n, "ticker": "AAPL"} for n, _ in SEEDED],
+            )
+        _run_partition_migration(engine)
+        yield engine
+    finally:
+        engine.dispose()
+        with admin.connect() as conn:
+            conn.execute(text(f"DROP DATABASE IF EXISTS {name}"))
+        admin.dispose()
+
+
+@requires_postgres
+def test_migration_keeps_rows_in_their_month(partitioned_engine):
+    with partitioned_engine.connect() as conn:
+        expected_months = month_range(SEEDED[0][1], add_months(month_floor(NOW), 3))
+        for table in ("article", "article_ticker"):
+            assert existing_partitions(conn, table) == {
+                MonthPartition(table, month).name for month in expected_months
+            } | {default_partition_name(table)}
+
+        rows = conn.execute(
+            text(
+                """
+                SELECT l.article_id, l.published_at, l.tableoid::regclass::text
+                FROM article_ticker l
+                ORDER BY l.article_id
+                """
+            )
+        ).all()
+        assert [(row[0], row[1]) for row in rows] == SEEDED
+        assert [row[2] for row in rows] == [
+            MonthPartition("article_ticker", month_floor(published_at)).name
+            for _, published_at in SEEDED
+        ]
+        assert conn.execute(select(func.count()).select_from(Article)).scalar() == 3
+
+
+@requires_postgres
+@pytest.mark.parametrize("window", [timedelta(hours=24), timedelta(days=7)])
+def test_time_bounded_queries_scan_only_overlapping_partitions(
+    partitioned_engine, window
+):
+    with partitioned_engine.begin() as conn:
+        last_month = add_months(month_floor(NOW), 6)
+        ensure_partitions(conn, month_range(NOW, last_month))
+
+        cutoff = NOW - window
+        statements = {
+            "article": select(Article.source, func.avg(Article.sentiment))
+            .where(Article.published_at >= cutoff)
+            .group_by(Article.source),
+            "article_ticker": select(ArticleTicker.ticker, func.count())
+            .where(ArticleTicker.published_at >= cutoff)
+            .group_by(ArticleTicker.ticker),
+        }
+        for table, statement in statements.items():
+            compiled = statement.compile(dialect=conn.dialect)
+            plan = conn.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+            ).scalar()
+            scanned = _scanned_relations(plan[0]["Plan"])
+
+            # Open-ended ranges also reach later months and DEFAULT
+            expected = {
+                MonthPartition(table, month).name
+                for month in month_range(cutoff, last_month)
+            } | {default_partition_name(table)}
+            assert scanned == expected
@@ -75,6 +75,29 @@ def test_upsert_creates_and_updates_summary(db_session, repo):
     assert updated.updated_at >= original_updated_at
 
 
+def test_upsert_persists_email_snapshot_fields(db_session, repo):
+    """Participant count and price snapshot round-trip through the repository."""
+
+    _ensure_ticker(db_session, "AAPL")
+    repo.upsert_summary(
+        DailyTickerSummaryUpsertDTO(
+            ticker="AAPL",
+            summary_date=date(2024, 1, 2),
+            mention_count=10,
+            engagement_count=40,
+            participant_count=7,
+            last_price=185.64,
+            price_change_percent=1.25,
+        )
+    )
+    db_session.commit()
+
+    (stored,) = repo.get_summaries_for_ticker("AAPL")
+    assert stored.participant_count == 7
+    assert stored.last_price == pytest.approx(185.64)
+    assert stored.price_change_percent == pytest.approx(1.25)
+
+
 def test_get_summaries_filters_and_orders(db_session, repo):
     """Fetching summaries should respect date filters and ordering."""
 
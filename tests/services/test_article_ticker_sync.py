@@ -0,0 +1,137 @@
+"""Tests for the article fields copied onto article_ticker."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.db.events import install_session_hooks
+from app.db.models import Article, ArticleTicker, Ticker
+from app.services import article_ticker_sync, author_ids
+from app.services.article_ticker_sync import sync_link_sentiment
+from app.services.sentiment_analytics import get_sentiment_analytics_service
+from app.services.velocity import get_velocity_service
+
+NOW = datetime.now(UTC)
+
+
+def make_article(n: int, **fields) -> Article:
+    values = {
+        "source": "reddit_comment",
+        "url": f"https://reddit.com/{n}",
+        "published_at": NOW - timedelta(hours=n),
+        "title": f"article {n}",
+        "author": f"user{n}",
+        "sentiment": 0.1 * n,
+    }
+    values.update(fields)
+    return Article(id=n, **values)
+
+
+def copies(db_session, ticker: str = "AAPL") -> dict[int, tuple]:
+    rows = db_session.execute(
+        select(
+            ArticleTicker.article_id,
+            ArticleTicker.published_at,
+            ArticleTicker.sentiment,
+            ArticleTicker.author,
+        ).where(ArticleTicker.ticker == ticker)
+    ).all()
+    return {
+        row.article_id: (
+            row.published_at.replace(tzinfo=UTC),
+            row.sentiment,
+            row.author,
+        )
+        for row in rows
+    }
+
+
+@pytest.fixture
+def ticker(db_session):
+    db_session.add(Ticker(symbol="AAPL", name="Apple"))
+    db_session.commit()
+
+
+class TestLinkCopies:
+    """Tests for filling and updating the copies."""
+
+    def test_new_links_copy_article_fields(
+        self, db_session, test_engine, ticker
+    ) -> None:
+        """Test links added by relationship, by pending id and by stored id."""
+        same_flush = make_article(1)
+        by_relationship = make_article(2)
+        by_relationship.tickers.append(ArticleTicker(ticker="AAPL"))
+        db_session.add_all([same_flush, by_relationship, make_article(3)])
+        db_session.add(ArticleTicker(article_id=1, ticker="AAPL"))
+        db_session.commit()
+
+        # Article 3 is neither pending nor loaded in this session
+        other = sessionmaker(bind=test_engine)()
+        other.add(ArticleTicker(article_id=3, ticker="AAPL"))
+        other.commit()
+        other.close()
+
+        linked = copies(db_session)
+        assert sorted(linked) == [1, 2, 3]
+        for n in (1, 2, 3):
+            published_at, sentiment, author = linked[n]
+            assert published_at == pytest.approx(
+                NOW - timedelta(hours=n), abs=timedelta(seconds=1)
+            )
+            assert (sentiment, author) == (pytest.approx(0.1 * n), f"user{n}")
+
+    def test_article_changes_reach_links(self, db_session, ticker) -> None:
+        """Test ORM edits and Core sentiment updates with sync_link_sentiment."""
+        article = make_article(1, sentiment=None)
+        db_session.add(article)
+        db_session.add(ArticleTicker(article_id=1, ticker="AAPL"))
+        db_session.commit()
+
+        article.sentiment = 0.7
+        article.author = "renamed"
+        db_session.commit()
+        assert copies(db_session)[1][1:] == (0.7, "renamed")
+
+        db_session.execute(update(Article).values(sentiment=-0.3))
+        sync_link_sentiment(db_session, {1: -0.3})
+        db_session.commit()
+        assert copies(db_session)[1][1] == -0.3
+
+    def test_install_session_hooks_registers_once(self, db_session) -> None:
+        """Test that repeated installs keep one hook, author ids first."""
+        install_session_hooks()
+        install_session_hooks()
+
+        before_flush = list(db_session.dispatch.before_flush)
+        assert before_flush.count(article_ticker_sync._fill_new_links) == 1
+        assert before_flush[0] is author_ids._assign_new_articles
+
+
+class TestJoinFreeAnalytics:
+    """Tests that per-ticker analytics read article_ticker alone."""
+
+    def test_lean_and_velocity_skip_article(
+        self, db_session, count_queries, ticker
+    ) -> None:
+        """Test results and that no statement touches the article table."""
+        for n, sentiment in [(1, 0.5), (2, -0.4), (3, 0.01), (30, 0.6)]:
+            db_session.add(make_article(n, sentiment=sentiment))
+            db_session.add(ArticleTicker(article_id=n, ticker="AAPL"))
+        db_session.commit()
+        with count_queries() as statements:
+            lean = get_sentiment_analytics_service().get_ticker_lean_map(
+                db_session, ["AAPL"], days=1
+            )
+            velocity = get_velocity_service(db_session).calculate_velocity("AAPL")
+
+        assert lean["AAPL"]["counts"] == {
+            "positive": 1,
+            "negative": 1,
+            "neutral": 1,
+            "total": 3,
+        }
+        assert velocity["recent_count"] == 3
+        assert not any("FROM article " in s or "JOIN article " in s for s in statements)
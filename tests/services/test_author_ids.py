@@ -0,0 +1,143 @@
+"""Tests for dictionary-encoded author ids."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+
+from sqlalchemy import func, select
+
+from app.db.models import Article, ArticleTicker, Author, Ticker
+from app.repos.author_sketch_repo import AuthorSketchRepository
+from app.services import author_ids
+from app.services.author_ids import (
+    AuthorIdCache,
+    assign_author_ids,
+    author_id_cache,
+    resolve_author_ids,
+)
+
+NOW = datetime.now(UTC).replace(minute=30, second=0, microsecond=0)
+
+
+def comment(n: int, author: str | None, ticker: str = "AAPL") -> Article:
+    article = Article(
+        id=n,
+        source="reddit_comment",
+        url=f"https://reddit.com/{n}",
+        published_at=NOW,
+        title=f"comment {n}",
+        author=author,
+        sentiment=0.5,
+    )
+    article.tickers.append(ArticleTicker(ticker=ticker))
+    return article
+
+
+def seed_ticker(db_session) -> None:
+    db_session.add(Ticker(symbol="AAPL", name="Apple"))
+    db_session.flush()
+
+
+class TestAuthorIds:
+    """Tests for ids assigned at ingest."""
+
+    def test_orm_articles_and_links_get_ids(self, db_session) -> None:
+        """Test one id per name, copied onto the ticker links."""
+        seed_ticker(db_session)
+        db_session.add_all(
+            [comment(1, "alice"), comment(2, "alice"), comment(3, "bob")]
+        )
+        db_session.commit()
+
+        articles = {a.id: a for a in db_session.scalars(select(Article))}
+        assert articles[1].author_id == articles[2].author_id
+        assert articles[1].author_id != articles[3].author_id
+        assert {
+            link.article_id: link.author_id
+            for link in db_session.scalars(select(ArticleTicker))
+        } == {
+            1: articles[1].author_id,
+            2: articles[1].author_id,
+            3: articles[3].author_id,
+        }
+        assert db_session.scalar(select(func.count()).select_from(Author)) == 2
+
+    def test_anonymous_authors_get_no_id(self, db_session) -> None:
+        """Test deleted and missing authors stay unencoded."""
+        seed_ticker(db_session)
+        db_session.add_all(
+            [comment(1, "[deleted]"), comment(2, None), comment(3, "[removed]")]
+        )
+        db_session.commit()
+
+        assert set(db_session.scalars(select(Article.author_id))) == {None}
+        assert db_session.scalar(select(func.count()).select_from(Author)) == 0
+
+    def test_bots_are_flagged_and_not_sketched(self, db_session) -> None:
+        """Test known bots are marked and left out of unique-user counts."""
+        seed_ticker(db_session)
+        db_session.add_all([comment(1, "AutoModerator"), comment(2, "alice")])
+        db_session.commit()
+
+        bot = db_session.scalar(select(Author).where(Author.name == "AutoModerator"))
+        assert bot.is_bot
+        repo = AuthorSketchRepository(db_session)
+        assert repo.unique_authors(["AAPL"], NOW, NOW) == {"AAPL": 1}
+
+    def test_rolled_back_ids_are_not_cached(self, db_session) -> None:
+        """Test a rollback leaves no cached id for the discarded row."""
+        seed_ticker(db_session)
+        db_session.add(comment(1, "alice"))
+        db_session.flush()
+        db_session.rollback()
+
+        assert author_id_cache.get("alice") is None
+        assert db_session.info.get(author_ids._PENDING_KEY) is None
+
+    def test_committed_ids_are_cached(self, db_session) -> None:
+        """Test known authors resolve without creating rows."""
+        ids = resolve_author_ids(db_session, ["alice", "bob"])
+        db_session.commit()
+
+        assert author_id_cache.get("alice") == ids["alice"]
+        assert resolve_author_ids(db_session, ["alice", "bob", "alice"]) == ids
+
+    def test_bulk_path_assigns_ids(self, db_session) -> None:
+        """Test assign_author_ids fills ids without flushing the articles."""
+        articles = [comment(1, "alice"), comment(2, "alice"), comment(3, "")]
+        assign_author_ids(db_session, articles)
+
+        assert articles[0].author_id is not None
+        assert articles[0].author_id == articles[1].author_id
+        assert articles[2].author_id is None
+        assert db_session.scalar(select(func.count()).select_from(Article)) == 0
+
+
+class TestAuthorIdCache:
+    """Tests for the bounded id cache."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the oldest untouched name is evicted first."""
+        cache = AuthorIdCache(max_size=2)
+        cache.put("alice", 1)
+        cache.put("bob", 2)
+        cache.get("alice")
+        cache.put("carol", 3)
+
+        assert len(cache) == 2
+        assert cache.get("bob") is None
+        assert (cache.get("alice"), cache.get("carol")) == (1, 3)
+
+    def test_concurrent_access_stays_bounded(self) -> None:
+        """Test that ingest threads sharing the cache never corrupt it."""
+        cache = AuthorIdCache(max_size=50)
+
+        def churn(worker: int) -> None:
+            for n in range(2000):
+                name = f"user{(worker * 7 + n) % 200}"
+                cache.put(name, n)
+                cache.get(name)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(churn, range(8)))
+
+        assert len(cache) == 50
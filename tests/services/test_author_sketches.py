@@ -0,0 +1,232 @@
+"""Tests for the hourly distinct-author sketches."""
+
+import asyncio
+import importlib.util
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Article, ArticleTicker, Author, Ticker, TickerAuthorSketch
+from app.main import get_ticker_sentiment_timeline
+from app.repos.author_sketch_repo import (
+    SKETCH_COLUMNS,
+    AuthorCounts,
+    AuthorSketchRepository,
+)
+from app.services.ticker_stats import record_sentiment_scores
+
+NOW = datetime.now(UTC).replace(minute=30, second=0, microsecond=0)
+
+AUTHOR_MIGRATION = (
+    Path(__file__).resolve().parents[2]
+    / "alembic"
+    / "versions"
+    / "c7e4a1f9d3b6_add_author_dimension.py"
+)
+
+
+def mention(db_session, n: int, published_at, author, sentiment=None, ticker="AAPL"):
+    article = Article(
+        id=n,
+        source="reddit_comment",
+        url=f"https://reddit.com/{n}",
+        published_at=published_at,
+        title=f"article {n}",
+        author=author,
+        sentiment=sentiment,
+    )
+    article.tickers.append(ArticleTicker(ticker=ticker))
+    db_session.add(article)
+
+
+@pytest.fixture
+def seeded(db_session):
+    db_session.add_all(
+        [Ticker(symbol="AAPL", name="Apple"), Ticker(symbol="TSLA", name="Tesla")]
+    )
+    db_session.flush()
+    mention(db_session, 1, NOW, "alice", 0.5)
+    mention(db_session, 2, NOW - timedelta(minutes=10), "alice", -0.5)
+    mention(db_session, 3, NOW - timedelta(hours=1), "bob", 0.0)
+    mention(db_session, 4, NOW - timedelta(hours=1), "", 0.5)
+    mention(db_session, 5, NOW - timedelta(days=2), "carol", None)
+    mention(db_session, 6, NOW, "dave", 0.9, ticker="TSLA")
+    db_session.commit()
+
+
+class TestSketchMaintenance:
+    """Tests for sketches written with the links."""
+
+    def test_committed_links_fill_hourly_sketches(self, db_session, seeded) -> None:
+        """Test one row per ticker-hour and windowed unique counts."""
+        repo = AuthorSketchRepository(db_session)
+
+        assert (
+            db_session.scalar(select(func.count()).select_from(TickerAuthorSketch)) == 4
+        )
+        assert repo.unique_authors(["AAPL", "TSLA"], NOW - timedelta(days=1), NOW) == {
+            "AAPL": 2,
+            "TSLA": 1,
+        }
+        assert repo.unique_authors(["AAPL"], NOW - timedelta(days=3), NOW) == {
+            "AAPL": 3
+        }
+        assert repo.unique_authors_in_windows(
+            "AAPL",
+            [(NOW - timedelta(minutes=5), NOW), (NOW - timedelta(days=3), NOW)],
+        ) == [1, 3]
+
+    def test_rolled_back_links_are_not_sketched(self, db_session, seeded) -> None:
+        """Test sketches move with the transaction."""
+        mention(db_session, 7, NOW, "erin", 0.5)
+        db_session.flush()
+        db_session.rollback()
+
+        repo = AuthorSketchRepository(db_session)
+        assert repo.unique_authors(["AAPL"], NOW, NOW)["AAPL"] == 1
+
+    def test_first_scores_join_sentiment_sketches(self, db_session, seeded) -> None:
+        """Test late sentiment scores add the author to their class."""
+        db_session.execute(
+            update(Article).where(Article.id == 5).values(sentiment=-0.4)
+        )
+        record_sentiment_scores(db_session, {5: -0.4})
+        db_session.commit()
+
+        timeline = AuthorSketchRepository(db_session).author_timeline(
+            "AAPL", NOW - timedelta(days=3), NOW, bucket="day"
+        )
+        assert timeline[(NOW - timedelta(days=2)).date()] == AuthorCounts(
+            total=1, negative=1
+        )
+
+    def test_rebuild_matches_incremental(self, db_session, seeded) -> None:
+        """Test rebuilding from the links reproduces the sketches."""
+        repo = AuthorSketchRepository(db_session)
+        start = NOW - timedelta(days=3)
+        before = repo.author_timeline("AAPL", start, NOW)
+
+        assert repo.rebuild(start) == 4
+        db_session.commit()
+
+        assert repo.author_timeline("AAPL", start, NOW) == before
+
+    def test_migration_rebuild_matches_repository(self, db_session, seeded) -> None:
+        """Test the author id migration writes the sketches the repository would."""
+        # Enough authors in one hour for a dense sketch
+        hour = NOW - timedelta(hours=3)
+        db_session.execute(
+            insert(Author),
+            [
+                {"id": 1000 + n, "name": f"user{n}", "created_at": NOW}
+                for n in range(2000)
+            ],
+        )
+        db_session.execute(
+            insert(Article),
+            [
+                {
+                    "id": 1000 + n,
+                    "source": "reddit_comment",
+                    "url": f"https://reddit.com/{1000 + n}",
+                    "published_at": hour,
+                    "title": f"article {1000 + n}",
+                    "author": f"user{n}",
+                    "author_id": 1000 + n,
+                    "sentiment": 0.2,
+                }
+                for n in range(2000)
+            ],
+        )
+        db_session.execute(
+            insert(ArticleTicker),
+            [
+                {
+                    "article_id": 1000 + n,
+                    "ticker": "TSLA",
+                    "published_at": hour,
+                    "sentiment": 0.2,
+                    "author": f"user{n}",
+                    "author_id": 1000 + n,
+                }
+                for n in range(2000)
+            ],
+        )
+        AuthorSketchRepository(db_session).rebuild(
+            NOW - timedelta(days=3), NOW + timedelta(hours=1)
+        )
+        db_session.commit()
+
+        def sketches():
+            db_session.expire_all()
+            return {
+                (row.ticker, row.hour): tuple(
+                    getattr(row, column) for column in SKETCH_COLUMNS
+                )
+                for row in db_session.scalars(select(TickerAuthorSketch))
+            }
+
+        expected = sketches()
+        spec = importlib.util.spec_from_file_location(
+            "author_migration", AUTHOR_MIGRATION
+        )
+        assert spec is not None and spec.loader is not None
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+        migration._rebuild_author_sketches(
+            db_session.connection(), now=NOW + timedelta(hours=1)
+        )
+        db_session.commit()
+
+        assert sketches() == expected
+        assert expected[("TSLA", hour.replace(minute=0, tzinfo=None))][0][0] == 2
+
+
+class TestUsersTimeline:
+    """Tests for metric=users on the sentiment timeline endpoint."""
+
+    @pytest.fixture
+    def fetch(self, test_engine, monkeypatch):
+        monkeypatch.setattr(
+            "app.db.session.SessionLocal", sessionmaker(bind=test_engine)
+        )
+        return lambda period: asyncio.run(
+            get_ticker_sentiment_timeline("aapl", period=period, metric="users", _=None)
+        )
+
+    def test_hourly_buckets(self, seeded, fetch) -> None:
+        """Test distinct authors per hour and sentiment class."""
+        data = fetch("day")["data"]
+
+        assert len(data) == 24
+        assert data[-1] == {
+            "timestamp": NOW.replace(minute=0).isoformat(),
+            "positive": 1,
+            "negative": 1,
+            "neutral": 0,
+            "total": 1,
+        }
+        assert data[-2]["total"] == 1
+        assert data[-2]["neutral"] == 1
+
+    def test_daily_buckets(self, seeded, fetch) -> None:
+        """Test hourly sketches merge into days."""
+        data = fetch("week")["data"]
+        by_day = {point["timestamp"][:10]: point["total"] for point in data}
+
+        authors_by_day = {
+            (published_at.date(), author)
+            for published_at, author in [
+                (NOW, "alice"),
+                (NOW - timedelta(minutes=10), "alice"),
+                (NOW - timedelta(hours=1), "bob"),
+                (NOW - timedelta(days=2), "carol"),
+            ]
+        }
+
+        assert len(data) == 7
+        assert by_day[(NOW - timedelta(days=2)).date().isoformat()] == 1
+        assert sum(by_day.values()) == len(authors_by_day)
@@ -0,0 +1,207 @@
+"""Tests for archiving old Reddit comments to Parquet."""
+
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.db.models import Article, ArticleBody, ArticleTicker, Ticker, TickerStats
+from app.repos.article_feed_repo import ArticleFeedRepository
+from app.repos.ticker_stats_repo import TickerStatsRepository
+from app.services.comment_archive import (
+    ARTICLE_DATASET,
+    LINK_DATASET,
+    CommentArchiver,
+    connect_duckdb,
+    read_archive,
+)
+from app.services.ticker_overview import get_ticker_overview
+
+NOW = datetime(2026, 10, 18, 12, tzinfo=UTC)
+OLD = NOW - timedelta(days=200)
+
+
+def add_article(
+    db_session, n: int, published_at, tickers=("AAPL",), source="reddit_comment"
+) -> Article:
+    article = Article(
+        id=n,
+        source=source,
+        url=f"https://reddit.com/{n}",
+        published_at=published_at,
+        title=f"article {n}",
+        text=f"body {n}",
+        sentiment=0.1 * n,
+        author=f"user{n}",
+    )
+    db_session.add(article)
+    db_session.flush()
+    for ticker in tickers:
+        db_session.add(
+            ArticleTicker(
+                article_id=n, ticker=ticker, confidence=0.9, matched_terms=[ticker]
+            )
+        )
+    return article
+
+
+@pytest.fixture
+def corpus(db_session):
+    db_session.add_all(
+        [Ticker(symbol="AAPL", name="Apple"), Ticker(symbol="TSLA", name="Tesla")]
+    )
+    db_session.commit()
+    add_article(db_session, 1, OLD, ["AAPL", "TSLA"])
+    add_article(db_session, 2, OLD + timedelta(hours=3))
+    add_article(db_session, 3, OLD + timedelta(days=1))
+    add_article(db_session, 4, OLD, source="reddit_post")
+    add_article(db_session, 5, NOW - timedelta(days=10))
+    db_session.commit()
+
+
+def remaining_ids(db_session) -> list[int]:
+    return sorted(db_session.scalars(select(Article.id)))
+
+
+class TestCommentArchiver:
+    """Tests for moving comments out of the database."""
+
+    def test_old_comments_move_to_parquet(self, db_session, corpus, tmp_path) -> None:
+        """Test only comments past the horizon leave, with bodies and links."""
+        result = CommentArchiver(db_session, uri=str(tmp_path), horizon_days=180).run(
+            now=NOW
+        )
+
+        assert result.articles == 3
+        assert result.links == 4
+        assert result.days == [OLD.date(), OLD.date() + timedelta(days=1)]
+        assert remaining_ids(db_session) == [4, 5]
+        assert db_session.scalar(select(func.count()).select_from(ArticleBody)) == 2
+        assert sorted(db_session.scalars(select(ArticleTicker.article_id))) == [4, 5]
+        assert sorted(p.name for p in (tmp_path / ARTICLE_DATASET).iterdir()) == [
+            f"published_date={OLD.date()}",
+            f"published_date={OLD.date() + timedelta(days=1)}",
+        ]
+
+    def test_dry_run_keeps_rows(self, db_session, corpus, tmp_path) -> None:
+        """Test a dry run counts without writing or deleting."""
+        result = CommentArchiver(db_session, uri=str(tmp_path), horizon_days=180).run(
+            now=NOW, dry_run=True
+        )
+
+        assert (result.articles, result.links) == (3, 4)
+        assert remaining_ids(db_session) == [1, 2, 3, 4, 5]
+        assert not (tmp_path / ARTICLE_DATASET).exists()
+
+    def test_rerun_is_idempotent(self, db_session, corpus, tmp_path) -> None:
+        """Test a second run finds nothing left to move."""
+        archiver = CommentArchiver(db_session, uri=str(tmp_path), horizon_days=180)
+        archiver.run(now=NOW)
+        again = archiver.run(now=NOW)
+
+        assert again.articles == 0
+        assert read_archive(ARTICLE_DATASET, uri=str(tmp_path)).num_rows == 3
+
+    def test_horizon_must_exceed_ui_window(self, db_session, tmp_path) -> None:
+        """Test comments still shown in the UI cannot be archived."""
+        with pytest.raises(ValueError):
+            CommentArchiver(db_session, uri=str(tmp_path), horizon_days=7)
+
+    def test_reconcile_keeps_archived_mentions(
+        self, db_session, corpus, tmp_path
+    ) -> None:
+        """Test lifetime counters survive archival and the nightly reconcile."""
+        repo = TickerStatsRepository(db_session)
+        repo.reconcile(now=NOW)
+        db_session.commit()
+        db_session.expire_all()
+        before = {
+            stats.ticker: (
+                stats.total_mentions,
+                stats.sentiment_count,
+                stats.last_mention_at,
+            )
+            for stats in db_session.scalars(select(TickerStats))
+        }
+
+        CommentArchiver(db_session, uri=str(tmp_path), horizon_days=180).run(now=NOW)
+        assert repo.reconcile(now=NOW) == 0
+        db_session.commit()
+        db_session.expire_all()
+
+        tsla = db_session.get(TickerStats, "TSLA")
+        assert tsla.archived_mentions == 1
+        assert {
+            stats.ticker: (
+                stats.total_mentions,
+                stats.sentiment_count,
+                stats.last_mention_at,
+            )
+            for stats in db_session.scalars(select(TickerStats))
+        } == before
+
+    def test_feed_totals_exclude_archived(self, db_session, corpus, tmp_path) -> None:
+        """Test page counts only cover rows the feed can still load."""
+        TickerStatsRepository(db_session).reconcile(now=NOW)
+        db_session.commit()
+
+        CommentArchiver(db_session, uri=str(tmp_path), horizon_days=180).run(now=NOW)
+        db_session.expire_all()
+
+        assert ArticleFeedRepository(db_session).ticker_total("AAPL") == 2
+        assert ArticleFeedRepository(db_session).ticker_total("TSLA") == 0
+        overview = get_ticker_overview(db_session, "AAPL", now=NOW)
+        assert overview is not None
+        assert overview.total_articles == 2
+
+
+class TestArchiveReaders:
+    """Tests for querying the archive."""
+
+    @pytest.fixture
+    def archive(self, db_session, corpus, tmp_path) -> str:
+        CommentArchiver(db_session, uri=str(tmp_path), horizon_days=180).run(now=NOW)
+        return str(tmp_path)
+
+    def test_read_archive_filters_by_date(self, archive) -> None:
+        """Test date bounds and round-tripped values."""
+        table = read_archive(
+            ARTICLE_DATASET, start=OLD.date(), end=OLD.date(), uri=archive
+        )
+        rows = sorted(table.to_pylist(), key=lambda row: row["id"])
+
+        assert [row["id"] for row in rows] == [1, 2]
+        assert rows[0]["text"] == "body 1"
+        assert rows[0]["published_at"] == OLD
+        assert rows[0]["published_date"] == OLD.date()
+
+        links = read_archive(LINK_DATASET, uri=archive).to_pylist()
+        assert sorted((row["article_id"], row["ticker"]) for row in links) == [
+            (1, "AAPL"),
+            (1, "TSLA"),
+            (2, "AAPL"),
+            (3, "AAPL"),
+        ]
+        assert links[0]["matched_terms"] == [links[0]["ticker"]]
+
+    def test_missing_archive_reads_empty(self, tmp_path) -> None:
+        """Test reading before the first run returns no rows."""
+        assert read_archive(LINK_DATASET, uri=str(tmp_path / "none")).num_rows == 0
+
+    def test_duckdb_views(self, archive) -> None:
+        """Test the DuckDB views join archived articles and links."""
+        connection = connect_duckdb(archive)
+
+        rows = connection.execute(
+            """
+            SELECT l.ticker, COUNT(*) AS mentions, MIN(a.author) AS first_author
+            FROM archived_article_ticker l
+            JOIN archived_article a ON a.id = l.article_id
+            WHERE l.published_date >= ?
+            GROUP BY l.ticker
+            ORDER BY l.ticker
+            """,
+            [date(2026, 1, 1)],
+        ).fetchall()
+
+        assert rows == [("AAPL", 3, "user1"), ("TSLA", 1, "user1")]
@@ -1,16 +1,77 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import math
+import time
+import tracemalloc
+from dataclasses import replace
+from datetime import UTC, date, datetime
+from typing import Any
 
 import pytest
 
 from app.config import settings
-from app.db.models import Article, ArticleTicker, LLMSentimentCategory, Ticker
+from app.db.models import (
+    Article,
+    ArticleBody,
+    ArticleTicker,
+    LLMSentimentCategory,
+    StockPrice,
+    Ticker,
+)
+from app.models.dto import DailyTickerSummaryUpsertDTO
+from app.repos.summary_repo import DailyTickerSummaryRepository
+from app.services.author_ids import resolve_author_ids
 from app.services.daily_summary import (
     DailySummaryResult,
     DailySummaryService,
+    PartialSummaryError,
     SummaryInfo,
+    SummaryResultCache,
+    local_summary_cache,
 )
+from app.services.ticker_stats import record_article_links
+
+
+@pytest.fixture(autouse=True)
+def _clear_local_summary_cache():
+    local_summary_cache.clear()
+    yield
+    local_summary_cache.clear()
+
+
+class FakeChatModel:
+    """Local stand-in for a LangChain chat model with structured output.
+
+    Echoes the ticker found in each prompt; tickers in ``fail_tickers`` come
+    back as exceptions (as ``batch(..., return_exceptions=True)`` does).
+    """
+
+    def __init__(self, fail_tickers: set[str] | None = None):
+        self.fail_tickers = set(fail_tickers or ())
+        self.batches: list[list[str]] = []
+
+    def with_structured_output(self, output_schema):
+        return self
+
+    def batch(self, prompts, config=None, return_exceptions=False):
+        self.batches.append(list(prompts))
+        responses: list[SummaryInfo | Exception] = []
+        for prompt in prompts:
+            ticker = prompt.split("Ticker: ", 1)[1].split()[0]
+            if ticker in self.fail_tickers:
+                responses.append(RuntimeError(f"timeout for {ticker}"))
+            else:
+                responses.append(
+                    SummaryInfo(
+                        summary=f"{ticker} summary",
+                        sentiment=LLMSentimentCategory.BULLISH,
+                    )
+                )
+        return responses
+
+    @property
+    def prompt_count(self) -> int:
+        return sum(len(batch) for batch in self.batches)
 
 
 def _seed_daily_summary_data(db_session) -> None:
@@ -160,6 +221,28 @@ def test_load_previous_day_summary_filters_and_scores(db_session, monkeypatch):
     )
 
 
+def test_load_previous_day_summary_snapshots_participants_and_price(
+    db_session, monkeypatch
+):
+    _seed_daily_summary_data(db_session)
+    db_session.add(
+        StockPrice(
+            symbol="TSLA",
+            price=181.234,
+            change_percent=-2.5,
+            updated_at=datetime(2024, 5, 2, 20, 0, tzinfo=UTC),
+        )
+    )
+    db_session.commit()
+
+    _, summary = _build_summary(db_session, monkeypatch)
+
+    ticker_summary = summary.tickers[0]
+    assert ticker_summary.participants == 2
+    assert ticker_summary.last_price == pytest.approx(181.234)
+    assert ticker_summary.price_change_percent == pytest.approx(-2.5)
+
+
 def test_build_payloads_include_api_key_and_prompt(db_session, monkeypatch):
     _seed_daily_summary_data(db_session)
     monkeypatch.setattr(settings, "openai_api_key", "sk-test")
@@ -203,7 +286,7 @@ def test_generate_langchain_summary_invokes_model(db_session, monkeypatch):
     class FakeStructuredModel:
         """Mock structured model that returns SummaryInfo objects."""
 
-        def batch(self, prompts, config=None):
+        def batch(self, prompts, config=None, return_exceptions=False):
             batch_inputs.extend(prompts)
             # Return SummaryInfo objects matching the structured output
             return [
@@ -335,7 +418,7 @@ def test_generate_langchain_summary_handles_fallback_parsing(db_session, monkeyp
             return '{"summary": "Fallback summary", "sentiment": "Neutral"}'
 
     class FakeStructuredModel:
-        def batch(self, prompts, config=None):
+        def batch(self, prompts, config=None, return_exceptions=False):
             # Return a non-SummaryInfo object (simulating fallback scenario)
             return [FakeResponse()]
 
@@ -393,3 +476,269 @@ def test_build_prompt_for_ticker_includes_sentiment_instructions(
     assert "sentiment" in prompt.lower()
     # Check that it mentions sentiment classification
     assert "sentiment" in prompt.lower()
+
+
+def _install_fake_model(monkeypatch, model: FakeChatModel) -> None:
+    monkeypatch.setattr(settings, "openai_api_key", "sk-test")
+    monkeypatch.setattr(settings, "daily_summary_llm_model", "gpt-test")
+    monkeypatch.setattr(
+        "app.services.daily_summary.init_chat_model", lambda *_, **__: model
+    )
+
+
+def _multi_ticker_summary(summary: DailySummaryResult) -> DailySummaryResult:
+    """Return TSLA, AAPL and a repeated TSLA built from the seeded TSLA entry."""
+    tsla = summary.tickers[0]
+    return replace(summary, tickers=[tsla, replace(tsla, ticker="AAPL"), tsla])
+
+
+def test_generate_langchain_summary_dedups_and_caches_locally(db_session, monkeypatch):
+    """Test that identical prompts are sent once and reruns hit the local tier."""
+    _seed_daily_summary_data(db_session)
+    model = FakeChatModel()
+    _install_fake_model(monkeypatch, model)
+    service, summary = _build_summary(db_session, monkeypatch)
+    summary = _multi_ticker_summary(summary)
+
+    first = service.generate_langchain_summary(summary)
+    second = DailySummaryService(db_session).generate_langchain_summary(summary)
+
+    assert [info.summary for info in first] == [
+        "TSLA summary",
+        "AAPL summary",
+        "TSLA summary",
+    ]
+    assert second == first
+    assert model.prompt_count == 2
+    assert service.cache_stats.misses == 2
+    assert service.cache_stats.deduplicated == 1
+
+
+def test_generate_langchain_summary_reuses_stored_summary(db_session, monkeypatch):
+    """Test that a persisted prompt hash is served without calling the model."""
+    _seed_daily_summary_data(db_session)
+    model = FakeChatModel()
+    _install_fake_model(monkeypatch, model)
+    service, summary = _build_summary(db_session, monkeypatch)
+    DailyTickerSummaryRepository(db_session).upsert_summary(
+        DailyTickerSummaryUpsertDTO(
+            ticker="TSLA",
+            summary_date=date(2024, 5, 2),
+            mention_count=2,
+            engagement_count=0,
+            llm_summary="Stored TSLA summary",
+            llm_sentiment=LLMSentimentCategory.DOOM,
+            prompt_hash=service.prompt_hashes(summary)[0],
+        )
+    )
+    db_session.commit()
+    monkeypatch.setattr(settings, "openai_api_key", None)
+
+    fresh = DailySummaryService(db_session, summary_cache=SummaryResultCache())
+    responses = fresh.generate_langchain_summary(summary)
+
+    assert [(r.summary, r.sentiment) for r in responses] == [
+        ("Stored TSLA summary", LLMSentimentCategory.DOOM)
+    ]
+    assert fresh.cache_stats.db_hits == 1
+    assert model.prompt_count == 0
+
+
+def test_generate_langchain_summary_force_bypasses_cache(db_session, monkeypatch):
+    """Test that force re-invokes the model for cached prompts."""
+    _seed_daily_summary_data(db_session)
+    model = FakeChatModel()
+    _install_fake_model(monkeypatch, model)
+    service, summary = _build_summary(db_session, monkeypatch)
+
+    service.generate_langchain_summary(summary)
+    service.generate_langchain_summary(summary, force=True)
+
+    assert model.prompt_count == 2
+    assert service.cache_stats.local_hits == 0
+
+
+def test_generate_langchain_summary_partial_failure_reruns_missing_only(
+    db_session, monkeypatch
+):
+    """Test that a rerun after a partial failure only sends the failed tickers."""
+    _seed_daily_summary_data(db_session)
+    model = FakeChatModel(fail_tickers={"AAPL"})
+    _install_fake_model(monkeypatch, model)
+    service, summary = _build_summary(db_session, monkeypatch)
+    summary = _multi_ticker_summary(summary)
+
+    with pytest.raises(PartialSummaryError) as excinfo:
+        service.generate_langchain_summary(summary)
+
+    assert [r.summary if r else None for r in excinfo.value.results] == [
+        "TSLA summary",
+        None,
+        "TSLA summary",
+    ]
+
+    model.fail_tickers.clear()
+    responses = service.generate_langchain_summary(summary)
+
+    assert [r.summary for r in responses][1] == "AAPL summary"
+    assert len(model.batches[-1]) == 1
+    assert "Ticker: AAPL" in model.batches[-1][0]
+
+
+def test_generate_langchain_summary_total_failure_raises(db_session, monkeypatch):
+    """Test that a failure for every ticker raises a descriptive RuntimeError."""
+    _seed_daily_summary_data(db_session)
+    _install_fake_model(monkeypatch, FakeChatModel(fail_tickers={"TSLA"}))
+    service, summary = _build_summary(db_session, monkeypatch)
+
+    with pytest.raises(RuntimeError, match="OpenAI API error") as excinfo:
+        service.generate_langchain_summary(summary)
+
+    assert not isinstance(excinfo.value, PartialSummaryError)
+
+
+def _seed_ranked_articles(db_session, tickers: list[str], per_ticker: int) -> None:
+    """Seed ``per_ticker`` articles per ticker inside the May 2 window.
+
+    Upvotes rise with the index and comments fall, so the ranking depends on
+    the engagement weights. Every article has a distinct author.
+    """
+    now = datetime(2024, 5, 2, 15, 0, tzinfo=UTC)
+    db_session.bulk_insert_mappings(
+        Ticker,
+        [{"symbol": t, "name": t, "aliases": [], "sources": []} for t in tickers],
+    )
+    articles: list[dict[str, Any]] = [
+        {
+            "id": t_idx * per_ticker + i + 1,
+            "source": "reddit",
+            "url": f"https://reddit.com/{ticker}/{i}",
+            "published_at": now,
+            "title": f"{ticker} post {i}",
+            "author": f"{ticker}-author-{i}",
+            "subreddit": "wallstreetbets",
+            "upvotes": i,
+            "num_comments": per_ticker - i,
+            "sentiment": 0.1,
+            "created_at": now,
+        }
+        for t_idx, ticker in enumerate(tickers)
+        for i in range(per_ticker)
+    ]
+    author_ids = resolve_author_ids(db_session, [a["author"] for a in articles])
+    for article in articles:
+        article["author_id"] = author_ids[article["author"]]
+    db_session.bulk_insert_mappings(Article, articles)
+    db_session.bulk_insert_mappings(
+        ArticleBody,
+        [
+            {
+                "article_id": t_idx * per_ticker + i + 1,
+                "text": f"{ticker} comment {i} " + "x" * 800,
+            }
+            for t_idx, ticker in enumerate(tickers)
+            for i in range(per_ticker)
+        ],
+    )
+    db_session.bulk_insert_mappings(
+        ArticleTicker,
+        [
+            {
+                "article_id": article["id"],
+                "ticker": article["title"].split()[0],
+                "confidence": 1.0,
+                "matched_terms": ["term"],
+                "published_at": article["published_at"],
+                "sentiment": article["sentiment"],
+                "author": article["author"],
+                "author_id": article["author_id"],
+            }
+            for article in articles
+        ],
+    )
+    # Bulk writers report their links, as the scraper does
+    record_article_links(
+        db_session,
+        [(article["id"], article["title"].split()[0]) for article in articles],
+    )
+    db_session.commit()
+
+
+def test_load_summary_fetches_only_top_k_per_ticker(db_session, monkeypatch):
+    """Test that ranking happens in SQL and participants cover the whole window."""
+    _seed_ranked_articles(db_session, ["TSLA", "AAPL"], per_ticker=12)
+    _build_summary(db_session, monkeypatch)
+    service = DailySummaryService(
+        db_session, articles_per_ticker=3, upvote_weight=1.0, comment_weight=0.0
+    )
+
+    summary = service.load_previous_day_summary()
+
+    assert {t.ticker for t in summary.tickers} == {"AAPL", "TSLA"}
+    tsla = next(t for t in summary.tickers if t.ticker == "TSLA")
+    assert [a.title for a in tsla.articles] == [
+        "TSLA post 11",
+        "TSLA post 10",
+        "TSLA post 9",
+    ]
+    assert tsla.participants == 12
+    assert summary.total_ranked_articles == 6
+    # Text is cut to the prompt preview plus one character
+    text = tsla.articles[0].text
+    assert text is not None
+    assert len(text) == 501
+    assert text.startswith("TSLA comment 11")
+    assert tsla.articles[0].matched_terms == ("term",)
+
+
+def test_load_summary_ranks_with_custom_weights(db_session, monkeypatch):
+    """Test that non-default weights are applied in the SQL ranking."""
+    _seed_ranked_articles(db_session, ["TSLA"], per_ticker=6)
+    _build_summary(db_session, monkeypatch)
+    service = DailySummaryService(
+        db_session, articles_per_ticker=2, upvote_weight=0.0, comment_weight=1.0
+    )
+
+    summary = service.load_previous_day_summary()
+
+    articles = summary.tickers[0].articles
+    assert [a.title for a in articles] == ["TSLA post 0", "TSLA post 1"]
+    assert articles[0].engagement_score == pytest.approx(math.log1p(6))
+
+
+@pytest.mark.performance
+def test_top_k_fetch_memory_and_latency(db_session, monkeypatch):
+    """Benchmark the top-K fetch against loading every article as ORM rows."""
+    _seed_ranked_articles(db_session, [f"T{i}" for i in range(10)], per_ticker=3000)
+    _build_summary(db_session, monkeypatch)
+    monkeypatch.setattr(settings, "daily_summary_max_tickers", 10)
+    service = DailySummaryService(db_session)
+
+    def measure(fn):
+        db_session.expunge_all()
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return result, elapsed, peak
+
+    def load_all():
+        return (
+            db_session.query(Article, ArticleTicker.ticker)
+            .join(ArticleTicker, Article.id == ArticleTicker.article_id)
+            .all()
+        )
+
+    all_rows, full_elapsed, full_peak = measure(load_all)
+    summary, top_k_elapsed, top_k_peak = measure(service.load_previous_day_summary)
+    print(
+        f"\nall rows: {len(all_rows)} in {full_elapsed:.2f}s, peak "
+        f"{full_peak / 2**20:.1f} MiB; top-K: {summary.total_ranked_articles} in "
+        f"{top_k_elapsed:.2f}s, peak {top_k_peak / 2**20:.1f} MiB"
+    )
+
+    assert summary.total_ranked_articles == 100
+    assert top_k_peak < full_peak / 10
+    assert top_k_elapsed < full_elapsed
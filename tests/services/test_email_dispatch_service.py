@@ -0,0 +1,182 @@
+"""Tests for bulk daily briefing dispatch planning."""
+
+from datetime import UTC, date, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.db.models import (
+    DailyTickerSummary,
+    Ticker,
+    User,
+    UserNotificationChannel,
+    UserProfile,
+    UserTickerFollow,
+)
+from app.models.dto import EmailSendResult
+from app.services.email_dispatch_service import EmailDispatchService
+from app.services.email_send_pool import ConcurrentEmailSender
+
+SUMMARY_DATE = date(2025, 1, 15)
+TICKERS = [f"T{i}" for i in range(50)]
+
+
+def seed_users(session, count: int) -> None:
+    """Seed users with daily-enabled channels, profiles and three follows each.
+
+    Every tenth user is weekly_only and every seventh follows only a ticker
+    without a summary.
+    """
+    now = datetime.now(UTC)
+    session.bulk_insert_mappings(
+        Ticker,
+        [{"symbol": t, "name": t, "aliases": [], "sources": []} for t in TICKERS]
+        + [{"symbol": "NOSUM", "name": "NOSUM", "aliases": [], "sources": []}],
+    )
+    session.bulk_insert_mappings(
+        DailyTickerSummary,
+        [
+            {
+                "ticker": ticker,
+                "summary_date": SUMMARY_DATE,
+                "llm_summary": f"{ticker} summary",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for ticker in TICKERS
+        ],
+    )
+    session.bulk_insert_mappings(
+        User,
+        [
+            {
+                "id": i,
+                "email": f"user{i}@example.com",
+                "is_active": True,
+                "is_deleted": False,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(1, count + 1)
+        ],
+    )
+    session.bulk_insert_mappings(
+        UserNotificationChannel,
+        [
+            {
+                "user_id": i,
+                "channel_type": "email",
+                "channel_value": f"user{i}@example.com",
+                "is_verified": True,
+                "is_enabled": True,
+                "email_bounced": False,
+                "preferences": {"notify_on_daily_briefing": True},
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(1, count + 1)
+        ],
+    )
+    session.bulk_insert_mappings(
+        UserProfile,
+        [
+            {
+                "user_id": i,
+                "timezone": "UTC",
+                "preferences": {
+                    "email_cadence": "weekly_only" if i % 10 == 0 else "daily_only"
+                },
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(1, count + 1)
+        ],
+    )
+    session.bulk_insert_mappings(
+        UserTickerFollow,
+        [
+            {
+                "user_id": i,
+                "ticker": "NOSUM" if i % 7 == 0 else TICKERS[(i + k) % len(TICKERS)],
+                "order": k,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(1, count + 1)
+            for k in range(1 if i % 7 == 0 else 3)
+        ],
+    )
+    session.commit()
+
+
+@pytest.fixture
+def email_service():
+    """Email service stub that always succeeds."""
+    service = MagicMock()
+    service.provider_name = "stub"
+    service.send_summary_email.return_value = EmailSendResult(
+        success=True, message_id="msg", error=None, provider="stub"
+    )
+    return service
+
+
+class TestDispatchPlanning:
+    """Tests for set-based eligibility and summary resolution."""
+
+    def test_plan_resolves_profiles_follows_and_summaries(
+        self, db_session, email_service
+    ) -> None:
+        """Test that recipients carry their own follows, profile and summaries."""
+        seed_users(db_session, 30)
+        service = EmailDispatchService(db_session, email_service)
+
+        users = service.get_eligible_users()
+        recipients = service.filter_users_with_summaries(users, SUMMARY_DATE)
+
+        assert {u.id for u in users} == {i for i in range(1, 31) if i % 10}
+        assert {r.user.id for r in recipients} == {
+            i for i in range(1, 31) if i % 10 and i % 7
+        }
+        recipient = next(r for r in recipients if r.user.id == 1)
+        assert recipient.profile is not None
+        assert recipient.profile.user_id == 1
+        assert [f.ticker for f in recipient.follows] == ["T1", "T2", "T3"]
+        assert [s.ticker for s in recipient.summaries] == ["T1", "T2", "T3"]
+
+    def test_send_batch_uses_planned_data(
+        self, db_session, email_service, count_queries
+    ) -> None:
+        """Test that sending does not re-query profiles or follows."""
+        seed_users(db_session, 5)
+        service = EmailDispatchService(
+            db_session, email_service, sender=ConcurrentEmailSender(1000.0, 4)
+        )
+        recipients = service.filter_users_with_summaries(
+            service.get_eligible_users(), SUMMARY_DATE
+        )
+
+        with count_queries() as statements:
+            sent, failed = service.send_batch(recipients, SUMMARY_DATE)
+
+        assert (sent, failed) == (len(recipients), 0)
+        assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        kwargs = email_service.send_summary_email.call_args.kwargs
+        assert kwargs["user_profile"] is not None
+        assert kwargs["user_ticker_follows"]
+
+    @pytest.mark.performance
+    def test_planning_query_count_is_constant_at_10k_users(
+        self, db_session, email_service, count_queries
+    ) -> None:
+        """Test that planning 10k users takes a handful of queries, not O(N)."""
+        seed_users(db_session, 10_000)
+        service = EmailDispatchService(db_session, email_service)
+
+        with count_queries() as statements:
+            users = service.get_eligible_users()
+            recipients = service.filter_users_with_summaries(users, SUMMARY_DATE)
+
+        assert len(users) == 9_000
+        assert len(recipients) == sum(1 for i in range(1, 10_001) if i % 10 and i % 7)
+        # 1 eligibility + 2 follow chunks + 1 summaries + 2 profile chunks
+        assert len(statements) <= 6
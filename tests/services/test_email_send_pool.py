@@ -0,0 +1,167 @@
+"""Tests for the token-bucket governed concurrent email sender."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.services.email_providers.ses import SESEmailService
+from app.services.email_send_pool import ConcurrentEmailSender, TokenBucket
+
+SES_LATENCY = 0.2  # Simulated SES round-trip in seconds
+SES_MAX_SEND_RATE = 20.0
+
+
+class StubSESClient:
+    """Local stand-in for the boto3 SES client that records send times."""
+
+    def __init__(self, throttle_first_for: set[str] | None = None):
+        self.send_times: list[float] = []
+        self.attempts: dict[str, int] = {}
+        self._throttle = set(throttle_first_for or ())
+        self._lock = threading.Lock()
+
+    def get_send_quota(self) -> dict:
+        return {"Max24HourSend": 50000.0, "MaxSendRate": SES_MAX_SEND_RATE}
+
+    def send_email(self, Source, Destination, Message) -> dict:  # noqa: N803
+        to_address = Destination["ToAddresses"][0]
+        with self._lock:
+            self.send_times.append(time.monotonic())
+            attempt = self.attempts.get(to_address, 0) + 1
+            self.attempts[to_address] = attempt
+        threading.Event().wait(SES_LATENCY)
+        if to_address in self._throttle and attempt == 1:
+            raise ClientError(
+                {"Error": {"Code": "Throttling", "Message": "Maximum sending rate"}},
+                "SendEmail",
+            )
+        return {"MessageId": f"msg-{to_address}-{attempt}"}
+
+
+def make_ses_service(client: StubSESClient) -> SESEmailService:
+    """Build an SES service wired to the stub client."""
+    with patch("boto3.client", return_value=client):
+        return SESEmailService()
+
+
+def send_plain(service: SESEmailService, to_email: str):
+    return service.send_email(
+        to_email=to_email, subject="Hi", html_body="<p>Hi</p>", text_body="Hi"
+    )
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket pacing."""
+
+    def test_acquire_paces_at_rate(self) -> None:
+        """Test that tokens beyond the capacity wait 1/rate each."""
+        now = [0.0]
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=10.0, clock=lambda: now[0], sleep=sleep)
+        for _ in range(5):
+            bucket.acquire()
+
+        assert now[0] == pytest.approx(0.4)
+        assert len(sleeps) == 4
+
+    def test_rejects_non_positive_rate(self) -> None:
+        """Test that a zero rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestConcurrentEmailSender:
+    """Tests for ConcurrentEmailSender against a stub SES client."""
+
+    def test_sizes_rate_from_ses_quota(self) -> None:
+        """Test that the bucket uses the account's MaxSendRate."""
+        sender = ConcurrentEmailSender.for_email_service(
+            make_ses_service(StubSESClient()), max_workers=4
+        )
+
+        assert sender.max_send_rate == SES_MAX_SEND_RATE
+        assert sender.max_workers == 4
+
+    def test_outcomes_keep_order_and_capture_errors(self) -> None:
+        """Test that exceptions are captured per item without stopping others."""
+
+        def send(item: int):
+            if item == 2:
+                raise RuntimeError("boom")
+            return item * 10
+
+        outcomes = ConcurrentEmailSender(1000.0, max_workers=3).send_all(
+            [1, 2, 3], send
+        )
+
+        assert [o.item for o in outcomes] == [1, 2, 3]
+        assert [o.result for o in outcomes] == [10, None, 30]
+        assert isinstance(outcomes[1].error, RuntimeError)
+
+    def test_send_iter_yields_each_outcome(self) -> None:
+        """Test that send_iter yields every outcome, errors included."""
+
+        def send(item: int):
+            if item == 2:
+                raise RuntimeError("boom")
+            return item * 10
+
+        outcomes = list(
+            ConcurrentEmailSender(1000.0, max_workers=3).send_iter([1, 2, 3], send)
+        )
+
+        by_item = {o.item: o for o in outcomes}
+        assert sorted(by_item) == [1, 2, 3]
+        assert (by_item[1].result, by_item[3].result) == (10, 30)
+        assert isinstance(by_item[2].error, RuntimeError)
+
+    def test_throttled_send_is_retried(self) -> None:
+        """Test that SES throttling is retried by _send_with_retry in the worker."""
+        client = StubSESClient(throttle_first_for={"b@example.com"})
+        service = make_ses_service(client)
+        sender = ConcurrentEmailSender(1000.0, max_workers=2)
+
+        with patch("app.services.email_providers.ses.time.sleep"):
+            outcomes = sender.send_all(
+                ["a@example.com", "b@example.com"],
+                lambda to: send_plain(service, to),
+            )
+
+        assert all(o.result is not None and o.result.success for o in outcomes)
+        assert client.attempts == {"a@example.com": 1, "b@example.com": 2}
+
+    @pytest.mark.performance
+    def test_achieved_rate_tracks_quota(self) -> None:
+        """Test throughput near MaxSendRate despite a 200ms SES round-trip."""
+        client = StubSESClient()
+        service = make_ses_service(client)
+        sender = ConcurrentEmailSender.for_email_service(service, max_workers=8)
+        recipients = [f"user{i}@example.com" for i in range(40)]
+
+        start = time.monotonic()
+        outcomes = sender.send_all(recipients, lambda to: send_plain(service, to))
+        elapsed = time.monotonic() - start
+
+        times = sorted(client.send_times)
+        achieved = (len(times) - 1) / (times[-1] - times[0])
+        busiest_second = max(
+            sum(1 for t in times if start_t <= t < start_t + 1.0) for start_t in times
+        )
+        serial_estimate = len(recipients) * (SES_LATENCY + 1 / 14)
+        print(
+            f"\nachieved {achieved:.1f}/s (quota {SES_MAX_SEND_RATE:.0f}/s), "
+            f"{elapsed:.2f}s vs ~{serial_estimate:.1f}s serial"
+        )
+
+        assert all(o.result is not None and o.result.success for o in outcomes)
+        assert SES_MAX_SEND_RATE * 0.7 <= achieved <= SES_MAX_SEND_RATE * 1.05
+        assert busiest_second <= SES_MAX_SEND_RATE + 1
+        assert elapsed < serial_estimate / 2
@@ -1,11 +1,20 @@
 """Tests for the email template rendering service."""
 
+import time
+from dataclasses import replace
 from datetime import UTC, date, datetime
 
 import pytest
+from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
-from app.db.models import LLMSentimentCategory
+from app.db.models import (
+    Article,
+    ArticleTicker,
+    LLMSentimentCategory,
+    StockPrice,
+    Ticker,
+)
 from app.models.dto import (
     DailyTickerSummaryDTO,
     UserDTO,
@@ -164,6 +173,41 @@ class TestEmailTemplateService:
         assert "Participants" in html
         assert "Apple comment preview text" in text
 
+    def test_stored_snapshot_skips_live_lookups(
+        self, monkeypatch, user, profile, follows
+    ):
+        """Summaries carrying participants/price render without querying."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unexpected live lookup")
+
+        service = EmailTemplateService(article_loader=lambda ids: {})
+        for lookup in (
+            "_get_participant_count",
+            "_get_last_price",
+            "_get_participant_counts",
+            "_get_last_prices",
+        ):
+            monkeypatch.setattr(service, lookup, fail)
+        summary = replace(
+            make_summary("NVDA", summary_id=1, sentiment=LLMSentimentCategory.BULLISH),
+            participant_count=42,
+            last_price=131.456,
+            price_change_percent=-1.5,
+        )
+
+        with service.ticker_section_cache([summary]):
+            html, text = service.render_daily_briefing(
+                user=user,
+                user_profile=profile,
+                ticker_summaries=[summary],
+                user_ticker_follows=follows,
+                unsubscribe_token="signed-token",
+            )
+
+        assert "Participants: 42 | Last Price: $131.46 (-1.50%)" in text
+        assert "(-1.50%)" in html
+
     def test_prepare_tickers_filters_and_sorts(self, user, follows, monkeypatch):
         """Personalization logic filters to watchlist symbols."""
         service = EmailTemplateService()
@@ -298,3 +342,184 @@ class TestEmailTemplateService:
         normalized = service._normalize_articles([10, 11, 12], date(2024, 1, 15))
 
         assert [article["title"] for article in normalized] == ["Night Session"]
+
+
+class TestTickerSectionCache:
+    """Render-once ticker sections for a dispatch run."""
+
+    @staticmethod
+    def make_service(monkeypatch, calls: dict[str, int], latency: float = 0.0):
+        """Service whose data lookups count calls and simulate a DB round-trip."""
+        published_at = datetime(2024, 11, 10, 15, tzinfo=UTC)
+
+        def lookup(name, value):
+            def fn(*args, **kwargs):
+                calls[name] = calls.get(name, 0) + 1
+                if latency:
+                    time.sleep(latency)
+                return value(*args) if callable(value) else value
+
+            return fn
+
+        service = EmailTemplateService(
+            article_loader=lookup(
+                "articles",
+                lambda ids: {
+                    article_id: {
+                        "title": f"Article {article_id}",
+                        "url": f"https://example.com/{article_id}",
+                        "engagement_score": 1.5,
+                        "source": "reddit",
+                        "text": "Preview text",
+                        "published_at": published_at,
+                    }
+                    for article_id in ids
+                },
+            )
+        )
+        monkeypatch.setattr(
+            service, "_get_participant_count", lookup("participants", 7)
+        )
+        monkeypatch.setattr(service, "_get_last_price", lookup("price", 101.5))
+        monkeypatch.setattr(
+            service,
+            "_get_participant_counts",
+            lookup("participants_bulk", lambda tickers, _: dict.fromkeys(tickers, 7)),
+        )
+        monkeypatch.setattr(
+            service,
+            "_get_last_prices",
+            lookup("price_bulk", lambda tickers: dict.fromkeys(tickers, 101.5)),
+        )
+        return service
+
+    @staticmethod
+    def make_users(count: int, tickers: list[str], per_user: int):
+        now = datetime.now(UTC)
+        for i in range(count):
+            user = UserDTO(
+                id=i,
+                email=f"user{i}@example.com",
+                auth_provider_id=None,
+                auth_provider=None,
+                is_active=True,
+                is_deleted=False,
+                created_at=now,
+                updated_at=now,
+                deleted_at=None,
+            )
+            follows = [
+                UserTickerFollowDTO(
+                    id=i * per_user + k,
+                    user_id=i,
+                    ticker=tickers[(i + k) % len(tickers)],
+                    ticker_name=f"{tickers[(i + k) % len(tickers)]} Corp",
+                    order=k,
+                )
+                for k in range(per_user)
+            ]
+            yield user, follows
+
+    def render_all(self, service, summaries, users) -> list[tuple[str, str]]:
+        return [
+            service.render_daily_briefing(
+                user=user,
+                user_profile=None,
+                ticker_summaries=summaries,
+                unsubscribe_token=f"token-{user.id}",
+                user_ticker_follows=follows,
+            )
+            for user, follows in users
+        ]
+
+    def test_cached_sections_match_uncached_render(self, monkeypatch):
+        """Cached rendering hydrates each ticker once and matches per-user output."""
+        tickers = ["AAPL", "NVDA", "TSLA"]
+        summaries = [
+            make_summary(ticker, summary_id=i, top_articles=[i * 10, i * 10 + 1])
+            for i, ticker in enumerate(tickers)
+        ]
+        users = list(self.make_users(4, tickers, per_user=2))
+
+        uncached_calls: dict[str, int] = {}
+        uncached = self.render_all(
+            self.make_service(monkeypatch, uncached_calls), summaries, users
+        )
+        cached_calls: dict[str, int] = {}
+        service = self.make_service(monkeypatch, cached_calls)
+        with service.ticker_section_cache(summaries):
+            cached = self.render_all(service, summaries, users)
+
+        assert [text for _, text in cached] == [text for _, text in uncached]
+        assert "unsubscribe?token=token-3" in cached[3][0]
+        assert uncached_calls == {"articles": 8, "participants": 8, "price": 8}
+        assert cached_calls == {"articles": 1, "participants_bulk": 1, "price_bulk": 1}
+        assert service._sections is None  # cache is scoped to the block
+
+    def test_bulk_lookups_match_per_ticker_queries(self, db_session, monkeypatch):
+        """Grouped participant/price queries agree with the per-ticker ones."""
+        monkeypatch.setattr(settings, "daily_summary_window_timezone", "UTC")
+        monkeypatch.setattr(settings, "daily_summary_window_start_hour", 0)
+        monkeypatch.setattr(settings, "daily_summary_window_end_hour", 23)
+        published_at = datetime(2024, 11, 10, 12, tzinfo=UTC)
+        db_session.add_all(
+            [Ticker(symbol=t, name=t, aliases=[], sources=[]) for t in ("AAPL", "NVDA")]
+        )
+        for i, (ticker, author) in enumerate(
+            [("AAPL", "a"), ("AAPL", "b"), ("AAPL", "a"), ("NVDA", "c")]
+        ):
+            article = Article(
+                source="reddit",
+                url=f"https://example.com/{i}",
+                published_at=published_at,
+                title=f"Post {i}",
+                author=author,
+            )
+            db_session.add(article)
+            db_session.flush()
+            db_session.add(ArticleTicker(article_id=article.id, ticker=ticker))
+        db_session.add(
+            StockPrice(symbol="AAPL", price=187.456, updated_at=published_at)
+        )
+        db_session.commit()
+
+        service = EmailTemplateService(
+            session_factory=sessionmaker(bind=db_session.get_bind())
+        )
+        tickers = ["AAPL", "NVDA"]
+        summary_date = date(2024, 11, 10)
+
+        assert service._get_participant_counts(tickers, summary_date) == {
+            t: service._get_participant_count(t, summary_date) for t in tickers
+        }
+        assert service._get_last_prices(tickers) == {"AAPL": 187.46}
+        assert service._get_last_price("NVDA") is None
+
+    @pytest.mark.performance
+    def test_render_time_per_1k_users(self, monkeypatch):
+        """Render 1k briefings with and without the per-dispatch section cache."""
+        tickers = [f"T{i}" for i in range(40)]
+        summaries = [
+            make_summary(ticker, summary_id=i, top_articles=[i * 10, i * 10 + 1])
+            for i, ticker in enumerate(tickers)
+        ]
+        users = list(self.make_users(1000, tickers, per_user=5))
+
+        start = time.perf_counter()
+        uncached = self.render_all(
+            self.make_service(monkeypatch, {}, latency=0.0001), summaries, users
+        )
+        uncached_seconds = time.perf_counter() - start
+
+        service = self.make_service(monkeypatch, {}, latency=0.0001)
+        start = time.perf_counter()
+        with service.ticker_section_cache(summaries):
+            cached = self.render_all(service, summaries, users)
+        cached_seconds = time.perf_counter() - start
+
+        print(
+            f"\nrender per 1k users: {uncached_seconds:.2f}s uncached, "
+            f"{cached_seconds:.2f}s with section cache"
+        )
+        assert [text for _, text in cached] == [text for _, text in uncached]
+        assert cached_seconds < uncached_seconds / 3
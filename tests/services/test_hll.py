@@ -0,0 +1,68 @@
+"""Tests for the HyperLogLog sketch library."""
+
+import pytest
+
+from app.services.hll import (
+    DEFAULT_PRECISION,
+    HyperLogLog,
+    merge_sketches,
+    standard_error,
+)
+
+
+def sketch_of(values) -> HyperLogLog:
+    sketch = HyperLogLog()
+    sketch.update(values)
+    return sketch
+
+
+class TestHyperLogLog:
+    """Tests for counting, merging and serialization."""
+
+    def test_small_counts_are_exact(self) -> None:
+        """Test empty and small sketches, ignoring repeats."""
+        assert HyperLogLog().count() == 0
+        assert sketch_of(["alice", "bob", "alice", "carol"]).count() == 3
+
+    @pytest.mark.parametrize("n", [2_000, 20_000, 100_000])
+    def test_large_counts_within_error_bound(self, n: int) -> None:
+        """Test estimates stay within three standard errors."""
+        estimate = sketch_of(f"user{i}" for i in range(n)).count()
+
+        assert abs(estimate - n) <= 3 * standard_error(DEFAULT_PRECISION) * n
+
+    def test_merge_is_union(self) -> None:
+        """Test merged sketches count the union, not the sum."""
+        first = sketch_of(f"user{i}" for i in range(3_000))
+        second = sketch_of(f"user{i}" for i in range(2_000, 6_000))
+        union = sketch_of(f"user{i}" for i in range(6_000))
+
+        first.merge(second)
+
+        assert first.to_bytes() == union.to_bytes()
+
+    def test_round_trip_sparse_and_dense(self) -> None:
+        """Test small sketches stay sparse and both formats reload."""
+        small = sketch_of(["alice", "bob"])
+        large = sketch_of(f"user{i}" for i in range(5_000))
+
+        assert len(small.to_bytes()) == 2 + 2 * 3
+        assert len(large.to_bytes()) == 2 + 2**DEFAULT_PRECISION
+        for sketch in (small, large):
+            loaded = HyperLogLog.from_bytes(sketch.to_bytes())
+            assert loaded.count() == sketch.count()
+
+    def test_merge_sketches_skips_missing(self) -> None:
+        """Test merging stored sketches with NULL columns."""
+        merged = merge_sketches([sketch_of(["a"]).to_bytes(), None, b""])
+
+        assert merged.count() == 1
+
+    def test_rejects_mismatched_or_corrupt_sketches(self) -> None:
+        """Test precision mismatches and truncated data raise ValueError."""
+        with pytest.raises(ValueError):
+            HyperLogLog().merge(HyperLogLog(precision=10))
+        with pytest.raises(ValueError):
+            HyperLogLog.from_bytes(sketch_of(["a"]).to_bytes()[:-1])
+        with pytest.raises(ValueError):
+            HyperLogLog(precision=20)
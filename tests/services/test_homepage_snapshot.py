@@ -0,0 +1,128 @@
+"""Tests for the precomputed homepage snapshot."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.db.models import Article, ArticleTicker, HomepageSnapshot, Ticker
+from app.repos.homepage_snapshot_repo import (
+    SNAPSHOT_RETENTION,
+    HomepageSnapshotRepository,
+)
+from app.services import homepage_snapshot
+from app.services.homepage_snapshot import (
+    HOMEPAGE_SNAPSHOT_VERSION,
+    build_homepage_data,
+    get_homepage_data,
+    refresh_homepage_snapshot,
+    save_homepage_snapshot,
+)
+
+
+def seed_mentions(db_session) -> None:
+    """Seed recent mentions: TSLA x3, AAPL x1 and an ETF that is excluded."""
+    now = datetime.utcnow()
+    db_session.add_all(
+        [
+            Ticker(symbol="TSLA", name="Tesla"),
+            Ticker(symbol="AAPL", name="Apple"),
+            Ticker(symbol="VOO", name="Vanguard S&P 500 ETF"),
+        ]
+    )
+    mentions = [("TSLA", 0.5), ("TSLA", 0.3), ("TSLA", -0.2), ("AAPL", -0.4)]
+    mentions += [("VOO", 0.1)] * 5
+    for i, (ticker, sentiment) in enumerate(mentions):
+        article = Article(
+            source="reddit_comment",
+            url=f"https://reddit.com/{i}",
+            published_at=now - timedelta(hours=1),
+            title=f"{ticker} mention",
+            sentiment=sentiment,
+        )
+        db_session.add(article)
+        db_session.flush()
+        db_session.add(ArticleTicker(article_id=article.id, ticker=ticker))
+    db_session.commit()
+
+
+class TestHomepageSnapshot:
+    """Tests for building and reading homepage snapshots."""
+
+    def test_build_ranks_top_tickers_without_etfs(self, db_session) -> None:
+        """Test the dataset's ticker cards and surge lists."""
+        seed_mentions(db_session)
+
+        data = build_homepage_data(db_session)
+
+        assert [t["symbol"] for t in data["tickers"]] == ["TSLA", "AAPL"]
+        assert data["tickers"][0]["article_count"] == 3
+        assert data["tickers"][0]["avg_sentiment"] == pytest.approx(0.2)
+        assert data["default_mention_symbols"] == ["TSLA", "AAPL"]
+        assert [t["symbol"] for t in data["negative_mention_surge_tickers"]] == ["AAPL"]
+        assert data["sentiment_histogram"]["total"] == 9
+
+    def test_fresh_snapshot_is_one_read(self, db_session, count_queries) -> None:
+        """Test that a fresh snapshot is served with a single query."""
+        seed_mentions(db_session)
+        expected = build_homepage_data(db_session)
+        save_homepage_snapshot(db_session)
+
+        with count_queries() as statements:
+            data = get_homepage_data(db_session)
+
+        assert data == expected
+        assert len(statements) == 1
+
+    def test_stale_or_old_version_snapshot_falls_back_to_live(self, db_session) -> None:
+        """Test that stale or other-version snapshots are ignored."""
+        seed_mentions(db_session)
+        repo = HomepageSnapshotRepository(db_session)
+        max_age = timedelta(minutes=settings.HOMEPAGE_SNAPSHOT_MAX_AGE_MINUTES)
+        repo.add(
+            {"tickers": []},
+            schema_version=HOMEPAGE_SNAPSHOT_VERSION,
+            built_at=datetime.now(UTC) - max_age - timedelta(minutes=1),
+        )
+        db_session.commit()
+        assert [t["symbol"] for t in get_homepage_data(db_session)["tickers"]] == [
+            "TSLA",
+            "AAPL",
+        ]
+
+        repo.add({"tickers": []}, schema_version=HOMEPAGE_SNAPSHOT_VERSION + 1)
+        db_session.commit()
+        assert len(get_homepage_data(db_session)["tickers"]) == 2
+
+    def test_add_prunes_old_snapshots(self, db_session) -> None:
+        """Test that only the newest snapshots are kept."""
+        repo = HomepageSnapshotRepository(db_session)
+        for i in range(SNAPSHOT_RETENTION + 2):
+            latest = repo.add({"n": i}, schema_version=HOMEPAGE_SNAPSHOT_VERSION)
+        db_session.commit()
+
+        count = db_session.scalar(select(func.count()).select_from(HomepageSnapshot))
+        assert count == SNAPSHOT_RETENTION
+        newest = repo.get_latest()
+        assert newest is not None
+        assert newest.id == latest.id
+
+    def test_refresh_commits_and_reports_failures(
+        self, db_session, test_engine, monkeypatch
+    ) -> None:
+        """Test the job hook writes a snapshot and swallows build errors."""
+        seed_mentions(db_session)
+        monkeypatch.setattr(
+            "app.db.session.SessionLocal", sessionmaker(bind=test_engine)
+        )
+
+        assert refresh_homepage_snapshot() is True
+        assert HomepageSnapshotRepository(db_session).get_latest() is not None
+
+        def fail(db):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(homepage_snapshot, "build_homepage_data", fail)
+        assert refresh_homepage_snapshot() is False
@@ -0,0 +1,131 @@
+"""Tests for the ticker page header metrics."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import (
+    Article,
+    ArticleTicker,
+    StockPrice,
+    StockPriceHistory,
+    Ticker,
+    TickerStats,
+)
+from app.main import get_ticker_overview_api
+from app.services.ticker_overview import TickerOverview, get_ticker_overview
+
+NOW = datetime(2026, 1, 5, 15, 0)
+TODAY = datetime(2026, 1, 5)
+
+
+def mention(db_session, n: int, published_at: datetime, author: str | None) -> None:
+    db_session.add(
+        Article(
+            id=n,
+            source="reddit_comment",
+            url=f"https://reddit.com/{n}",
+            published_at=published_at,
+            title=f"article {n}",
+            author=author,
+        )
+    )
+    db_session.add(ArticleTicker(article_id=n, ticker="AAPL"))
+
+
+@pytest.fixture
+def seeded(db_session):
+    db_session.add(Ticker(symbol="AAPL", name="Apple Inc.", exchange="NASDAQ"))
+    db_session.flush()
+    today = [("alice", 1), ("alice", 2), ("bob", 3), (None, 4), ("", 5)]
+    for author, hour in today:
+        mention(db_session, hour, TODAY + timedelta(hours=hour), author)
+    mention(db_session, 10, TODAY - timedelta(hours=3), "carol")
+    mention(db_session, 11, TODAY - timedelta(hours=20), "carol")
+    mention(db_session, 12, TODAY - timedelta(days=3), "dave")
+    db_session.add(StockPrice(symbol="AAPL", price=190.0, change=1.5))
+    for day in range(35):
+        db_session.add(
+            StockPriceHistory(
+                symbol="AAPL",
+                date=TODAY - timedelta(days=35 - day),
+                close_price=100.0 + day,
+            )
+        )
+    db_session.commit()
+
+
+class TestTickerOverview:
+    """Tests for get_ticker_overview."""
+
+    def test_header_metrics(self, db_session, seeded) -> None:
+        """Test day counts, unique authors, price and history window."""
+        overview = get_ticker_overview(db_session, "aapl", now=NOW)
+
+        assert overview is not None
+        assert (overview.symbol, overview.name) == ("AAPL", "Apple Inc.")
+        assert overview.total_articles == 8
+        assert (overview.today_articles, overview.yesterday_articles) == (5, 2)
+        assert overview.unique_users_today == 2
+        assert overview.unique_users_yesterday == 1
+        assert overview.article_change == 3
+        assert overview.article_change_percent == pytest.approx(150.0)
+        assert overview.users_change_percent == pytest.approx(100.0)
+        assert overview.stock_data is not None
+        assert overview.stock_data["price"] == 190.0
+        assert len(overview.price_history) == 30
+        assert overview.price_history[0]["price"] == 105.0
+        assert overview.price_history[-1]["date"] == "2026-01-04"
+
+    def test_total_prefers_ticker_stats(self, db_session, seeded) -> None:
+        """Test that the maintained counter replaces the exact count."""
+        db_session.merge(TickerStats(ticker="AAPL", total_mentions=42))
+        db_session.commit()
+
+        overview = get_ticker_overview(db_session, "AAPL", now=NOW)
+        assert overview is not None
+        assert overview.total_articles == 42
+
+    def test_three_statements(self, db_session, count_queries, seeded) -> None:
+        """Test one header query, one author sketch query and one history query."""
+        with count_queries() as statements:
+            get_ticker_overview(db_session, "AAPL", now=NOW)
+
+        assert len(statements) == 3
+
+    def test_unknown_ticker(self, db_session) -> None:
+        """Test that unknown symbols return None."""
+        assert get_ticker_overview(db_session, "NOPE", now=NOW) is None
+
+    def test_change_percent_from_zero(self) -> None:
+        """Test that activity after a silent day counts as +100%."""
+        overview = TickerOverview("X", "X", None, 1, 4, 0, 0, 0)
+
+        assert overview.article_change_percent == 100.0
+        assert overview.users_change_percent == 0.0
+
+
+class TestTickerOverviewEndpoint:
+    """Tests for /api/ticker/{ticker}/overview."""
+
+    @pytest.fixture
+    def fetch(self, test_engine, monkeypatch):
+        async def fresh(*args, **kwargs) -> None:
+            return None
+
+        monkeypatch.setattr(
+            "app.db.session.SessionLocal", sessionmaker(bind=test_engine)
+        )
+        monkeypatch.setattr("app.main.ensure_fresh_stock_price", fresh)
+        return lambda ticker: asyncio.run(get_ticker_overview_api(ticker, _=None))
+
+    def test_overview_payload(self, seeded, fetch) -> None:
+        """Test the JSON payload and 404 for unknown tickers."""
+        body = fetch("aapl")
+
+        assert body["symbol"] == "AAPL"
+        assert body["total_articles"] == 8
+        assert {"article_change_percent", "users_change"} <= body.keys()
+        assert fetch("NOPE").status_code == 404
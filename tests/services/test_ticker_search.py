@@ -0,0 +1,170 @@
+"""Tests for the in-memory ticker typeahead index."""
+
+import random
+import string
+import time
+
+import pytest
+from sqlalchemy import case, func
+
+from app.db.models import Ticker
+from app.services.ticker_search import (
+    TickerSearchCache,
+    TickerSearchEntry,
+    TickerSearchIndex,
+    ticker_search_cache,
+)
+
+TICKERS = [
+    ("AAPL", "Apple Inc."),
+    ("AAP", "Advance Auto Parts"),
+    ("MAAP", "Maap Holdings"),
+    ("PLAP", "Snapple Group"),
+    ("APLE", "Apple Hospitality REIT"),
+    ("TSLA", "Tesla Inc."),
+    ("NVDA", "NVIDIA Corporation"),
+]
+
+
+def make_index(tickers=TICKERS) -> TickerSearchIndex:
+    return TickerSearchIndex(
+        TickerSearchEntry(symbol=symbol, name=name, exchange=None)
+        for symbol, name in tickers
+    )
+
+
+def symbols(entries) -> list[str]:
+    return [entry.symbol for entry in entries]
+
+
+def sql_search(db_session, q: str, limit: int) -> list[str]:
+    """The ILIKE query the index replaces."""
+    upper_query = q.strip().upper()
+    relevance_order = case(
+        (func.lower(Ticker.symbol) == upper_query.lower(), 0),
+        (Ticker.symbol.ilike(f"{upper_query}%"), 1),
+        (Ticker.symbol.ilike(f"%{upper_query}%"), 2),
+        else_=3,
+    )
+    rows = (
+        db_session.query(Ticker.symbol)
+        .filter(
+            Ticker.symbol.ilike(f"%{upper_query}%")
+            | Ticker.name.ilike(f"%{upper_query}%")
+        )
+        .order_by(relevance_order, Ticker.symbol)
+        .limit(limit)
+        .all()
+    )
+    return [row.symbol for row in rows]
+
+
+class TestTickerSearchIndex:
+    """Tests for TickerSearchIndex ranking."""
+
+    def test_ranks_exact_prefix_symbol_then_name(self) -> None:
+        """Test exact symbol, symbol prefix, symbol substring, then name order."""
+        results = make_index().search("aap")
+
+        assert symbols(results) == ["AAP", "AAPL", "MAAP"]
+
+    def test_name_matches_follow_symbol_matches(self) -> None:
+        """Test that name-only matches rank after symbol matches by symbol."""
+        results = make_index().search("apple")
+
+        assert symbols(results) == ["AAPL", "APLE", "PLAP"]
+
+    def test_short_and_long_queries(self) -> None:
+        """Test one-character and multi-trigram queries."""
+        index = make_index()
+
+        assert symbols(index.search("v")) == ["NVDA", "AAP"]
+        assert symbols(index.search("  Hospitality REIT ")) == ["APLE"]
+        assert index.search("zzz") == []
+        assert index.search("") == []
+
+    def test_limit(self) -> None:
+        """Test that results stop at the limit in relevance order."""
+        assert symbols(make_index().search("a", limit=2)) == ["AAP", "AAPL"]
+
+    def test_matches_sql_ordering(self, db_session) -> None:
+        """Test parity with the ILIKE query on a random ticker universe."""
+        rng = random.Random(7)
+        words = ["Apple", "Holdings", "Energy", "Bank", "Group", "Tech", "Corp"]
+        tickers: dict[str, str] = {}
+        while len(tickers) < 300:
+            symbol = "".join(rng.choices(string.ascii_uppercase, k=rng.randint(1, 5)))
+            tickers[symbol] = " ".join(rng.sample(words, 2))
+        db_session.add_all(
+            Ticker(symbol=symbol, name=name) for symbol, name in tickers.items()
+        )
+        db_session.commit()
+        index = make_index(tickers.items())
+
+        for q in ["a", "Ap", "b", "xy", "ENE", "corp", "ank Gr", "QQ", "zzzz"]:
+            assert symbols(index.search(q, limit=20)) == sql_search(db_session, q, 20)
+
+
+class TestTickerSearchCache:
+    """Tests for TickerSearchCache rebuilds."""
+
+    def test_commit_of_ticker_change_rebuilds(self, db_session) -> None:
+        """Test that committing a new ticker invalidates the shared index."""
+        db_session.add(Ticker(symbol="AAPL", name="Apple Inc."))
+        db_session.commit()
+        assert symbols(ticker_search_cache.search(db_session, "ZZ")) == []
+
+        db_session.add(Ticker(symbol="ZZTOP", name="Top Co"))
+        db_session.commit()
+
+        assert symbols(ticker_search_cache.search(db_session, "ZZ")) == ["ZZTOP"]
+
+    def test_rebuilds_after_ttl(self, db_session) -> None:
+        """Test that rows written outside the ORM appear after the TTL."""
+        now = [0.0]
+        cache = TickerSearchCache(ttl_seconds=60, clock=lambda: now[0])
+        index = cache.get_index(db_session)
+
+        assert cache.get_index(db_session) is index
+        now[0] = 61.0
+        assert cache.get_index(db_session) is not index
+
+    @pytest.mark.performance
+    def test_sub_millisecond_lookups_at_15k_tickers(self, db_session) -> None:
+        """Benchmark typeahead lookups against the ILIKE query on 15k tickers."""
+        rng = random.Random(42)
+        words = ["Apple", "Holdings", "Energy", "Bank", "Group", "Tech", "Capital"]
+        tickers: dict[str, str] = {}
+        while len(tickers) < 15_000:
+            symbol = "".join(rng.choices(string.ascii_uppercase, k=rng.randint(1, 5)))
+            tickers[symbol] = " ".join(rng.sample(words, 3)) + f" {len(tickers)}"
+        db_session.bulk_insert_mappings(
+            Ticker,
+            [
+                {"symbol": s, "name": n, "aliases": [], "sources": []}
+                for s, n in tickers.items()
+            ],
+        )
+        db_session.commit()
+        queries = [
+            prefix[:length]
+            for prefix in rng.sample(sorted(tickers), 100)
+            for length in (1, 2, 3)
+        ] + ["apple", "bank gr", "capital 12"]
+        index = ticker_search_cache.get_index(db_session)
+
+        start = time.perf_counter()
+        for q in queries:
+            index.search(q, limit=20)
+        per_lookup = (time.perf_counter() - start) / len(queries)
+
+        start = time.perf_counter()
+        for q in queries[:30]:
+            sql_search(db_session, q, 20)
+        per_query = (time.perf_counter() - start) / 30
+        print(
+            f"\nindex {per_lookup * 1e6:.0f}us/lookup vs ILIKE "
+            f"{per_query * 1e3:.2f}ms/query over {len(tickers)} tickers"
+        )
+
+        assert per_lookup < 0.001
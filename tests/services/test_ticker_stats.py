@@ -0,0 +1,241 @@
+"""Tests for incrementally maintained ticker_stats counters."""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Article, ArticleTicker, Ticker, TickerStats
+from app.main import get_all_tickers
+from app.repos.ticker_stats_repo import TickerStatsRepository
+from app.services.ticker_stats import record_article_links, record_sentiment_scores
+
+NOW = datetime.now(UTC)
+
+
+def add_article(db_session, n: int, tickers, published_at, sentiment=None) -> Article:
+    article = Article(
+        source="reddit_comment",
+        url=f"https://reddit.com/{n}",
+        published_at=published_at,
+        title=f"article {n}",
+        sentiment=sentiment,
+    )
+    db_session.add(article)
+    db_session.flush()
+    for ticker in tickers:
+        db_session.add(ArticleTicker(article_id=article.id, ticker=ticker))
+    return article
+
+
+def stats(db_session, ticker: str) -> TickerStats:
+    db_session.expire_all()
+    return db_session.get(TickerStats, ticker)
+
+
+@pytest.fixture
+def tickers(db_session):
+    db_session.add_all(
+        [
+            Ticker(symbol="AAPL", name="Apple"),
+            Ticker(symbol="TSLA", name="Tesla"),
+            Ticker(symbol="MSFT", name="Microsoft"),
+        ]
+    )
+    db_session.commit()
+
+
+class TestIncrementalCounters:
+    """Tests for counters maintained at commit time."""
+
+    def test_committed_links_update_counters(self, db_session, tickers) -> None:
+        """Test mentions, sentiment, last mention and 24h counts."""
+        add_article(db_session, 1, ["AAPL", "TSLA"], NOW - timedelta(hours=1), 0.5)
+        add_article(db_session, 2, ["AAPL"], NOW - timedelta(days=3), -0.1)
+        add_article(db_session, 3, ["AAPL"], NOW - timedelta(hours=2))
+        db_session.commit()
+
+        aapl = stats(db_session, "AAPL")
+        assert aapl.total_mentions == 3
+        assert aapl.sentiment_count == 2
+        assert aapl.avg_sentiment == pytest.approx(0.2)
+        assert aapl.recent_mentions_24h == 2
+        assert aapl.last_mention_at is not None
+        assert aapl.last_mention_at.replace(tzinfo=UTC) == pytest.approx(
+            NOW - timedelta(hours=1), abs=timedelta(seconds=1)
+        )
+        assert stats(db_session, "TSLA").total_mentions == 1
+
+    def test_rolled_back_links_are_not_counted(self, db_session, tickers) -> None:
+        """Test that counters roll back with the links."""
+        add_article(db_session, 1, ["AAPL"], NOW)
+        db_session.flush()
+        db_session.rollback()
+        add_article(db_session, 2, ["TSLA"], NOW)
+        db_session.commit()
+
+        assert stats(db_session, "AAPL") is None
+        assert stats(db_session, "TSLA").total_mentions == 1
+
+    def test_bulk_links_and_sentiment_updates_are_recorded(
+        self, db_session, tickers
+    ) -> None:
+        """Test writers that bypass the unit of work."""
+        article = add_article(db_session, 1, [], NOW)
+        db_session.commit()
+        db_session.bulk_save_objects(
+            [ArticleTicker(article_id=article.id, ticker="MSFT")]
+        )
+        record_article_links(db_session, [(article.id, "MSFT")])
+        db_session.commit()
+        assert stats(db_session, "MSFT").sentiment_count == 0
+
+        db_session.execute(
+            update(Article).where(Article.id == article.id).values(sentiment=0.8)
+        )
+        record_sentiment_scores(db_session, {article.id: 0.8})
+        db_session.commit()
+
+        msft = stats(db_session, "MSFT")
+        assert msft.total_mentions == 1
+        assert (msft.sentiment_sum, msft.sentiment_count) == (0.8, 1)
+
+
+class TestMaintenance:
+    """Tests for 24h refresh and nightly reconciliation."""
+
+    def test_refresh_recent_mentions_decays_counts(self, db_session, tickers) -> None:
+        """Test that mentions older than 24h drop out and rows exist for all."""
+        add_article(db_session, 1, ["AAPL"], NOW - timedelta(hours=23))
+        add_article(db_session, 2, ["AAPL"], NOW - timedelta(hours=1))
+        db_session.commit()
+
+        repo = TickerStatsRepository(db_session)
+        assert repo.refresh_recent_mentions(now=NOW + timedelta(hours=2)) == 1
+        db_session.commit()
+
+        assert stats(db_session, "AAPL").recent_mentions_24h == 1
+        assert stats(db_session, "MSFT").recent_mentions_24h == 0
+        assert repo.count() == 3
+
+    def test_reconcile_corrects_drift(self, db_session, tickers) -> None:
+        """Test that reconcile recomputes counters missed by the writers."""
+        add_article(db_session, 1, ["AAPL"], NOW, 0.4)
+        db_session.commit()
+        # Sentiment override written without recording it
+        db_session.execute(update(Article).values(sentiment=-0.6))
+        db_session.execute(update(TickerStats).values(total_mentions=7))
+        db_session.commit()
+
+        repo = TickerStatsRepository(db_session)
+        assert repo.reconcile(now=NOW) == 3
+        db_session.commit()
+        assert repo.reconcile(now=NOW) == 0
+
+        aapl = stats(db_session, "AAPL")
+        assert aapl.total_mentions == 1
+        assert aapl.avg_sentiment == pytest.approx(-0.6)
+        assert stats(db_session, "TSLA").total_mentions == 0
+
+
+class TestTickersEndpoint:
+    """Tests for /api/tickers served from ticker_stats."""
+
+    @pytest.fixture
+    def list_tickers(self, test_engine, monkeypatch):
+        monkeypatch.setattr(
+            "app.db.session.SessionLocal", sessionmaker(bind=test_engine)
+        )
+
+        def run(**kwargs: Any):
+            params: dict[str, Any] = {"page": 1, "limit": 50, "search": None}
+            params.update(kwargs)
+            return asyncio.run(get_all_tickers(**params, _=None))
+
+        return run
+
+    def test_sort_orders_and_search(self, db_session, tickers, list_tickers) -> None:
+        """Test recent, total and alphabetical orders plus symbol search."""
+        add_article(db_session, 1, ["TSLA", "MSFT"], NOW - timedelta(days=2), 0.2)
+        add_article(db_session, 2, ["TSLA"], NOW - timedelta(days=2))
+        add_article(db_session, 3, ["MSFT"], NOW - timedelta(hours=1))
+        db_session.commit()
+        TickerStatsRepository(db_session).refresh_recent_mentions()
+        db_session.commit()
+
+        recent = list_tickers(sort_by="recent_activity")
+        total = list_tickers(sort_by="total_articles")
+        alpha = list_tickers(sort_by="alphabetical", search=" a ")
+
+        assert [t["symbol"] for t in recent["tickers"]] == ["MSFT", "AAPL", "TSLA"]
+        assert [t["symbol"] for t in total["tickers"]] == ["MSFT", "TSLA", "AAPL"]
+        assert total["tickers"][1]["article_count"] == 2
+        assert total["tickers"][1]["avg_sentiment"] == pytest.approx(0.2)
+        assert total["pagination"]["total"] == 3
+        assert [t["symbol"] for t in alpha["tickers"]] == ["AAPL", "TSLA"]
+
+    @pytest.mark.performance
+    def test_browse_page_cost_is_independent_of_corpus(
+        self, db_session, list_tickers
+    ) -> None:
+        """Benchmark a browse page against the full-corpus aggregate."""
+        symbols = [f"T{i:04d}" for i in range(2_000)]
+        db_session.bulk_insert_mappings(
+            Ticker,
+            [{"symbol": s, "name": s, "aliases": [], "sources": []} for s in symbols],
+        )
+        db_session.bulk_insert_mappings(
+            Article,
+            [
+                {
+                    "id": i,
+                    "source": "reddit_comment",
+                    "url": f"https://reddit.com/{i}",
+                    "published_at": NOW - timedelta(minutes=i),
+                    "title": "t",
+                    "sentiment": 0.1,
+                    "created_at": NOW,
+                }
+                for i in range(1, 60_001)
+            ],
+        )
+        db_session.bulk_insert_mappings(
+            ArticleTicker,
+            [
+                {"article_id": i, "ticker": symbols[i % len(symbols)]}
+                for i in range(1, 60_001)
+            ],
+        )
+        db_session.commit()
+        repo = TickerStatsRepository(db_session)
+        repo.ensure_rows()
+        repo.reconcile()
+        db_session.commit()
+
+        start = time.perf_counter()
+        page = list_tickers(sort_by="total_articles", page=3)
+        stats_page = time.perf_counter() - start
+
+        start = time.perf_counter()
+        db_session.execute(
+            select(Ticker.symbol, func.count(ArticleTicker.article_id))
+            .outerjoin(ArticleTicker, ArticleTicker.ticker == Ticker.symbol)
+            .outerjoin(Article, Article.id == ArticleTicker.article_id)
+            .group_by(Ticker.symbol)
+            .order_by(func.count(ArticleTicker.article_id).desc(), Ticker.symbol)
+            .offset(100)
+            .limit(50)
+        ).all()
+        aggregate_page = time.perf_counter() - start
+        print(
+            f"\nticker_stats page {stats_page * 1000:.1f}ms vs "
+            f"corpus aggregate {aggregate_page * 1000:.1f}ms"
+        )
+
+        assert len(page["tickers"]) == 50
+        assert page["tickers"][0]["article_count"] == 30
+        assert stats_page < aggregate_page
@@ -0,0 +1,296 @@
+"""Tests for phased weekly digest dispatch."""
+
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.db.models import (
+    DailyTickerSummary,
+    Ticker,
+    User,
+    UserNotificationChannel,
+    UserProfile,
+    UserTickerFollow,
+)
+from app.models.dto import EmailSendResult
+from app.repos.weekly_digest_repo import WeeklyDigestRepository
+from app.services.email_send_pool import ConcurrentEmailSender
+from app.services.weekly_digest_dispatch import WeeklyDigestDispatchService
+from app.services.weekly_summary import WeeklySummaryInfo, WeeklySummaryService
+
+WEEK_START = date(2025, 12, 1)
+WEEK_END = date(2025, 12, 7)
+TICKER_SETS = [["AAPL", "TSLA"], ["TSLA", "AAPL"], ["NVDA"], ["AAPL", "NVDA"]]
+
+
+def seed(session, user_count: int) -> None:
+    """Seed weekly users cycling through TICKER_SETS, plus two skip cases.
+
+    The last user has no follows and the one before follows only a ticker
+    without daily summaries.
+    """
+    now = datetime.now(UTC)
+    session.bulk_insert_mappings(
+        Ticker,
+        [
+            {"symbol": t, "name": f"{t} Inc.", "aliases": [], "sources": []}
+            for t in ("AAPL", "TSLA", "NVDA", "QUIET")
+        ],
+    )
+    session.bulk_insert_mappings(
+        DailyTickerSummary,
+        [
+            {
+                "ticker": ticker,
+                "summary_date": WEEK_START + timedelta(days=day),
+                "mention_count": 10 * (i + 1),
+                "engagement_count": 50,
+                "avg_sentiment": 0.2,
+                "llm_summary": f"{ticker} day {day}",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i, ticker in enumerate(("AAPL", "TSLA", "NVDA"))
+            for day in range(3)
+        ],
+    )
+    ids = range(1, user_count + 1)
+    session.bulk_insert_mappings(
+        User,
+        [
+            {
+                "id": i,
+                "email": f"user{i}@example.com",
+                "is_active": True,
+                "is_deleted": False,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in ids
+        ],
+    )
+    session.bulk_insert_mappings(
+        UserNotificationChannel,
+        [
+            {
+                "user_id": i,
+                "channel_type": "email",
+                "channel_value": f"user{i}@example.com",
+                "is_verified": True,
+                "is_enabled": True,
+                "email_bounced": False,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in ids
+        ],
+    )
+    session.bulk_insert_mappings(
+        UserProfile,
+        [
+            {
+                "user_id": i,
+                "timezone": "UTC",
+                "preferences": {"email_cadence": "weekly_only"},
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in ids
+        ],
+    )
+    follows: list[dict] = []
+    for i in ids:
+        if i == user_count:
+            continue
+        tickers = ["QUIET"] if i == user_count - 1 else TICKER_SETS[i % 4]
+        follows.extend(
+            {
+                "user_id": i,
+                "ticker": ticker,
+                "order": k,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for k, ticker in enumerate(tickers)
+        )
+    session.bulk_insert_mappings(UserTickerFollow, follows)
+    session.commit()
+
+
+@pytest.fixture
+def email_service():
+    """Email service stub that always succeeds."""
+    service = MagicMock()
+    service.provider_name = "stub"
+    service.send_weekly_digest.return_value = EmailSendResult(
+        success=True, message_id="msg", error=None, provider="stub"
+    )
+    return service
+
+
+class CountingSummaryService(WeeklySummaryService):
+    """Real summary service with a counting fake LLM synthesis."""
+
+    def __init__(self, session) -> None:
+        super().__init__(session)
+        self.llm_calls: list[list[str]] = []
+        self.aggregate_calls: list[list[str]] = []
+
+    def aggregate_weekly_summaries(self, tickers, week_start, week_end):
+        self.aggregate_calls.append(list(tickers))
+        return super().aggregate_weekly_summaries(
+            tickers=tickers, week_start=week_start, week_end=week_end
+        )
+
+    def _generate_llm_synthesis(self, aggregates, week_start, week_end):
+        self.llm_calls.append(sorted(a.ticker for a in aggregates))
+        return WeeklySummaryInfo(
+            headline="Week in review",
+            highlights=["Momentum"],
+            top_signals=[],
+            sentiment_direction="stable",
+            sentiment_evidence="Flat",
+            risks_opportunities=[],
+            next_actions=[],
+            ticker_summaries=[],
+        )
+
+
+@pytest.fixture
+def summary_service(db_session):
+    return CountingSummaryService(db_session)
+
+
+def make_dispatcher(db_session, email_service, summary_service):
+    return WeeklyDigestDispatchService(
+        db_session,
+        email_service,
+        summary_service=summary_service,
+        sender=ConcurrentEmailSender(1000.0, max_workers=4),
+    )
+
+
+class TestPhasedWeeklyDispatch:
+    """Tests for shared aggregates, cached synthesis and bulk records."""
+
+    def test_shares_aggregates_and_synthesis_across_users(
+        self, db_session, email_service, summary_service
+    ) -> None:
+        """Test that overlapping watchlists reuse aggregates and LLM output."""
+        seed(db_session, 22)
+        dispatcher = make_dispatcher(db_session, email_service, summary_service)
+
+        stats = dispatcher.dispatch_weekly_digests(
+            week_start=WEEK_START, week_end=WEEK_END, batch_size=8
+        )
+
+        assert (stats.sent, stats.skipped, stats.failed) == (20, 2, 0)
+        # Each ticker is aggregated in the first batch that needs it
+        aggregated = [t for call in summary_service.aggregate_calls for t in call]
+        assert sorted(aggregated) == ["AAPL", "NVDA", "QUIET", "TSLA"]
+        # {AAPL, TSLA} is one set regardless of follow order
+        assert sorted(summary_service.llm_calls) == [
+            ["AAPL", "NVDA"],
+            ["AAPL", "TSLA"],
+            ["NVDA"],
+        ]
+        records = {
+            r.user_id: r
+            for r in WeeklyDigestRepository(db_session).get_records_for_week(WEEK_START)
+        }
+        assert len(records) == 22
+        assert records[1].status == "sent" and records[1].ticker_count == 2
+        assert records[21].skip_reason == "no_weekly_data"
+        assert records[22].skip_reason == "no_ticker_follows"
+
+    def test_rerun_is_idempotent(
+        self, db_session, email_service, summary_service
+    ) -> None:
+        """Test that a second run skips users already sent or skipped."""
+        seed(db_session, 10)
+        make_dispatcher(
+            db_session, email_service, summary_service
+        ).dispatch_weekly_digests(week_start=WEEK_START, week_end=WEEK_END)
+        email_service.send_weekly_digest.reset_mock()
+
+        stats = make_dispatcher(
+            db_session, email_service, summary_service
+        ).dispatch_weekly_digests(week_start=WEEK_START, week_end=WEEK_END)
+
+        assert (stats.sent, stats.skipped, stats.failed) == (0, 10, 0)
+        email_service.send_weekly_digest.assert_not_called()
+
+    def test_crash_mid_batch_keeps_records_of_sent_digests(
+        self, db_session, email_service, summary_service
+    ) -> None:
+        """Test that digests sent before a crash are recorded and not resent."""
+
+        class Crash(BaseException):
+            pass
+
+        seed(db_session, 6)
+        sent_to: list[int] = []
+
+        def send_weekly_digest(user, **kwargs):
+            if user.id == 3:
+                raise Crash
+            sent_to.append(user.id)
+            return EmailSendResult(
+                success=True, message_id="msg", error=None, provider="stub"
+            )
+
+        email_service.send_weekly_digest.side_effect = send_weekly_digest
+        dispatcher = WeeklyDigestDispatchService(
+            db_session,
+            email_service,
+            summary_service=summary_service,
+            sender=ConcurrentEmailSender(1000.0, max_workers=1),
+        )
+        with pytest.raises(Crash):
+            dispatcher.dispatch_weekly_digests(week_start=WEEK_START, week_end=WEEK_END)
+        db_session.rollback()
+        assert sent_to == [1, 2]
+
+        repo = WeeklyDigestRepository(db_session)
+        assert repo.get_finalized_user_ids(range(1, 7), WEEK_START) == {1, 2, 5, 6}
+
+        email_service.send_weekly_digest.side_effect = None
+        stats = make_dispatcher(
+            db_session, email_service, summary_service
+        ).dispatch_weekly_digests(week_start=WEEK_START, week_end=WEEK_END)
+
+        assert (stats.sent, stats.skipped, stats.failed) == (2, 4, 0)
+        resent = {
+            call.kwargs["user"].id
+            for call in email_service.send_weekly_digest.call_args_list[-2:]
+        }
+        assert resent == {3, 4}
+
+    def test_bulk_upsert_never_downgrades_sent(self, db_session) -> None:
+        """Test that a failed retry does not overwrite a sent record."""
+        seed(db_session, 2)
+        repo = WeeklyDigestRepository(db_session)
+        repo.upsert_records(
+            WEEK_START,
+            [
+                {"user_id": 1, "status": "sent", "message_id": "m1", "ticker_count": 2},
+                {"user_id": 2, "status": "failed", "error": "boom"},
+            ],
+        )
+        repo.upsert_records(
+            WEEK_START,
+            [
+                {"user_id": 1, "status": "failed", "error": "late"},
+                {"user_id": 2, "status": "sent", "message_id": "m2"},
+            ],
+        )
+        db_session.commit()
+
+        first = repo.get_record_for_user_week(1, WEEK_START)
+        second = repo.get_record_for_user_week(2, WEEK_START)
+        assert first is not None and second is not None
+        assert (first.status, first.message_id, first.error) == ("sent", "m1", None)
+        assert (second.status, second.message_id, second.error) == ("sent", "m2", None)
+        assert second.sent_at is not None
+        assert repo.get_finalized_user_ids([1, 2, 3], WEEK_START) == {1, 2}
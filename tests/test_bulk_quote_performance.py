@@ -0,0 +1,144 @@
+"""Benchmark per-symbol vs bulk quote collection against a local HTTP stub.
+
+A small threaded HTTP server stands in for Yahoo Finance and adds a fixed
+latency to every request, so the benchmark measures round-trips rather than
+parsing. ``yf.Ticker`` and ``yf.download`` are replaced with thin clients that
+talk to this server, mirroring how each path hits the real API.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+import requests
+
+from app.services.stock_data import StockDataService
+
+REQUEST_LATENCY = 0.02
+SYMBOLS = [f"SYM{i}" for i in range(100)]
+
+
+@pytest.fixture
+def quote_server():
+    """Start a local quote server that counts requests."""
+    stats = {"requests": 0}
+    lock = threading.Lock()
+
+    class QuoteHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                stats["requests"] += 1
+            time.sleep(REQUEST_LATENCY)
+            query = parse_qs(urlparse(self.path).query)
+            symbols = query["symbols"][0].split(",")
+            body = json.dumps(
+                {
+                    symbol: {
+                        "previousClose": 100.0,
+                        "currentPrice": 100.0 + len(symbol),
+                    }
+                    for symbol in symbols
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), QuoteHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}/quote", stats
+
+    server.shutdown()
+    server.server_close()
+
+
+def _fetch(url: str, symbols: list[str]) -> dict:
+    response = requests.get(url, params={"symbols": ",".join(symbols)}, timeout=5)
+    response.raise_for_status()
+    return response.json()
+
+
+def _stub_ticker(url: str):
+    class StubTicker:
+        def __init__(self, symbol: str):
+            self.symbol = symbol
+
+        @property
+        def info(self) -> dict:
+            quote = _fetch(url, [self.symbol])[self.symbol]
+            return {**quote, "marketState": "REGULAR", "currency": "USD"}
+
+    return StubTicker
+
+
+def _stub_download(url: str):
+    def download(tickers: str, **kwargs) -> pd.DataFrame:
+        quotes = _fetch(url, tickers.split())
+        index = pd.date_range("2025-01-01", periods=2, freq="D")
+        return pd.concat(
+            {
+                symbol: pd.DataFrame(
+                    {
+                        "Open": [q["previousClose"], q["previousClose"]],
+                        "High": [q["currentPrice"], q["currentPrice"]],
+                        "Low": [q["previousClose"], q["previousClose"]],
+                        "Close": [q["previousClose"], q["currentPrice"]],
+                        "Volume": [1000, 1000],
+                    },
+                    index=index,
+                )
+                for symbol, q in quotes.items()
+            },
+            axis=1,
+        )
+
+    return download
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_bulk_quotes_vs_per_symbol_performance(quote_server):
+    """Bulk downloads should need far fewer round-trips than per-symbol info calls."""
+    url, stats = quote_server
+    service = StockDataService()
+    # Disable the per-request throttle so the per-symbol path is measured at
+    # its best case; in production it adds 500ms per symbol on top.
+    service._min_request_interval = 0.0
+
+    with patch("app.services.stock_data.yf.Ticker", _stub_ticker(url)):
+        start = time.perf_counter()
+        per_symbol = await service.get_multiple_prices(SYMBOLS)
+        per_symbol_elapsed = time.perf_counter() - start
+    per_symbol_requests = stats["requests"]
+
+    stats["requests"] = 0
+    with patch("app.services.stock_data.yf.download", _stub_download(url)):
+        start = time.perf_counter()
+        bulk = await service.get_bulk_quotes(SYMBOLS, chunk_size=50)
+        bulk_elapsed = time.perf_counter() - start
+    bulk_requests = stats["requests"]
+
+    print(
+        f"\nper-symbol: {per_symbol_elapsed:.3f}s / {per_symbol_requests} requests, "
+        f"bulk: {bulk_elapsed:.3f}s / {bulk_requests} requests"
+    )
+
+    assert all(per_symbol[s] is not None for s in SYMBOLS)
+    assert all(bulk[s] is not None for s in SYMBOLS)
+    bulk_quote, per_symbol_quote = bulk["SYM3"], per_symbol["SYM3"]
+    assert bulk_quote is not None and per_symbol_quote is not None
+    assert bulk_quote["price"] == per_symbol_quote["price"]
+    assert per_symbol_requests == len(SYMBOLS)
+    assert bulk_requests == 2
+    assert bulk_elapsed < per_symbol_elapsed
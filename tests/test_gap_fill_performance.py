@@ -0,0 +1,140 @@
+"""Before/after benchmark for weekend/holiday gap filling.
+
+``_legacy_fill`` reproduces the previous per-symbol ORM loop (one history query
+per symbol, one existence check and one ``db.add`` per gap day) so the
+vectorised ``fill_weekend_holiday_gaps`` can be compared on the same data.
+"""
+
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import and_, create_engine, func, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.collectors.stock_price_collector import StockPriceCollector
+from app.db.models import Base, StockPriceHistory, Ticker
+
+SYMBOL_COUNT = 60
+DAYS = 90
+
+
+def _seeded_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    start = datetime.now(UTC).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    ) - timedelta(days=DAYS - 1)
+    rows = []
+    for i in range(SYMBOL_COUNT):
+        symbol = f"SYM{i}"
+        session.add(Ticker(symbol=symbol, name=symbol, aliases=[], sources=[]))
+        for day in range(DAYS):
+            bar_date = start + timedelta(days=day, hours=20)
+            if bar_date.weekday() < 5:
+                rows.append(
+                    {
+                        "symbol": symbol,
+                        "date": bar_date,
+                        "close_price": 100.0 + day,
+                        "volume": 1000,
+                    }
+                )
+    session.commit()
+    session.execute(insert(StockPriceHistory), rows)
+    session.commit()
+    return session
+
+
+def _legacy_fill(db, days_back: int) -> int:
+    cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
+    symbols = [s for (s,) in db.query(StockPriceHistory.symbol).distinct().all()]
+    total_filled = 0
+    for symbol in symbols:
+        records = (
+            db.query(StockPriceHistory)
+            .filter(
+                StockPriceHistory.symbol == symbol,
+                StockPriceHistory.date >= cutoff_date,
+            )
+            .order_by(StockPriceHistory.date)
+            .all()
+        )
+        if not records:
+            continue
+        by_date = {r.date.date(): r for r in records}
+        current = records[0].date.date()
+        last_record = records[0]
+        while current <= records[-1].date.date():
+            if current in by_date:
+                last_record = by_date[current]
+            else:
+                existing = (
+                    db.query(StockPriceHistory)
+                    .filter(
+                        and_(
+                            StockPriceHistory.symbol == symbol,
+                            func.date(StockPriceHistory.date) == current,
+                        )
+                    )
+                    .first()
+                )
+                if not existing:
+                    db.add(
+                        StockPriceHistory(
+                            symbol=symbol,
+                            date=datetime.combine(current, datetime.min.time()).replace(
+                                tzinfo=UTC
+                            ),
+                            open_price=last_record.close_price,
+                            high_price=last_record.close_price,
+                            low_price=last_record.close_price,
+                            close_price=last_record.close_price,
+                            volume=0,
+                        )
+                    )
+                    total_filled += 1
+            current += timedelta(days=1)
+    db.commit()
+    return total_filled
+
+
+def _filled_rows(db) -> set[tuple]:
+    return {
+        (symbol, bar_date.date(), close)
+        for symbol, bar_date, close in db.query(
+            StockPriceHistory.symbol,
+            StockPriceHistory.date,
+            StockPriceHistory.close_price,
+        )
+        .filter(StockPriceHistory.volume == 0)
+        .all()
+    }
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_gap_fill_vectorised_vs_legacy_performance():
+    """The vectorised gap fill should match the legacy output and be faster."""
+    legacy_db = _seeded_session()
+    start = time.perf_counter()
+    legacy_filled = _legacy_fill(legacy_db, days_back=DAYS)
+    legacy_elapsed = time.perf_counter() - start
+
+    vector_db = _seeded_session()
+    start = time.perf_counter()
+    result = await StockPriceCollector().fill_weekend_holiday_gaps(
+        vector_db, days_back=DAYS
+    )
+    vector_elapsed = time.perf_counter() - start
+
+    print(
+        f"\nlegacy: {legacy_elapsed:.3f}s, vectorised: {vector_elapsed:.3f}s "
+        f"({legacy_filled} rows filled for {SYMBOL_COUNT} symbols x {DAYS} days)"
+    )
+
+    assert result["total_filled"] == legacy_filled
+    assert _filled_rows(vector_db) == _filled_rows(legacy_db)
+    assert vector_elapsed < legacy_elapsed
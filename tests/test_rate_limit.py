@@ -1,9 +1,173 @@
+import asyncio
+import time
+
+import fakeredis
+import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
+from starlette.requests import Request
 
+import app.services.rate_limit as rate_limit_module
 from app.main import app
+from app.services.rate_limit import LocalRateLimitCache, rate_limit
 
 
 def test_health_not_rate_limited():
     client = TestClient(app)
     resp = client.get("/health")
     assert resp.status_code == 200
+
+
+class FakeRedis:
+    """In-memory async Redis running the production Lua script (fakeredis + lupa)."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.client = fakeredis.FakeAsyncRedis(
+            server=fakeredis.FakeServer(), decode_responses=True
+        )
+        self.round_trips = 0
+
+    def register_script(self, source: str):
+        script = self.client.register_script(source)
+
+        async def run(keys, args):
+            self.round_trips += 1
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return await script(keys=keys, args=args)
+
+        return run
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit_module, "time", clock)
+    monkeypatch.setattr(
+        rate_limit_module,
+        "local_rate_limits",
+        LocalRateLimitCache(clock=clock.monotonic),
+    )
+    return clock
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(rate_limit_module, "_redis_client", fake)
+    return fake
+
+
+def make_request(ip: str = "1.2.3.4") -> Request:
+    return Request({"type": "http", "headers": [], "client": (ip, 1234)})
+
+
+def run_requests(dependency, count: int, ip: str = "1.2.3.4") -> list[int | None]:
+    """Return None for allowed requests and Retry-After for blocked ones."""
+
+    async def run():
+        results: list[int | None] = []
+        for _ in range(count):
+            try:
+                await dependency(make_request(ip))
+                results.append(None)
+            except HTTPException as exc:
+                assert exc.status_code == 429
+                assert exc.headers is not None
+                results.append(int(exc.headers["Retry-After"]))
+        return results
+
+    return asyncio.run(run())
+
+
+def test_lease_serves_under_quota_clients_locally(clock, redis):
+    """Test that a client well under quota costs one round-trip per lease."""
+    dependency = rate_limit("t", requests=60, window_seconds=60, lease=5)
+
+    assert run_requests(dependency, 20) == [None] * 20
+    assert redis.round_trips == 4
+
+
+def test_quota_is_exact_and_blocks_locally(clock, redis):
+    """Test that leasing never admits more than the quota."""
+    dependency = rate_limit("t", requests=60, window_seconds=60, lease=5)
+
+    results = run_requests(dependency, 100)
+
+    assert results.count(None) == 60
+    assert results[60:] == [1] * 40
+    trips = redis.round_trips
+    run_requests(dependency, 10)
+    # Blocked clients are rejected without another round-trip
+    assert redis.round_trips == trips
+
+
+def test_no_burst_at_window_edge(clock, redis):
+    """Test that half a window after exhausting the quota only half refills."""
+    dependency = rate_limit("t", requests=60, window_seconds=60, lease=1)
+    assert run_requests(dependency, 60) == [None] * 60
+
+    clock.now += 30
+    results = run_requests(dependency, 60)
+
+    assert results.count(None) == 30
+
+
+def test_clients_are_limited_independently(clock, redis):
+    """Test that one IP exhausting its quota does not block another."""
+    dependency = rate_limit("t", requests=5, window_seconds=60, lease=1)
+    run_requests(dependency, 10, ip="10.0.0.1")
+
+    assert run_requests(dependency, 5, ip="10.0.0.2") == [None] * 5
+
+
+def test_redis_errors_fail_open(clock, monkeypatch):
+    """Test that a Redis failure allows the request."""
+
+    class BrokenRedis:
+        def register_script(self, source):
+            async def run(keys, args):
+                raise ConnectionError("down")
+
+            return run
+
+    monkeypatch.setattr(rate_limit_module, "_redis_client", BrokenRedis())
+    dependency = rate_limit("t", requests=1, window_seconds=60)
+
+    assert run_requests(dependency, 3) == [None] * 3
+
+
+@pytest.mark.performance
+def test_added_latency_per_request(monkeypatch):
+    """Benchmark limiter overhead with a 1ms Redis round-trip."""
+    rtt = 0.001
+    requests = 300
+    fake = FakeRedis(latency=rtt)
+    monkeypatch.setattr(rate_limit_module, "_redis_client", fake)
+    monkeypatch.setattr(rate_limit_module, "local_rate_limits", LocalRateLimitCache())
+    dependency = rate_limit("bench", requests=6000, window_seconds=60, lease=5)
+
+    start = time.perf_counter()
+    assert run_requests(dependency, requests) == [None] * requests
+    per_request = (time.perf_counter() - start) / requests
+    # INCR + EXPIRE (+ TTL when blocked) cost at least two round-trips each
+    fixed_window_estimate = 2 * rtt
+    print(
+        f"\n{per_request * 1000:.3f} ms/request over {fake.round_trips} round-trips "
+        f"(fixed-window INCR/EXPIRE >= {fixed_window_estimate * 1000:.1f} ms)"
+    )
+
+    assert fake.round_trips == requests // 5
+    assert per_request < fixed_window_estimate / 2
@@ -9,7 +9,7 @@ import pytest
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.db.models import Article, ArticleTicker, Ticker
+from app.db.models import Article, ArticleBody, ArticleTicker, Ticker
 from app.db.session import SessionLocal
 from app.services.llm_sentiment import get_llm_sentiment_service
 from app.services.sentiment import get_sentiment_service
@@ -38,7 +38,7 @@ class TestRealWorldIntegration:
             db.query(
                 Article.id,
                 Article.title,
-                Article.text,
+                ArticleBody.text,
                 Article.source,
                 Article.subreddit,
                 Article.upvotes,
@@ -46,13 +46,14 @@ class TestRealWorldIntegration:
                 func.string_agg(ArticleTicker.ticker, ", ").label("tickers"),
             )
             .outerjoin(ArticleTicker, Article.id == ArticleTicker.article_id)
+            .outerjoin(ArticleBody, Article.id == ArticleBody.article_id)
             .filter(Article.source.like("%reddit%"))
             .filter(Article.title.isnot(None))
             .filter(Article.title != "")
             .group_by(
                 Article.id,
                 Article.title,
-                Article.text,
+                ArticleBody.text,
                 Article.source,
                 Article.subreddit,
                 Article.upvotes,
@@ -295,9 +296,10 @@ class TestRealWorldIntegration:
         # Get Reddit articles with text content
         query = (
             self.db.query(Article)
+            .join(ArticleBody, Article.id == ArticleBody.article_id)
             .filter(Article.source.like("%reddit%"))
-            .filter(Article.text.isnot(None))
-            .filter(Article.text != "")
+            .filter(ArticleBody.text.isnot(None))
+            .filter(ArticleBody.text != "")
             .limit(10)
         )
 
@@ -341,9 +343,10 @@ class TestRealWorldIntegration:
         # Get a Reddit article
         article = (
             self.db.query(Article)
+            .join(ArticleBody, Article.id == ArticleBody.article_id)
             .filter(Article.source.like("%reddit%"))
-            .filter(Article.text.isnot(None))
-            .filter(Article.text != "")
+            .filter(ArticleBody.text.isnot(None))
+            .filter(ArticleBody.text != "")
             .first()
         )
 
@@ -0,0 +1,268 @@
+"""Tests for the session user cache and request-scoped user resolution."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Ticker, TickerStats
+from app.db.session import get_db
+from app.main import app
+from app.models.dto import (
+    UserCreateDTO,
+    UserProfileCreateDTO,
+    UserTickerFollowCreateDTO,
+)
+from app.repos.user_repo import UserRepository
+from app.services.auth_service import AuthService, resolve_session_user
+from app.services.session_cache import (
+    SessionUser,
+    SessionUserCache,
+    session_user_cache,
+)
+
+
+def snapshot(user_id: int = 1, email: str = "a@gmail.com") -> SessionUser:
+    now = datetime(2025, 1, 1, tzinfo=UTC)
+    return SessionUser(
+        id=user_id,
+        email=email,
+        auth_provider="google",
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis-py hash commands used."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def delete(self, key):
+        self.hashes.pop(key, None)
+
+    def pipeline(self):
+        redis = self
+
+        class Pipeline:
+            def hset(self, key, field, value):
+                redis.hashes.setdefault(key, {})[field] = value
+
+            def expire(self, key, seconds):
+                pass
+
+            def execute(self):
+                pass
+
+        return Pipeline()
+
+
+@pytest.fixture
+def user(db_session):
+    created = UserRepository(db_session).create_user(
+        UserCreateDTO(email="cached@gmail.com", auth_provider_id="google_cached")
+    )
+    db_session.commit()
+    return created
+
+
+@pytest.fixture
+def count_user_queries(db_session):
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if "FROM users" in statement:
+            statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+class TestSessionUserCache:
+    """Tests for SessionUserCache TTL, LRU and invalidation."""
+
+    def test_entries_expire_after_ttl(self) -> None:
+        """Test that entries older than the TTL are misses."""
+        now = [0.0]
+        cache = SessionUserCache(ttl_seconds=30, clock=lambda: now[0])
+        cache.set(1, 100, snapshot())
+
+        now[0] = 29.0
+        assert cache.get(1, 100) == snapshot()
+        now[0] = 31.0
+        assert cache.get(1, 100) is None
+
+    def test_key_includes_issued_at_and_lru_bound(self) -> None:
+        """Test that another token of the same user misses and old entries evict."""
+        cache = SessionUserCache(max_entries=2)
+        cache.set(1, 100, snapshot(1))
+        cache.set(2, 100, snapshot(2))
+        cache.set(3, 100, snapshot(3))
+
+        assert cache.get(1, 101) is None
+        assert cache.get(1, 100) is None
+        assert cache.get(3, 100) == snapshot(3)
+
+    def test_invalidate_user_clears_local_and_redis(self) -> None:
+        """Test that invalidation drops every session of the user in both tiers."""
+        redis = FakeRedis()
+        cache = SessionUserCache(redis_client=redis)
+        cache.set(1, 100, snapshot(1))
+        cache.set(1, 200, snapshot(1))
+        cache.set(2, 100, snapshot(2))
+
+        cache.invalidate_user(1)
+
+        assert cache.get(1, 100) is None and cache.get(1, 200) is None
+        assert cache.get(2, 100) == snapshot(2)
+        assert "session_user:1" not in redis.hashes
+
+    def test_redis_tier_is_shared_between_processes(self) -> None:
+        """Test that a second process-local cache is filled from Redis."""
+        redis = FakeRedis()
+        SessionUserCache(redis_client=redis).set(1, 100, snapshot(1))
+
+        assert SessionUserCache(redis_client=redis).get(1, 100) == snapshot(1)
+
+    def test_redis_errors_fall_back_to_misses(self) -> None:
+        """Test that an unavailable Redis does not fail authentication."""
+        redis = MagicMock()
+        redis.hget.side_effect = ConnectionError("down")
+        redis.pipeline.side_effect = ConnectionError("down")
+        cache = SessionUserCache(redis_client=redis)
+
+        cache.set(1, 100, snapshot(1))
+        cache.clear()
+
+        assert cache.get(1, 100) is None
+
+
+class TestCachedGetCurrentUser:
+    """Tests for AuthService.get_current_user with the shared cache."""
+
+    def test_second_lookup_skips_database(
+        self, db_session, user, count_user_queries
+    ) -> None:
+        """Test that the same token resolves from cache on later requests."""
+        auth_service = AuthService()
+        token = auth_service.create_session_token(user.id, user.email)
+
+        first = auth_service.get_current_user(db_session, token)
+        second = auth_service.get_current_user(db_session, token)
+
+        assert first == second
+        assert first is not None
+        assert first.email == "cached@gmail.com"
+        assert len(count_user_queries) == 1
+
+    @pytest.mark.parametrize("action", ["soft_delete", "block", "profile"])
+    def test_user_changes_invalidate_cached_sessions(
+        self, db_session, user, action
+    ) -> None:
+        """Test that block, delete and profile updates invalidate the cache."""
+        auth_service = AuthService()
+        token = auth_service.create_session_token(user.id, user.email)
+        assert auth_service.get_current_user(db_session, token) is not None
+
+        repo = UserRepository(db_session)
+        if action == "soft_delete":
+            repo.soft_delete_user(user.id)
+        elif action == "block":
+            repo.update_user(user.id, is_active=False)
+        else:
+            repo.create_profile(UserProfileCreateDTO(user_id=user.id))
+            db_session.commit()
+            assert auth_service.get_current_user(db_session, token) is not None
+            repo.update_profile(user.id, timezone="Europe/Paris")
+        db_session.commit()
+
+        issued_at = int(auth_service.verify_session_token(token)["iat"])
+        assert session_user_cache.get(user.id, issued_at) is None
+        if action != "profile":
+            assert auth_service.get_current_user(db_session, token) is None
+
+
+def _issued_at(auth_service: AuthService, token: str) -> int:
+    return int(auth_service.verify_session_token(token)["iat"])
+
+
+class TestRequestScopedUser:
+    """Tests for resolving the current user once per request."""
+
+    def test_resolve_memoizes_on_request_state(self, db_session, user) -> None:
+        """Test that a second resolve in the same request does not re-verify."""
+        token = AuthService().create_session_token(user.id, user.email)
+        request = MagicMock()
+        request.state = type("State", (), {})()
+        request.cookies = {"session_token": token}
+
+        first = resolve_session_user(request, db_session)
+        request.cookies = {}
+
+        assert resolve_session_user(request, db_session) is first
+        assert request.state.current_user.id == user.id
+
+    def test_anonymous_request_resolves_to_none(self, db_session) -> None:
+        """Test that a request without a cookie resolves to None."""
+        request = MagicMock()
+        request.state = type("State", (), {})()
+        request.cookies = {}
+
+        assert resolve_session_user(request, db_session) is None
+
+    def test_profile_endpoint_uses_cached_user(
+        self, db_session, user, count_user_queries
+    ) -> None:
+        """Test that repeated authenticated API calls verify the user once."""
+        app.dependency_overrides[get_db] = lambda: db_session
+        try:
+            client = TestClient(app)
+            client.cookies.set(
+                "session_token",
+                AuthService().create_session_token(user.id, user.email),
+            )
+            for _ in range(3):
+                assert client.get("/auth/me").status_code == 200
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+
+        lookups = [s for s in count_user_queries if "users.is_active" in s]
+        assert len(lookups) == 1
+
+    def test_pages_take_the_user_from_the_dependency(
+        self, db_session, test_engine, user, monkeypatch
+    ) -> None:
+        """Test that /browse marks the request user's follows."""
+        monkeypatch.setattr(
+            "app.db.session.SessionLocal", sessionmaker(bind=test_engine)
+        )
+        for symbol in ("AAPL", "TSLA"):
+            db_session.add(Ticker(symbol=symbol, name=symbol))
+            db_session.add(TickerStats(ticker=symbol))
+        UserRepository(db_session).create_ticker_follow(
+            UserTickerFollowCreateDTO(user_id=user.id, ticker="TSLA")
+        )
+        db_session.commit()
+        app.dependency_overrides[get_db] = lambda: db_session
+        try:
+            client = TestClient(app)
+            client.cookies.set(
+                "session_token",
+                AuthService().create_session_token(user.id, user.email),
+            )
+            response = client.get("/browse")
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+
+        assert response.status_code == 200
+        assert response.text.count('data-following="true"') == 1
@@ -209,6 +209,46 @@ class TestStockAPIIntegration:
         # Skipping for now as it requires more complex setup
         pass
 
+    def test_chart_long_period_is_downsampled(self, client, test_db_engine, db_session):
+        """Test that a 5y chart is served from the weekly tier within 500 points."""
+        from app.repos.stock_price_repo import StockPriceRepository
+
+        now = datetime.now(UTC)
+        db_session.bulk_insert_mappings(
+            StockPriceHistory,
+            [
+                {
+                    "symbol": "AAPL",
+                    "date": now - timedelta(days=10 + day, hours=hour),
+                    "close_price": 100.0 + day,
+                    "volume": 10,
+                }
+                for day in range(1800)
+                for hour in (1, 3, 5)
+            ],
+        )
+        StockPriceRepository(db_session).refresh_rollups(["AAPL"])
+        db_session.commit()
+
+        TestSessionLocal = sessionmaker(bind=test_db_engine)
+        with patch("app.db.session.SessionLocal", TestSessionLocal):
+            response = client.get("/api/stock/AAPL/chart?period=5y")
+            history = client.get(
+                "/api/stock/AAPL/history",
+                params={
+                    "start_date": (now - timedelta(days=365)).strftime("%Y-%m-%d"),
+                    "end_date": now.strftime("%Y-%m-%d"),
+                },
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["resolution"] == "1w"
+        assert 250 <= len(data["data"]) <= 500
+        assert history.status_code == 200
+        assert history.json()["resolution"] == "1d"
+        assert history.json()["count"] <= 366
+
     @pytest.mark.asyncio
     async def test_chart_endpoint_no_mock_data_fallback(self, client, test_db_engine):
         """Test that chart endpoint doesn't return mock data."""
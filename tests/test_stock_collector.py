@@ -415,3 +415,102 @@ class TestStockPriceCollector:
             assert collection_run.completed_at is not None
             assert collection_run.duration_seconds is not None
             assert collection_run.duration_seconds > 0
+
+    @pytest.mark.asyncio
+    async def test_collect_current_prices_bulk(
+        self, collector, db_session, mock_stock_data
+    ):
+        """Test bulk collection upserts quotes and keeps untouched columns."""
+        existing_price = StockPrice(
+            symbol="AAPL",
+            price=145.00,
+            market_cap=3_000_000_000_000,
+            market_state="CLOSED",
+            currency="USD",
+            updated_at=datetime.now(UTC) - timedelta(hours=1),
+        )
+        db_session.add(existing_price)
+        db_session.commit()
+
+        with (
+            patch.object(
+                collector.stock_service,
+                "get_bulk_quotes",
+                new_callable=AsyncMock,
+            ) as mock_bulk,
+            patch.object(
+                collector.stock_service,
+                "get_multiple_prices",
+                new_callable=AsyncMock,
+            ) as mock_get_prices,
+        ):
+            mock_bulk.return_value = {
+                "AAPL": mock_stock_data,
+                "MSFT": {**mock_stock_data, "symbol": "MSFT", "price": 380.50},
+                "GOOGL": None,
+            }
+
+            result = await collector.collect_current_prices(db_session, bulk=True)
+
+            assert result["success"] == 2
+            assert result["failed"] == 1
+            mock_bulk.assert_called_once()
+            mock_get_prices.assert_not_called()
+
+        db_session.expire_all()
+        aapl_price = db_session.get(StockPrice, "AAPL")
+        assert aapl_price.price == 150.25
+        assert aapl_price.market_state == "REGULAR"
+        assert aapl_price.market_cap == 3_000_000_000_000
+        assert db_session.get(StockPrice, "MSFT").price == 380.50
+        assert db_session.get(StockPrice, "GOOGL") is None
+
+        collection_run = (
+            db_session.query(StockDataCollection)
+            .filter(StockDataCollection.collection_type == "current")
+            .first()
+        )
+        assert collection_run.rows_written == 2
+
+    @pytest.mark.asyncio
+    async def test_fill_weekend_holiday_gaps(self, collector, db_session):
+        """Test that missing calendar days are forward-filled from the last close."""
+        friday = datetime.now(UTC).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=10)
+        friday -= timedelta(days=(friday.weekday() - 4) % 7)
+        for symbol, offset, close in [
+            ("AAPL", 0, 150.0),
+            ("AAPL", 3, 152.0),
+            ("MSFT", 0, 380.0),
+            ("MSFT", 1, 381.0),
+        ]:
+            db_session.add(
+                StockPriceHistory(
+                    symbol=symbol,
+                    date=friday + timedelta(days=offset, hours=20),
+                    close_price=close,
+                    volume=1000,
+                )
+            )
+        db_session.commit()
+
+        result = await collector.fill_weekend_holiday_gaps(db_session, days_back=30)
+
+        assert result == {"symbols_processed": 1, "total_filled": 2}
+        fills = (
+            db_session.query(StockPriceHistory)
+            .filter(StockPriceHistory.volume == 0)
+            .order_by(StockPriceHistory.date)
+            .all()
+        )
+        assert [f.symbol for f in fills] == ["AAPL", "AAPL"]
+        assert [f.close_price for f in fills] == [150.0, 150.0]
+        assert [f.date.date() for f in fills] == [
+            (friday + timedelta(days=1)).date(),
+            (friday + timedelta(days=2)).date(),
+        ]
+
+        # Re-running is a no-op
+        result = await collector.fill_weekend_holiday_gaps(db_session, days_back=30)
+        assert result["total_filled"] == 0
@@ -286,3 +286,62 @@ class TestStockDataService:
 
             # Should be called with normalized symbol
             mock_yf.assert_called_with("BRK-B")
+
+    @pytest.mark.asyncio
+    async def test_get_bulk_quotes(self, stock_service):
+        """Test parsing multi-symbol download frames into quote dicts."""
+        index = pd.date_range("2025-01-01", periods=2, freq="D")
+        frame = pd.concat(
+            {
+                "AAPL": pd.DataFrame(
+                    {
+                        "Open": [148.0, 149.0],
+                        "High": [149.5, 151.0],
+                        "Low": [147.5, 148.5],
+                        "Close": [148.5, 150.25],
+                        "Volume": [1000000, 1200000],
+                    },
+                    index=index,
+                ),
+                "BRK-B": pd.DataFrame(
+                    {
+                        "Open": [400.0, 401.0],
+                        "High": [402.0, 405.0],
+                        "Low": [399.0, 400.0],
+                        "Close": [400.0, 404.0],
+                        "Volume": [500000, 600000],
+                    },
+                    index=index,
+                ),
+            },
+            axis=1,
+        )
+
+        with patch(
+            "app.services.stock_data.yf.download", return_value=frame
+        ) as mock_download:
+            results = await stock_service.get_bulk_quotes(["AAPL", "BRK.B", "NOPE"])
+
+        mock_download.assert_called_once()
+        assert mock_download.call_args.kwargs["tickers"] == "AAPL BRK-B NOPE"
+
+        assert results["AAPL"]["price"] == 150.25
+        assert results["AAPL"]["previous_close"] == 148.5
+        assert results["AAPL"]["change"] == 1.75
+        assert results["AAPL"]["day_high"] == 151.0
+        assert results["AAPL"]["volume"] == 1200000
+        assert results["BRK.B"]["price"] == 404.0
+        assert results["NOPE"] is None
+
+    @pytest.mark.asyncio
+    async def test_get_bulk_quotes_chunks_requests(self, stock_service):
+        """Test that bulk quotes issue one download per chunk."""
+        with patch(
+            "app.services.stock_data.yf.download", return_value=pd.DataFrame()
+        ) as mock_download:
+            results = await stock_service.get_bulk_quotes(
+                ["AAPL", "MSFT", "GOOGL"], chunk_size=2
+            )
+
+        assert mock_download.call_count == 2
+        assert results == {"AAPL": None, "MSFT": None, "GOOGL": None}
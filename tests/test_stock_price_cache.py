@@ -1,12 +1,26 @@
 """Tests for on-demand stock price caching helpers."""
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock
 
 import pytest
 
 from app.db.models import StockPrice
-from app.services.stock_price_cache import ensure_fresh_stock_price
+from app.services.stock_price_cache import (
+    QuoteCache,
+    _background_refreshes,
+    ensure_fresh_stock_price,
+    quote_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_quote_cache():
+    """Isolate tests from quotes cached by earlier tests."""
+    quote_cache.clear()
+    yield
+    quote_cache.clear()
 
 
 @pytest.mark.asyncio
@@ -112,3 +126,87 @@ async def test_ensure_fresh_stock_price_refreshes_when_stale(db_session, monkeyp
 
     updated = db_session.query(StockPrice).filter_by(symbol="TSLA").first()
     assert updated.price == 210.0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_share_one_fetch(db_session, monkeypatch):
+    """Concurrent requests for a stale symbol should coalesce into one fetch."""
+    db_session.add(
+        StockPrice(
+            symbol="NVDA",
+            price=100.0,
+            updated_at=datetime.now(UTC) - timedelta(hours=2),
+        )
+    )
+    db_session.commit()
+
+    async def slow_fetch(symbol):
+        await asyncio.sleep(0.05)
+        return {"symbol": symbol, "price": 120.0, "currency": "USD"}
+
+    mock_fetch = AsyncMock(side_effect=slow_fetch)
+    monkeypatch.setattr(
+        "app.services.stock_price_cache.stock_service.get_stock_price",
+        mock_fetch,
+    )
+
+    results = await asyncio.gather(
+        *[ensure_fresh_stock_price(db_session, "NVDA") for _ in range(10)]
+    )
+
+    assert mock_fetch.await_count == 1
+    assert all(result is not None and result.price == 120.0 for result in results)
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate_returns_stale_then_refreshes(
+    db_session, monkeypatch
+):
+    """Stale rows should be served immediately and refreshed in the background."""
+    db_session.add(
+        StockPrice(
+            symbol="AMD",
+            price=90.0,
+            updated_at=datetime.now(UTC) - timedelta(hours=2),
+        )
+    )
+    db_session.commit()
+
+    mock_fetch = AsyncMock(
+        return_value={"symbol": "AMD", "price": 95.0, "currency": "USD"}
+    )
+    monkeypatch.setattr(
+        "app.services.stock_price_cache.stock_service.get_stock_price",
+        mock_fetch,
+    )
+
+    result = await ensure_fresh_stock_price(
+        db_session, "AMD", stale_while_revalidate=True
+    )
+    assert result is not None
+    assert result.price == 90.0
+
+    await asyncio.gather(*_background_refreshes.values())
+
+    assert mock_fetch.await_count == 1
+    db_session.expire_all()
+    assert db_session.get(StockPrice, "AMD").price == 95.0
+
+
+@pytest.mark.asyncio
+async def test_quote_cache_expires_after_ttl():
+    """Cached quotes should be reused within the TTL and refetched after it."""
+    now = [0.0]
+    cache = QuoteCache(ttl_seconds=30, clock=lambda: now[0])
+    fetcher = AsyncMock(return_value={"price": 1.0})
+
+    await cache.fetch("AAPL", fetcher)
+    await cache.fetch("AAPL", fetcher)
+    assert fetcher.await_count == 1
+
+    now[0] = 31.0
+    await cache.fetch("AAPL", fetcher)
+    assert fetcher.await_count == 2
+
+    await cache.fetch("AAPL", fetcher, use_cache=False)
+    assert fetcher.await_count == 3
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 import pytest
 
-from app.db.models import StockPriceHistory
+from app.db.models import StockPriceHistory, StockPriceRollup
 from app.services.stock_data import StockDataService
 
 
@@ -193,6 +193,7 @@ class TestStockDataServiceHistory:
         assert len(result) == 3
         mock_ticker.history.assert_called_once()
 
-        # Verify DB populated
+        # Verify DB populated, rollups included
         count = db_session.query(StockPriceHistory).count()
         assert count == 3
+        assert db_session.query(StockPriceRollup).count() > 0
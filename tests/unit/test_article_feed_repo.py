@@ -0,0 +1,177 @@
+"""Unit tests for ArticleFeedRepository keyset pagination."""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Article, ArticleBody, ArticleTicker, Ticker, TickerStats
+from app.main import get_ticker_articles
+from app.repos.article_feed_repo import ArticleFeedRepository, FeedCursor
+
+BASE = datetime(2026, 1, 5, 12, tzinfo=UTC)
+
+
+def seed_feed(db_session, count: int, ticker: str = "AAPL") -> None:
+    """Link ``count`` articles to ``ticker``; every third shares a timestamp."""
+    db_session.add(Ticker(symbol=ticker, name=ticker, aliases=[], sources=[]))
+    db_session.bulk_insert_mappings(
+        Article,
+        [
+            {
+                "id": i,
+                "source": "reddit_comment",
+                "url": f"https://reddit.com/{i}",
+                "published_at": BASE - timedelta(minutes=i // 3),
+                "title": f"article {i}",
+                "created_at": BASE,
+            }
+            for i in range(1, count + 1)
+        ],
+    )
+    db_session.bulk_insert_mappings(
+        ArticleBody,
+        [{"article_id": i, "text": f"comment {i}"} for i in range(1, count + 1)],
+    )
+    db_session.bulk_insert_mappings(
+        ArticleTicker,
+        [{"article_id": i, "ticker": ticker} for i in range(1, count + 1)],
+    )
+    db_session.commit()
+
+
+def ids(page) -> list[int]:
+    return [article.id for article, _, _ in page.rows]
+
+
+class TestFeedCursor:
+    """Tests for cursor tokens."""
+
+    def test_round_trip(self) -> None:
+        """Test that a token decodes to the same position."""
+        cursor = FeedCursor(BASE, 42)
+
+        assert FeedCursor.decode(cursor.encode()) == cursor
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "MjAyNnwx"])
+    def test_invalid_tokens_raise(self, token: str) -> None:
+        """Test that malformed tokens raise ValueError."""
+        with pytest.raises(ValueError):
+            FeedCursor.decode(token)
+
+
+class TestArticleFeedRepository:
+    """Tests for feed pages and totals."""
+
+    def test_keyset_pages_match_offset_pages(self, db_session) -> None:
+        """Test that walking cursors visits every article once in feed order."""
+        seed_feed(db_session, 23)
+        repo = ArticleFeedRepository(db_session)
+        query = repo.ticker_feed_query("AAPL")
+
+        walked: list[int] = []
+        after = None
+        while True:
+            page = repo.fetch_page(query, 5, after=after)
+            walked.extend(ids(page))
+            if not page.has_next:
+                break
+            assert page.next_cursor is not None
+            after = FeedCursor.decode(page.next_cursor)
+
+        by_offset = [
+            article_id
+            for offset in range(0, 25, 5)
+            for article_id in ids(repo.fetch_page(query, 5, offset=offset))
+        ]
+        assert walked == by_offset
+        assert sorted(walked) == list(range(1, 24))
+        assert walked[:4] == [2, 1, 5, 4]
+
+    def test_total_prefers_ticker_stats(self, db_session) -> None:
+        """Test the maintained counter and the exact COUNT fallback."""
+        seed_feed(db_session, 7)
+        repo = ArticleFeedRepository(db_session)
+
+        assert repo.ticker_total("AAPL") == 7
+        db_session.merge(TickerStats(ticker="AAPL", total_mentions=9))
+        db_session.commit()
+        assert repo.ticker_total("AAPL") == 9
+        assert repo.estimate_count(repo.ticker_feed_query("AAPL")) == 7
+
+
+class TestTickerArticlesEndpoint:
+    """Tests for cursor pagination on /api/ticker/{ticker}/articles."""
+
+    @pytest.fixture
+    def list_articles(self, test_engine, monkeypatch):
+        monkeypatch.setattr(
+            "app.db.session.SessionLocal", sessionmaker(bind=test_engine)
+        )
+
+        def run(**kwargs: Any):
+            params: dict[str, Any] = {
+                "page": 1,
+                "limit": 10,
+                "cursor": None,
+                "include_total": True,
+            }
+            params.update(kwargs)
+            return asyncio.run(get_ticker_articles("aapl", **params, _=None))
+
+        return run
+
+    def test_cursor_follows_page_numbers(self, db_session, list_articles) -> None:
+        """Test that next_cursor continues where page 1 ended."""
+        seed_feed(db_session, 25)
+
+        first = list_articles()
+        second = list_articles(page=2, cursor=first["pagination"]["next_cursor"])
+        third = list_articles(page=3, cursor=second["pagination"]["next_cursor"])
+
+        assert first["pagination"]["total"] == 25
+        assert first["pagination"]["total_pages"] == 3
+        assert [a["id"] for a in second["articles"]] == [
+            a["id"] for a in list_articles(page=2)["articles"]
+        ]
+        assert second["pagination"]["has_prev"]
+        assert len(third["articles"]) == 5
+        assert third["pagination"]["next_cursor"] is None
+        assert not third["pagination"]["has_next"]
+
+    def test_optional_total_and_bad_cursor(self, db_session, list_articles) -> None:
+        """Test include_total=false and rejection of unknown cursors."""
+        seed_feed(db_session, 3)
+
+        untotalled = list_articles(include_total=False)
+        bad = list_articles(cursor="not-a-cursor")
+
+        assert untotalled["pagination"]["total"] is None
+        assert len(untotalled["articles"]) == 3
+        assert bad.status_code == 400
+
+    @pytest.mark.performance
+    def test_deep_keyset_page_cost(self, db_session) -> None:
+        """Benchmark a deep page by cursor against the same page by offset."""
+        seed_feed(db_session, 100_000)
+        repo = ArticleFeedRepository(db_session)
+        query = repo.ticker_feed_query("AAPL")
+        boundary = repo.fetch_page(query, 1, offset=89_999).rows[0][0]
+        after = FeedCursor(boundary.published_at, boundary.id)
+
+        start = time.perf_counter()
+        by_cursor = repo.fetch_page(query, 50, after=after)
+        keyset = time.perf_counter() - start
+
+        start = time.perf_counter()
+        by_offset = repo.fetch_page(query, 50, offset=90_000)
+        offset = time.perf_counter() - start
+        print(
+            f"\npage at 90k: keyset {keyset * 1000:.1f}ms vs offset {offset * 1000:.1f}ms"
+        )
+
+        assert ids(by_cursor) == ids(by_offset)
+        assert keyset < offset
@@ -0,0 +1,273 @@
+"""Unit tests for StockPriceRepository."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.db.models import (
+    StockPrice,
+    StockPriceHistory,
+    StockPriceRollup,
+    StockPriceRollupState,
+    Ticker,
+)
+from app.repos.stock_price_repo import (
+    StockPriceRepository,
+    pick_resolution,
+    price_row_from_quote,
+)
+
+
+@pytest.fixture
+def tickers(db_session):
+    """Seed tickers referenced by price rows."""
+    for symbol in ("AAPL", "MSFT"):
+        db_session.add(Ticker(symbol=symbol, name=symbol, aliases=[], sources=[]))
+    db_session.commit()
+
+
+class TestPriceRowFromQuote:
+    """Tests for quote-to-row mapping."""
+
+    def test_copies_requested_fields_only(self) -> None:
+        """Test that only listed fields are copied and currency defaults."""
+        now = datetime.now(UTC)
+        row = price_row_from_quote(
+            "AAPL",
+            {"price": 150.0, "change": 1.5, "last_updated": "ignored"},
+            now,
+            fields=("price", "change", "currency"),
+        )
+        assert row == {
+            "symbol": "AAPL",
+            "price": 150.0,
+            "change": 1.5,
+            "currency": "USD",
+            "updated_at": now,
+        }
+
+
+class TestStockPriceRepository:
+    """Tests for StockPriceRepository bulk writes."""
+
+    def test_upsert_prices_inserts_and_updates(self, db_session, tickers) -> None:
+        """Test that upserts create new rows and overwrite only given columns."""
+        db_session.add(
+            StockPrice(symbol="AAPL", price=100.0, market_cap=1000, currency="USD")
+        )
+        db_session.commit()
+
+        repo = StockPriceRepository(db_session)
+        now = datetime.now(UTC)
+        written = repo.upsert_prices(
+            [
+                {"symbol": "AAPL", "price": 150.0, "updated_at": now},
+                {"symbol": "MSFT", "price": 380.0, "updated_at": now},
+            ]
+        )
+        db_session.commit()
+        db_session.expire_all()
+
+        assert written == 2
+        aapl = db_session.get(StockPrice, "AAPL")
+        assert aapl.price == 150.0
+        assert aapl.market_cap == 1000
+        assert db_session.get(StockPrice, "MSFT").price == 380.0
+
+    def test_upsert_prices_dedupes_symbols(self, db_session, tickers) -> None:
+        """Test that duplicate symbols in one call keep the last row."""
+        repo = StockPriceRepository(db_session)
+        now = datetime.now(UTC)
+        written = repo.upsert_prices(
+            [
+                {"symbol": "AAPL", "price": 1.0, "updated_at": now},
+                {"symbol": "AAPL", "price": 2.0, "updated_at": now},
+            ]
+        )
+        db_session.commit()
+
+        assert written == 1
+        assert db_session.get(StockPrice, "AAPL").price == 2.0
+
+    def test_insert_history_skips_existing(self, db_session, tickers) -> None:
+        """Test that existing (symbol, date) bars are left alone."""
+        start = datetime(2025, 1, 6, tzinfo=UTC)
+        repo = StockPriceRepository(db_session, chunk_size=2)
+        rows = [
+            {"symbol": "AAPL", "date": start + timedelta(days=i), "close_price": 1.0}
+            for i in range(3)
+        ]
+        assert repo.insert_history(rows) == 3
+
+        rows.append(
+            {"symbol": "AAPL", "date": start + timedelta(days=3), "close_price": 2.0}
+        )
+        assert repo.insert_history(rows) == 1
+        db_session.commit()
+
+        assert (
+            db_session.query(StockPriceHistory)
+            .filter(StockPriceHistory.symbol == "AAPL")
+            .count()
+            == 4
+        )
+
+    def test_insert_history_update_existing(self, db_session, tickers) -> None:
+        """Test that update_existing overwrites OHLCV of existing bars."""
+        bar_date = datetime(2025, 1, 6, tzinfo=UTC)
+        repo = StockPriceRepository(db_session)
+        repo.insert_history(
+            [{"symbol": "AAPL", "date": bar_date, "close_price": 1.0, "volume": 10}]
+        )
+        repo.insert_history(
+            [{"symbol": "AAPL", "date": bar_date, "close_price": 5.0, "volume": 20}],
+            update_existing=True,
+        )
+        db_session.commit()
+
+        bar = db_session.query(StockPriceHistory).one()
+        assert bar.close_price == 5.0
+        assert bar.volume == 20
+
+
+class TestPriceRollups:
+    """Tests for downsampled OHLCV tiers."""
+
+    @pytest.fixture
+    def hourly_bars(self, db_session, tickers):
+        """Seed three hourly bars per day for two weeks starting on a Monday."""
+        start = datetime(2025, 1, 6, 14, tzinfo=UTC)
+        db_session.bulk_insert_mappings(
+            StockPriceHistory,
+            [
+                {
+                    "symbol": "AAPL",
+                    "date": start + timedelta(days=day, hours=hour),
+                    "open_price": 10.0 * day + hour,
+                    "high_price": 10.0 * day + hour + 1,
+                    "low_price": 10.0 * day + hour - 1,
+                    "close_price": 10.0 * day + hour + 0.5,
+                    "volume": 100,
+                }
+                for day in range(14)
+                for hour in range(3)
+            ],
+        )
+        db_session.commit()
+        return start
+
+    def test_pick_resolution_bounds_points(self) -> None:
+        """Test that tiers get coarser as the span grows."""
+        assert pick_resolution(timedelta(days=5)) == "raw"
+        assert pick_resolution(timedelta(days=90)) == "1d"
+        assert pick_resolution(timedelta(days=1825)) == "1w"
+
+    def test_refresh_rollups_aggregates_ohlcv(self, db_session, hourly_bars) -> None:
+        """Test daily and weekly buckets take first open, extremes, last close."""
+        written = StockPriceRepository(db_session).refresh_rollups(["AAPL"])
+        db_session.commit()
+
+        assert written == 14 + 2
+        first_week = (
+            db_session.query(StockPriceRollup)
+            .filter(StockPriceRollup.resolution == "1w")
+            .order_by(StockPriceRollup.bucket_start)
+            .first()
+        )
+        assert first_week.bucket_start.date() == hourly_bars.date()
+        assert first_week.open_price == 0.0
+        assert first_week.high_price == 63.0
+        assert first_week.low_price == -1.0
+        assert first_week.close_price == 62.5
+        assert first_week.volume == 2100
+
+    def test_get_ohlcv_reads_rollups(self, db_session, hourly_bars) -> None:
+        """Test that rollup tiers are read back in chronological order."""
+        repo = StockPriceRepository(db_session)
+        repo.refresh_rollups(["AAPL"], since=hourly_bars + timedelta(days=8))
+        repo.refresh_rollups(["AAPL"])
+        db_session.commit()
+
+        bars = repo.get_ohlcv(
+            "AAPL", hourly_bars, hourly_bars + timedelta(days=14), "1d"
+        )
+
+        assert len(bars) == 14
+        assert bars[0]["close_price"] == 2.5
+        assert bars[-1]["close_price"] == 132.5
+        assert [bar["date"] for bar in bars] == sorted(bar["date"] for bar in bars)
+
+    def test_get_ohlcv_falls_back_to_raw(self, db_session, hourly_bars) -> None:
+        """Test that uncovered ranges are aggregated from raw history."""
+        repo = StockPriceRepository(db_session)
+        repo.refresh_rollups(["AAPL"], since=hourly_bars + timedelta(days=8))
+        db_session.commit()
+
+        bars = repo.get_ohlcv(
+            "AAPL", hourly_bars, hourly_bars + timedelta(days=14), "1w"
+        )
+
+        assert [bar["close_price"] for bar in bars] == [62.5, 132.5]
+        assert [bar["volume"] for bar in bars] == [2100, 2100]
+
+    def test_get_ohlcv_falls_back_past_watermark(self, db_session, hourly_bars) -> None:
+        """Test that raw bars newer than the rolled-through point force a fallback."""
+        repo = StockPriceRepository(db_session)
+        repo.refresh_rollups(["AAPL"])
+        repo.insert_history(
+            [
+                {
+                    "symbol": "AAPL",
+                    "date": hourly_bars + timedelta(days=14),
+                    "close_price": 140.5,
+                }
+            ]
+        )
+        db_session.commit()
+
+        bars = repo.get_ohlcv(
+            "AAPL", hourly_bars, hourly_bars + timedelta(days=15), "1d"
+        )
+
+        assert len(bars) == 15
+        assert bars[-1]["close_price"] == 140.5
+
+    def test_partial_refresh_keeps_coverage(self, db_session, hourly_bars) -> None:
+        """Test that covered symbols are served from rollups without a raw scan."""
+        repo = StockPriceRepository(db_session)
+        repo.refresh_rollups(["AAPL"])
+        repo.refresh_rollups(["AAPL"], since=hourly_bars + timedelta(days=8))
+        state = db_session.get(StockPriceRollupState, "AAPL")
+        assert state is not None
+        assert state.rolled_through.replace(tzinfo=UTC) == hourly_bars + timedelta(
+            days=13, hours=2
+        )
+        # A rollup row removed behind the repository's back stays missing,
+        # showing the read never re-aggregated raw history
+        db_session.query(StockPriceRollup).filter(
+            StockPriceRollup.resolution == "1d",
+            StockPriceRollup.bucket_start
+            == hourly_bars.replace(hour=0) + timedelta(days=5),
+        ).delete()
+        db_session.commit()
+
+        bars = repo.get_ohlcv(
+            "AAPL", hourly_bars, hourly_bars + timedelta(days=14), "1d"
+        )
+
+        assert len(bars) == 13
+
+    def test_new_symbol_partial_refresh_is_covered(self, db_session, tickers) -> None:
+        """Test that a refresh from a symbol's first bar counts as full coverage."""
+        start = datetime(2025, 1, 6, 14, tzinfo=UTC)
+        repo = StockPriceRepository(db_session)
+        repo.insert_history(
+            [
+                {"symbol": "MSFT", "date": start + timedelta(days=d), "close_price": d}
+                for d in range(3)
+            ]
+        )
+        repo.refresh_rollups(["MSFT"], since=start)
+        db_session.commit()
+
+        assert db_session.get(StockPriceRollupState, "MSFT") is not None